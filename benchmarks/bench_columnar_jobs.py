@@ -0,0 +1,57 @@
+"""
+Time turning a page of 1000 jobs into a pandas DataFrame, from the Job objects returned by
+JobsRepository.list_jobs as the CLI used to, and from the JobTable returned by
+JobsRepository.list_jobs_table.
+
+Run with ``python -m benchmarks.bench_columnar_jobs`` from the repository root.
+"""
+import timeit
+
+import pandas
+
+from .bench_job_decoding import make_repository
+from .payloads import job_dict
+
+JOBS = 1000
+HISTORY_LENGTH = 20
+REPEAT = 5
+
+
+def from_objects(repository):
+    jobs_df = pandas.json_normalize(
+        [job.to_dict() for job in repository.list_jobs("")])
+    jobs_df["time_created"] = pandas.to_datetime(jobs_df.time_created,
+                                                 unit="s")
+    jobs_df["last_updated"] = pandas.to_datetime(jobs_df.last_updated,
+                                                 unit="s")
+    return jobs_df
+
+
+def from_table(repository):
+    return repository.list_jobs_table("").to_pandas()
+
+
+def main():
+    payload = {
+        "jobs": [
+            job_dict(i, history_length=HISTORY_LENGTH) for i in range(JOBS)
+        ]
+    }
+    repository = make_repository(payload)
+    print("{jobs} jobs with {history} status history entries".format(
+        jobs=JOBS, history=HISTORY_LENGTH))
+    results = {}
+    for label, convert in [("Job objects", from_objects),
+                           ("JobTable", from_table)]:
+        results[label] = min(
+            timeit.repeat(lambda: convert(repository), number=1,
+                          repeat=REPEAT))
+    for label, seconds in results.items():
+        print("{label:>12}: {ms:8.1f} ms".format(label=label,
+                                                 ms=seconds * 1000))
+    print("{speedup:>12.1f}x faster from the JobTable".format(
+        speedup=results["Job objects"] / results["JobTable"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Per-call latency of RequestsRepository with and without the pooled session.
+
+Run with ``python -m benchmarks.bench_http_session`` from the repository root.
+"""
+import timeit
+
+from galileo_sdk.compat import mock, requests
+from galileo_sdk.data.providers.session import SessionProvider
+from galileo_sdk.data.repositories.lz import LzRepository
+
+from .payloads import lz_dict
+from tests.stand_in_server import NAMESPACE, StandInServer, json_route
+
+CALLS = 500
+
+
+class UnpooledSessionProvider(SessionProvider):
+    """Module-level ``requests`` calls: a new connection for every request."""
+    def get_session(self):
+        return requests
+
+
+def make_repo(backend, session_provider):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = backend
+    settings_repo.get_settings().universe = None
+    auth_provider = mock.Mock()
+    auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+    return LzRepository(settings_repo, auth_provider, NAMESPACE,
+                        session_provider)
+
+
+def main():
+    routes = {
+        NAMESPACE + "/machines":
+        json_route({"machines": [lz_dict(i) for i in range(5)]}),
+    }
+    with StandInServer(routes) as server:
+        for label, provider in [
+            ("unpooled", UnpooledSessionProvider()),
+            ("pooled", SessionProvider()),
+        ]:
+            repo = make_repo(server.backend, provider)
+            repo.list_lz("")  # warm up
+            connections = server.connection_count
+            seconds = timeit.timeit(lambda: repo.list_lz(""), number=CALLS)
+            print("{label:>10}: {latency:8.1f} us/call, {conns} new connections".
+                  format(label=label,
+                         latency=seconds / CALLS * 1e6,
+                         conns=server.connection_count - connections))
+            provider.close()
+
+
+if __name__ == "__main__":
+    main()
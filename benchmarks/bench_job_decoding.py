@@ -0,0 +1,62 @@
+"""
+Time JobsRepository.list_jobs spends converting a page of 1000 jobs with long status
+histories, when only the statuses are read and when every status history is read too,
+which costs as much as the former eager conversion.
+
+Run with ``python -m benchmarks.bench_job_decoding`` from the repository root.
+"""
+import timeit
+
+from galileo_sdk.compat import mock
+from galileo_sdk.data.repositories.jobs import JobsRepository
+from galileo_sdk.mock_response import MockResponse
+
+from .payloads import job_dict
+from tests.stand_in_server import NAMESPACE
+
+JOBS = 1000
+HISTORY_LENGTH = 100
+REPEAT = 5
+
+
+def make_repository(payload):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = "http://BACKEND"
+    settings_repo.get_settings().universe = None
+    repository = JobsRepository(settings_repo, mock.Mock(), NAMESPACE)
+    # The body is already decoded, only the conversion to jobs is timed
+    repository._get = lambda *args, **kwargs: MockResponse(payload, 200)
+    return repository
+
+
+def statuses(repository):
+    return [job.status for job in repository.list_jobs("")]
+
+
+def histories(repository):
+    return [job.status_history for job in repository.list_jobs("")]
+
+
+def main():
+    payload = {
+        "jobs": [
+            job_dict(i, history_length=HISTORY_LENGTH) for i in range(JOBS)
+        ]
+    }
+    repository = make_repository(payload)
+    print("{jobs} jobs with {history} status history entries".format(
+        jobs=JOBS, history=HISTORY_LENGTH))
+    results = {}
+    for label, read in [("status only", statuses),
+                        ("status_history", histories)]:
+        results[label] = min(
+            timeit.repeat(lambda: read(repository), number=1, repeat=REPEAT))
+    for label, seconds in results.items():
+        print("{label:>15}: {ms:8.1f} ms".format(label=label,
+                                                 ms=seconds * 1000))
+    print("{speedup:>15.1f}x faster when the histories are not read".format(
+        speedup=results["status_history"] / results["status only"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Time decoding large list responses with each JSON decoder installed, and converting the
+decoded dictionaries to business objects, per entity type. Jobs are converted without
+reading their status histories, which are converted when first read.
+
+Run with ``python -m benchmarks.bench_json_decoding`` from the repository root.
+"""
+import json
+import timeit
+
+from galileo_sdk.data.repositories import json_decoding
+from galileo_sdk.data.repositories.jobs import job_dict_to_job
+from galileo_sdk.data.repositories.lz import lz_dict_to_lz
+from galileo_sdk.data.repositories.missions import file_dict_to_file_listing
+from galileo_sdk.data.repositories.stations import station_dict_to_station
+
+from .payloads import file_dict, job_dict, lz_dict, station_dict
+
+REPEAT = 5
+
+# Entity, list key, payload of each entry, conversion of each entry, entries
+ENTITIES = [
+    ("jobs", "jobs", job_dict, job_dict_to_job, 1000),
+    ("stations", "stations", station_dict, station_dict_to_station, 500),
+    ("lzs", "machines", lz_dict, lz_dict_to_lz, 1000),
+    ("files", "files", file_dict, file_dict_to_file_listing, 5000),
+]
+
+
+def decoders():
+    installed = [("json", json.loads)]
+    if json_decoding.ujson is not None:
+        installed.append(("ujson", json_decoding.ujson.loads))
+    if json_decoding.orjson is not None:
+        installed.append(("orjson", json_decoding.orjson.loads))
+    return installed
+
+
+def best_ms(function):
+    return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1000
+
+
+def main():
+    installed = decoders()
+    print("{entity:>9} {size:>8} {decoders} {convert:>9}".format(
+        entity="entity",
+        size="KiB",
+        decoders=" ".join("{name:>9}".format(name=name)
+                          for name, _ in installed),
+        convert="convert"))
+    for entity, key, payload, convert, count in ENTITIES:
+        content = json.dumps({
+            key: [payload(i) for i in range(count)]
+        }).encode("utf-8")
+        decoded = json.loads(content)[key]
+        timings = [
+            best_ms(lambda: decoder(content)) for _, decoder in installed
+        ]
+        converting = best_ms(lambda: [convert(entry) for entry in decoded])
+        print("{entity:>9} {size:8.0f} {decoders} {convert:9.1f}".format(
+            entity=entity,
+            size=len(content) / 1024.0,
+            decoders=" ".join("{ms:9.1f}".format(ms=ms) for ms in timings),
+            convert=converting))
+    print("Times in ms, decoders installed: {names}".format(
+        names=", ".join(name for name, _ in installed)))
+
+
+if __name__ == "__main__":
+    main()
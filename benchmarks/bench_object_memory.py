@@ -0,0 +1,55 @@
+"""
+Bytes per Job decoded by job_dict_to_job, with a 20-entry status history, for the slotted
+business objects and for plain classes holding the same attributes in a __dict__.
+
+Run with ``python -m benchmarks.bench_object_memory`` from the repository root.
+"""
+import tracemalloc
+
+from galileo_sdk.business.objects import Job, JobStatus
+from galileo_sdk.compat import mock
+from galileo_sdk.data.repositories import jobs as jobs_repository
+
+from .payloads import job_dict
+
+JOBS = 20000
+HISTORY_LENGTH = 20
+
+
+def plain_class(cls):
+    # Same methods and properties, attributes in a per-instance dictionary
+    namespace = dict((name, value) for name, value in cls.__dict__.items()
+                     if name not in cls.__slots__ and name != "__slots__")
+    return type(cls.__name__, (object, ), namespace)
+
+
+def bytes_per_job(payloads):
+    tracemalloc.start()
+    jobs = [jobs_repository.job_dict_to_job(job) for job in payloads]
+    for job in jobs:
+        # Converted when first read
+        job.status_history
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / float(len(jobs))
+
+
+def main():
+    payloads = [
+        job_dict(i, history_length=HISTORY_LENGTH) for i in range(JOBS)
+    ]
+    with mock.patch.object(jobs_repository, "Job", plain_class(Job)), \
+            mock.patch.object(jobs_repository, "JobStatus",
+                              plain_class(JobStatus)):
+        plain = bytes_per_job(payloads)
+    slotted = bytes_per_job(payloads)
+    print("{jobs} jobs with {history} status history entries".format(
+        jobs=JOBS, history=HISTORY_LENGTH))
+    for label, size in [("__dict__", plain), ("__slots__", slotted)]:
+        print("{label:>10}: {size:8.0f} bytes per job".format(label=label,
+                                                               size=size))
+    print("{saved:>10.1%} saved".format(saved=1 - slotted / plain))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Wall time of a full job history scan: page by page, lazy iterator with prefetch,
+and concurrent page fetches.
+
+Run with ``python -m benchmarks.bench_pagination`` from the repository root.
+"""
+import json
+import time
+
+from galileo_sdk.business.services.jobs import JobsService
+from galileo_sdk.compat import mock
+from galileo_sdk.data.providers.session import SessionProvider
+from galileo_sdk.data.repositories.jobs import JobsRepository
+
+from .payloads import job_dict
+from tests.stand_in_server import NAMESPACE, StandInServer
+
+TOTAL_JOBS = 2000
+ITEMS = 100
+LATENCY = 0.02  # Seconds the stand-in backend spends on every page
+
+
+def jobs_route(handler):
+    query = handler.path.split("?", 1)[1] if "?" in handler.path else ""
+    params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+    page = int(params.get("page", 1))
+    items = int(params.get("items", 25))
+    start = (page - 1) * items
+    jobs = [job_dict(i) for i in range(start, min(start + items, TOTAL_JOBS))]
+    time.sleep(LATENCY)
+    body = json.dumps({"jobs": jobs}).encode("utf-8")
+    return 200, {"Content-Type": "application/json"}, body
+
+
+def make_service(backend):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = backend
+    settings_repo.get_settings().universe = None
+    auth_provider = mock.Mock()
+    auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+    jobs_repo = JobsRepository(settings_repo, auth_provider, NAMESPACE,
+                               SessionProvider())
+    profile_repo = mock.Mock()
+    profile_repo.self.return_value = mock.Mock(user_id="user-0001")
+    return JobsService(jobs_repo, profile_repo)
+
+
+def page_by_page(service):
+    jobs, page = [], 1
+    while True:
+        results = service.list_jobs(page=page, items=ITEMS)
+        jobs.extend(results)
+        if len(results) < ITEMS:
+            return jobs
+        page += 1
+
+
+def main():
+    with StandInServer({NAMESPACE + "/jobs": jobs_route}) as server:
+        service = make_service(server.backend)
+        for label, scan in [
+            ("list_jobs loop", page_by_page),
+            ("iter_jobs", lambda s: list(s.iter_jobs(items=ITEMS))),
+            ("fetch_all x4",
+             lambda s: s.fetch_all_jobs(items=ITEMS, concurrency=4)),
+            ("fetch_all x8",
+             lambda s: s.fetch_all_jobs(items=ITEMS, concurrency=8)),
+        ]:
+            requests = server.request_count
+            start = time.time()
+            jobs = scan(service)
+            print("{label:>16}: {seconds:6.3f} s, {count} jobs, {requests} requests".
+                  format(label=label,
+                         seconds=time.time() - start,
+                         count=len(jobs),
+                         requests=server.request_count - requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Time to the first job, total time and peak memory of summing the runtime of a page of
+1000 jobs, with JobsService.list_jobs reading the whole response first and with
+list_jobs(stream=True) converting each job as it is received.
+
+Run with ``python -m benchmarks.bench_streaming`` from the repository root.
+"""
+import time
+import tracemalloc
+
+from .bench_pagination import make_service
+from .payloads import job_dict
+from tests.stand_in_server import NAMESPACE, StandInServer, json_route
+
+JOBS = 1000
+HISTORY_LENGTH = 20
+REPEAT = 5
+
+
+def total_runtime(service, stream):
+    start = time.perf_counter()
+    first = None
+    total = 0
+    for job in service.list_jobs(items=JOBS, stream=stream):
+        if first is None:
+            first = time.perf_counter() - start
+        total += job.total_runtime
+    return first, time.perf_counter() - start
+
+
+def peak_bytes(service, stream):
+    tracemalloc.start()
+    total_runtime(service, stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    payload = {
+        "jobs": [
+            job_dict(i, history_length=HISTORY_LENGTH) for i in range(JOBS)
+        ]
+    }
+    with StandInServer({NAMESPACE + "/jobs": json_route(payload)}) as server:
+        service = make_service(server.backend)
+        print("{jobs} jobs with {history} status history entries".format(
+            jobs=JOBS, history=HISTORY_LENGTH))
+        for label, stream in [("list_jobs", False), ("stream=True", True)]:
+            runs = [total_runtime(service, stream) for _ in range(REPEAT)]
+            first = min(run[0] for run in runs)
+            total = min(run[1] for run in runs)
+            peak = peak_bytes(service, stream)
+            print("{label:>12}: first job {first:7.1f} ms, all jobs {total:7.1f} ms, "
+                  "peak {peak:6.1f} MiB".format(label=label,
+                                                first=first * 1000,
+                                                total=total * 1000,
+                                                peak=peak / 1048576.0))
+
+
+if __name__ == "__main__":
+    main()
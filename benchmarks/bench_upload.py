@@ -0,0 +1,73 @@
+"""
+Wall time and peak Python memory of MissionsService.upload for a directory of files,
+sequential versus concurrent. The peak includes the stand-in server, which buffers
+every request body it receives.
+
+Run with ``python -m benchmarks.bench_upload`` from the repository root.
+"""
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from galileo_sdk.business.services.missions import MissionsService
+from galileo_sdk.compat import mock
+from galileo_sdk.data.providers.session import SessionProvider
+from galileo_sdk.data.repositories.missions import MissionsRepository
+
+from tests.stand_in_server import NAMESPACE, StandInServer
+
+FILES = 64
+FILE_SIZE = 1024 * 1024
+LATENCY = 0.01  # Seconds the stand-in backend spends on every upload
+
+
+def upload_route(handler):
+    time.sleep(LATENCY)
+    return 200, {"Content-Type": "application/json"}, b"true"
+
+
+def make_files(directory):
+    chunk = os.urandom(FILE_SIZE)
+    for i in range(FILES):
+        with open(os.path.join(directory, "input{i:03d}.bin".format(i=i)),
+                  "wb") as f:
+            f.write(chunk)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    make_files(directory)
+    routes = {NAMESPACE + "/projects/mission/files": upload_route}
+    try:
+        with StandInServer(routes) as server:
+            settings_repo = mock.Mock()
+            settings_repo.get_settings().backend = server.backend
+            settings_repo.get_settings().universe = None
+            auth_provider = mock.Mock()
+            auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+            repo = MissionsRepository(settings_repo, auth_provider, NAMESPACE,
+                                      SessionProvider(pool_maxsize=16))
+            service = MissionsService(repo)
+            for concurrency in [1, 4, 8]:
+                tracemalloc.start()
+                start = time.time()
+                report = service.upload("mission",
+                                        directory,
+                                        concurrency=concurrency)
+                seconds = time.time() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    "concurrency {concurrency}: {seconds:6.3f} s, peak {peak:7.1f} KiB, {report}"
+                    .format(concurrency=concurrency,
+                            seconds=seconds,
+                            peak=peak / 1024.0,
+                            report=report))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
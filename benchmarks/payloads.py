@@ -0,0 +1,101 @@
+"""
+Synthetic API payloads shaped like the Galileo backend responses.
+"""
+import time
+
+STATUSES = [
+    "uploaded", "submitted", "downloaded", "building_image", "built_image",
+    "building_container", "built_container", "start_requested", "started",
+    "running", "collecting_results", "posting_results", "results_posted",
+    "completed"
+]
+
+
+def job_dict(index, history_length=20, now=None):
+    now = now or int(time.time())
+    job_id = "job-{index:08d}".format(index=index)
+    return {
+        "jobid": job_id,
+        "receiverid": "lz-{index:04d}".format(index=index % 64),
+        "project_id": "mission-{index:04d}".format(index=index % 256),
+        "mission_id": "mission-{index:04d}".format(index=index % 256),
+        "time_created": now - 3600,
+        "last_updated": now,
+        "status": STATUSES[index % len(STATUSES)],
+        "cpu_count": 4,
+        "gpu_count": 0,
+        "memory_amount": 4096,
+        "enable_tunnel": False,
+        "tunnel_port": None,
+        "tunnel_url": None,
+        "name": "job {index}".format(index=index),
+        "stationid": "station-{index:02d}".format(index=index % 8),
+        "userid": "user-0001",
+        "state": "running",
+        "pay_status": "current",
+        "pay_interval": 0,
+        "total_runtime": 1800 + index % 600,
+        "archived": False,
+        "status_history": [{
+            "jobstatusid": "{job_id}-{n}".format(job_id=job_id, n=n),
+            "jobid": job_id,
+            "timestamp": now - 3600 + n * 60,
+            "status": STATUSES[n % len(STATUSES)],
+        } for n in range(history_length)],
+    }
+
+
+def lz_dict(index):
+    return {
+        "name": "lz {index}".format(index=index),
+        "userid": "user-0001",
+        "status": "online" if index % 3 else "offline",
+        "mid": "lz-{index:04d}".format(index=index),
+        "gpu_count": index % 2,
+        "cpu_count": 16,
+        "operating_system": "linux",
+        "arch": "x86_64",
+        "memory_amount": 65536,
+        "memory": "64GB",
+        "job_runner": "docker",
+        "container_technology": "docker",
+    }
+
+
+def station_dict(index, user_count=20, volume_count=5):
+    station_id = "station-{index:02d}".format(index=index)
+    return {
+        "stationid": station_id,
+        "name": "station {index}".format(index=index),
+        "description": "benchmark station",
+        "users": [{
+            "stationuserid": "{station_id}-u{n}".format(station_id=station_id,
+                                                        n=n),
+            "userid": "user-{n:04d}".format(n=n),
+            "status": "MEMBER",
+        } for n in range(user_count)],
+        "mids": ["lz-{n:04d}".format(n=n) for n in range(8)],
+        "volumes": [{
+            "volumeid": "{station_id}-v{n}".format(station_id=station_id, n=n),
+            "name": "volume {n}".format(n=n),
+            "mount_point": "/mnt/{n}".format(n=n),
+            "stationid": station_id,
+            "access": "rw",
+            "host_paths": [{
+                "volumehostpathid": "hp-{n}".format(n=n),
+                "mid": "lz-0000",
+                "host_path": "/data/{n}".format(n=n),
+            }],
+        } for n in range(volume_count)],
+    }
+
+
+def file_dict(index):
+    return {
+        "filename": "file-{index:06d}.dat".format(index=index),
+        "path": "/inputs",
+        "modification_date": 1600000000 + index,
+        "creation_date": 1600000000,
+        "file_size": 1024 * (index % 97 + 1),
+        "nonce": None,
+    }
@@ -1,10 +1,14 @@
 from .galileo_sdk import GalileoSdk
 from .sdk import AuthSdk
+from .data import ResponseCache, SessionProvider
 from .business.objects import (
+    EventEmitterMetrics,
     EJobRunningStatus,
     EJobStatus,
+    TERMINAL_JOB_STATUSES,
     EPaymentStatus,
     Job,
+    JobEvent,
     JobLauncherResultsDownloadedEvent,
     JobLauncherUpdatedEvent,
     JobLauncherSubmittedEvent,
@@ -17,14 +21,21 @@ from .business.objects import (
     TopDetails,
     TopProcess,
     JobsEvents,
+    FileDownloadResult,
+    DownloadReport,
     UpdateMissionRequest,
     CreateMissionRequest,
     FileListing,
     DirectoryListing,
+    FileUploadResult,
+    UploadReport,
+    SyncReport,
     CargoBay,
     Universe,
     Mission,
     MissionType,
+    JobTable,
+    MissionTable,
     ELzStatus,
     Lz,
     LzStatusUpdateEvent,
@@ -85,3 +96,9 @@ from .business.objects import (
     AutoscaleSettings,
     StationRole,
 )
+
+import sys
+
+if sys.version_info[0] == 3:
+    from .async_galileo_sdk import AsyncGalileoSdk
+    from .data import EOverflowPolicy, EventStream
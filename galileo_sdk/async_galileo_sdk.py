@@ -0,0 +1,227 @@
+from .business import (
+    UniversesService,
+    CargoBaysService,
+    LogService,
+)
+from .business.services.aio import (
+    AsyncJobsService,
+    AsyncLzService,
+    AsyncMissionsService,
+    AsyncProfilesService,
+    AsyncStationsService,
+)
+from .data import AsyncGalileoConnector, GalileoConnector, IdentityCache
+from .data.providers.async_session import AsyncSessionProvider
+from .data.repositories.aio import (
+    AsyncUniversesRepository,
+    AsyncCargoBaysRepository,
+    AsyncJobsRepository,
+    AsyncLzRepository,
+    AsyncProfilesRepository,
+    AsyncMissionsRepository,
+    AsyncStationsRepository,
+)
+from .galileo_sdk import (
+    NAMESPACE,
+    create_auth_provider,
+    create_settings_repository,
+)
+from .sdk import (
+    UniversesSdk,
+    CargoBaysSdk,
+    JobsSdk,
+    ProfilesSdk,
+)
+from .sdk.aio import AsyncLzSdk, AsyncMissionsSdk, AsyncStationsSdk
+
+
+class AsyncGalileoSdk:
+    def __init__(
+        self,
+        auth_token=None,
+        refresh_token=None,
+        username=None,
+        password=None,
+        config=None,
+        session_provider=None,
+        identity_ttl=300,
+        response_cache=None,
+        event_executor=None,
+        on_event_error=None,
+        job_events_window=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio Galileo SDK object. It exposes the same API as GalileoSdk, but every call to
+        the backend is a coroutine running over a pooled aiohttp session, so many requests
+        can be in flight at once. The iter_* methods return asynchronous iterators, read them
+        with async for.
+
+        Requires aiohttp: pip install galileo_sdk[async]
+
+        Example:
+            >>> async with AsyncGalileoSdk(username="user", password="pass") as galileo:
+            >>>     jobs, stations = await asyncio.gather(galileo.jobs.list_jobs(), galileo.stations.list_stations())
+            >>>     async for lz in galileo.lz.iter_lz(items=100):
+            >>>         print(lz.name)
+
+        :param auth_token: authentication token
+        :param refresh_token: refresh token
+        :param username: Galileo username
+        :param password: Galileo password
+        :param config: production or development
+        :param session_provider: pooled aiohttp session settings shared by every API, defaults to AsyncSessionProvider()
+        :param identity_ttl: seconds your profile is cached for, 0 fetches it on every call, defaults to 300
+        :param response_cache: opt-in cache of read-mostly endpoints such as mission types and station roles, e.g. ResponseCache(), defaults to None
+        :param event_executor: executor running your event callbacks, e.g. ThreadPoolExecutor(4), so slow callbacks do not hold up the connection; events of one job stay in order, defaults to None to run them on the connection's thread
+        :param on_event_error: called with the exception, the event name and the handler when an event callback fails, defaults to None to log it
+        :param job_events_window: seconds job_launcher_updated and station_job_updated events are held for, only the latest event of each job in the window is delivered, defaults to None to deliver every event
+        :param json_decoder: function decoding the JSON responses from bytes, such as json.loads, defaults to None to use orjson or ujson when installed
+        """
+        self.log = LogService()
+
+        self._settings = create_settings_repository(config)
+        settings = self._settings.get_settings()
+        self.backend = settings.backend
+
+        self._auth_provider = create_auth_provider(self._settings, auth_token,
+                                                   refresh_token, username,
+                                                   password)
+
+        # Set up the connection pool shared by every repository
+        if session_provider is None:
+            session_provider = AsyncSessionProvider()
+        self._session_provider = session_provider
+
+        # Your profile is looked up by every call listing your own jobs
+        self._identity_cache = IdentityCache(ttl=identity_ttl)
+
+        self._response_cache = response_cache
+        self._json_decoder = json_decoder
+
+        # Set up feature repositories
+        self._universes_repo = AsyncUniversesRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._cargo_bays_repo = AsyncCargoBaysRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._jobs_repo = AsyncJobsRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._stations_repo = AsyncStationsRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._profiles_repo = AsyncProfilesRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            self._identity_cache,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._lz_repo = AsyncLzRepository(self._settings,
+                                          self._auth_provider,
+                                          NAMESPACE,
+                                          self._session_provider,
+                                          response_cache=self._response_cache,
+                                          json_decoder=self._json_decoder)
+        self._missions_repo = AsyncMissionsRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+
+        # set up feature services
+        self._universes_service = UniversesService(self._universes_repo)
+        self._cargobays_service = CargoBaysService(self._cargo_bays_repo)
+        self._jobs_service = AsyncJobsService(self._jobs_repo,
+                                              self._profiles_repo)
+        self._stations_service = AsyncStationsService(self._stations_repo)
+        self._profiles_service = AsyncProfilesService(self._profiles_repo)
+        self._lz_service = AsyncLzService(self._lz_repo)
+        self._missions_service = AsyncMissionsService(self._missions_repo)
+
+        # set up feature SDKs
+        self.universes = UniversesSdk(self._universes_service)
+        self.cargobays = CargoBaysSdk(self._cargobays_service)
+        self.profiles = ProfilesSdk(self._profiles_service)
+        self.missions = AsyncMissionsSdk(self._missions_service)
+
+        # Event callbacks are delivered by the Socket.IO client thread, event
+        # streams by an asyncio connection on the event loop
+        connector = GalileoConnector(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            executor=event_executor,
+            on_error=on_event_error,
+            job_events_window=job_events_window,
+        )
+        self._stream_connector = AsyncGalileoConnector(
+            self._settings, self._auth_provider, NAMESPACE)
+
+        self.jobs = JobsSdk(self._jobs_service,
+                            connector,
+                            stream_connector=self._stream_connector)
+        self.stations = AsyncStationsSdk(
+            self._stations_service,
+            connector,
+            stream_connector=self._stream_connector)
+        self.lz = AsyncLzSdk(self._lz_service,
+                             connector,
+                             stream_connector=self._stream_connector)
+
+    async def close(self):
+        """
+        Call close before your application or script ends.
+        :return: None
+        """
+        self.jobs.disconnect()
+        self.stations.disconnect()
+        self.lz.disconnect()
+        await self._stream_connector.disconnect()
+        await self._session_provider.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def update_auth_token(self, auth_token):
+        """
+
+        :param auth_token: str, new auth_token
+        :return: None
+        """
+        self._auth_provider.set_access_token(auth_token)
+        self._identity_cache.invalidate()
+
+    def set_universe(self, universe_id):
+        """
+        Call this function to set your Galileo Universe context. The Hypernet Labs Universe is the
+        default operating Universe if nothing is set.
+
+        :param universe_id: str, the uuid of the universe you want to operate in (default is Hypernet Labs)
+        :return: None
+        """
+        self._settings.get_settings().universe = universe_id
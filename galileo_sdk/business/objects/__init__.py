@@ -1,10 +1,16 @@
-from galileo_sdk.business.objects.event import EventEmitter
+from galileo_sdk.business.objects.event import (
+    EventEmitter,
+    EventEmitterMetrics,
+    event_key,
+)
 
 from galileo_sdk.business.objects.jobs import (
     EJobRunningStatus,
     EJobStatus,
+    TERMINAL_JOB_STATUSES,
     EPaymentStatus,
     Job,
+    JobEvent,
     JobLauncherResultsDownloadedEvent,
     JobLauncherUpdatedEvent,
     JobLauncherSubmittedEvent,
@@ -17,6 +23,8 @@ from galileo_sdk.business.objects.jobs import (
     TopDetails,
     TopProcess,
     JobsEvents,
+    FileDownloadResult,
+    DownloadReport,
 )
 
 from galileo_sdk.business.objects.universes import (Universe)
@@ -28,6 +36,9 @@ from galileo_sdk.business.objects.missions import (
     CreateMissionRequest,
     FileListing,
     DirectoryListing,
+    FileUploadResult,
+    UploadReport,
+    SyncReport,
     Mission,
     MissionType,
 )
@@ -97,3 +108,5 @@ from galileo_sdk.business.objects.stations import (
     AutoscaleSettings,
     StationRole,
 )
+
+from galileo_sdk.business.objects.tables import JobTable, MissionTable
@@ -1,4 +1,9 @@
-class CargoBay:
+from ...business.objects.slotted import SlottedObject
+
+
+class CargoBay(SlottedObject):
+    __slots__ = ("storage_id", "storage_type", "name", "creation_timestamp")
+
     def __init__(
         self,
         name,
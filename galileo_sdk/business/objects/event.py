@@ -1,14 +1,188 @@
+import collections
+import logging
+import threading
+import time
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
 
-class EventEmitter:
+# time.perf_counter is not available in Python 2
+_clock = getattr(time, "perf_counter", time.time)
+
+
+def event_key(event):
+    """
+    Default ordering key: events about the same job, or about the same landing zone, share a
+    key. Other events have no key.
+
+    :param event: Typed event
+    :return: Key of the event, None if it has none
+    """
+    # Job events read the id without converting the job
+    job_id = getattr(event, "job_id", None)
+    if job_id is not None:
+        return "job", job_id
+    job = getattr(event, "job", None)
+    if job is not None:
+        return "job", job.job_id
+    lz = getattr(event, "lz", None)
+    if lz is not None:
+        return "lz", lz.lz_id
+    lz_id = getattr(event, "lz_id", None)
+    if lz_id is not None:
+        return "lz", lz_id
+    return None
+
+
+class EventEmitterMetrics:
     def __init__(self):
+        """
+        Counters of an EventEmitter. Latencies are in seconds.
+        """
+        # Events waiting for a worker, and the most there ever were
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.events = 0
+        self.errors = 0
+        self.handler_calls = 0
+        self.handler_time = 0.0
+        self.max_handler_time = 0.0
+
+    @property
+    def mean_handler_time(self):
+        if not self.handler_calls:
+            return 0.0
+        return self.handler_time / self.handler_calls
+
+    def __repr__(self):
+        return ("EventEmitterMetrics(queue_depth={queue_depth}, events={events}, "
+                "errors={errors}, mean_handler_time={mean:.6f})").format(
+                    queue_depth=self.queue_depth,
+                    events=self.events,
+                    errors=self.errors,
+                    mean=self.mean_handler_time,
+                )
+
+
+class EventEmitter:
+    def __init__(self, executor=None, key=event_key, on_error=None):
+        """
+        Calls the handlers registered for an event. Without an executor the handlers run on the
+        emitting thread. With an executor events run on its workers: events with the same key
+        are delivered one at a time in the order they were emitted, events with different keys
+        run in parallel. Events without a key are kept in order with each other.
+
+        A handler raising an exception does not stop the other handlers, the exception is passed
+        to on_error, or logged if there is none.
+
+        :param executor: Executor running the handlers, defaults to None
+        :type executor: concurrent.futures.Executor, optional
+        :param key: Ordering key of an event, defaults to the job or landing zone id
+        :type key: Callable[[object], Hashable], optional
+        :param on_error: Called with the exception, the event name and the handler, defaults to None
+        :type on_error: Callable[[Exception, str, Callable], None], optional
+        """
         self._registered_listeners = defaultdict(list)
+        self._executor = executor
+        self._key = key
+        self._on_error = on_error
+        self.metrics = EventEmitterMetrics()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # Events of each key, the first one is being handled
+        self._lanes = {}
 
     def on(self, event_name, handler):
         self._registered_listeners[event_name].append(handler)
 
+    def off(self, event_name, handler):
+        if handler in self._registered_listeners[event_name]:
+            self._registered_listeners[event_name].remove(handler)
+
     def emit(self, event_name, *args, **kwargs):
-        handlers = self._registered_listeners[event_name]
+        handlers = list(self._registered_listeners[event_name])
+        if self._executor is None:
+            with self._lock:
+                self.metrics.events += 1
+            self._dispatch(event_name, handlers, args, kwargs)
+            return
+
+        key = self._key(args[0]) if self._key and args else None
+        with self._lock:
+            self.metrics.events += 1
+            self.metrics.queue_depth += 1
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth,
+                                               self.metrics.queue_depth)
+            item = (event_name, handlers, args, kwargs)
+            if key in self._lanes:
+                self._lanes[key].append(item)
+                return
+            self._lanes[key] = collections.deque([item])
+        try:
+            self._executor.submit(self._drain, key)
+        except RuntimeError:
+            # The executor was shut down, handle the events on this thread
+            self._drain(key)
+
+    def _drain(self, key):
+        while True:
+            with self._lock:
+                lane = self._lanes[key]
+                if not lane:
+                    del self._lanes[key]
+                    if not self._lanes:
+                        self._idle.notify_all()
+                    return
+                event_name, handlers, args, kwargs = lane[0]
+                self.metrics.queue_depth -= 1
+            self._dispatch(event_name, handlers, args, kwargs)
+            with self._lock:
+                lane.popleft()
+
+    def _dispatch(self, event_name, handlers, args, kwargs):
         for handler in handlers:
-            handler(*args, **kwargs)
+            start = _clock()
+            try:
+                handler(*args, **kwargs)
+            except Exception as e:
+                self._record(_clock() - start, error=True)
+                self._error(e, event_name, handler)
+            else:
+                self._record(_clock() - start)
+
+    def _record(self, elapsed, error=False):
+        with self._lock:
+            self.metrics.handler_calls += 1
+            self.metrics.handler_time += elapsed
+            self.metrics.max_handler_time = max(self.metrics.max_handler_time,
+                                                elapsed)
+            if error:
+                self.metrics.errors += 1
+
+    def _error(self, error, event_name, handler):
+        # Called while handling the exception, so it is logged with its traceback
+        if self._on_error is None:
+            logger.exception("Handler of %s failed", event_name)
+            return
+        try:
+            self._on_error(error, event_name, handler)
+        except Exception:
+            logger.exception("Error callback of %s failed", event_name)
+
+    def join(self, timeout=None):
+        """
+        Wait until every emitted event was handled
+
+        :param timeout: Seconds to wait, defaults to None to wait forever
+        :type timeout: float, optional
+        :return: True if every event was handled
+        :rtype: bool
+        """
+        deadline = None if timeout is None else _clock() + timeout
+        with self._lock:
+            while self._lanes:
+                remaining = None if deadline is None else deadline - _clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
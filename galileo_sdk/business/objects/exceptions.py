@@ -2,3 +2,9 @@ class JobsException(Exception):
     def __init__(self, job_id, msg=None):
         self.job_id = job_id
         super().__init__(msg)
+
+
+class DownloadException(Exception):
+    def __init__(self, path, msg=None):
+        self.path = path
+        super().__init__(msg)
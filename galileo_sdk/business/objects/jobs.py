@@ -1,6 +1,9 @@
 import enum
+import threading
+from collections import OrderedDict
 
 from galileo_sdk.business.objects import EventEmitter
+from galileo_sdk.business.objects.slotted import SlottedObject
 
 
 class EJobStatus(enum.Enum):
@@ -32,6 +35,17 @@ class EJobStatus(enum.Enum):
     kill_requested = 25
 
 
+# Statuses a job does not leave
+TERMINAL_JOB_STATUSES = frozenset([
+    EJobStatus.completed,
+    EJobStatus.terminated,
+    EJobStatus.stopped,
+    EJobStatus.removed_by_host,
+    EJobStatus.error,
+    EJobStatus.build_error,
+])
+
+
 class EJobRunningStatus(enum.Enum):
     not_running = 0  # job isn't running
     running = 1  # job is running
@@ -67,10 +81,12 @@ class UpdateJobRequest:
         return "Update Job Request Object"
 
 
-class JobStatus:
+class JobStatus(SlottedObject):
     """
     A class representing a Job Status
     """
+    __slots__ = ("jobstatusid", "jobid", "timestamp", "status")
+
     def __init__(
         self,
         timestamp,
@@ -104,10 +120,36 @@ class JobStatus:
         )
 
 
-class Job:
+class Job(SlottedObject):
     """
     Job Object 
     """
+    __slots__ = (
+        "job_id",
+        "receiver_id",
+        "mission_id",
+        "time_created",
+        "last_updated",
+        "status",
+        "cpu_count",
+        "gpu_count",
+        "memory_amount",
+        "enable_tunnel",
+        "tunnel_port",
+        "tunnel_url",
+        "name",
+        "station_id",
+        "user_id",
+        "state",
+        "pay_status",
+        "pay_interval",
+        "total_runtime",
+        "archived",
+        "_status_history",
+        "_status_history_dicts",
+        "_job_status_loader",
+    )
+
     def __init__(
         self,
         job_id,
@@ -131,6 +173,8 @@ class Job:
         total_runtime=None,
         archived=False,
         status_history=None,
+        status_history_dicts=None,
+        job_status_loader=None,
     ):
         """
         
@@ -155,6 +199,8 @@ class Job:
         :param total_runtime: Total Job runtime in seconds
         :param archived: Boolean indicating if job is archived 
         :param status_history: Dictionary of Job status and time stamp history
+        :param status_history_dicts: Job status dictionaries, converted by job_status_loader when status_history is first read
+        :param job_status_loader: Function converting a job status dictionary to a JobStatus
         """
         self.job_id = job_id
         self.receiver_id = receiver_id
@@ -175,9 +221,27 @@ class Job:
         self.pay_status = pay_status
         self.pay_interval = pay_interval
         self.total_runtime = total_runtime
-        self.status_history = status_history
+        self._status_history = status_history
+        self._status_history_dicts = status_history_dicts
+        self._job_status_loader = job_status_loader
         self.archived = archived
 
+    @property
+    def status_history(self):
+        if (self._status_history is None
+                and self._status_history_dicts is not None):
+            self._status_history = [
+                self._job_status_loader(job_status)
+                for job_status in self._status_history_dicts
+            ]
+            self._status_history_dicts = None
+        return self._status_history
+
+    @status_history.setter
+    def status_history(self, status_history):
+        self._status_history = status_history
+        self._status_history_dicts = None
+
     def __str__(self):
         return "Job: job_id: {job_id}, mission_id: {mission_id}".format(
             job_id=self.job_id,
@@ -188,10 +252,120 @@ class Job:
         return "Job Object"
 
 
+class FileDownloadResult:
+    """
+    Outcome of the download of a single results file
+    """
+    def __init__(self,
+                 filename,
+                 local_path,
+                 success,
+                 error=None,
+                 extracted_path=None):
+        """
+        :param filename: Name of the results file
+        :type filename: str
+
+        :param local_path: Path of the downloaded file on disk
+        :type local_path: str
+
+        :param success: True if the file was downloaded
+        :type success: bool
+
+        :param error: Error raised by the download or the extraction, None on success
+        :type error: Exception
+
+        :param extracted_path: Folder the archive was extracted to, None if it was not extracted
+        :type extracted_path: str
+        """
+        self.filename = filename
+        self.local_path = local_path
+        self.success = success
+        self.error = error
+        self.extracted_path = extracted_path
+
+    def __str__(self):
+        return "FileDownloadResult: {filename} {status}".format(
+            filename=self.filename,
+            status="downloaded" if self.success else "failed ({error})".format(
+                error=self.error))
+
+    def __repr__(self):
+        return str(self)
+
+
+class DownloadReport(list):
+    """
+    Paths of the downloaded results files, with the outcome of every file. It is a list of
+    the paths that were downloaded, so it can be used wherever a list of paths is expected.
+    """
+    def __init__(self, job_id, results=None):
+        """
+        :param job_id: UUID of the Job the results belong to
+        :type job_id: str
+
+        :param results: Outcome of each file
+        :type results: List[FileDownloadResult]
+        """
+        self.job_id = job_id
+        self.results = results or []
+        super(DownloadReport, self).__init__(
+            result.local_path for result in self.succeeded)
+
+    @property
+    def succeeded(self):
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self):
+        return [result for result in self.results if not result.success]
+
+
+class JobEvent(object):
+    """
+    Event carrying a Job. It can be created from the job dictionary of the event and the
+    function converting it, the Job is then only converted when event.job is first read.
+    """
+    def __init__(self, job=None, job_dict=None, loader=None):
+        """
+        :param job: Job of the event
+        :type job: Job
+
+        :param job_dict: Job dictionary of the event, converted by loader when job is read
+        :type job_dict: Dict
+
+        :param loader: Function converting job_dict to a Job
+        :type loader: Callable[[Dict], Job]
+        """
+        self._job = job
+        self._job_dict = job_dict
+        self._loader = loader
+
+    @property
+    def job(self):
+        if self._job is None and self._job_dict is not None:
+            self._job = self._loader(self._job_dict)
+            self._job_dict = None
+        return self._job
+
+    @job.setter
+    def job(self, job):
+        self._job = job
+        self._job_dict = None
+
+    @property
+    def job_id(self):
+        """
+        UUID of the job, read without converting the job dictionary
+        """
+        if self._job_dict is not None:
+            return self._job_dict["jobid"]
+        return None if self._job is None else self._job.job_id
+
+
 #TODO: Add Docstring to class
-class JobLauncherUpdatedEvent:
-    def __init__(self, job):
-        self.job = job
+class JobLauncherUpdatedEvent(JobEvent):
+    pass
 
 
 #TODO: Add Docstring to class
@@ -202,9 +376,8 @@ class JobLauncherResultsDownloadedEvent:
 
 
 #TODO: Add Docstring to class
-class StationJobUpdatedEvent:
-    def __init__(self, job):
-        self.job = job
+class StationJobUpdatedEvent(JobEvent):
+    pass
 
 
 #TODO: Add Docstring to class
@@ -222,34 +395,87 @@ class JobLogEvent:
 
 
 #TODO: Add Docstring to class
-class JobLauncherSubmittedEvent:
-    def __init__(self, job):
-        self.job = job
+class JobLauncherSubmittedEvent(JobEvent):
+    pass
 
 
 #TODO: Add Docstring to class
-class TopDetails:
+class TopDetails(SlottedObject):
+    __slots__ = ("title", "detail")
+
     def __init__(self, title, detail):
         self.title = title
         self.detail = detail
 
 
 #TODO: Add Docstring to class
-class TopProcess:
+class TopProcess(SlottedObject):
+    __slots__ = ("items",)
+
     def __init__(self, items):
         self.items = items
 
 
 #TODO: Add Docstring to class
 class JobsEvents:
-    def __init__(self):
-        self._events = EventEmitter()
+    def __init__(self, emitter=None, coalesce_window=None):
+        """
+        :param emitter: Emitter calling the handlers, defaults to EventEmitter()
+        :type emitter: EventEmitter
+
+        :param coalesce_window: Seconds job_launcher_updated and station_job_updated events are
+            held for, only the latest event of each job is delivered at the end of the window,
+            defaults to None to deliver every event
+        :type coalesce_window: float
+        """
+        self._events = emitter if emitter is not None else EventEmitter()
+        self.coalesce_window = coalesce_window
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        # Latest event of each (event name, job id) in the current window
+        self._pending = OrderedDict()
+        self._timer = None
+
+    @property
+    def metrics(self):
+        return self._events.metrics
+
+    def _coalesce(self, event_name, event):
+        if not self.coalesce_window:
+            self._events.emit(event_name, event)
+            return
+        with self._lock:
+            key = (event_name, event.job_id)
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = event
+            if self._timer is None:
+                self._timer = threading.Timer(self.coalesce_window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """
+        Deliver the events held by the coalescing window now
+
+        :return: None
+        """
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for (event_name, job_id), event in pending.items():
+            self._events.emit(event_name, event)
 
     def on_job_launcher_updated(self, func):
         self._events.on("job_launcher_updated", func)
 
+    def off_job_launcher_updated(self, func):
+        self._events.off("job_launcher_updated", func)
+
     def job_launcher_updated(self, event):
-        self._events.emit("job_launcher_updated", event)
+        self._coalesce("job_launcher_updated", event)
 
     def on_job_launcher_results_downloaded(self, func):
         self._events.on("job_launcher_results_downloaded", func)
@@ -260,8 +486,11 @@ class JobsEvents:
     def on_station_job_updated(self, func):
         self._events.on("station_job_updated", func)
 
+    def off_station_job_updated(self, func):
+        self._events.off("station_job_updated", func)
+
     def station_job_updated(self, event):
-        self._events.emit("station_job_updated", event)
+        self._coalesce("station_job_updated", event)
 
     def on_job_top(self, func):
         self._events.on("top", func)
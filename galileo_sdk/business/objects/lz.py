@@ -1,6 +1,7 @@
 import enum
 
 from ...business.objects.event import EventEmitter
+from ...business.objects.slotted import SlottedObject
 
 
 class ELzStatus(enum.Enum):
@@ -9,7 +10,22 @@ class ELzStatus(enum.Enum):
     default = offline
 
 
-class Lz:
+class Lz(SlottedObject):
+    __slots__ = (
+        "lz_id",
+        "name",
+        "userid",
+        "status",
+        "gpu_count",
+        "cpu_count",
+        "operating_system",
+        "job_runner",
+        "arch",
+        "memory",
+        "memory_amount",
+        "container_technology",
+    )
+
     def __init__(
         self,
         name,
@@ -102,8 +118,12 @@ class UpdateLzRequest:
 
 
 class LzEvents:
-    def __init__(self):
-        self._events = EventEmitter()
+    def __init__(self, emitter=None):
+        self._events = emitter if emitter is not None else EventEmitter()
+
+    @property
+    def metrics(self):
+        return self._events.metrics
 
     def on_lz_status_update(self, func):
         self._events.on("machine/status_updated", func)
@@ -1,4 +1,18 @@
-class FileListing:
+from ...business.objects.slotted import SlottedObject
+
+
+class FileListing(SlottedObject):
+    __slots__ = (
+        "filename",
+        "path",
+        "modification_date",
+        "modification_timestamp",
+        "creation_date",
+        "creation_timestamp",
+        "file_size",
+        "nonce",
+    )
+
     def __init__(
         self,
         filename,
@@ -35,7 +49,9 @@ class FileListing:
         return str(self)
 
 
-class DirectoryListing:
+class DirectoryListing(SlottedObject):
+    __slots__ = ("storage_id", "path", "listings")
+
     def __init__(
         self,
         storage_id,
@@ -47,7 +63,119 @@ class DirectoryListing:
         self.listings = listings
 
 
-class Mission:
+class FileUploadResult:
+    def __init__(self, filename, local_path, size, success, error=None):
+        """
+        Outcome of the upload of a single file
+
+        :param filename: Path of the file in the Mission file tree
+        :param local_path: Path of the uploaded file on disk
+        :param size: Size in bytes of the file
+        :param success: True if the file was uploaded
+        :param error: Error raised by the upload, None on success
+        """
+        self.filename = filename
+        self.local_path = local_path
+        self.size = size
+        self.success = success
+        self.error = error
+
+    def __str__(self):
+        return 'FileUploadResult: {filename} {status}'.format(
+            filename=self.filename,
+            status="uploaded" if self.success else "failed ({error})".format(
+                error=self.error))
+
+    def __repr__(self):
+        return str(self)
+
+
+class UploadReport:
+    def __init__(self, mission_id, results=None, error=None):
+        """
+        Per-file report of an upload to a Mission. A report is truthy only if every file was
+        uploaded, so it can be used wherever upload used to return a bool.
+
+        :param mission_id: UUID of the Mission the files were uploaded to
+        :param results: Outcome of each file (List[FileUploadResult])
+        :param error: Error that prevented the upload from starting, e.g. a missing payload
+        """
+        self.mission_id = mission_id
+        self.results = results or []
+        self.error = error
+
+    @property
+    def succeeded(self):
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self):
+        return [result for result in self.results if not result.success]
+
+    @property
+    def bytes_uploaded(self):
+        return sum(result.size for result in self.succeeded)
+
+    def __bool__(self):
+        return self.error is None and not self.failed
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        return 'UploadReport: {succeeded} uploaded, {failed} failed'.format(
+            succeeded=len(self.succeeded), failed=len(self.failed))
+
+    def __repr__(self):
+        return str(self)
+
+
+class SyncReport(UploadReport):
+    def __init__(self,
+                 mission_id,
+                 results=None,
+                 unchanged=None,
+                 deleted=None,
+                 error=None):
+        """
+        Report of a sync of a folder to a Mission. Only new or changed files are uploaded.
+
+        :param mission_id: UUID of the Mission the folder was synced to
+        :param results: Outcome of each uploaded file (List[FileUploadResult])
+        :param unchanged: Filenames skipped because they did not change since the last sync
+        :param deleted: Filenames deleted from the Mission because they are missing locally
+        :param error: Error that prevented the sync from starting, e.g. a missing folder
+        """
+        super(SyncReport, self).__init__(mission_id, results, error)
+        self.unchanged = unchanged or []
+        self.deleted = deleted or []
+
+    def __str__(self):
+        return 'SyncReport: {succeeded} uploaded, {failed} failed, {unchanged} unchanged, {deleted} deleted'.format(
+            succeeded=len(self.succeeded),
+            failed=len(self.failed),
+            unchanged=len(self.unchanged),
+            deleted=len(self.deleted))
+
+
+class Mission(SlottedObject):
+    __slots__ = (
+        "mission_id",
+        "name",
+        "description",
+        "source_storage_id",
+        "source_path",
+        "destination_storage_id",
+        "destination_path",
+        "user_id",
+        "creation_timestamp",
+        "mission_type_id",
+        "updated_timestamp",
+        "organization_id",
+        "settings",
+        "mission_type_name",
+        "public",
+    )
+
     def __init__(
             self,
             mission_id,
@@ -107,7 +235,31 @@ class Mission:
         return str(self)
 
 
-class MissionType:
+class MissionType(SlottedObject):
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "version",
+        "active",
+        "container_type",
+        "wizard_spec",
+        "enable_tunnels",
+        "generate_credentials",
+        "distributed",
+        "min_cpu_count",
+        "max_cpu_count",
+        "default_cpu_count",
+        "min_memory_amount",
+        "max_memory_amount",
+        "default_memory_amount",
+        "min_gpu_count",
+        "max_gpu_count",
+        "default_gpu_count",
+        "logo_url",
+        "credits_per_hour",
+    )
+
     def __init__(self,
                  id,
                  name,
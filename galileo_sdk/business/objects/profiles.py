@@ -1,4 +1,14 @@
-class ProfileCard:
+from ...business.objects.slotted import SlottedObject
+
+
+class ProfileCard(SlottedObject):
+    __slots__ = (
+        "id",
+        "user_id",
+        "stripe_payment_method_id",
+        "creation_timestamp",
+    )
+
     def __init__(self, id, user_id, stripe_payment_method_id,
                  creation_timestamp):
         """
@@ -25,7 +35,16 @@ class ProfileCard:
         return "Profile Card"
 
 
-class Profile:
+class Profile(SlottedObject):
+    __slots__ = (
+        "user_id",
+        "username",
+        "lz_ids",
+        "stripe_customer_id",
+        "pricing_tier_id",
+        "stored_cards",
+    )
+
     def __init__(
         self,
         user_id=None,
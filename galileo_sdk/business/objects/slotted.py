@@ -0,0 +1,46 @@
+class SlottedObject(object):
+    """
+    Base of the objects returned by the API. Subclasses declare their attributes in __slots__,
+    so instances hold no per-instance dictionary, and __dict__ and vars() are not available.
+    to_dict() returns the public attributes instead.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _slot_names(cls):
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in names:
+                    names.append(name)
+        return names
+
+    @classmethod
+    def _public_names(cls):
+        names = []
+        for name in cls._slot_names():
+            if not name.startswith("_"):
+                names.append(name)
+            elif isinstance(getattr(cls, name[1:], None), property):
+                names.append(name[1:])
+        return names
+
+    def to_dict(self):
+        """
+        Public attributes of the object. A private slot backing a property of the same name,
+        such as _status_history, is returned under the name of the property.
+
+        :return: Attribute names and values, a new dict at every call
+        :rtype: Dict[str, Any]
+        """
+        return dict((name, getattr(self, name))
+                    for name in self._public_names() if hasattr(self, name))
+
+    def __getstate__(self):
+        # The slots themselves, so lazy attributes are pickled unconverted
+        return dict((name, getattr(self, name))
+                    for name in self._slot_names() if hasattr(self, name))
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
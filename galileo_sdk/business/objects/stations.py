@@ -1,6 +1,7 @@
 import enum
 
 from ...business.objects.event import EventEmitter
+from ...business.objects.slotted import SlottedObject
 
 
 class UpdateStationRequest:
@@ -24,14 +25,25 @@ class EVolumeAccess(enum.Enum):
     READWRITE = "rw"
 
 
-class VolumeHostPath:
+class VolumeHostPath(SlottedObject):
+    __slots__ = ("volume_hostpath_id", "lz_id", "host_path")
+
     def __init__(self, volume_hostpath_id, lz_id, host_path):
         self.volume_hostpath_id = volume_hostpath_id
         self.lz_id = lz_id
         self.host_path = host_path
 
 
-class Volume:
+class Volume(SlottedObject):
+    __slots__ = (
+        "volume_id",
+        "station_id",
+        "name",
+        "mount_point",
+        "access",
+        "host_paths",
+    )
+
     def __init__(
         self,
         station_id,
@@ -60,7 +72,18 @@ class EStationUserRole(enum.Enum):
     BLOCKED = 5
 
 
-class StationUser:
+class StationUser(SlottedObject):
+    __slots__ = (
+        "stationuser_id",
+        "user_id",
+        "status",
+        "station_id",
+        "username",
+        "role_id",
+        "creation_timestamp",
+        "updated_timestamp",
+    )
+
     def __init__(
         self,
         stationuser_id,
@@ -82,7 +105,25 @@ class StationUser:
         self.updated_timestamp = updated_timestamp
 
 
-class PublicStation:
+class PublicStation(SlottedObject):
+    __slots__ = (
+        "station_id",
+        "name",
+        "description",
+        "creation_timestamp",
+        "updated_timestamp",
+        "public",
+        "allow_auto_join",
+        "allowed_mission_types",
+        "jobs_in_queue_count",
+        "member_count",
+        "lz_id_count",
+        "resource_policy",
+        "user_count",
+        "user_status",
+        "volume_count",
+    )
+
     def __init__(
         self,
         name,
@@ -145,7 +186,25 @@ class PublicStation:
         return self.__str__()
 
 
-class Station:
+class Station(SlottedObject):
+    __slots__ = (
+        "station_id",
+        "name",
+        "description",
+        "users",
+        "lz_ids",
+        "crew_ids",
+        "volumes",
+        "status",
+        "universe_id",
+        "creation_timestamp",
+        "updated_timestamp",
+        "autoscale_settings",
+        "machine_summaries",
+        "allow_auto_join",
+        "public",
+    )
+
     def __init__(
         self,
         station_id,
@@ -408,7 +467,34 @@ class StationMemberStationUpdated:
         self.station = station
 
 
-class ResourcePolicy:
+class ResourcePolicy(SlottedObject):
+    __slots__ = (
+        "id",
+        "max_cpu_per_job",
+        "max_memory_per_job",
+        "max_gpu_per_job",
+        "max_cpu_per_station",
+        "max_memory_per_station",
+        "max_gpu_per_station",
+        "max_cpu_global",
+        "max_memory_global",
+        "max_gpu_global",
+        "max_missions",
+        "max_users_in_station",
+        "max_stations",
+        "max_mission_types",
+        "max_cloud_storage_space",
+        "max_spend_per_day",
+        "max_spend_per_week",
+        "max_spend_per_month",
+        "max_spend_per_year",
+        "cpu_credits_per_hour",
+        "memory_credits_per_hour",
+        "gpu_credits_per_hour",
+        "creation_timestamp",
+        "updated_timestamp",
+    )
+
     def __init__(
         self,
         id,
@@ -851,7 +937,23 @@ class UpdateStationRoleRequest(CreateStationRoleRequest, object):
         ])
 
 
-class AutoscaleSettings:
+class AutoscaleSettings(SlottedObject):
+    __slots__ = (
+        "id",
+        "station_id",
+        "creation_timestamp",
+        "updated_timestamp",
+        "increment_amount",
+        "name_prefix",
+        "computer_provider_id",
+        "provision_count",
+        "provision_count_min",
+        "provision_count_max",
+        "usage_threshold_up",
+        "usage_threshold_down",
+        "status",
+    )
+
     def __init__(
         self,
         id,
@@ -913,7 +1015,45 @@ class AutoscaleSettings:
         self.status = status
 
 
-class StationRole:
+class StationRole(SlottedObject):
+    __slots__ = (
+        "id",
+        "station_id",
+        "creation_timestamp",
+        "updated_timestamp",
+        "name",
+        "description",
+        "role_type",
+        "protected_role",
+        "edit_station_roles",
+        "assign_user_roles",
+        "assign_protected_user_roles",
+        "launch_jobs",
+        "invite_users",
+        "remove_all_users",
+        "remove_invited_users",
+        "view_all_users",
+        "edit_metadata",
+        "add_lz",
+        "remove_any_lz",
+        "view_all_jobs",
+        "control_all_jobs",
+        "view_jobs_on_own_lzs",
+        "control_jobs_on_own_lzs",
+        "view_own_jobs",
+        "control_own_jobs",
+        "view_complete_activity",
+        "edit_station_policy",
+        "edit_own_lz_policy",
+        "edit_lz_policy",
+        "edit_user_policy",
+        "edit_job_resource_limits",
+        "manage_volumes",
+        "reject_user_requests",
+        "create_tunnels",
+        "allowed_mission_types",
+    )
+
     def __init__(
         self,
         id,
@@ -1071,8 +1211,12 @@ class StationRole:
 
 
 class StationsEvents:
-    def __init__(self):
-        self._event = EventEmitter()
+    def __init__(self, emitter=None):
+        self._event = emitter if emitter is not None else EventEmitter()
+
+    @property
+    def metrics(self):
+        return self._event.metrics
 
     def on_new_station(self, func):
         self._event.on("new_station", func)
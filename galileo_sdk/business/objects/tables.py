@@ -0,0 +1,287 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from .jobs import EJobStatus
+
+# Kinds of column, deciding the array a column is converted to
+VALUE = "value"  # Object array
+NUMBER = "number"  # float64, None becomes NaN
+EPOCH = "epoch"  # Seconds since the epoch, datetime64[ms]
+ISO = "iso"  # ISO 8601 string in UTC, datetime64[ms]
+CATEGORY = "category"  # int32 codes into the categories of the column, -1 for None
+
+
+def _require(module, name):
+    if module is None:
+        raise ImportError(
+            "Columnar results require {name}, install it with: pip install {name}"
+            .format(name=name))
+    return module
+
+
+def _value(entry, keys):
+    for key in keys:
+        if key in entry:
+            return entry[key]
+    return None
+
+
+def _iso(value):
+    if value is None:
+        return "NaT"
+    # datetime64 has no time zone, the UTC designator is dropped
+    for utc in ("Z", "+00:00"):
+        if value.endswith(utc):
+            return value[:-len(utc)]
+    return value
+
+
+class ColumnTable(object):
+    """
+    Columnar list result, built directly from the dictionaries of the response pages without
+    creating an object per row. Each column is a list, converted to NumPy arrays, a pandas
+    DataFrame or an Arrow table on demand. Timestamps become datetime64 vectors and category
+    columns hold integer codes into their categories, which are shared by every page.
+    """
+
+    # Name, keys looked up in the dictionary in order, and kind of each column
+    COLUMNS = ()
+    # Categories known in advance, so codes are stable across results
+    CATEGORIES = {}
+
+    def __init__(self):
+        self.columns = dict((name, []) for name, keys, kind in self.COLUMNS)
+        self.categories = dict((name, list(self.CATEGORIES.get(name, ())))
+                               for name, keys, kind in self.COLUMNS
+                               if kind == CATEGORY)
+        # Code of each category
+        self._codes = {}
+        for name, categories in self.categories.items():
+            self._codes[name] = dict(
+                (category, code) for code, category in enumerate(categories))
+
+    @classmethod
+    def from_dicts(cls, entries):
+        """
+        :param entries: Dictionaries of the response
+        :type entries: List[Dict]
+        :return: Table of the entries
+        :rtype: ColumnTable
+        """
+        table = cls()
+        table.extend(entries)
+        return table
+
+    @classmethod
+    def concat(cls, tables):
+        """
+        :param tables: Tables to put one after the other
+        :type tables: Iterable[ColumnTable]
+        :return: New table holding the rows of every table
+        :rtype: ColumnTable
+        """
+        result = cls()
+        for table in tables:
+            for name, keys, kind in cls.COLUMNS:
+                if kind == CATEGORY:
+                    # Codes of the table in the categories of the result
+                    codes = [
+                        result._code(name, category)
+                        for category in table.categories[name]
+                    ]
+                    result.columns[name].extend(
+                        -1 if code < 0 else codes[code]
+                        for code in table.columns[name])
+                else:
+                    result.columns[name].extend(table.columns[name])
+        return result
+
+    def _code(self, name, category):
+        codes = self._codes[name]
+        code = codes.get(category)
+        if code is None:
+            code = codes[category] = len(self.categories[name])
+            self.categories[name].append(category)
+        return code
+
+    def extend(self, entries):
+        """
+        Append the rows of response dictionaries
+
+        :param entries: Dictionaries of the response
+        :type entries: List[Dict]
+        :return: None
+        """
+        for name, keys, kind in self.COLUMNS:
+            values = [_value(entry, keys) for entry in entries]
+            if kind == CATEGORY:
+                values = [
+                    -1 if value is None else self._code(name, value)
+                    for value in values
+                ]
+            self.columns[name].extend(values)
+
+    def take(self, indices):
+        """
+        :param indices: Positions of the rows to keep
+        :type indices: Iterable[int]
+        :return: New table holding the rows at the positions
+        :rtype: ColumnTable
+        """
+        indices = list(indices)
+        result = type(self)()
+        result.categories = dict(
+            (name, list(categories))
+            for name, categories in self.categories.items())
+        result._codes = dict(
+            (name, dict(codes)) for name, codes in self._codes.items())
+        for name, values in self.columns.items():
+            result.columns[name] = [values[index] for index in indices]
+        return result
+
+    def __len__(self):
+        return len(self.columns[self.COLUMNS[0][0]]) if self.COLUMNS else 0
+
+    def category_values(self, name):
+        """
+        :param name: Category column
+        :type name: str
+        :return: Category of each row, None where it has none
+        :rtype: List
+        """
+        categories = self.categories[name]
+        return [
+            None if code < 0 else categories[code]
+            for code in self.columns[name]
+        ]
+
+    def to_numpy(self):
+        """
+        Convert the columns to NumPy arrays. Category columns are converted to their int32
+        codes, the categories are in table.categories.
+
+        :return: Array of each column
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        np = _require(numpy, "numpy")
+        arrays = {}
+        for name, keys, kind in self.COLUMNS:
+            values = self.columns[name]
+            if kind == CATEGORY:
+                array = np.array(values, dtype=np.int32)
+            elif kind == NUMBER:
+                array = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64)
+            elif kind == EPOCH:
+                seconds = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64)
+                # NaN becomes NaT
+                array = (seconds * 1000).astype("datetime64[ms]")
+            elif kind == ISO:
+                array = np.array([_iso(value) for value in values],
+                                 dtype="datetime64[ms]")
+            else:
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+            arrays[name] = array
+        return arrays
+
+    def to_pandas(self):
+        """
+        :return: DataFrame with a column per column of the table, category columns as pandas.Categorical
+        :rtype: pandas.DataFrame
+        """
+        pd = _require(pandas, "pandas")
+        arrays = self.to_numpy()
+        for name, categories in self.categories.items():
+            arrays[name] = pd.Categorical.from_codes(arrays[name], categories)
+        return pd.DataFrame(
+            arrays, columns=[name for name, keys, kind in self.COLUMNS])
+
+    def to_arrow(self):
+        """
+        :return: Arrow table with a column per column of the table, category columns dictionary encoded
+        :rtype: pyarrow.Table
+        """
+        pa = _require(pyarrow, "pyarrow")
+        arrays = self.to_numpy()
+        columns = []
+        for name, keys, kind in self.COLUMNS:
+            array = arrays[name]
+            if kind == CATEGORY:
+                columns.append(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(array, mask=array < 0),
+                        pa.array(self.categories[name], type=pa.string())))
+            elif kind == VALUE:
+                columns.append(pa.array(self.columns[name]))
+            else:
+                columns.append(pa.array(array, from_pandas=True))
+        return pa.Table.from_arrays(
+            columns, names=[name for name, keys, kind in self.COLUMNS])
+
+
+class JobTable(ColumnTable):
+    """
+    Jobs as columns, see ColumnTable. The status column holds codes into the EJobStatus names,
+    and the status history is left out.
+    """
+    COLUMNS = (
+        ("job_id", ("jobid", ), VALUE),
+        ("receiver_id", ("receiverid", ), VALUE),
+        ("mission_id", ("project_id", "mission_id"), VALUE),
+        ("time_created", ("time_created", ), EPOCH),
+        ("last_updated", ("last_updated", ), EPOCH),
+        ("status", ("status", ), CATEGORY),
+        ("cpu_count", ("cpu_count", ), NUMBER),
+        ("gpu_count", ("gpu_count", ), NUMBER),
+        ("memory_amount", ("memory_amount", ), NUMBER),
+        ("enable_tunnel", ("enable_tunnel", ), VALUE),
+        ("tunnel_port", ("tunnel_port", ), VALUE),
+        ("tunnel_url", ("tunnel_url", ), VALUE),
+        ("name", ("name", ), VALUE),
+        ("station_id", ("stationid", ), VALUE),
+        ("user_id", ("userid", ), VALUE),
+        ("state", ("state", ), CATEGORY),
+        ("pay_status", ("pay_status", ), VALUE),
+        ("pay_interval", ("pay_interval", ), NUMBER),
+        ("total_runtime", ("total_runtime", ), NUMBER),
+        ("archived", ("archived", ), VALUE),
+    )
+    CATEGORIES = {"status": [status.name for status in EJobStatus]}
+
+
+class MissionTable(ColumnTable):
+    """
+    Missions as columns, see ColumnTable. The mission settings are left out.
+    """
+    COLUMNS = (
+        ("mission_id", ("id", ), VALUE),
+        ("name", ("name", ), VALUE),
+        ("description", ("description", ), VALUE),
+        ("source_storage_id", ("source_storage_id", ), VALUE),
+        ("source_path", ("source_path", ), VALUE),
+        ("destination_storage_id", ("destination_storage_id", ), VALUE),
+        ("destination_path", ("destination_path", ), VALUE),
+        ("user_id", ("user_id", ), VALUE),
+        ("creation_timestamp", ("creation_timestamp", ), ISO),
+        ("mission_type_id", ("mission_type_id", ), CATEGORY),
+        ("updated_timestamp", ("updated_timestamp", ), ISO),
+        ("organization_id", ("organization_id", ), VALUE),
+        ("mission_type_name", ("mission_type_name", ), CATEGORY),
+        ("public", ("public", ), VALUE),
+    )
@@ -1,4 +1,9 @@
-class Universe:
+from ...business.objects.slotted import SlottedObject
+
+
+class Universe(SlottedObject):
+    __slots__ = ("universe_id", "name", "creation_timestamp")
+
     def __init__(
         self,
         universe_id,
@@ -0,0 +1,5 @@
+from .jobs import AsyncJobsService
+from .lz import AsyncLzService
+from .missions import AsyncMissionsService
+from .profiles import AsyncProfilesService
+from .stations import AsyncStationsService
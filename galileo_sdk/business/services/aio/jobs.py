@@ -0,0 +1,310 @@
+import asyncio
+
+from ..jobs import JobsService, _download_report, _extract_result, _local_path
+from ...objects import FileDownloadResult
+from ...objects.tables import JobTable
+from ...objects.exceptions import JobsException
+from ...utils.async_job_waiter import AsyncJobWaiter
+from ...utils.async_paginate import fetch_pages, iter_pages
+from ...utils.generate_query_str import generate_query_str
+from galileo_sdk.compat import quote
+
+
+class AsyncJobsService(JobsService):
+    def __init__(self, jobs_repo, profile_repo):
+        """
+        Asyncio Jobs Service. Methods that only forward to the repository are inherited
+        from JobsService and return the repository coroutine.
+
+        :param jobs_repo: Asyncio Jobs Repository
+        :type jobs_repo: AsyncJobsRepository
+        :param profile_repo: Asyncio Profile Repository
+        :type profile_repo: AsyncProfilesRepository
+        """
+        super(AsyncJobsService, self).__init__(jobs_repo, profile_repo)
+
+    async def request_send_job(self):
+        """
+        FIXME: Potentially out of date
+        """
+        r = await self._jobs_repo.request_send_job()
+        return r.json()
+
+    async def request_send_job_completed(self, destination_mid, file_name,
+                                         station_id):
+        """
+        FIXME: Potentially out of date
+        """
+        r = await self._jobs_repo.request_send_job_completed(
+            destination_mid, file_name, station_id)
+        return r.json()
+
+    async def request_receive_job(self, job_id):
+        """
+        FIXME Potentially incorrect endpoint
+        """
+        r = await self._jobs_repo.request_receive_job(job_id)
+        return r.json()
+
+    async def request_receive_job_completed(self, job_id):
+        """
+        FIXME Potentially incorrect endpoint
+        """
+        r = await self._jobs_repo.request_receive_job_completed(job_id)
+        return r.json()
+
+    async def submit_job(self, job_id):
+        """
+        FIXME: To submit a job, we need to use a mission/project endpoint:
+                /projects/{project_id}/jobs
+                To resume a job, we PUT to the job/{job_id}/start endpoint
+        """
+        r = await self._jobs_repo.submit_job(job_id)
+        return r.json()
+
+    async def list_jobs(
+        self,
+        job_ids=None,
+        receiver_ids=None,
+        user_ids=None,
+        station_ids=None,
+        statuses=None,
+        page=1,
+        items=25,
+        mission_ids=None,
+        archived=False,
+        receiver_archived=False,
+        partial_names=None,
+        lz_ids=None,
+        owner_ids=None,
+        sort_by=None,
+        sort_order=None,
+        columnar=False,
+        stream=False,
+    ):
+        """
+        Get a filtered list of jobs, see JobsService.list_jobs. Streaming is not available
+        with asyncio, each page is read at once, use iter_jobs to hold one page in memory at
+        a time.
+
+        :raises ValueError: stream was requested
+        :return: List of jobs
+        :rtype: Union[List[Job], JobTable]
+        """
+        if stream:
+            raise ValueError(
+                "stream is not supported by AsyncGalileoSdk, use iter_jobs to get the jobs page by page"
+            )
+        if user_ids is None:
+            self_profile = await self._profile_repo.self()
+            user_ids = [self_profile.user_id]
+        return await super(AsyncJobsService, self).list_jobs(
+            job_ids=job_ids,
+            receiver_ids=receiver_ids,
+            user_ids=user_ids,
+            station_ids=station_ids,
+            statuses=statuses,
+            page=page,
+            items=items,
+            mission_ids=mission_ids,
+            archived=archived,
+            receiver_archived=receiver_archived,
+            partial_names=partial_names,
+            lz_ids=lz_ids,
+            owner_ids=owner_ids,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            columnar=columnar,
+        )
+
+    async def iter_jobs(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every job matching the filters, page by page, see
+        JobsService.iter_jobs
+
+        :return: Asynchronous generator over the jobs
+        :rtype: AsyncIterator[Job]
+        """
+        if filters.get("user_ids") is None:
+            # Resolve the current user once instead of once per page
+            self_profile = await self._profile_repo.self()
+            filters["user_ids"] = [self_profile.user_id]
+        async for job in iter_pages(
+                lambda page, items: self.list_jobs(
+                    page=page, items=items, **filters),
+                items=items,
+                prefetch=prefetch,
+        ):
+            yield job
+
+    async def fetch_all_jobs(self,
+                             items=25,
+                             concurrency=4,
+                             columnar=False,
+                             **filters):
+        """
+        Get every job matching the filters, requesting several pages concurrently, see
+        JobsService.fetch_all_jobs
+
+        :return: Jobs, in page order
+        :rtype: Union[List[Job], JobTable]
+        """
+        if filters.get("user_ids") is None:
+            self_profile = await self._profile_repo.self()
+            filters["user_ids"] = [self_profile.user_id]
+        return await fetch_pages(
+            lambda page, items: self.list_jobs(
+                page=page, items=items, columnar=columnar, **filters),
+            items=items,
+            concurrency=concurrency,
+            concat=JobTable.concat if columnar else None,
+        )
+
+    def wait_for_jobs(self,
+                      job_ids,
+                      until=None,
+                      timeout=None,
+                      poll_interval=2.0,
+                      max_poll_interval=60.0,
+                      events=None):
+        """
+        Wait for many jobs at once, see JobsService.wait_for_jobs. Iterate the waiter with
+        async for, or await its wait().
+
+        :return: Asynchronous iterator over the jobs as they finish
+        :rtype: AsyncJobWaiter
+        """
+        user_ids = []
+
+        async def list_jobs(ids):
+            if not user_ids:
+                # Resolve the current user once instead of once per listing
+                self_profile = await self._profile_repo.self()
+                user_ids.append(self_profile.user_id)
+            return await self.list_jobs(job_ids=ids,
+                                        user_ids=user_ids,
+                                        items=len(ids))
+
+        waiter = AsyncJobWaiter(
+            job_ids,
+            list_jobs,
+            until=until,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
+        if events is not None:
+            waiter.listen(events)
+        return waiter
+
+    async def download_job_results(self,
+                                   job_id,
+                                   path,
+                                   nonce=None,
+                                   concurrency=4,
+                                   chunk_size=8192):
+        """
+        Gets the jobs results files, downloading up to concurrency files at a time. Files that
+        were already downloaded are skipped and interrupted downloads are resumed.
+
+        :param job_id: Job Id of the job to get the results from
+        :type job_id: str
+        :param path: File path to store results
+        :type path: str
+        :param nonce: arbitrary number that can be used just once in a cryptographic communication, defaults to None
+        :type nonce: int, optional
+        :param concurrency: Number of files downloaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :raises JobsException: No results for the job, or none of its files could be downloaded
+        :return: The downloaded job results paths, with the outcome of every file
+        :rtype: DownloadReport
+        """
+        files = await self._jobs_repo.get_results_metadata(job_id)
+
+        if not files:
+            raise JobsException(job_id, "No files to download")
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def download_file(file):
+            async with semaphore:
+                return await self._download_file(job_id, file, path, nonce,
+                                                 chunk_size)
+
+        results = await asyncio.gather(*[download_file(file) for file in files])
+        return _download_report(job_id, list(results))
+
+    async def _download_file(self,
+                             job_id,
+                             file,
+                             path,
+                             nonce=None,
+                             chunk_size=8192):
+        absolute_path = _local_path(path, file)
+        try:
+            await self._jobs_repo.download_results(
+                job_id,
+                generate_query_str({
+                    "filename": quote(file.filename, safe=""),
+                    "path": file.path,
+                    "nonce": nonce,
+                }),
+                absolute_path,
+                chunk_size=chunk_size,
+                expected_size=file.file_size,
+            )
+        except Exception as e:
+            return FileDownloadResult(file.filename, absolute_path, False, e)
+        return FileDownloadResult(file.filename, absolute_path, True)
+
+    async def download_and_extract_job_results(self,
+                                               job_id,
+                                               path,
+                                               nonce=None,
+                                               concurrency=4,
+                                               chunk_size=8192,
+                                               members=None,
+                                               delete_archives=False):
+        """
+        Gets the jobs results files and extracts the zip archives. Each archive is extracted
+        in the default executor as soon as it is downloaded, so extraction overlaps with the
+        remaining downloads and does not block the event loop.
+
+        :param job_id: Job Id of the job to get the results from
+        :type job_id: str
+        :param path: File path to store results
+        :type path: str
+        :param nonce: arbitrary number that can be used just once in a cryptographic communication, defaults to None
+        :type nonce: int, optional
+        :param concurrency: Number of files downloaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :param members: Glob patterns of the archive members to extract, defaults to None to extract everything
+        :type members: List[str], optional
+        :param delete_archives: Delete each archive once it is extracted, defaults to False
+        :type delete_archives: bool, optional
+        :raises JobsException: No results for the job, or none of its files could be downloaded
+        :return: The downloaded job results paths, with the outcome of every file
+        :rtype: DownloadReport
+        """
+        files = await self._jobs_repo.get_results_metadata(job_id)
+
+        if not files:
+            raise JobsException(job_id, "No files to download")
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        loop = asyncio.get_event_loop()
+
+        async def download_and_extract(file):
+            async with semaphore:
+                result = await self._download_file(job_id, file, path, nonce,
+                                                   chunk_size)
+            return await loop.run_in_executor(None, _extract_result, result,
+                                              members, delete_archives)
+
+        results = await asyncio.gather(
+            *[download_and_extract(file) for file in files])
+        return _download_report(job_id, list(results))
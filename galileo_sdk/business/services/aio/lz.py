@@ -0,0 +1,44 @@
+from ..lz import LzService
+from ...utils.async_paginate import fetch_pages, iter_pages
+
+
+class AsyncLzService(LzService):
+    def __init__(self, lz_repo):
+        """
+        Asyncio Landing Zone Service. Methods that only forward to the repository are
+        inherited from LzService and return the repository coroutine.
+
+        :param lz_repo: Asyncio LZ Repository
+        :type lz_repo: AsyncLzRepository
+        """
+        super(AsyncLzService, self).__init__(lz_repo)
+
+    def iter_lz(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every Landing Zone matching the filters, page by page, see
+        LzService.iter_lz
+
+        :return: Asynchronous generator over the Landing Zones
+        :rtype: AsyncIterator[Lz]
+        """
+        return iter_pages(
+            lambda page, items: self.list_lz(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_lz(self, items=25, concurrency=4, **filters):
+        """
+        Get every Landing Zone matching the filters, requesting several pages concurrently, see
+        LzService.fetch_all_lz
+
+        :return: List of Landing Zones, in page order
+        :rtype: List[Lz]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_lz(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
@@ -0,0 +1,411 @@
+import asyncio
+import os
+
+from ..missions import (
+    CHUNK_RETRIES,
+    CHUNK_RETRY_DELAY,
+    MissionsService,
+    _check_uploaded_size,
+    _payload_files,
+    _plan_sync,
+    _sync_name,
+)
+from ...utils.async_paginate import fetch_pages, iter_pages
+from ...utils.generate_query_str import generate_query_str
+from ...utils.sync_manifest import SyncManifest, file_sha256
+from ...utils.upload_journal import UploadJournal, is_retryable
+from ...objects import (
+    FileUploadResult,
+    SyncReport,
+    UpdateMissionRequest,
+    UploadReport,
+)
+from ...objects.tables import MissionTable
+from galileo_sdk.compat import quote
+
+
+class AsyncMissionsService(MissionsService):
+    def __init__(self, missions_repo):
+        """
+        Asyncio Mission Service. Methods that only forward to the repository are inherited
+        from MissionsService and return the repository coroutine.
+
+        :param missions_repo: Asyncio Mission repository
+        :type missions_repo: AsyncMissionsRepository
+        """
+        super(AsyncMissionsService, self).__init__(missions_repo)
+
+    def iter_missions(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every mission matching the filters, page by page, see
+        MissionsService.iter_missions
+
+        :return: Asynchronous generator over the missions
+        :rtype: AsyncIterator[Mission]
+        """
+        return iter_pages(
+            lambda page, items: self.list_missions(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_missions(self,
+                           items=25,
+                           concurrency=4,
+                           columnar=False,
+                           **filters):
+        """
+        Get every mission matching the filters, requesting several pages concurrently, see
+        MissionsService.fetch_all_missions
+
+        :return: Missions, in page order
+        :rtype: Union[List[Mission], MissionTable]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_missions(
+                page=page, items=items, columnar=columnar, **filters),
+            items=items,
+            concurrency=concurrency,
+            concat=MissionTable.concat if columnar else None,
+        )
+
+    def get_mission_files(self, mission_id, stream=False):
+        """
+        Get files for/from a mission, see MissionsService.get_mission_files. Streaming is not
+        available with asyncio, the whole listing is read at once.
+
+        :raises ValueError: stream was requested
+        :return: Coroutine of the files for/from the mission
+        :rtype: Awaitable[List[FileListing]]
+        """
+        if stream:
+            raise ValueError(
+                "stream is not supported by AsyncGalileoSdk, the files are listed at once")
+        return self._missions_repo.get_mission_files(mission_id)
+
+    async def get_mission_by_id(self, mission_id):
+        """
+        Get mission by id
+
+        :param mission_id: Mission id of the mission to get
+        :type mission_id: str
+        :return: Selected mission object
+        :rtype: Mission
+        """
+        query = generate_query_str({"ids": mission_id})
+
+        missions = await self._missions_repo.list_missions(query)
+        return missions[0]
+
+    async def create_mission_and_run_job(self,
+                                         request,
+                                         directory,
+                                         station_id,
+                                         lz_id=None,
+                                         cpu_count=None,
+                                         memory_amount=None,
+                                         gpu_count=None):
+        """
+        Create a new mission and run a job on a station
+
+        :param request: Create mission request
+        :type request: CreateMissionRequest
+        :param directory: Job folder to run
+        :type directory: str
+        :param station_id: Station id to run the job on
+        :type station_id: str
+        :param lz_id: Specific LZ to run the job on, defaults to None
+        :type lz_id: str, optional
+        :param cpu_count: Cpu count to run the job with, defaults to None
+        :type cpu_count: number, optional
+        :param memory_amount: Memory amount to run the job with, defaults to None
+        :type memory_amount: number, optional
+        :param gpu_count: GPU count to run the job with, defaults to None
+        :type gpu_count: number, optional
+        :return: Job that was run
+        :rtype: Job
+        """
+        mission = await self.create_mission(request)
+        await self.upload(mission.mission_id, directory)
+        if lz_id:
+            job = await self.run_job_on_lz(mission.mission_id, station_id,
+                                           lz_id, cpu_count, memory_amount,
+                                           gpu_count)
+        else:
+            job = await self.run_job_on_station(mission.mission_id,
+                                                station_id,
+                                                cpu_count=cpu_count,
+                                                memory_amount=memory_amount,
+                                                gpu_count=gpu_count)
+
+        return job
+
+    async def upload(self,
+                     mission_id,
+                     payload,
+                     rename=None,
+                     verbose=False,
+                     concurrency=4,
+                     experimental_chunk_size=None,
+                     journal_dir=None):
+        """
+        Upload a folder to a mission. Files are streamed from disk, up to concurrency at a time.
+        Experimental: with an experimental_chunk_size, larger files are uploaded in resumable
+        chunks, with the data loss risk described in MissionsService.upload.
+
+        :param mission_id: Mission id of the mission to upload to
+        :type mission_id: str
+        :param payload: Path to the folder to upload
+        :type payload: str
+        :param rename: Renamed folder, defaults to None
+        :type rename: str, optional
+        :param verbose: Verbose output, defaults to False
+        :type verbose: bool, optional
+        :param concurrency: Number of files uploaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param experimental_chunk_size: Experimental, size in bytes of the chunks, defaults to None to send each file at once
+        :type experimental_chunk_size: int, optional
+        :param journal_dir: Folder of the resume journals, defaults to ~/.galileo_sync/uploads
+        :type journal_dir: str, optional
+        :return: Outcome of each file, truthy if every file was uploaded
+        :rtype: UploadReport
+        """
+        if not os.path.exists(payload):
+            if verbose:
+                print("Payload is not a directory or file")
+            return UploadReport(mission_id,
+                                error="Payload is not a directory or file")
+
+        try:
+            files = _payload_files(payload, rename)
+        except Exception as e:
+            print("Error: ", e)
+            return UploadReport(mission_id, error=e)
+
+        results = await self._upload_files(mission_id, files, verbose,
+                                           concurrency, experimental_chunk_size,
+                                           journal_dir)
+        return UploadReport(mission_id, results)
+
+    async def sync(self,
+                   mission_id,
+                   directory,
+                   delete=False,
+                   verbose=False,
+                   concurrency=4,
+                   manifest_dir=None,
+                   experimental_chunk_size=None,
+                   journal_dir=None):
+        """
+        Sync a folder to a mission, uploading only the files that are new or changed since
+        the last sync.
+
+        :param mission_id: Mission id of the mission to sync to
+        :type mission_id: str
+        :param directory: Path to the folder to sync
+        :type directory: str
+        :param delete: Delete the mission files that are missing locally, defaults to False
+        :type delete: bool, optional
+        :param verbose: Verbose output, defaults to False
+        :type verbose: bool, optional
+        :param concurrency: Number of files uploaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param manifest_dir: Folder of the sync manifests, defaults to ~/.galileo_sync
+        :type manifest_dir: str, optional
+        :param experimental_chunk_size: Experimental, size in bytes of the chunks, defaults to None to send each file at once
+        :type experimental_chunk_size: int, optional
+        :param journal_dir: Folder of the resume journals, defaults to ~/.galileo_sync/uploads
+        :type journal_dir: str, optional
+        :return: Uploaded, unchanged and deleted files, truthy if every upload succeeded
+        :rtype: SyncReport
+        """
+        if not os.path.isdir(directory):
+            if verbose:
+                print("Payload is not a directory")
+            return SyncReport(mission_id, error="Payload is not a directory")
+
+        manifest = SyncManifest(mission_id, manifest_dir)
+        remote_files = await self.get_mission_files(mission_id)
+        files, unchanged, deleted = _plan_sync(manifest,
+                                               _payload_files(directory),
+                                               remote_files)
+
+        results = await self._upload_files(mission_id, files, verbose,
+                                           concurrency, experimental_chunk_size,
+                                           journal_dir)
+        for result in results:
+            if result.success:
+                manifest.record(_sync_name(result.filename),
+                                result.local_path)
+
+        if delete:
+            deleted = [
+                filename for filename in deleted
+                if await self.delete_file(mission_id, filename)
+            ]
+            for filename in deleted:
+                manifest.forget(filename)
+        else:
+            deleted = []
+
+        manifest.save()
+        return SyncReport(mission_id, results, unchanged, deleted)
+
+    async def _upload_files(self,
+                            mission_id,
+                            files,
+                            verbose=False,
+                            concurrency=4,
+                            chunk_size=None,
+                            journal_dir=None):
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def upload_file(filepath, filename):
+            async with semaphore:
+                return await self._upload_file(mission_id, filepath, filename,
+                                               verbose, chunk_size,
+                                               journal_dir)
+
+        results = await asyncio.gather(
+            *[upload_file(filepath, filename) for filepath, filename in files])
+        return list(results)
+
+    async def _upload_file(self,
+                           mission_id,
+                           filepath,
+                           filename,
+                           verbose=False,
+                           chunk_size=None,
+                           journal_dir=None):
+        size = 0
+        try:
+            size = os.path.getsize(filepath)
+            if chunk_size and size > chunk_size:
+                await self._upload_file_chunks(mission_id, filepath, filename,
+                                               size, chunk_size, journal_dir,
+                                               verbose)
+            else:
+                with open(filepath, "rb") as f:
+                    # aiohttp streams the open file as the request body
+                    await self._missions_repo.upload_single_file(
+                        mission_id, f, filename)
+        except Exception as e:
+            if verbose:
+                print("Error: ", filename, e)
+            return FileUploadResult(filename, filepath, size, False, e)
+
+        if verbose:
+            print(" Upload complete: ", filename)
+        return FileUploadResult(filename, filepath, size, True)
+
+    async def _upload_file_chunks(self,
+                                  mission_id,
+                                  filepath,
+                                  filename,
+                                  size,
+                                  chunk_size,
+                                  journal_dir=None,
+                                  verbose=False):
+        # Hashing a large file would block the event loop
+        sha256 = await asyncio.get_event_loop().run_in_executor(
+            None, file_sha256, filepath)
+        journal = UploadJournal(mission_id, filename, sha256, size,
+                                journal_dir)
+        if verbose and journal.offset:
+            print(" Resuming upload: ", filename, journal.offset, "/", size)
+
+        with open(filepath, "rb") as f:
+            f.seek(journal.offset)
+            offset = journal.offset
+            while offset < size:
+                chunk = f.read(chunk_size)
+                await self._upload_chunk(mission_id, chunk, filename, offset,
+                                         size)
+                offset += len(chunk)
+                journal.update(offset)
+        # The next attempt starts over, whether the backend stored the whole file or not
+        journal.remove()
+        _check_uploaded_size(
+            await self._missions_repo.get_mission_files(mission_id), filename,
+            size)
+
+    async def _upload_chunk(self, mission_id, chunk, filename, offset, size):
+        for attempt in range(CHUNK_RETRIES + 1):
+            try:
+                return await self._missions_repo.upload_file_chunk(
+                    mission_id, chunk, filename, offset, size)
+            except Exception as e:
+                if attempt == CHUNK_RETRIES or not is_retryable(e):
+                    raise
+                await asyncio.sleep(min(CHUNK_RETRY_DELAY * 2**attempt, 30))
+
+    async def update_mission(self, update_mission_request):
+        """
+        Update a mission
+
+        :param update_mission_request: Update mission request
+        :type update_mission_request: UpdateMissionRequest
+        :return: Successful update
+        :rtype: bool
+        """
+        try:
+            await self._missions_repo.update_mission(update_mission_request)
+            return True
+        except Exception as e:
+            print("Error: ", e)
+            return False
+
+    async def update_mission_args(self, mission_id, arg):
+        """
+        Update mission args
+
+        :param mission_id: Mission id of the mission to update
+        :type mission_id: str
+        :param arg: Argument to update
+        :type arg: List[str]
+        :return: True if mission args were updated, False otherwise
+        :rtype: bool
+        """
+        missions = await self.list_missions(mission_ids=[mission_id])
+        mission = missions[0]
+        mission.settings["arg"] = arg
+        if not isinstance(arg, list):
+            raise Exception(
+                "args must be in the form of a List[str] e.g. ['arg1', 'arg2', 'arg3']"
+            )
+        update_mission_request = UpdateMissionRequest(
+            mission_id=mission_id, settings=mission.settings)
+        return await self._missions_repo.update_mission(update_mission_request)
+
+    async def delete_file(self, mission_id, filename):
+        """
+        Delete a file from a mission
+
+        :param mission_id: Mission id of the mission to delete the file from
+        :type mission_id: str
+        :param filename: Filename to delete
+        :type filename: str
+        :return: True if file was deleted, False otherwise
+        :rtype: bool
+        """
+        try:
+            query = generate_query_str({"filename": quote(filename, safe="")})
+            await self._missions_repo.delete_file(mission_id, query)
+
+            return True
+        except Exception as e:
+            print("Error: ", e)
+            return False
+
+    async def get_mission_type_settings_info(self, mission_type_id):
+        """
+        Gets mission type settings
+
+        :param mission_type_id: Mission ID to get settings from
+        :type mission_type_id: str
+        :return: Dict of mission type settings
+        :rtype: Dict
+        """
+        mission_type = await self.get_mission_type(mission_type_id)
+        return self._get_settings(mission_type.wizard_spec)
@@ -0,0 +1,44 @@
+from ..profiles import ProfilesService
+from ...utils.async_paginate import fetch_pages, iter_pages
+
+
+class AsyncProfilesService(ProfilesService):
+    def __init__(self, profile_repo):
+        """
+        Asyncio Profile Service. Methods that only forward to the repository are inherited
+        from ProfilesService and return the repository coroutine.
+
+        :param profile_repo: Asyncio Profile Repository
+        :type profile_repo: AsyncProfilesRepository
+        """
+        super(AsyncProfilesService, self).__init__(profile_repo)
+
+    def iter_users(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every user matching the filters, page by page, see
+        ProfilesService.iter_users
+
+        :return: Asynchronous generator over the profiles
+        :rtype: AsyncIterator[Profile]
+        """
+        return iter_pages(
+            lambda page, items: self.list_users(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_users(self, items=25, concurrency=4, **filters):
+        """
+        Get every user matching the filters, requesting several pages concurrently, see
+        ProfilesService.fetch_all_users
+
+        :return: List of users, in page order
+        :rtype: List[Profile]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_users(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
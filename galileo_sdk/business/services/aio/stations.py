@@ -0,0 +1,44 @@
+from ..stations import StationsService
+from ...utils.async_paginate import fetch_pages, iter_pages
+
+
+class AsyncStationsService(StationsService):
+    def __init__(self, stations_repo):
+        """
+        Asyncio Stations Service. Methods that only forward to the repository are inherited
+        from StationsService and return the repository coroutine.
+
+        :param stations_repo: Asyncio Stations Repository
+        :type stations_repo: AsyncStationsRepository
+        """
+        super(AsyncStationsService, self).__init__(stations_repo)
+
+    def iter_stations(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every station matching the filters, page by page, see
+        StationsService.iter_stations
+
+        :return: Asynchronous generator over the stations
+        :rtype: AsyncIterator[Station]
+        """
+        return iter_pages(
+            lambda page, items: self.list_stations(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_stations(self, items=25, concurrency=4, **filters):
+        """
+        Get every station matching the filters, requesting several pages concurrently, see
+        StationsService.fetch_all_stations
+
+        :return: List of stations, in page order
+        :rtype: List[Station]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_stations(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
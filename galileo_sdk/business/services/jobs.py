@@ -1,10 +1,21 @@
+import fnmatch
 import os
 import zipfile
 
+from ..objects import DownloadReport, FileDownloadResult
 from ..objects.exceptions import JobsException
+from ..objects.tables import JobTable
 from ..utils.generate_query_str import generate_query_str
+from ..utils.job_waiter import JobWaiter
+from ..utils.paginate import fetch_pages, iter_pages
 from galileo_sdk.compat import quote
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+except ImportError:
+    # Python 2 without the futures backport, files are downloaded one by one
+    ThreadPoolExecutor = None
+
 
 # TODO: Check some endpoints
 class JobsService:
@@ -133,6 +144,8 @@ class JobsService:
         owner_ids=None,
         sort_by=None,
         sort_order=None,
+        columnar=False,
+        stream=False,
     ):
         """
         Get a filtered list of jobs
@@ -167,9 +180,16 @@ class JobsService:
         :type sort_by: str, optional
         :param sort_order: Sort order of list of jobs, defaults to None
         :type sort_order: str, optional
+        :param columnar: Return the jobs as a JobTable, defaults to False
+        :type columnar: bool, optional
+        :param stream: Return the jobs as they are received, requires ijson, defaults to False
+        :type stream: bool, optional
+        :raises ValueError: Both columnar and stream were requested
         :return: List of jobs
-        :rtype: List[Job]
+        :rtype: Union[List[Job], JobTable, Iterator[Job]]
         """
+        if columnar and stream:
+            raise ValueError("columnar and stream cannot be combined")
         if user_ids is None:
             self_profile = self._profile_repo.self()
             user_ids = [self_profile.user_id]
@@ -191,11 +211,115 @@ class JobsService:
                 "sort_by": sort_by,
                 "sort_order": sort_order,
             }, )
+        if columnar:
+            return self._jobs_repo.list_jobs_table(query)
+        if stream:
+            return self._jobs_repo.stream_jobs(query)
         return self._jobs_repo.list_jobs(query)
 
-    def download_job_results(self, job_id, path, nonce=None):
+    def iter_jobs(self, items=25, prefetch=True, **filters):
         """
-        Gets the jobs results file
+        Lazily iterate over every job matching the filters, page by page
+
+        :param items: How many items per page in request, defaults to 25
+        :type items: int, optional
+        :param prefetch: Fetch the next page in the background, defaults to True
+        :type prefetch: bool, optional
+        :param filters: Any filter accepted by list_jobs, except page and items
+        :return: Generator over the jobs
+        :rtype: Iterator[Job]
+        """
+        if filters.get("user_ids") is None:
+            # Resolve the current user once instead of once per page
+            self_profile = self._profile_repo.self()
+            filters["user_ids"] = [self_profile.user_id]
+        return iter_pages(
+            lambda page, items: self.list_jobs(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_jobs(self,
+                       items=25,
+                       concurrency=4,
+                       columnar=False,
+                       **filters):
+        """
+        Get every job matching the filters, requesting several pages concurrently
+
+        :param items: How many items per page in request, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param columnar: Return the jobs as a single JobTable, defaults to False
+        :type columnar: bool, optional
+        :param filters: Any filter accepted by list_jobs, except page and items
+        :return: List of jobs, in page order
+        :rtype: Union[List[Job], JobTable]
+        """
+        if filters.get("user_ids") is None:
+            self_profile = self._profile_repo.self()
+            filters["user_ids"] = [self_profile.user_id]
+        return fetch_pages(
+            lambda page, items: self.list_jobs(
+                page=page, items=items, columnar=columnar, **filters),
+            items=items,
+            concurrency=concurrency,
+            concat=JobTable.concat if columnar else None,
+        )
+
+    def wait_for_jobs(self,
+                      job_ids,
+                      until=None,
+                      timeout=None,
+                      poll_interval=2.0,
+                      max_poll_interval=60.0,
+                      events=None):
+        """
+        Wait for many jobs at once. The pending jobs are listed by batches, and finished as
+        soon as their event arrives when events are given. The events are only subscribed to
+        once the returned waiter is iterated.
+
+        :param job_ids: Ids of the jobs to wait for
+        :type job_ids: Iterable[str]
+        :param until: Statuses a job is done in, or a function telling whether a job is done, defaults to TERMINAL_JOB_STATUSES
+        :type until: Union[Iterable[EJobStatus], Callable[[Job], bool]], optional
+        :param timeout: Seconds to wait for, defaults to None to wait forever
+        :type timeout: float, optional
+        :param poll_interval: Shortest interval between two listings, defaults to 2.0
+        :type poll_interval: float, optional
+        :param max_poll_interval: Longest interval between two listings, defaults to 60.0
+        :type max_poll_interval: float, optional
+        :param events: Subscribes a handler to the job events and returns the function unsubscribing it, defaults to None to only poll
+        :type events: Callable[[Callable[[JobEvent], None]], Callable[[], None]], optional
+        :return: Iterator over the jobs as they finish
+        :rtype: JobWaiter
+        """
+        # Resolve the current user once instead of once per listing
+        user_ids = [self._profile_repo.self().user_id]
+        waiter = JobWaiter(
+            job_ids,
+            lambda ids: self.list_jobs(
+                job_ids=ids, user_ids=user_ids, items=len(ids)),
+            until=until,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
+        if events is not None:
+            waiter.listen(events)
+        return waiter
+
+    def download_job_results(self,
+                             job_id,
+                             path,
+                             nonce=None,
+                             concurrency=4,
+                             chunk_size=8192):
+        """
+        Gets the jobs results files, downloading up to concurrency files at a time. Files that
+        were already downloaded are skipped and interrupted downloads are resumed.
 
         :param job_id: Job Id of the job to get the results from
         :type job_id: str
@@ -203,19 +327,34 @@ class JobsService:
         :type path: str
         :param nonce: arbitrary number that can be used just once in a cryptographic communication, defaults to None
         :type nonce: int, optional
-        :raises JobsException: No results for the job
-        :return: The job results paths
-        :rtype: List[str]
+        :param concurrency: Number of files downloaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :raises JobsException: No results for the job, or none of its files could be downloaded
+        :return: The downloaded job results paths, with the outcome of every file
+        :rtype: DownloadReport
         """
         files = self._jobs_repo.get_results_metadata(job_id)
 
         if not files:
             raise JobsException(job_id, "No files to download")
 
-        files_downloaded = []
+        def download_file(file):
+            return self._download_file(job_id, file, path, nonce, chunk_size)
+
+        if concurrency > 1 and ThreadPoolExecutor is not None and len(
+                files) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(download_file, files))
+        else:
+            results = [download_file(file) for file in files]
 
-        for file in files:
-            absolute_path = os.path.join(path, file.filename)
+        return _download_report(job_id, results)
+
+    def _download_file(self, job_id, file, path, nonce=None, chunk_size=8192):
+        absolute_path = _local_path(path, file)
+        try:
             self._jobs_repo.download_results(
                 job_id,
                 generate_query_str({
@@ -223,15 +362,26 @@ class JobsService:
                     "path": file.path,
                     "nonce": nonce,
                 }),
-                os.path.join(path, file.filename),
+                absolute_path,
+                chunk_size=chunk_size,
+                expected_size=file.file_size,
             )
-            files_downloaded.append(absolute_path)
-
-        return files_downloaded
-
-    def download_and_extract_job_results(self, job_id, path, nonce=None):
-        """
-        Gets the jobs results file and extracts it
+        except Exception as e:
+            return FileDownloadResult(file.filename, absolute_path, False, e)
+        return FileDownloadResult(file.filename, absolute_path, True)
+
+    def download_and_extract_job_results(self,
+                                         job_id,
+                                         path,
+                                         nonce=None,
+                                         concurrency=4,
+                                         chunk_size=8192,
+                                         members=None,
+                                         delete_archives=False):
+        """
+        Gets the jobs results files and extracts the zip archives. Each archive is extracted
+        as soon as it is downloaded, in a separate pool, while the other files are still
+        downloading.
 
         :param job_id: Job Id of the job to get the results from
         :type job_id: str
@@ -239,14 +389,46 @@ class JobsService:
         :type path: str
         :param nonce: arbitrary number that can be used just once in a cryptographic communication, defaults to None
         :type nonce: int, optional
+        :param concurrency: Number of files downloaded, and of archives extracted, at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :param members: Glob patterns of the archive members to extract, defaults to None to extract everything
+        :type members: List[str], optional
+        :param delete_archives: Delete each archive once it is extracted, defaults to False
+        :type delete_archives: bool, optional
+        :raises JobsException: No results for the job, or none of its files could be downloaded
+        :return: The downloaded job results paths, with the outcome of every file
+        :rtype: DownloadReport
         """
-        files_downloaded = self.download_job_results(job_id, path, nonce)
-        for file in files_downloaded:
-            dir = file.rsplit(".zip", 1)[0]
-            if not os.path.exists(dir):
-                os.mkdir(dir)
-            with zipfile.ZipFile(file) as zf:
-                zf.extractall(dir)
+        files = self._jobs_repo.get_results_metadata(job_id)
+
+        if not files:
+            raise JobsException(job_id, "No files to download")
+
+        def download_file(file):
+            return self._download_file(job_id, file, path, nonce, chunk_size)
+
+        def extract(result):
+            return _extract_result(result, members, delete_archives)
+
+        if concurrency <= 1 or ThreadPoolExecutor is None:
+            results = [extract(download_file(file)) for file in files]
+            return _download_report(job_id, results)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as downloads, \
+                ThreadPoolExecutor(max_workers=concurrency) as extractions:
+            pending = {
+                downloads.submit(download_file, file): index
+                for index, file in enumerate(files)
+            }
+            extracted = [None] * len(files)
+            for future in as_completed(pending):
+                extracted[pending[future]] = extractions.submit(
+                    extract, future.result())
+            results = [future.result() for future in extracted]
+
+        return _download_report(job_id, results)
 
     def update_job(self, request):
         """
@@ -270,3 +452,76 @@ class JobsService:
         :rtype: Job
         """
         return self._jobs_repo.request_kill_job(job_id)
+
+
+def _extract(archive, members=None):
+    """
+    Extract a zip archive next to it, in a folder named after the archive
+
+    :param archive: Path of the archive
+    :type archive: str
+    :param members: Glob patterns of the members to extract, defaults to None to extract everything
+    :type members: List[str], optional
+    :return: Folder the archive was extracted to
+    :rtype: str
+    """
+    dir = archive.rsplit(".zip", 1)[0]
+    if not os.path.exists(dir):
+        os.makedirs(dir)
+    with zipfile.ZipFile(archive) as zf:
+        if members is None:
+            zf.extractall(dir)
+        else:
+            for name in zf.namelist():
+                if any(fnmatch.fnmatch(name, pattern) for pattern in members):
+                    zf.extract(name, dir)
+    return dir
+
+
+def _download_report(job_id, results):
+    """
+    Report of the results files of a job. Files that failed are only reported when some
+    files were downloaded, a download where every file failed raises instead.
+
+    :param job_id: Job Id of the job the results belong to
+    :type job_id: str
+    :param results: Outcome of each file
+    :type results: List[FileDownloadResult]
+    :raises JobsException: None of the files could be downloaded
+    :return: The downloaded job results paths, with the outcome of every file
+    :rtype: DownloadReport
+    """
+    report = DownloadReport(job_id, results)
+    if results and not report.succeeded:
+        failed = report.failed[0]
+        raise JobsException(
+            job_id,
+            "None of the {count} results files could be downloaded, {filename}: {error}"
+            .format(count=len(results),
+                    filename=failed.filename,
+                    error=failed.error))
+    return report
+
+
+def _local_path(path, file):
+    # Results with the same name in different folders of the job must not share a file, or
+    # a partial download
+    folders = [
+        folder for folder in (file.path or "").replace("\\", "/").split("/")
+        if folder not in ("", ".", "..")
+    ]
+    return os.path.join(path, *(folders + [file.filename]))
+
+
+def _extract_result(result, members=None, delete_archive=False):
+    # Only zip archives are extracted, other results files are left as downloaded
+    if not result.success or not zipfile.is_zipfile(result.local_path):
+        return result
+    try:
+        result.extracted_path = _extract(result.local_path, members)
+        if delete_archive:
+            os.remove(result.local_path)
+    except Exception as e:
+        result.success = False
+        result.error = e
+    return result
@@ -1,4 +1,5 @@
 from ..utils.generate_query_str import generate_query_str
+from ..utils.paginate import fetch_pages, iter_pages
 
 
 #TODO Replace some bool return types with Success objects
@@ -63,6 +64,44 @@ class LzService:
         })
         return self._lz_repo.list_lz(query)
 
+    def iter_lz(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every Landing Zone matching the filters, page by page
+
+        :param items: Number of items on page, defaults to 25
+        :type items: int, optional
+        :param prefetch: Fetch the next page in the background, defaults to True
+        :type prefetch: bool, optional
+        :param filters: Any filter accepted by list_lz, except page and items
+        :return: Generator over the Landing Zones
+        :rtype: Iterator[Lz]
+        """
+        return iter_pages(
+            lambda page, items: self.list_lz(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_lz(self, items=25, concurrency=4, **filters):
+        """
+        Get every Landing Zone matching the filters, requesting several pages concurrently
+
+        :param items: Number of items on page, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param filters: Any filter accepted by list_lz, except page and items
+        :return: List of Landing Zones, in page order
+        :rtype: List[Lz]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_lz(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
+
     def update(self, request):
         """
         Update a Landing Zone
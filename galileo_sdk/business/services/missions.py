@@ -1,9 +1,35 @@
 import os
+import sys
+import time
 
 from ..utils.generate_query_str import generate_query_str
-from ..objects import UpdateMissionRequest
+from ..utils.paginate import fetch_pages, iter_pages
+from ..utils.sync_manifest import SyncManifest, file_sha256
+from ..utils.upload_journal import UploadJournal, is_retryable
+from ..objects import (
+    FileUploadResult,
+    SyncReport,
+    UpdateMissionRequest,
+    UploadReport,
+)
+from ..objects.tables import MissionTable
 from galileo_sdk.compat import quote
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without the futures backport, files are uploaded one by one
+    ThreadPoolExecutor = None
+
+_ver = sys.version_info
+
+is_py2 = _ver[0] == 2
+is_py3 = _ver[0] == 3
+
+# Attempts after the first for each chunk of a chunked upload, and the first retry delay in seconds
+CHUNK_RETRIES = 5
+CHUNK_RETRY_DELAY = 1.0
+
 
 #TODO Replace some bool return types with Success objects
 class MissionsService:
@@ -23,7 +49,8 @@ class MissionsService:
                       page=1,
                       items=25,
                       mission_type_ids=None,
-                      archived=None):
+                      archived=None,
+                      columnar=False):
         """
         List filtered missions
 
@@ -41,8 +68,10 @@ class MissionsService:
         :type mission_type_ids: List[str], optional
         :param archived: Filter by archived missions, defaults to None
         :type archived: bool, optional
+        :param columnar: Return the missions as a MissionTable, defaults to False
+        :type columnar: bool, optional
         :return: Filtered missions
-        :rtype: List[Mission]
+        :rtype: Union[List[Mission], MissionTable]
         """
         query = generate_query_str({
             "ids": mission_ids,
@@ -54,8 +83,55 @@ class MissionsService:
             "archived": archived
         })
 
+        if columnar:
+            return self._missions_repo.list_missions_table(query)
         return self._missions_repo.list_missions(query)
 
+    def iter_missions(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every mission matching the filters, page by page
+
+        :param items: Number of items per page, defaults to 25
+        :type items: int, optional
+        :param prefetch: Fetch the next page in the background, defaults to True
+        :type prefetch: bool, optional
+        :param filters: Any filter accepted by list_missions, except page and items
+        :return: Generator over the missions
+        :rtype: Iterator[Mission]
+        """
+        return iter_pages(
+            lambda page, items: self.list_missions(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_missions(self,
+                           items=25,
+                           concurrency=4,
+                           columnar=False,
+                           **filters):
+        """
+        Get every mission matching the filters, requesting several pages concurrently
+
+        :param items: Number of items per page, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param columnar: Return the missions as a single MissionTable, defaults to False
+        :type columnar: bool, optional
+        :param filters: Any filter accepted by list_missions, except page and items
+        :return: List of missions, in page order
+        :rtype: Union[List[Mission], MissionTable]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_missions(
+                page=page, items=items, columnar=columnar, **filters),
+            items=items,
+            concurrency=concurrency,
+            concat=MissionTable.concat if columnar else None,
+        )
+
     def get_mission_by_id(self, mission_id):
         """
         Get mission by id
@@ -122,9 +198,25 @@ class MissionsService:
 
         return job
 
-    def upload(self, mission_id, payload, rename=None, verbose=False):
-        """
-        Upload a folder to a mission
+    def upload(self,
+               mission_id,
+               payload,
+               rename=None,
+               verbose=False,
+               concurrency=4,
+               experimental_chunk_size=None,
+               journal_dir=None):
+        """
+        Upload a folder to a mission. Files are streamed from disk, up to concurrency at a time,
+        each in a single request.
+
+        Experimental: with an experimental_chunk_size, larger files are uploaded in chunks that
+        are retried on failure, and an interrupted upload continues from the last stored chunk
+        when it is run again. Chunks are only reassembled by a backend supporting Content-Range
+        uploads, which the Galileo backend is not known to do. A backend ignoring the header
+        replaces the mission file with each chunk, destroying any file of the same name already
+        in the mission. The size of the mission file is checked once its last chunk is sent and
+        the file is reported as failed when it does not match, but only after the loss.
 
         :param mission_id: Mission id of the mission to upload to
         :type mission_id: str
@@ -134,42 +226,176 @@ class MissionsService:
         :type rename: str, optional
         :param verbose: Verbose output, defaults to False
         :type verbose: bool, optional
-        :return: Succesfully uploaded files
-        :rtype: bool
-        """
+        :param concurrency: Number of files uploaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param experimental_chunk_size: Experimental, size in bytes of the chunks, defaults to None to send each file at once
+        :type experimental_chunk_size: int, optional
+        :param journal_dir: Folder of the resume journals, defaults to ~/.galileo_sync/uploads
+        :type journal_dir: str, optional
+        :return: Outcome of each file, truthy if every file was uploaded
+        :rtype: UploadReport
+        """
+        if not os.path.exists(payload):
+            if verbose:
+                print("Payload is not a directory or file")
+            return UploadReport(mission_id,
+                                error="Payload is not a directory or file")
+
         try:
-            if not os.path.exists(payload):
-                if verbose:
-                    print("Payload is not a directory or file")
-                return False
-
-            name = os.path.basename(payload)
-            if os.path.isdir(payload):
-                for root, dirs, files in os.walk(payload):
-                    for file in files:
-                        basename = os.path.basename(root)
-                        filepath = os.path.join(os.path.abspath(root), file)
-                        if basename == name:
-                            filename = file
-                        else:
-                            filename = os.path.relpath(filepath, payload)
-
-                        f = open(filepath, "rb").read()
-                        self._missions_repo.upload_single_file(
-                            mission_id, f, filename)
-                        if verbose:
-                            print(" Upload complete: ", filename)
-            else:
-                f = open(payload, "rb").read()
-                if rename:
-                    name = rename
-                self._missions_repo.upload_single_file(mission_id, f, name)
-                if verbose:
-                    print("Upload complete: ", name)
-            return True
+            files = _payload_files(payload, rename)
         except Exception as e:
             print("Error: ", e)
-            return False
+            return UploadReport(mission_id, error=e)
+
+        results = self._upload_files(mission_id, files, verbose, concurrency,
+                                     experimental_chunk_size, journal_dir)
+        return UploadReport(mission_id, results)
+
+    def sync(self,
+             mission_id,
+             directory,
+             delete=False,
+             verbose=False,
+             concurrency=4,
+             manifest_dir=None,
+             experimental_chunk_size=None,
+             journal_dir=None):
+        """
+        Sync a folder to a mission, uploading only the files that are new or changed since
+        the last sync. A file is unchanged when its size and modification time match the
+        local manifest, or when its content hash does. Files missing from the mission are
+        always uploaded. experimental_chunk_size carries the data loss risk described in upload.
+
+        :param mission_id: Mission id of the mission to sync to
+        :type mission_id: str
+        :param directory: Path to the folder to sync
+        :type directory: str
+        :param delete: Delete the mission files that are missing locally, defaults to False
+        :type delete: bool, optional
+        :param verbose: Verbose output, defaults to False
+        :type verbose: bool, optional
+        :param concurrency: Number of files uploaded at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param manifest_dir: Folder of the sync manifests, defaults to ~/.galileo_sync
+        :type manifest_dir: str, optional
+        :param experimental_chunk_size: Experimental, size in bytes of the chunks, defaults to None to send each file at once
+        :type experimental_chunk_size: int, optional
+        :param journal_dir: Folder of the resume journals, defaults to ~/.galileo_sync/uploads
+        :type journal_dir: str, optional
+        :return: Uploaded, unchanged and deleted files, truthy if every upload succeeded
+        :rtype: SyncReport
+        """
+        if not os.path.isdir(directory):
+            if verbose:
+                print("Payload is not a directory")
+            return SyncReport(mission_id, error="Payload is not a directory")
+
+        manifest = SyncManifest(mission_id, manifest_dir)
+        remote_files = self.get_mission_files(mission_id)
+        files, unchanged, deleted = _plan_sync(manifest,
+                                               _payload_files(directory),
+                                               remote_files)
+
+        results = self._upload_files(mission_id, files, verbose, concurrency,
+                                     experimental_chunk_size, journal_dir)
+        for result in results:
+            if result.success:
+                manifest.record(_sync_name(result.filename),
+                                result.local_path)
+
+        if delete:
+            deleted = [
+                filename for filename in deleted
+                if self.delete_file(mission_id, filename)
+            ]
+            for filename in deleted:
+                manifest.forget(filename)
+        else:
+            deleted = []
+
+        manifest.save()
+        return SyncReport(mission_id, results, unchanged, deleted)
+
+    def _upload_files(self,
+                      mission_id,
+                      files,
+                      verbose=False,
+                      concurrency=4,
+                      chunk_size=None,
+                      journal_dir=None):
+        def upload_file(file):
+            return self._upload_file(mission_id, file[0], file[1], verbose,
+                                     chunk_size, journal_dir)
+
+        if concurrency > 1 and ThreadPoolExecutor is not None and len(
+                files) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                return list(executor.map(upload_file, files))
+        return [upload_file(file) for file in files]
+
+    def _upload_file(self,
+                     mission_id,
+                     filepath,
+                     filename,
+                     verbose=False,
+                     chunk_size=None,
+                     journal_dir=None):
+        size = 0
+        try:
+            size = os.path.getsize(filepath)
+            if chunk_size and size > chunk_size:
+                self._upload_file_chunks(mission_id, filepath, filename, size,
+                                         chunk_size, journal_dir, verbose)
+            else:
+                with open(filepath, "rb") as f:
+                    # The open file is sent as the request body, so it is never fully in memory
+                    body = f.read() if is_py2 else f
+                    self._missions_repo.upload_single_file(
+                        mission_id, body, filename)
+        except Exception as e:
+            if verbose:
+                print("Error: ", filename, e)
+            return FileUploadResult(filename, filepath, size, False, e)
+
+        if verbose:
+            print(" Upload complete: ", filename)
+        return FileUploadResult(filename, filepath, size, True)
+
+    def _upload_file_chunks(self,
+                            mission_id,
+                            filepath,
+                            filename,
+                            size,
+                            chunk_size,
+                            journal_dir=None,
+                            verbose=False):
+        journal = UploadJournal(mission_id, filename, file_sha256(filepath),
+                                size, journal_dir)
+        if verbose and journal.offset:
+            print(" Resuming upload: ", filename, journal.offset, "/", size)
+
+        with open(filepath, "rb") as f:
+            f.seek(journal.offset)
+            offset = journal.offset
+            while offset < size:
+                chunk = f.read(chunk_size)
+                self._upload_chunk(mission_id, chunk, filename, offset, size)
+                offset += len(chunk)
+                journal.update(offset)
+        # The next attempt starts over, whether the backend stored the whole file or not
+        journal.remove()
+        _check_uploaded_size(self._missions_repo.get_mission_files(mission_id),
+                             filename, size)
+
+    def _upload_chunk(self, mission_id, chunk, filename, offset, size):
+        for attempt in range(CHUNK_RETRIES + 1):
+            try:
+                return self._missions_repo.upload_file_chunk(
+                    mission_id, chunk, filename, offset, size)
+            except Exception as e:
+                if attempt == CHUNK_RETRIES or not is_retryable(e):
+                    raise
+                time.sleep(min(CHUNK_RETRY_DELAY * 2**attempt, 30))
 
     def run_job_on_station(self,
                            mission_id,
@@ -226,16 +452,20 @@ class MissionsService:
                                                  cpu_count, memory_amount,
                                                  gpu_count)
 
-    def get_mission_files(self, mission_id):
+    def get_mission_files(self, mission_id, stream=False):
         """
         Get files for/from a mission
 
         :param mission_id: Mission id of the mission to get files for/from
         :type mission_id: str
+        :param stream: Return the files as they are received, requires ijson, defaults to False
+        :type stream: bool, optional
         :return: Files for/from the mission
-        :rtype: List[FileListing]
+        :rtype: Union[List[FileListing], Iterator[FileListing]]
 
         """
+        if stream:
+            return self._missions_repo.stream_mission_files(mission_id)
         return self._missions_repo.get_mission_files(mission_id)
 
     def delete_mission(self, mission_id):
@@ -397,3 +627,119 @@ class MissionsService:
         """
         mission_type = self.get_mission_type(mission_type_id)
         return self._get_settings(mission_type.wizard_spec)
+
+
+def _payload_files(payload, rename=None):
+    """
+    List the files of an upload payload
+
+    :param payload: Path to a folder or a file
+    :type payload: str
+    :param rename: Name of the file in the mission when payload is a file, defaults to None
+    :type rename: str, optional
+    :return: Path on disk and filename in the mission of every file
+    :rtype: List[Tuple[str, str]]
+    """
+    name = os.path.basename(payload)
+    if not os.path.isdir(payload):
+        return [(payload, rename or name)]
+
+    files = []
+    for root, dirs, filenames in os.walk(payload):
+        for file in filenames:
+            basename = os.path.basename(root)
+            filepath = os.path.join(os.path.abspath(root), file)
+            if basename == name:
+                filename = file
+            else:
+                filename = os.path.relpath(filepath, payload)
+            files.append((filepath, filename))
+    return files
+
+
+def _sync_name(filename):
+    # Mission file names always use forward slashes
+    return filename.replace(os.sep, "/").lstrip("/")
+
+
+def _remote_path(file_listing):
+    # Name of the file relative to the mission root, the name local files are synced to
+    if not file_listing.path:
+        return _sync_name(file_listing.filename)
+    return _sync_name("{path}/{filename}".format(
+        path=file_listing.path.rstrip("/"), filename=file_listing.filename))
+
+
+def _check_uploaded_size(remote_files, filename, size):
+    """
+    Check that a file uploaded in chunks was stored whole. A backend ignoring the
+    Content-Range header keeps only part of the file without reporting an error.
+
+    :param remote_files: Files currently in the mission
+    :type remote_files: List[FileListing]
+    :param filename: Name of the file in the mission
+    :type filename: str
+    :param size: Size of the local file
+    :type size: int
+    :raises IOError: The file is missing from the mission or its size does not match
+    :return: None
+    """
+    name = _sync_name(filename)
+    for file_listing in remote_files:
+        if _remote_path(file_listing) != name:
+            continue
+        # Listings without a size cannot be checked
+        if file_listing.file_size is not None and int(file_listing.file_size) != size:
+            raise IOError(
+                "Mission stored {remote} of {size} bytes of {filename}, the backend may not "
+                "support chunked uploads".format(remote=file_listing.file_size,
+                                                 size=size,
+                                                 filename=filename))
+        return
+    raise IOError(
+        "{filename} is missing from the mission after its chunked upload".format(
+            filename=filename))
+
+
+def _remote_names(file_listing):
+    return {_sync_name(file_listing.filename), _remote_path(file_listing)}
+
+
+def _plan_sync(manifest, files, remote_files):
+    """
+    Decide which local files must be uploaded and which mission files are missing locally
+
+    :param manifest: Manifest of the previous syncs
+    :type manifest: SyncManifest
+    :param files: Path on disk and filename in the mission of every local file
+    :type files: List[Tuple[str, str]]
+    :param remote_files: Files currently in the mission
+    :type remote_files: List[FileListing]
+    :return: Files to upload, unchanged filenames and paths of the mission files missing locally
+    :rtype: Tuple[List[Tuple[str, str]], List[str], List[str]]
+    """
+    remote = {}
+    for file_listing in remote_files:
+        for name in _remote_names(file_listing):
+            remote[name] = file_listing
+
+    to_upload = []
+    unchanged = []
+    local_names = set()
+    for filepath, filename in files:
+        name = _sync_name(filename)
+        local_names.add(name)
+        file_listing = remote.get(name)
+        if (file_listing is not None
+                and (file_listing.file_size is None or int(
+                    file_listing.file_size) == os.path.getsize(filepath))
+                and manifest.is_unchanged(name, filepath)):
+            unchanged.append(name)
+        else:
+            to_upload.append((filepath, filename))
+
+    missing = [
+        _remote_path(file_listing) for file_listing in remote_files
+        if not _remote_names(file_listing) & local_names
+    ]
+    return to_upload, unchanged, missing
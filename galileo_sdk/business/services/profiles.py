@@ -1,4 +1,5 @@
 from ..utils.generate_query_str import generate_query_str
+from ..utils.paginate import fetch_pages, iter_pages
 
 
 class ProfilesService:
@@ -43,6 +44,44 @@ class ProfilesService:
         })
         return self._profile_repo.list_users(query)
 
+    def iter_users(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every user matching the filters, page by page
+
+        :param items: Number of items per page, defaults to 25
+        :type items: int, optional
+        :param prefetch: Fetch the next page in the background, defaults to True
+        :type prefetch: bool, optional
+        :param filters: Any filter accepted by list_users, except page and items
+        :return: Generator over the profiles
+        :rtype: Iterator[Profile]
+        """
+        return iter_pages(
+            lambda page, items: self.list_users(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_users(self, items=25, concurrency=4, **filters):
+        """
+        Get every user matching the filters, requesting several pages concurrently
+
+        :param items: Number of items per page, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param filters: Any filter accepted by list_users, except page and items
+        :return: List of users, in page order
+        :rtype: List[Profile]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_users(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
+
     def self(self):
         """
         Get the current logged-in user's profile
@@ -52,6 +91,14 @@ class ProfilesService:
         """
         return self._profile_repo.self()
 
+    def invalidate_self(self):
+        """
+        Forget the cached profile of the current user, the next call to self fetches it again
+
+        :return: None
+        """
+        self._profile_repo.invalidate_self()
+
     def list_station_invites(self):
         """
         List all inbound station invites
@@ -1,4 +1,5 @@
 from ..utils.generate_query_str import generate_query_str
+from ..utils.paginate import fetch_pages, iter_pages
 
 
 class StationsService:
@@ -87,6 +88,44 @@ class StationsService:
 
         return self._stations_repo.list_stations(query)
 
+    def iter_stations(self, items=25, prefetch=True, **filters):
+        """
+        Lazily iterate over every station matching the filters, page by page
+
+        :param items: Items per page, defaults to 25
+        :type items: int, optional
+        :param prefetch: Fetch the next page in the background, defaults to True
+        :type prefetch: bool, optional
+        :param filters: Any filter accepted by list_stations, except page and items
+        :return: Generator over the stations
+        :rtype: Iterator[Station]
+        """
+        return iter_pages(
+            lambda page, items: self.list_stations(
+                page=page, items=items, **filters),
+            items=items,
+            prefetch=prefetch,
+        )
+
+    def fetch_all_stations(self, items=25, concurrency=4, **filters):
+        """
+        Get every station matching the filters, requesting several pages concurrently
+
+        :param items: Items per page, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :param filters: Any filter accepted by list_stations, except page and items
+        :return: List of stations, in page order
+        :rtype: List[Station]
+        """
+        return fetch_pages(
+            lambda page, items: self.list_stations(
+                page=page, items=items, **filters),
+            items=items,
+            concurrency=concurrency,
+        )
+
     def get_public_stations(self,
                             mission_types=[],
                             mission_cpu_value=None,
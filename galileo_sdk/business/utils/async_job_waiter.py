@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+from galileo_sdk.business.objects.exceptions import JobsException
+
+from .job_waiter import POLL_BATCH_SIZE, JobWaiter
+
+
+class AsyncJobWaiter(JobWaiter):
+    def __init__(self,
+                 job_ids,
+                 list_jobs,
+                 until=None,
+                 timeout=None,
+                 poll_interval=2.0,
+                 max_poll_interval=60.0):
+        """
+        Asyncio version of JobWaiter, for list_jobs returning a coroutine. Iterate it with
+        async for, or await wait(). Job events are still delivered by the connection's thread,
+        they wake the event loop up instead of waiting for the next listing.
+
+        :param job_ids: Ids of the jobs to wait for
+        :type job_ids: Iterable[str]
+        :param list_jobs: Function returning a coroutine of the jobs with the given ids
+        :type list_jobs: Callable[[List[str]], Awaitable[List[Job]]]
+        :param until: Statuses a job is done in, or a function telling whether a job is done, defaults to TERMINAL_JOB_STATUSES
+        :type until: Union[Iterable[EJobStatus], Callable[[Job], bool]], optional
+        :param timeout: Seconds to wait for, defaults to None to wait forever
+        :type timeout: float, optional
+        :param poll_interval: Shortest interval between two listings, defaults to 2.0
+        :type poll_interval: float, optional
+        :param max_poll_interval: Longest interval between two listings, defaults to 60.0
+        :type max_poll_interval: float, optional
+        """
+        super(AsyncJobWaiter, self).__init__(job_ids,
+                                             list_jobs,
+                                             until=until,
+                                             timeout=timeout,
+                                             poll_interval=poll_interval,
+                                             max_poll_interval=max_poll_interval)
+        self._loop = None
+        self._wake = None
+
+    def _check(self, job):
+        finished = super(AsyncJobWaiter, self)._check(job)
+        if finished and self._loop is not None:
+            # Events arrive on the connection's thread
+            self._loop.call_soon_threadsafe(self._wake.set)
+        return finished
+
+    async def poll(self):
+        """
+        List the pending jobs and finish the ones that are done
+
+        :return: Number of jobs finished
+        :rtype: int
+        """
+        ids = sorted(self.pending)
+        finished = 0
+        for start in range(0, len(ids), POLL_BATCH_SIZE):
+            for job in await self._list_jobs(ids[start:start + POLL_BATCH_SIZE]):
+                if job.job_id in self.pending and self._check(job):
+                    finished += 1
+        return finished
+
+    def __iter__(self):
+        raise TypeError("Iterate an AsyncJobWaiter with async for")
+
+    async def __aiter__(self):
+        self._loop = asyncio.get_event_loop()
+        self._wake = asyncio.Event()
+        # Subscribed before the first listing, so no update falls between the two
+        self._listen()
+        try:
+            while True:
+                # Cleared before the state is read, a job finished afterwards sets it again
+                self._wake.clear()
+                job = None
+                wait = None
+                with self._changed:
+                    if self._finished:
+                        job = self._finished.pop(0)
+                    elif not self.pending:
+                        return
+                    else:
+                        now = time.time()
+                        if self._deadline is not None and now >= self._deadline:
+                            raise JobsException(
+                                sorted(self.pending),
+                                "Timed out waiting for {count} jobs".format(
+                                    count=len(self.pending)))
+                        if now < self._next_poll:
+                            wake = self._next_poll
+                            if self._deadline is not None:
+                                wake = min(wake, self._deadline)
+                            wait = wake - now
+                if job is not None:
+                    yield job
+                elif wait is not None:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    self._schedule(await self.poll())
+        finally:
+            self.close()
+            self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    async def wait(self):
+        """
+        Wait for every job
+
+        :raises JobsException: Timed out, job_id holds the ids of the jobs still pending
+        :return: Job of each job id
+        :rtype: Dict[str, Job]
+        """
+        async for job in self:
+            pass
+        return self.done
+
+    def futures(self):
+        raise TypeError(
+            "futures() is not available on an AsyncJobWaiter, await wait() instead")
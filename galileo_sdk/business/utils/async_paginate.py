@@ -0,0 +1,101 @@
+import asyncio
+from collections import deque
+
+from .paginate import _chain
+
+
+async def iter_pages(list_page, items=25, page=1, prefetch=True):
+    """
+    Asyncio version of paginate.iter_pages, for list_page returning a coroutine. Only one
+    page is held in memory at a time, and the next page is requested in a task while the
+    caller processes the current one. Iteration stops after the first short page.
+
+    :param list_page: Function returning a coroutine of the results of a page, called as list_page(page, items)
+    :type list_page: Callable[[int, int], Awaitable[List]]
+    :param items: Number of items per page, defaults to 25
+    :type items: int, optional
+    :param page: First page to fetch, defaults to 1
+    :type page: int, optional
+    :param prefetch: Request the next page while the current one is processed, defaults to True
+    :type prefetch: bool, optional
+    :return: Asynchronous generator over the results of every page
+    :rtype: AsyncIterator
+    """
+    if items is None or items < 1:
+        raise ValueError("items must be a positive number")
+
+    next_page = asyncio.ensure_future(list_page(page, items))
+    try:
+        while next_page is not None:
+            results = await next_page
+            next_page = None
+            if len(results) >= items and prefetch:
+                next_page = asyncio.ensure_future(list_page(page + 1, items))
+            for result in results:
+                yield result
+            if len(results) < items:
+                return
+            page += 1
+            if next_page is None:
+                next_page = asyncio.ensure_future(list_page(page, items))
+    finally:
+        # The caller may stop early, the prefetched page is dropped
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def fetch_pages(list_page, items=25, concurrency=4, page=1, concat=None):
+    """
+    Asyncio version of paginate.fetch_pages, for list_page returning a coroutine. Up to
+    concurrency pages are requested at the same time, and results are returned in page
+    order. No new page is requested once a short page has been received.
+
+    :param list_page: Function returning a coroutine of the results of a page, called as list_page(page, items)
+    :type list_page: Callable[[int, int], Awaitable[List]]
+    :param items: Number of items per page, defaults to 25
+    :type items: int, optional
+    :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+    :type concurrency: int, optional
+    :param page: First page to fetch, defaults to 1
+    :type page: int, optional
+    :param concat: Function combining the results of the pages, such as JobTable.concat, defaults to None to return a list
+    :type concat: Callable[[List], object], optional
+    :return: The results of every page
+    :rtype: List
+    """
+    if concurrency is None or concurrency < 1:
+        raise ValueError("concurrency must be a positive number")
+
+    if items is None or items < 1:
+        raise ValueError("items must be a positive number")
+
+    if concat is None:
+        concat = _chain
+
+    def is_short(task):
+        return (task.done() and not task.cancelled()
+                and task.exception() is None and len(task.result()) < items)
+
+    pages = []
+    pending = deque(
+        asyncio.ensure_future(list_page(next_page, items))
+        for next_page in range(page, page + concurrency))
+    next_page = page + concurrency
+    exhausted = False
+    try:
+        while pending:
+            page_results = await pending.popleft()
+            pages.append(page_results)
+            if len(page_results) < items:
+                break
+            # A later page may already have come back short, the end is known
+            exhausted = exhausted or any(is_short(t) for t in pending)
+            if not exhausted:
+                pending.append(
+                    asyncio.ensure_future(list_page(next_page, items)))
+                next_page += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return concat(pages)
@@ -0,0 +1,252 @@
+import logging
+import threading
+import time
+
+try:
+    from concurrent.futures import Future
+except ImportError:
+    # Python 2 without the futures backport, only iterating is available
+    Future = None
+
+from galileo_sdk.business.objects.exceptions import JobsException
+from galileo_sdk.business.objects.jobs import TERMINAL_JOB_STATUSES, EJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Number of job ids requested per list_jobs call
+POLL_BATCH_SIZE = 100
+
+
+def job_status(job):
+    """
+    Status of a job as an EJobStatus, the backend sends its name
+
+    :param job: Job
+    :type job: Job
+    :return: Status of the job, unchanged if it is not a known status
+    :rtype: EJobStatus
+    """
+    status = job.status
+    if isinstance(status, EJobStatus):
+        return status
+    try:
+        return EJobStatus[status]
+    except (KeyError, TypeError):
+        return status
+
+
+def _until(until):
+    if until is None:
+        until = TERMINAL_JOB_STATUSES
+    if callable(until):
+        return until
+    statuses = set(
+        status if isinstance(status, EJobStatus) else EJobStatus[status]
+        for status in until)
+    return lambda job: job_status(job) in statuses
+
+
+class JobWaiter:
+    def __init__(self,
+                 job_ids,
+                 list_jobs,
+                 until=None,
+                 timeout=None,
+                 poll_interval=2.0,
+                 max_poll_interval=60.0):
+        """
+        Waits for many jobs at once, yielding each job as soon as it is done. The pending jobs
+        are listed by batches of ids every poll_interval seconds, backing off up to
+        max_poll_interval while nothing changes. Once listening to the job events, jobs are
+        finished as their events arrive and only listed every max_poll_interval seconds, to
+        catch what the events missed. The events are subscribed to when the iteration starts
+        and unsubscribed from when it ends. A waiter stopped early, without iterating to the
+        end, must be closed, or used as a context manager.
+
+        :param job_ids: Ids of the jobs to wait for
+        :type job_ids: Iterable[str]
+        :param list_jobs: Function listing the jobs with the given ids
+        :type list_jobs: Callable[[List[str]], List[Job]]
+        :param until: Statuses a job is done in, or a function telling whether a job is done, defaults to TERMINAL_JOB_STATUSES
+        :type until: Union[Iterable[EJobStatus], Callable[[Job], bool]], optional
+        :param timeout: Seconds to wait for, defaults to None to wait forever
+        :type timeout: float, optional
+        :param poll_interval: Shortest interval between two listings, defaults to 2.0
+        :type poll_interval: float, optional
+        :param max_poll_interval: Longest interval between two listings, defaults to 60.0
+        :type max_poll_interval: float, optional
+        """
+        self.pending = set(job_ids)
+        self.done = {}
+        self._list_jobs = list_jobs
+        self._until = _until(until)
+        self._deadline = None if timeout is None else time.time() + timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.events = False
+        self._subscribe = None
+        self._closer = None
+        self._interval = poll_interval
+        self._next_poll = time.time()
+        self._finished = []
+        self._changed = threading.Condition()
+
+    def listen(self, subscribe):
+        """
+        Listen to the job events once the jobs are iterated. If subscribing fails the jobs are
+        only polled.
+
+        :param subscribe: Subscribes a handler to the job events and returns the function unsubscribing it
+        :type subscribe: Callable[[Callable[[JobEvent], None]], Callable[[], None]]
+        :return: None
+        """
+        self._subscribe = subscribe
+
+    def _listen(self):
+        subscribe, self._subscribe = self._subscribe, None
+        if subscribe is None:
+            return
+        try:
+            self._closer = subscribe(self.on_event)
+        except Exception:
+            logger.warning("Job events are unavailable, polling the jobs",
+                           exc_info=True)
+            return
+        self.events = True
+
+    def on_event(self, event):
+        """
+        Handler of the job_launcher_updated and station_job_updated events
+
+        :param event: Job event
+        :type event: JobEvent
+        :return: None
+        """
+        # job_id is read without converting the job of events about other jobs
+        if event.job_id in self.pending:
+            self._check(event.job)
+
+    def _check(self, job):
+        if not self._until(job):
+            return False
+        with self._changed:
+            if job.job_id not in self.pending:
+                return False
+            self.pending.discard(job.job_id)
+            self.done[job.job_id] = job
+            self._finished.append(job)
+            self._changed.notify_all()
+        return True
+
+    def poll(self):
+        """
+        List the pending jobs and finish the ones that are done
+
+        :return: Number of jobs finished
+        :rtype: int
+        """
+        ids = sorted(self.pending)
+        finished = 0
+        for start in range(0, len(ids), POLL_BATCH_SIZE):
+            for job in self._list_jobs(ids[start:start + POLL_BATCH_SIZE]):
+                if job.job_id in self.pending and self._check(job):
+                    finished += 1
+        return finished
+
+    def _schedule(self, finished):
+        if self.events:
+            # Only catches what the events missed
+            self._interval = self.max_poll_interval
+        elif finished:
+            self._interval = self.poll_interval
+        else:
+            self._interval = min(self._interval * 1.5, self.max_poll_interval)
+        self._next_poll = time.time() + self._interval
+
+    def __iter__(self):
+        # Subscribed before the first listing, so no update falls between the two
+        self._listen()
+        try:
+            while True:
+                job = None
+                with self._changed:
+                    if self._finished:
+                        job = self._finished.pop(0)
+                    elif not self.pending:
+                        return
+                    else:
+                        now = time.time()
+                        if self._deadline is not None and now >= self._deadline:
+                            raise JobsException(
+                                sorted(self.pending),
+                                "Timed out waiting for {count} jobs".format(
+                                    count=len(self.pending)))
+                        if now < self._next_poll:
+                            wake = self._next_poll
+                            if self._deadline is not None:
+                                wake = min(wake, self._deadline)
+                            self._changed.wait(wake - now)
+                            continue
+                # The lock is not held while the caller handles the job or jobs are listed
+                if job is not None:
+                    yield job
+                else:
+                    self._schedule(self.poll())
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop receiving the job events, or stop a waiter that was not iterated yet from
+        subscribing to them
+
+        :return: None
+        """
+        self._subscribe = None
+        closer, self._closer = self._closer, None
+        if closer is not None:
+            closer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def wait(self):
+        """
+        Wait for every job
+
+        :raises JobsException: Timed out, job_id holds the ids of the jobs still pending
+        :return: Job of each job id
+        :rtype: Dict[str, Job]
+        """
+        for job in self:
+            pass
+        return self.done
+
+    def futures(self):
+        """
+        Future of each job, resolved with the Job when it is done. The jobs are waited for in
+        a background thread.
+
+        :return: Future of each job id
+        :rtype: Dict[str, concurrent.futures.Future]
+        """
+        if Future is None:
+            raise Exception("Futures are not available in Python 2")
+        futures = dict((job_id, Future()) for job_id in self.pending)
+
+        def run():
+            try:
+                for job in self:
+                    futures[job.job_id].set_result(job)
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return futures
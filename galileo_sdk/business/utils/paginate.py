@@ -0,0 +1,129 @@
+from collections import deque
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without the futures backport, pages are fetched in the foreground
+    ThreadPoolExecutor = None
+
+
+def iter_pages(list_page, items=25, page=1, prefetch=True):
+    """
+    Lazily iterate over every result of a paginated list endpoint. Only one page is held in
+    memory at a time, and the next page is requested in the background while the caller
+    processes the current one. Iteration stops after the first short page.
+
+    :param list_page: Function returning the results of a page, called as list_page(page, items)
+    :type list_page: Callable[[int, int], List]
+    :param items: Number of items per page, defaults to 25
+    :type items: int, optional
+    :param page: First page to fetch, defaults to 1
+    :type page: int, optional
+    :param prefetch: Fetch the next page in a background thread, defaults to True
+    :type prefetch: bool, optional
+    :return: Generator over the results of every page
+    :rtype: Iterator
+    """
+    if items is None or items < 1:
+        raise ValueError("items must be a positive number")
+
+    if not prefetch or ThreadPoolExecutor is None:
+        while True:
+            results = list_page(page, items)
+            for result in results:
+                yield result
+            if len(results) < items:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(list_page, page, items)
+    try:
+        while future is not None:
+            results = future.result()
+            if len(results) < items:
+                future = None
+            else:
+                page += 1
+                future = executor.submit(list_page, page, items)
+            for result in results:
+                yield result
+    finally:
+        # The caller may stop early, the prefetched page is dropped
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def fetch_pages(list_page, items=25, concurrency=4, page=1, concat=None):
+    """
+    Fetch every result of a paginated list endpoint, requesting up to concurrency pages at
+    the same time. Results are returned in page order. No new page is requested once a
+    short page has been received.
+
+    :param list_page: Function returning the results of a page, called as list_page(page, items)
+    :type list_page: Callable[[int, int], List]
+    :param items: Number of items per page, defaults to 25
+    :type items: int, optional
+    :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+    :type concurrency: int, optional
+    :param page: First page to fetch, defaults to 1
+    :type page: int, optional
+    :param concat: Function combining the results of the pages, such as JobTable.concat, defaults to None to return a list
+    :type concat: Callable[[List], object], optional
+    :return: The results of every page
+    :rtype: List
+    """
+    if concurrency is None or concurrency < 1:
+        raise ValueError("concurrency must be a positive number")
+
+    if items is None or items < 1:
+        raise ValueError("items must be a positive number")
+
+    if concat is None:
+        concat = _chain
+
+    if concurrency == 1 or ThreadPoolExecutor is None:
+        pages = []
+        while True:
+            pages.append(list_page(page, items))
+            if len(pages[-1]) < items:
+                return concat(pages)
+            page += 1
+
+    def is_short(future):
+        return (future.done() and not future.cancelled()
+                and future.exception() is None
+                and len(future.result()) < items)
+
+    pages = []
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    try:
+        for next_page in range(page, page + concurrency):
+            pending.append(executor.submit(list_page, next_page, items))
+        next_page = page + concurrency
+        exhausted = False
+        while pending:
+            page_results = pending.popleft().result()
+            pages.append(page_results)
+            if len(page_results) < items:
+                break
+            # A later page may already have come back short, the end is known
+            exhausted = exhausted or any(is_short(f) for f in pending)
+            if not exhausted:
+                pending.append(executor.submit(list_page, next_page, items))
+                next_page += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    return concat(pages)
+
+
+def _chain(pages):
+    results = []
+    for page_results in pages:
+        results.extend(page_results)
+    return results
@@ -0,0 +1,394 @@
+import logging
+import threading
+
+from galileo_sdk.business.objects.jobs import JobEvent
+from galileo_sdk.business.objects.lz import (
+    LzHardwareUpdateEvent,
+    LzRegisteredEvent,
+    LzStatusUpdateEvent,
+)
+from galileo_sdk.business.objects.stations import (
+    NewStationEvent,
+    StationAdminDestroyedEvent,
+    StationAdminLzAddedEvent,
+    StationAdminLzRemovedEvent,
+    StationAdminStationUpdated,
+    StationMemberDestroyedEvent,
+    StationMemberLzAddedEvent,
+    StationMemberLzRemovedEvent,
+    StationMemberStationUpdated,
+    StationUserExpelledEvent,
+    StationUserInviteReceivedEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Topics a store listens to
+STATE_TOPICS = ("jobs", "lz", "stations")
+
+_STATION_UPSERTS = (
+    NewStationEvent,
+    StationUserInviteReceivedEvent,
+    StationAdminStationUpdated,
+    StationMemberStationUpdated,
+)
+_STATION_REMOVALS = (
+    StationAdminDestroyedEvent,
+    StationMemberDestroyedEvent,
+    StationUserExpelledEvent,
+)
+_STATION_LZ_ADDITIONS = (StationAdminLzAddedEvent, StationMemberLzAddedEvent)
+_STATION_LZ_REMOVALS = (StationAdminLzRemovedEvent,
+                        StationMemberLzRemovedEvent)
+
+
+def _status_key(status):
+    # Jobs carry the status name sent by the backend, Landing Zones an enum
+    return getattr(status, "name", status)
+
+
+def _station_id(event):
+    station = getattr(event, "station", None)
+    if station is not None:
+        return station.station_id
+    # Some station events name it stationid
+    return getattr(event, "station_id", getattr(event, "stationid", None))
+
+
+class _Index:
+    def __init__(self):
+        self._ids = {}
+
+    def add(self, key, item_id):
+        if key is not None:
+            self._ids.setdefault(key, set()).add(item_id)
+
+    def discard(self, key, item_id):
+        ids = self._ids.get(key)
+        if ids is not None:
+            ids.discard(item_id)
+            if not ids:
+                del self._ids[key]
+
+    def get(self, key):
+        return self._ids.get(key, set())
+
+    def clear(self):
+        self._ids.clear()
+
+
+class StateStore:
+    # Attributes of a job indexed, by lookup name
+    JOB_INDEXES = {
+        "status": lambda job: _status_key(job.status),
+        "station_id": lambda job: job.station_id,
+        "lz_id": lambda job: job.receiver_id,
+        "mission_id": lambda job: job.mission_id,
+    }
+
+    def __init__(self, jobs_service, lz_service, stations_service):
+        """
+        In-process view of your jobs, Landing Zones and stations. It is loaded once from the
+        list endpoints and then kept up to date by the jobs, lz and stations events, so it can
+        be queried without a request.
+
+        Job and Landing Zone events carry what changed and are applied as they arrive. Most
+        station events only carry ids, the stations they touch are listed again the next time
+        stations are looked up.
+
+        :param jobs_service: Jobs service
+        :type jobs_service: JobsService
+        :param lz_service: Landing Zones service
+        :type lz_service: LzService
+        :param stations_service: Stations service
+        :type stations_service: StationsService
+        """
+        self._jobs_service = jobs_service
+        self._lz_service = lz_service
+        self._stations_service = stations_service
+        self._lock = threading.RLock()
+        self._jobs = {}
+        self._lzs = {}
+        self._stations = {}
+        self._job_indexes = dict((name, _Index()) for name in self.JOB_INDEXES)
+        self._lz_status = _Index()
+        self._station_lzs = _Index()
+        # Ids of the stations to list again
+        self._stale_stations = set()
+        # Events received while loading, applied over the lists once they are loaded
+        self._backlog = None
+        self._closers = []
+        self.loaded = False
+
+    def listen(self, subscribe):
+        """
+        Apply the events of each topic
+
+        :param subscribe: Subscribes a handler to every event of a topic and returns the function unsubscribing it
+        :type subscribe: Callable[[str, Callable[[object], None]], Callable[[], None]]
+        :return: None
+        """
+        for topic in STATE_TOPICS:
+            self._closers.append(subscribe(topic, self.apply))
+
+    def load(self, items=25, concurrency=4):
+        """
+        List the jobs, Landing Zones and stations, replacing what the store holds. Events
+        received while listing are applied afterwards.
+
+        :param items: Items per page, defaults to 25
+        :type items: int, optional
+        :param concurrency: Maximum number of pages requested at the same time, defaults to 4
+        :type concurrency: int, optional
+        :return: None
+        """
+        with self._lock:
+            self._backlog = []
+        try:
+            jobs = self._jobs_service.fetch_all_jobs(items=items,
+                                                     concurrency=concurrency)
+            lzs = self._lz_service.fetch_all_lz(items=items,
+                                                concurrency=concurrency)
+            stations = self._stations_service.fetch_all_stations(
+                items=items, concurrency=concurrency)
+        except Exception:
+            with self._lock:
+                self._backlog = None
+            raise
+        with self._lock:
+            backlog, self._backlog = self._backlog, None
+            self._jobs.clear()
+            for index in self._job_indexes.values():
+                index.clear()
+            self._lzs.clear()
+            self._lz_status.clear()
+            self._stations.clear()
+            self._station_lzs.clear()
+            self._stale_stations.clear()
+            for job in jobs:
+                self._put_job(job)
+            for lz in lzs:
+                self._put_lz(lz)
+            for station in stations:
+                self._put_station(station)
+            for event in backlog:
+                self._apply(event)
+            self.loaded = True
+
+    def apply(self, event):
+        """
+        Apply a jobs, lz or stations event. Other events are ignored.
+
+        :param event: Typed event
+        :return: None
+        """
+        with self._lock:
+            if self._backlog is not None:
+                self._backlog.append(event)
+            else:
+                self._apply(event)
+
+    def _apply(self, event):
+        if isinstance(event, JobEvent):
+            job = event.job
+            current = self._jobs.get(job.job_id)
+            # Events received while loading may be older than the listed job
+            if current is None or not _older(job, current):
+                self._put_job(job)
+        elif isinstance(event, LzStatusUpdateEvent):
+            lz = self._lzs.get(event.lz_id)
+            if lz is not None:
+                self._lz_status.discard(_status_key(lz.status), lz.lz_id)
+                lz.status = event.status
+                self._lz_status.add(_status_key(lz.status), lz.lz_id)
+        elif isinstance(event, (LzRegisteredEvent, LzHardwareUpdateEvent)):
+            self._put_lz(event.lz)
+        elif isinstance(event, _STATION_UPSERTS):
+            self._put_station(event.station)
+        elif isinstance(event, _STATION_REMOVALS):
+            self._remove_station(_station_id(event))
+        elif isinstance(event, _STATION_LZ_ADDITIONS + _STATION_LZ_REMOVALS):
+            self._update_station_lzs(event)
+        else:
+            station_id = _station_id(event)
+            if station_id is not None:
+                self._stale_stations.add(station_id)
+
+    def _put_job(self, job):
+        current = self._jobs.get(job.job_id)
+        for name, key in self.JOB_INDEXES.items():
+            if current is not None:
+                self._job_indexes[name].discard(key(current), job.job_id)
+            self._job_indexes[name].add(key(job), job.job_id)
+        self._jobs[job.job_id] = job
+
+    def _put_lz(self, lz):
+        current = self._lzs.get(lz.lz_id)
+        if current is not None:
+            self._lz_status.discard(_status_key(current.status), lz.lz_id)
+        self._lz_status.add(_status_key(lz.status), lz.lz_id)
+        self._lzs[lz.lz_id] = lz
+
+    def _put_station(self, station):
+        self._remove_station(station.station_id)
+        for lz_id in station.lz_ids or ():
+            self._station_lzs.add(lz_id, station.station_id)
+        self._stations[station.station_id] = station
+
+    def _remove_station(self, station_id):
+        self._stale_stations.discard(station_id)
+        station = self._stations.pop(station_id, None)
+        if station is not None:
+            for lz_id in station.lz_ids or ():
+                self._station_lzs.discard(lz_id, station_id)
+
+    def _update_station_lzs(self, event):
+        station = self._stations.get(event.station_id)
+        if station is None:
+            self._stale_stations.add(event.station_id)
+            return
+        lz_ids = list(station.lz_ids or ())
+        if isinstance(event, _STATION_LZ_ADDITIONS):
+            lz_ids.extend(lz_id for lz_id in event.mids if lz_id not in lz_ids)
+        else:
+            lz_ids = [lz_id for lz_id in lz_ids if lz_id not in event.lz_ids]
+        self._remove_station(station.station_id)
+        station.lz_ids = lz_ids
+        self._put_station(station)
+
+    def _refresh_stations(self):
+        with self._lock:
+            station_ids = sorted(self._stale_stations)
+        if not station_ids:
+            return
+        stations = self._stations_service.list_stations(
+            station_ids=station_ids, items=len(station_ids))
+        with self._lock:
+            listed = dict((station.station_id, station)
+                          for station in stations)
+            for station_id in station_ids:
+                if station_id not in self._stale_stations:
+                    # Updated or removed by an event while it was listed
+                    continue
+                if station_id in listed:
+                    self._put_station(listed[station_id])
+                else:
+                    # Not one of your stations anymore
+                    self._remove_station(station_id)
+
+    def job(self, job_id):
+        """
+        :param job_id: Job id
+        :type job_id: str
+        :return: The job, None if it is not in the store
+        :rtype: Job
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, status=None, station_id=None, lz_id=None, mission_id=None):
+        """
+        Jobs matching every filter given
+
+        :param status: Status of the jobs, defaults to None
+        :type status: Union[EJobStatus, str], optional
+        :param station_id: Station the jobs were sent to, defaults to None
+        :type station_id: str, optional
+        :param lz_id: Landing Zone running the jobs, defaults to None
+        :type lz_id: str, optional
+        :param mission_id: Mission of the jobs, defaults to None
+        :type mission_id: str, optional
+        :return: Matching jobs
+        :rtype: List[Job]
+        """
+        filters = {
+            "status": _status_key(status),
+            "station_id": station_id,
+            "lz_id": lz_id,
+            "mission_id": mission_id,
+        }
+        with self._lock:
+            matches = [
+                self._job_indexes[name].get(key)
+                for name, key in filters.items() if key is not None
+            ]
+            if not matches:
+                return list(self._jobs.values())
+            # Smallest set first, the others only narrow it down
+            matches.sort(key=len)
+            ids = matches[0].intersection(*matches[1:])
+            return [self._jobs[job_id] for job_id in ids]
+
+    def lz(self, lz_id):
+        """
+        :param lz_id: Landing Zone id
+        :type lz_id: str
+        :return: The Landing Zone, None if it is not in the store
+        :rtype: Lz
+        """
+        with self._lock:
+            return self._lzs.get(lz_id)
+
+    def lzs(self, status=None):
+        """
+        :param status: Status of the Landing Zones, defaults to None for every Landing Zone
+        :type status: Union[ELzStatus, str], optional
+        :return: Matching Landing Zones
+        :rtype: List[Lz]
+        """
+        with self._lock:
+            if status is None:
+                return list(self._lzs.values())
+            return [
+                self._lzs[lz_id]
+                for lz_id in self._lz_status.get(_status_key(status))
+            ]
+
+    def station(self, station_id):
+        """
+        :param station_id: Station id
+        :type station_id: str
+        :return: The station, None if it is not in the store
+        :rtype: Station
+        """
+        self._refresh_stations()
+        with self._lock:
+            return self._stations.get(station_id)
+
+    def stations(self, lz_id=None):
+        """
+        :param lz_id: Landing Zone in the stations, defaults to None for every station
+        :type lz_id: str, optional
+        :return: Matching stations
+        :rtype: List[Station]
+        """
+        self._refresh_stations()
+        with self._lock:
+            if lz_id is None:
+                return list(self._stations.values())
+            return [
+                self._stations[station_id]
+                for station_id in self._station_lzs.get(lz_id)
+            ]
+
+    def close(self):
+        """
+        Stop applying the events
+
+        :return: None
+        """
+        closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                closer()
+            except Exception:
+                logger.warning("Could not unsubscribe the state store",
+                               exc_info=True)
+
+
+def _older(job, current):
+    try:
+        return job.last_updated < current.last_updated
+    except TypeError:
+        # Missing update time
+        return False
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_MANIFEST_DIR = os.path.join(os.path.expanduser("~"), ".galileo_sync")
+
+
+def file_sha256(filepath, block_size=1024 * 1024):
+    """
+    Hash a file without reading it fully in memory
+
+    :param filepath: Path of the file on disk
+    :type filepath: str
+    :param block_size: Number of bytes read at a time, defaults to 1MiB
+    :type block_size: int, optional
+    :return: Hex digest of the content
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    def __init__(self, mission_id, manifest_dir=None):
+        """
+        Local record of the files synced to a Mission: size, modification time and content
+        hash of each file when it was last uploaded. It is stored outside the synced folder,
+        in one JSON file per Mission.
+
+        :param mission_id: Mission id the files are synced to
+        :type mission_id: str
+        :param manifest_dir: Folder of the manifests, defaults to ~/.galileo_sync
+        :type manifest_dir: str, optional
+        """
+        self.mission_id = mission_id
+        self.manifest_dir = manifest_dir or DEFAULT_MANIFEST_DIR
+        self.path = os.path.join(self.manifest_dir,
+                                 "{mission_id}.json".format(mission_id=mission_id))
+        self._lock = threading.Lock()
+        self._digests = {}
+        self._files = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f).get("files", {})
+        except (IOError, OSError, ValueError):
+            # A missing or corrupted manifest only means every file is uploaded again
+            return {}
+
+    def is_unchanged(self, filename, filepath):
+        """
+        Check whether a file is the same as when it was last synced. The content is only
+        hashed when the size matches but the modification time does not.
+
+        :param filename: Name of the file in the Mission
+        :type filename: str
+        :param filepath: Path of the file on disk
+        :type filepath: str
+        :return: True if the file does not need to be uploaded
+        :rtype: bool
+        """
+        entry = self._files.get(filename)
+        stat = os.stat(filepath)
+        if entry is None or entry["size"] != stat.st_size:
+            return False
+        if entry["mtime"] == stat.st_mtime:
+            return True
+
+        digest = file_sha256(filepath)
+        with self._lock:
+            self._digests[filename] = digest
+        if digest != entry["sha256"]:
+            return False
+        # Touched but not modified, remember the new time to skip hashing next time
+        with self._lock:
+            entry["mtime"] = stat.st_mtime
+        return True
+
+    def record(self, filename, filepath):
+        """
+        Record a file as synced
+
+        :param filename: Name of the file in the Mission
+        :type filename: str
+        :param filepath: Path of the file on disk
+        :type filepath: str
+        :return: None
+        """
+        stat = os.stat(filepath)
+        with self._lock:
+            digest = self._digests.pop(filename, None)
+        if digest is None:
+            digest = file_sha256(filepath)
+        with self._lock:
+            self._files[filename] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "sha256": digest,
+            }
+
+    def forget(self, filename):
+        """
+        Remove a file from the manifest
+
+        :param filename: Name of the file in the Mission
+        :type filename: str
+        :return: None
+        """
+        with self._lock:
+            self._files.pop(filename, None)
+
+    def save(self):
+        """
+        Write the manifest to disk, replacing the previous one atomically
+
+        :return: None
+        """
+        if not os.path.isdir(self.manifest_dir):
+            os.makedirs(self.manifest_dir)
+        tmp_path = self.path + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump({"mission_id": self.mission_id, "files": self._files},
+                          f)
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, self.path)
+        else:
+            # Python 2, os.rename does not overwrite on Windows
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+
+    def __contains__(self, filename):
+        return filename in self._files
+
+    def __len__(self):
+        return len(self._files)
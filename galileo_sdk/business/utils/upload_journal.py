@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+
+from .sync_manifest import DEFAULT_MANIFEST_DIR
+
+DEFAULT_JOURNAL_DIR = os.path.join(DEFAULT_MANIFEST_DIR, "uploads")
+
+
+def is_retryable(error):
+    """
+    Check whether a failed request is worth sending again: dropped connections, timeouts
+    and server errors are, client errors are not.
+
+    :param error: Error raised by the request
+    :type error: Exception
+    :return: True if the request can be retried
+    :rtype: bool
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        # aiohttp.ClientResponseError
+        status = getattr(error, "status", None)
+    if status is None:
+        return True
+    return status >= 500 or status in (408, 429)
+
+
+class UploadJournal:
+    def __init__(self, mission_id, filename, sha256, size, journal_dir=None):
+        """
+        Local record of how much of a file was uploaded in chunks. The journal is keyed by
+        mission, filename and content hash, so an interrupted upload of the same file
+        continues where it stopped while a modified file starts over.
+
+        :param mission_id: Mission id the file is uploaded to
+        :type mission_id: str
+        :param filename: Name of the file in the Mission
+        :type filename: str
+        :param sha256: Hex digest of the file content
+        :type sha256: str
+        :param size: Size in bytes of the file
+        :type size: int
+        :param journal_dir: Folder of the journals, defaults to ~/.galileo_sync/uploads
+        :type journal_dir: str, optional
+        """
+        self.mission_id = mission_id
+        self.filename = filename
+        self.sha256 = sha256
+        self.size = size
+        self.journal_dir = journal_dir or DEFAULT_JOURNAL_DIR
+        key = hashlib.sha256("\0".join([mission_id, filename,
+                                        sha256]).encode("utf-8")).hexdigest()
+        self.path = os.path.join(self.journal_dir,
+                                 "{key}.json".format(key=key))
+        self.offset = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return 0
+        if entry.get("size") != self.size:
+            return 0
+        return min(max(int(entry.get("offset", 0)), 0), self.size)
+
+    def update(self, offset):
+        """
+        Record that every byte before offset was uploaded
+
+        :param offset: Number of bytes uploaded
+        :type offset: int
+        :return: None
+        """
+        self.offset = offset
+        if not os.path.isdir(self.journal_dir):
+            os.makedirs(self.journal_dir)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "mission_id": self.mission_id,
+                    "filename": self.filename,
+                    "sha256": self.sha256,
+                    "size": self.size,
+                    "offset": offset,
+                }, f)
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, self.path)
+        else:
+            # Python 2, os.rename does not overwrite on Windows
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+
+    def remove(self):
+        """
+        Forget the upload once the file is complete
+
+        :return: None
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -1,7 +1,13 @@
 import sys
 
 if sys.version_info[0] == 3:
-    from .events import GalileoConnector
+    from .events import (
+        AsyncGalileoConnector,
+        EOverflowPolicy,
+        EventRecovery,
+        EventStream,
+        GalileoConnector,
+    )
 
 from .repositories import (
     UniversesRepository,
@@ -14,6 +20,11 @@ from .repositories import (
     StationsRepository,
     SettingsRepository,
 )
-from .providers import AuthProvider
+from .providers import (
+    AuthProvider,
+    IdentityCache,
+    ResponseCache,
+    SessionProvider,
+)
 
 # from .util import file_dict_to_file_listing, job_dict_to_job
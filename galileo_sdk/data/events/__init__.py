@@ -1,4 +1,7 @@
 import sys
 
 if sys.version_info[0] == 3:
+    from .async_connector import AsyncGalileoConnector
     from .connector import GalileoConnector
+    from .recovery import EventRecovery
+    from .stream import EOverflowPolicy, EventStream
@@ -0,0 +1,142 @@
+import asyncio
+
+import socketio
+
+from galileo_sdk.data.events.stream import (
+    EOverflowPolicy,
+    EventStream,
+    event_key,
+)
+from galileo_sdk.data.events.topics import TOPICS
+
+
+class AsyncGalileoConnector:
+    def __init__(self, settings_repo, auth_provider, namespace):
+        """
+        Asyncio Socket.IO connection delivering the events to EventStreams. One connection is
+        shared by every stream, it is opened with the first stream and closed with the last.
+        Handlers run on the event loop, so nothing is delivered from another thread.
+
+        :param settings_repo: Settings repository
+        :type settings_repo: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Socket.IO namespace
+        :type namespace: str
+        """
+        self._settings_repo = settings_repo
+        self._auth_provider = auth_provider
+        self.namespace = namespace
+        self._socket = None
+        self._lock = None
+        # Open streams of each topic
+        self._streams = {}
+
+    def stream(self,
+               topic,
+               maxsize=1000,
+               overflow=EOverflowPolicy.drop_oldest,
+               key=event_key):
+        """
+        Create a stream of the events of a topic. It subscribes when it is first iterated.
+
+        :param topic: "lz", "jobs" or "stations"
+        :type topic: str
+        :param maxsize: Maximum number of queued events, defaults to 1000
+        :type maxsize: int, optional
+        :param overflow: What to do when the queue is full, defaults to EOverflowPolicy.drop_oldest
+        :type overflow: EOverflowPolicy, optional
+        :param key: Coalescing key of an event, defaults to the job or landing zone id
+        :type key: Callable[[object], Hashable], optional
+        :return: Stream of typed events
+        :rtype: EventStream
+        """
+        if topic not in TOPICS:
+            raise ValueError("Unknown event topic {topic}".format(topic=topic))
+        return EventStream(
+            maxsize,
+            overflow,
+            key,
+            opener=lambda stream: self._subscribe(topic, stream),
+            closer=lambda stream: self._release(topic, stream),
+        )
+
+    def _get_lock(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _connect(self):
+        settings = self._settings_repo.get_settings()
+        token = self._auth_provider.get_access_token()
+        await self._socket.connect(
+            "{backend}{namespace}".format(backend=settings.backend,
+                                          namespace=self.namespace),
+            headers={"Authorization": "Bearer {token}".format(token=token)},
+            transports="websocket",
+            namespaces=[self.namespace],
+        )
+
+    async def _subscribe(self, topic, stream):
+        async with self._get_lock():
+            if self._socket is None:
+                self._socket = socketio.AsyncClient()
+            first = topic not in self._streams
+            if first:
+                for event, method, convert in TOPICS[topic][1]:
+                    self._socket.on(event, self._handler(topic, convert),
+                                    self.namespace)
+                self._streams[topic] = []
+            self._streams[topic].append(stream)
+            if not self._socket.connected:
+                try:
+                    await self._connect()
+                except Exception:
+                    self._remove(topic, stream)
+                    raise
+
+    def _handler(self, topic, convert):
+        async def handler(data):
+            event = convert(data)
+            for stream in list(self._streams.get(topic, ())):
+                await stream.put(event)
+
+        return handler
+
+    def _remove(self, topic, stream):
+        streams = self._streams.get(topic, [])
+        if stream in streams:
+            streams.remove(stream)
+        if streams or topic not in self._streams:
+            return
+        del self._streams[topic]
+        handlers = self._socket.handlers.get(self.namespace, {})
+        for event, method, convert in TOPICS[topic][1]:
+            handlers.pop(event, None)
+
+    async def _release(self, topic, stream):
+        async with self._get_lock():
+            self._remove(topic, stream)
+            if not self._streams:
+                await self._disconnect()
+
+    async def _disconnect(self):
+        if self._socket is None:
+            return
+        socket, self._socket = self._socket, None
+        if socket.connected:
+            await socket.disconnect()
+
+    async def disconnect(self):
+        """
+        Close every stream and the connection
+
+        :return: None
+        """
+        streams = [
+            stream for streams in self._streams.values() for stream in streams
+        ]
+        for stream in streams:
+            await stream.close()
+        async with self._get_lock():
+            await self._disconnect()
@@ -1,66 +1,16 @@
+import logging
+import random
 import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 if sys.version_info[0] == 3:
     import socketio
 
-    from galileo_sdk.business.objects.jobs import (
-        JobLauncherSubmittedEvent,
-        JobLauncherUpdatedEvent,
-        JobsEvents,
-        StationJobUpdatedEvent,
-    )
-    from galileo_sdk.business.objects.lz import (
-        ELzStatus,
-        LzHardwareUpdateEvent,
-        LzRegisteredEvent,
-        LzEvents,
-        LzStatusUpdateEvent,
-    )
-    from galileo_sdk.business.objects.stations import (
-        NewStationEvent,
-        StationAdminDestroyedEvent,
-        StationAdminInviteAcceptedEvent,
-        StationAdminInviteRejectedEvent,
-        StationAdminInviteSentEvent,
-        StationAdminLzAddedEvent,
-        StationAdminLzRemovedEvent,
-        StationAdminMemberRemovedEvent,
-        StationAdminRequestAcceptedEvent,
-        StationAdminRequestReceivedEvent,
-        StationAdminRequestRejectedEvent,
-        StationAdminStationUpdated,
-        StationAdminVolumeAddedEvent,
-        StationAdminVolumeHostPathAddedEvent,
-        StationAdminVolumeHostPathRemovedEvent,
-        StationAdminVolumeRemovedEvent,
-        StationMemberDestroyedEvent,
-        StationMemberLzAddedEvent,
-        StationMemberLzRemovedEvent,
-        StationMemberMemberEvent,
-        StationMemberMemberRemovedEvent,
-        StationMemberStationUpdated,
-        StationMemberVolumeAddedEvent,
-        StationMemberVolumeHostPathAddedEvent,
-        StationMemberVolumeHostPathRemovedEvent,
-        StationMemberVolumeRemovedEvent,
-        StationsEvents,
-        StationUserExpelledEvent,
-        StationUserInviteAcceptedEvent,
-        StationUserInviteDestroyedEvent,
-        StationUserInviteReceivedEvent,
-        StationUserInviteRejectedEvent,
-        StationUserRequestAcceptedEvent,
-        StationUserRequestDestroyedEvent,
-        StationUserRequestRejectedEvent,
-        StationUserRequestSentEvent,
-        StationUserWithdrawnEvent,
-    )
-    from galileo_sdk.data.repositories.jobs import job_dict_to_job
-    from galileo_sdk.data.repositories.lz import lz_dict_to_lz
-    from galileo_sdk.data.repositories.stations import (
-        station_dict_to_station,
-        volume_dict_to_volume,
-    )
+    from galileo_sdk.business.objects.event import EventEmitter
+    from galileo_sdk.data.events.topics import TOPICS
 
     class GalileoConnector:
         def __init__(
@@ -68,7 +18,45 @@ if sys.version_info[0] == 3:
             settings_repo,
             auth_provider,
             namespace,
+            executor=None,
+            on_error=None,
+            job_events_window=None,
+            recovery=None,
+            reconnect_delay=1.0,
+            reconnect_delay_max=30.0,
+            reconnect_attempts=0,
         ):
+            """
+            Socket.IO connection shared by the jobs, stations and lz SDKs. A single connection is
+            opened on the first subscription, the handlers of each topic are registered when the
+            topic is first subscribed to, and the connection is closed once every subscription
+            is released.
+
+            When the connection drops it is opened again, waiting a random time of up to
+            reconnect_delay, doubled after every failed attempt up to reconnect_delay_max. Once
+            reconnected, recovery synthesizes the events missed in between.
+
+            :param settings_repo: Settings repository
+            :type settings_repo: SettingsRepository
+            :param auth_provider: Authentication provider
+            :type auth_provider: AuthProvider
+            :param namespace: Socket.IO namespace
+            :type namespace: str
+            :param executor: Executor running the event handlers off the receive thread, defaults to None
+            :type executor: concurrent.futures.Executor, optional
+            :param on_error: Called with the exception, the event name and the handler when a handler fails, defaults to None
+            :type on_error: Callable[[Exception, str, Callable], None], optional
+            :param job_events_window: Seconds job update events are coalesced for, only the latest event of each job is delivered, defaults to None
+            :type job_events_window: float, optional
+            :param recovery: Synthesizes the events missed while disconnected, defaults to None
+            :type recovery: EventRecovery, optional
+            :param reconnect_delay: Seconds waited before the first reconnection attempt at most, defaults to 1.0
+            :type reconnect_delay: float, optional
+            :param reconnect_delay_max: Longest wait between reconnection attempts, defaults to 30.0
+            :type reconnect_delay_max: float, optional
+            :param reconnect_attempts: Attempts before giving up, defaults to 0 to never give up
+            :type reconnect_attempts: int, optional
+            """
             self._settings_repo = settings_repo
             self._auth_provider = auth_provider
             self.lz_events = None
@@ -76,6 +64,32 @@ if sys.version_info[0] == 3:
             self.stations_events = None
             self._socket = None
             self.namespace = namespace
+            self._executor = executor
+            self._on_error = on_error
+            # Arguments of the events class of each topic
+            self._topic_options = {
+                "jobs": {
+                    "coalesce_window": job_events_window
+                }
+            }
+            self.recovery = recovery
+            self.reconnect_delay = reconnect_delay
+            self.reconnect_delay_max = reconnect_delay_max
+            self.reconnect_attempts = reconnect_attempts
+            self._lock = threading.RLock()
+            # Set when the socket is closed on purpose, stopping its reconnection
+            self._closed = None
+            # Number of times the connection dropped, and whether it is being reconnected
+            self._reconnect_lock = threading.Lock()
+            self._drops = 0
+            self._reconnecting = False
+            # Time of the last event received, or of the connection if none was
+            self._last_event_time = None
+            # Number of subscribers of each topic, and the Socket.IO events it registered
+            self._references = {}
+            self._topic_handlers = {}
+            # Handlers receiving every event of a topic, see observe
+            self._observers = {}
 
         def on(self, event, handler=None):
             def wrapper(handler):
@@ -86,310 +100,249 @@ if sys.version_info[0] == 3:
             wrapper(handler)
 
         def set_socket_io_connection(self):
-            settings = self._settings_repo.get_settings()
-            token = self._auth_provider.get_access_token()
-            self._socket = socketio.Client()
-            self._socket.connect(
-                "{backend}{namespace}".format(backend=settings.backend,
-                                              namespace=self.namespace),
-                headers={
-                    "Authorization": "Bearer {token}".format(token=token)
-                },
-                transports="websocket",
-                namespaces=[self.namespace],
-            )
+            """
+            Open the shared connection, unless it is already open
+
+            :return: None
+            """
+            with self._lock:
+                self._create_socket()
+                if self._socket.connected:
+                    return
+                settings = self._settings_repo.get_settings()
+                token = self._auth_provider.get_access_token()
+                self._socket.connect(
+                    "{backend}{namespace}".format(backend=settings.backend,
+                                                  namespace=self.namespace),
+                    headers={
+                        "Authorization": "Bearer {token}".format(token=token)
+                    },
+                    transports="websocket",
+                    namespaces=[self.namespace],
+                )
+                if self._last_event_time is None:
+                    self._last_event_time = time.time()
+
+        def _create_socket(self):
+            if self._socket is not None:
+                return
+            # The socketio reconnection sends the headers of the first connection again, with
+            # an access token that may have expired, so the connector reconnects by itself
+            self._socket = socketio.Client(reconnection=False)
+            self._closed = threading.Event()
+            self._socket.on("disconnect",
+                            self._disconnected(self._socket, self._closed),
+                            self.namespace)
+
+        def _disconnected(self, socket, closed):
+            def handler():
+                # Runs on the receive thread, it must not wait for self._lock
+                if closed.is_set():
+                    return
+                with self._reconnect_lock:
+                    self._drops += 1
+                    if self._reconnecting:
+                        return
+                    self._reconnecting = True
+                thread = threading.Thread(target=self._reconnect,
+                                          args=(socket, closed))
+                thread.daemon = True
+                thread.start()
+
+            return handler
+
+        def _reconnect(self, socket, closed):
+            while True:
+                with self._reconnect_lock:
+                    drops = self._drops
+                reconnected = self._reconnect_once(socket, closed)
+                with self._reconnect_lock:
+                    # Start over if the connection dropped again in the meantime
+                    if (not reconnected or closed.is_set()
+                            or self._drops == drops):
+                        self._reconnecting = False
+                        return
+
+        def _reconnect_once(self, socket, closed):
+            since = self._last_event_time
+            delay = self.reconnect_delay
+            attempt = 0
+            while not closed.wait(random.uniform(0, delay)):
+                attempt += 1
+                with self._lock:
+                    if self._socket is not socket:
+                        return False
+                    try:
+                        self.set_socket_io_connection()
+                    except Exception:
+                        logger.info("Reconnection attempt %d failed",
+                                    attempt,
+                                    exc_info=True)
+                    else:
+                        # Everything before now is recovered below
+                        self._last_event_time = time.time()
+                if socket.connected:
+                    self._recover(since)
+                    return True
+                if (self.reconnect_attempts
+                        and attempt >= self.reconnect_attempts):
+                    logger.error(
+                        "Could not reconnect after %d attempts, giving up",
+                        attempt)
+                    return False
+                delay = min(delay * 2, self.reconnect_delay_max)
+            return False
+
+        def _recover(self, since):
+            if self.recovery is None or since is None:
+                return
+            try:
+                events = self.recovery.catch_up(since, list(self._references))
+            except Exception:
+                logger.exception("Could not recover the missed events")
+                return
+            for topic, method, event in events:
+                if topic in self._references:
+                    self._deliver(topic, method, event)
+
+        def _subscribe(self, topic):
+            with self._lock:
+                self._create_socket()
+                handlers = self._socket.handlers.setdefault(self.namespace, {})
+                first = topic not in self._references
+                if first:
+                    events_class, events = TOPICS[topic]
+                    emitter = EventEmitter(self._executor,
+                                           on_error=self._on_error)
+                    setattr(
+                        self, topic + "_events",
+                        events_class(emitter,
+                                     **self._topic_options.get(topic, {})))
+                    registered = set(handlers)
+                    for event, method, convert in events:
+                        self.on(event, self._handler(topic, method, convert))
+                    self._topic_handlers[topic] = set(handlers) - registered
+                try:
+                    self.set_socket_io_connection()
+                except Exception:
+                    if first:
+                        for event in self._topic_handlers.pop(topic):
+                            handlers.pop(event, None)
+                    raise
+                self._references[topic] = self._references.get(topic, 0) + 1
+                return getattr(self, topic + "_events")
+
+        def _handler(self, topic, method, convert):
+            def handler(data):
+                self._last_event_time = time.time()
+                event = convert(data)
+                if self.recovery is not None:
+                    self.recovery.observe(event)
+                self._deliver(topic, method, event)
+
+            return handler
+
+        def _deliver(self, topic, method, event):
+            for observer in self._observers.get(topic, ()):
+                try:
+                    observer(event)
+                except Exception:
+                    logger.exception("Observer of the %s events failed", topic)
+            events = getattr(self, topic + "_events")
+            if events is not None:
+                getattr(events, method)(event)
+
+        def observe(self, topic, handler):
+            """
+            Subscribe a handler to every event of a topic, received or recovered. Observers are
+            called on the receive thread before the event handlers, they must return quickly.
+
+            :param topic: "lz", "jobs" or "stations"
+            :type topic: str
+            :param handler: Called with each typed event of the topic
+            :type handler: Callable[[object], None]
+            :return: Function removing the handler and releasing the subscription
+            :rtype: Callable[[], None]
+            """
+            with self._lock:
+                self._subscribe(topic)
+                # Replaced rather than appended to, the receive thread iterates without the lock
+                observers = self._observers.get(topic, ())
+                self._observers[topic] = observers + (handler, )
+
+            def unobserve():
+                with self._lock:
+                    observers = list(self._observers.get(topic, ()))
+                    if handler not in observers:
+                        return
+                    observers.remove(handler)
+                    self._observers[topic] = tuple(observers)
+                    self.release(topic)
+
+            return unobserve
 
         def set_lz_events(self):
-            self.set_socket_io_connection()
-            self.lz_events = LzEvents()
-            self._register_machines_listeners()
-            return self.lz_events
+            """
+            Subscribe to the lz events. Each call must be paired with release("lz").
+
+            :return: Lz events of the shared connection
+            :rtype: LzEvents
+            """
+            return self._subscribe("lz")
 
         def set_jobs_events(self):
-            self.set_socket_io_connection()
-            self.jobs_events = JobsEvents()
-            self._register_jobs_listeners()
-            return self.jobs_events
+            """
+            Subscribe to the jobs events. Each call must be paired with release("jobs").
+
+            :return: Jobs events of the shared connection
+            :rtype: JobsEvents
+            """
+            return self._subscribe("jobs")
 
         def set_stations_events(self):
-            self.set_socket_io_connection()
-            self.stations_events = StationsEvents()
-            self._register_stations_listeners()
-            return self.stations_events
-
-        def _register_machines_listeners(self):
-            # Machines
-            @self.on("machine/status_updated")
-            def on_lz_status_update(data):
-                self.lz_events.lz_status_update(
-                    LzStatusUpdateEvent(lz_id=data["mid"],
-                                        status=ELzStatus[data["status"]]))
-
-            @self.on("machine/registered")
-            def on_lz_registered(data):
-                self.lz_events.lz_registered(
-                    LzRegisteredEvent(lz_dict_to_lz(data["machine"])))
-
-            @self.on("machine/hardware_updated")
-            def on_machine_hardware_updated(data):
-                self.lz_events.lz_hardware_update(
-                    LzHardwareUpdateEvent(lz_dict_to_lz(data["machine"])))
-
-        def _register_jobs_listeners(self):
-            # Jobs
-            @self.on("job_launcher_updated")
-            def on_job_launcher_updated(data):
-                self.jobs_events.job_launcher_updated(
-                    JobLauncherUpdatedEvent(job_dict_to_job(data["job"])))
-
-            @self.on("station_job_updated")
-            def on_station_job_updated(data):
-                self.jobs_events.station_job_updated(
-                    StationJobUpdatedEvent(job_dict_to_job(data["job"])))
-
-            @self.on("job_launcher_submitted")
-            def on_job_launcher_submitted(data):
-                self.jobs_events.job_launcher_submitted(
-                    JobLauncherSubmittedEvent(job_dict_to_job(data["job"])))
-
-        def _register_stations_listeners(self):
-            # Stations
-            @self.on("new_station")
-            def on_new_station(data):
-                self.stations_events.new_station(
-                    NewStationEvent(station_dict_to_station(data["station"])))
-
-            @self.on("station_admin_invite_sent")
-            def on_station_admin_invite_sent(data):
-                self.stations_events.station_admin_invite_sent(
-                    StationAdminInviteSentEvent(data["stationid"],
-                                                data["userids"]))
-
-            @self.on("station_user_invite_received")
-            def on_station_user_invite_received(data):
-                self.stations_events.station_user_invite_received(
-                    StationUserInviteReceivedEvent(
-                        station_dict_to_station(data["station"])))
-
-            @self.on("station_admin_invite_accepted")
-            def on_station_admin_invite_accepted(data):
-                self.stations_events.station_admin_invite_accepted(
-                    StationAdminInviteAcceptedEvent(data["stationid"],
-                                                    data["userid"]))
-
-            @self.on("station_member_member_added")
-            def on_station_member_member_added(data):
-                self.stations_events.station_member_member_added(
-                    StationMemberMemberEvent(data["stationid"],
-                                             data["userid"]))
-
-            @self.on("station_user_invite_accepted")
-            def on_station_user_invite_accepted(data):
-                self.stations_events.station_user_invite_accepted(
-                    StationUserInviteAcceptedEvent(data["stationid"],
-                                                   data["userid"]))
-
-            @self.on("station_admin_invite_rejected")
-            def on_station_admin_invite_rejected(data):
-                self.stations_events.station_admin_invite_rejected(
-                    StationAdminInviteRejectedEvent(data["stationid"],
-                                                    data["userids"]))
-
-            @self.on("station_user_invite_rejected")
-            def on_station_user_invite_rejected(data):
-                self.stations_events.station_user_invite_rejected(
-                    StationUserInviteRejectedEvent(data["stationid"],
-                                                   data["userids"]))
-
-            @self.on("station_admin_request_received")
-            def on_station_admin_request_received(data):
-                self.stations_events.station_admin_request_received(
-                    StationAdminRequestReceivedEvent(data["stationid"],
-                                                     data["userid"]))
-
-            @self.on("station_user_request_sent")
-            def on_station_user_request_sent(data):
-                self.stations_events.station_user_request_sent(
-                    StationUserRequestSentEvent(data["stationid"],
-                                                data["userid"]))
-
-            @self.on("station_admin_request_accepted")
-            def on_station_admin_request_accepted(data):
-                self.stations_events.station_admin_request_accepted(
-                    StationAdminRequestAcceptedEvent(data["stationid"],
-                                                     data["userid"]))
-
-            @self.on("station_user_request_accepted")
-            def on_station_user_request_accepted(data):
-                self.stations_events.station_user_request_accepted(
-                    StationUserRequestAcceptedEvent(data["stationid"]))
-
-            @self.on("station_admin_request_rejected")
-            def on_station_admin_request_rejected(data):
-                self.stations_events.station_admin_request_rejected(
-                    StationAdminRequestRejectedEvent(data["stationid"],
-                                                     data["userid"]))
-
-            @self.on("station_user_request_rejected")
-            def on_station_user_request_rejected(data):
-                self.stations_events.station_user_request_rejected(
-                    StationUserRequestRejectedEvent(data["stationid"]))
-
-            @self.on("station_admin_member_removed")
-            def on_station_admin_member_removed(data):
-                self.stations_events.station_admin_member_removed(
-                    StationAdminMemberRemovedEvent(data["stationid"],
-                                                   data["userids"]))
-
-            @self.on("station_admin_machine_removed")
-            def on_station_admin_machine_removed(data):
-                self.stations_events.station_admin_machine_removed(
-                    StationAdminLzRemovedEvent(data["stationid"],
-                                               data["mids"]))
-
-            @self.on("station_member_member_removed")
-            def on_station_member_member_removed(data):
-                self.stations_events.station_member_member_removed(
-                    StationMemberMemberRemovedEvent(data["stationid"],
-                                                    data["userids"]))
-
-            @self.on("station_member_machine_removed")
-            def on_station_member_machine_removed(data):
-                self.stations_events.station_member_machine_removed(
-                    StationMemberLzRemovedEvent(data["stationid"],
-                                                data["mids"]))
-
-            @self.on("station_user_withdrawn")
-            def on_station_user_withdrawn(data):
-                self.stations_events.station_user_withdrawn(
-                    StationUserWithdrawnEvent(data["stationid"], data["mids"]))
-
-            @self.on("station_user_expelled")
-            def on_station_user_expelled(data):
-                self.stations_events.station_user_expelled(
-                    StationUserExpelledEvent(data["stationid"]))
-
-            @self.on("station_admin_destroyed")
-            def on_station_admin_destroyed(data):
-                self.stations_events.station_admin_destroyed(
-                    StationAdminDestroyedEvent(data["stationid"]))
-
-            @self.on("station_member_destroyed")
-            def on_station_member_destroyed(data):
-                self.stations_events.station_member_destroyed(
-                    StationMemberDestroyedEvent(data["stationid"]))
-
-            @self.on("station_user_invite_destroyed")
-            def on_station_user_invite_destroyed(data):
-                self.stations_events.station_user_invite_destroyed(
-                    StationUserInviteDestroyedEvent(data["stationid"]))
-
-            @self.on("station_user_request_destroyed")
-            def on_station_user_request_destroyed(data):
-                self.stations_events.station_user_request_destroyed(
-                    StationUserRequestDestroyedEvent(data["stationid"]))
-
-            @self.on("station_admin_machine_added")
-            def on_station_admin_machine_added(data):
-                self.stations_events.station_admin_machine_added(
-                    StationAdminLzAddedEvent(data["stationid"], data["mids"]))
-
-            @self.on("station_member_machine_added")
-            def on_station_member_machine_added(data):
-                self.stations_events.station_member_machine_added(
-                    StationMemberLzAddedEvent(data["stationid"], data["mids"]))
-
-            @self.on("station_admin_volume_added")
-            def on_station_admin_volume_added(data):
-                self.stations_events.station_admin_volume_added(
-                    StationAdminVolumeAddedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_member_volume_added")
-            def on_station_member_volume_added(data):
-                self.stations_events.station_member_volume_added(
-                    StationMemberVolumeAddedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_admin_volume_host_path_added")
-            def on_station_admin_volume_host_path_added(data):
-                self.stations_events.station_admin_volume_host_path_added(
-                    StationAdminVolumeHostPathAddedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_member_volume_host_path_added")
-            def on_station_member_volume_host_path_added(data):
-                self.stations_events.station_member_volume_host_path_added(
-                    StationMemberVolumeHostPathAddedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_admin_volume_host_path_removed")
-            def on_station_admin_volume_host_path_removed(data):
-                self.stations_events.station_admin_volume_host_path_removed(
-                    StationAdminVolumeHostPathRemovedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_member_volume_host_path_removed")
-            def on_station_member_volume_host_path_removed(data):
-                self.stations_events.station_member_volume_host_path_removed(
-                    StationMemberVolumeHostPathRemovedEvent(
-                        data["stationid"],
-                        [
-                            volume_dict_to_volume(value)
-                            for key, value in data["volumes"].items()
-                        ],
-                    ))
-
-            @self.on("station_admin_volume_removed")
-            def on_station_admin_volume_removed(data):
-                self.stations_events.station_admin_volume_removed(
-                    StationAdminVolumeRemovedEvent(data["stationid"],
-                                                   data["volume_names"]))
-
-            @self.on("station_member_volume_removed")
-            def on_station_member_volume_removed(data):
-                self.stations_events.station_member_volume_removed(
-                    StationMemberVolumeRemovedEvent(data["stationid"],
-                                                    data["volume_names"]))
-
-            @self.on("station_admin_station_updated")
-            def on_station_admin_station_updated(data):
-                self.stations_events.station_admin_station_updated(
-                    StationAdminStationUpdated(
-                        station_dict_to_station(data["station"])))
-
-            @self.on("station_member_station_updated")
-            def on_station_member_station_updated(data):
-                self.stations_events.station_member_station_updated(
-                    StationMemberStationUpdated(
-                        station_dict_to_station(data["station"])))
+            """
+            Subscribe to the stations events. Each call must be paired with release("stations").
+
+            :return: Stations events of the shared connection
+            :rtype: StationsEvents
+            """
+            return self._subscribe("stations")
+
+        def release(self, topic):
+            """
+            Release a subscription. The handlers of the topic are removed when its last
+            subscription is released, and the connection is closed when no topic is left.
+
+            :param topic: "lz", "jobs" or "stations"
+            :type topic: str
+            :return: None
+            """
+            with self._lock:
+                if topic not in self._references:
+                    return
+                self._references[topic] -= 1
+                if self._references[topic] > 0:
+                    return
+                del self._references[topic]
+                handlers = self._socket.handlers.get(self.namespace, {})
+                for event in self._topic_handlers.pop(topic, ()):
+                    handlers.pop(event, None)
+                if not self._references:
+                    self.disconnect()
 
         def disconnect(self):
-            if self._socket is None:
-                return
-            self._socket.disconnect()
+            """
+            Close the connection, whatever subscriptions are left
+
+            :return: None
+            """
+            with self._lock:
+                self._references.clear()
+                self._topic_handlers.clear()
+                self._observers.clear()
+                self._last_event_time = None
+                if self._socket is None:
+                    return
+                self._closed.set()
+                socket, self._socket = self._socket, None
+                socket.disconnect()
@@ -0,0 +1,130 @@
+from datetime import datetime
+
+from galileo_sdk.business.objects.jobs import (
+    JobLauncherUpdatedEvent,
+    StationJobUpdatedEvent,
+)
+from galileo_sdk.business.objects.lz import (
+    LzHardwareUpdateEvent,
+    LzRegisteredEvent,
+    LzStatusUpdateEvent,
+)
+
+# Seconds subtracted from the time of the last event, for the clock skew between the
+# client and the backend. Events may be delivered twice, never skipped.
+RECOVERY_MARGIN = 30
+
+
+class EventRecovery:
+    def __init__(self,
+                 jobs_service,
+                 lz_service,
+                 profiles_service,
+                 items=25,
+                 max_pages=20):
+        """
+        Finds what changed while the event connection was down and synthesizes the events that
+        were missed. Jobs updated since the last event are listed, newest first, and delivered
+        as job_launcher_updated for the jobs you launched and station_job_updated for the jobs
+        of your Landing Zones. Landing Zones have no update time, so every Landing Zone whose status is not
+        the last one seen is delivered as lz_status_update.
+
+        :param jobs_service: Jobs service
+        :type jobs_service: JobsService
+        :param lz_service: Landing Zones service
+        :type lz_service: LzService
+        :param profiles_service: Profiles service
+        :type profiles_service: ProfilesService
+        :param items: Number of items per page, defaults to 25
+        :type items: int, optional
+        :param max_pages: Maximum number of pages requested per list, defaults to 20
+        :type max_pages: int, optional
+        """
+        self._jobs_service = jobs_service
+        self._lz_service = lz_service
+        self._profiles_service = profiles_service
+        self.items = items
+        self.max_pages = max_pages
+        # Last status seen of each Landing Zone
+        self._lz_status = {}
+
+    def observe(self, event):
+        """
+        Record the Landing Zone status carried by a received event
+
+        :param event: Typed event
+        :return: None
+        """
+        if isinstance(event, LzStatusUpdateEvent):
+            self._lz_status[event.lz_id] = event.status
+        elif isinstance(event, (LzRegisteredEvent, LzHardwareUpdateEvent)):
+            self._lz_status[event.lz.lz_id] = event.lz.status
+
+    def catch_up(self, since, topics):
+        """
+        Synthesize the events missed since a point in time
+
+        :param since: Time of the last event received, in seconds since the epoch
+        :type since: float
+        :param topics: Subscribed topics, "lz" and/or "jobs"
+        :type topics: Iterable[str]
+        :return: Topic, events method and event of each missed event
+        :rtype: List[Tuple[str, str, object]]
+        """
+        topics = set(topics)
+        if not topics & {"jobs", "lz"}:
+            return []
+        user_id = self._profiles_service.self().user_id
+        # Both topics need the Landing Zones, they are listed once
+        lzs = list(
+            self._pages(lambda page: self._lz_service.list_lz(
+                user_ids=[user_id], page=page, items=self.items)))
+        events = []
+        if "jobs" in topics:
+            cutoff = datetime.fromtimestamp(since - RECOVERY_MARGIN)
+            for job in self._updated_jobs(cutoff, user_ids=[user_id]):
+                events.append(("jobs", "job_launcher_updated",
+                               JobLauncherUpdatedEvent(job)))
+            lz_ids = sorted({lz.lz_id for lz in lzs})
+            if lz_ids:
+                # Jobs launched by anyone on your Landing Zones, an empty user_ids list
+                # keeps list_jobs from filtering by launcher
+                for job in self._updated_jobs(cutoff, user_ids=[],
+                                              lz_ids=lz_ids):
+                    events.append(("jobs", "station_job_updated",
+                                   StationJobUpdatedEvent(job)))
+        if "lz" in topics:
+            for lz in lzs:
+                if self._lz_status.get(lz.lz_id) != lz.status:
+                    self._lz_status[lz.lz_id] = lz.status
+                    events.append(("lz", "lz_status_update",
+                                   LzStatusUpdateEvent(lz.lz_id, lz.status)))
+        return events
+
+    def _updated_jobs(self, cutoff, **filters):
+        def list_page(page):
+            return self._jobs_service.list_jobs(page=page,
+                                                items=self.items,
+                                                sort_by="last_updated",
+                                                sort_order="desc",
+                                                **filters)
+
+        for jobs in self._iter_pages(list_page):
+            updated = [job for job in jobs if job.last_updated >= cutoff]
+            for job in updated:
+                yield job
+            # Sorted newest first, so a page without any update is past the cutoff
+            if not updated:
+                return
+
+    def _pages(self, list_page):
+        for results in self._iter_pages(list_page):
+            for result in results:
+                yield result
+
+    def _iter_pages(self, list_page):
+        for page in range(1, self.max_pages + 1):
+            results = list_page(page)
+            yield results
+            if len(results) < self.items:
+                return
@@ -0,0 +1,150 @@
+import asyncio
+import collections
+import enum
+
+from galileo_sdk.business.objects.event import event_key
+
+
+class EOverflowPolicy(enum.Enum):
+    block = 0  # the receive loop waits until the consumer catches up
+    drop_oldest = 1  # the oldest queued event is dropped to make room
+    coalesce = 2  # a queued event with the same key is replaced, else the oldest is dropped
+
+
+class EventStream:
+    def __init__(self,
+                 maxsize=1000,
+                 overflow=EOverflowPolicy.drop_oldest,
+                 key=event_key,
+                 opener=None,
+                 closer=None):
+        """
+        Bounded queue of typed events that is consumed with async for. The subscription is
+        opened on the first iteration, or when entering async with, and released by close.
+
+        :param maxsize: Maximum number of queued events, defaults to 1000
+        :type maxsize: int, optional
+        :param overflow: What to do when the queue is full, defaults to EOverflowPolicy.drop_oldest
+        :type overflow: EOverflowPolicy, optional
+        :param key: Coalescing key of an event, used with EOverflowPolicy.coalesce, defaults to event_key
+        :type key: Callable[[object], Hashable], optional
+        :param opener: Coroutine function subscribing the stream, defaults to None
+        :type opener: Callable[[EventStream], Awaitable], optional
+        :param closer: Coroutine function releasing the subscription, defaults to None
+        :type closer: Callable[[EventStream], Awaitable], optional
+        """
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.key = key
+        self.dropped = 0
+        self.coalesced = 0
+        self._opener = opener
+        self._closer = closer
+        self._opened = False
+        self._closed = False
+        # Each slot is [key, event] so a coalesced event keeps its place in the queue
+        self._slots = collections.deque()
+        self._keyed = {}
+        self._changed = None
+
+    def _condition(self):
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def open(self):
+        """
+        Subscribe the stream. Called by the first iteration if it was not called before.
+
+        :return: None
+        """
+        if self._opened:
+            return
+        self._opened = True
+        if self._opener is not None:
+            await self._opener(self)
+
+    async def close(self):
+        """
+        Release the subscription. Events already queued can still be consumed.
+
+        :return: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        async with self._condition():
+            self._condition().notify_all()
+        if self._opened and self._closer is not None:
+            await self._closer(self)
+
+    async def put(self, event):
+        """
+        Queue an event according to the overflow policy
+
+        :param event: Typed event
+        :return: None
+        """
+        async with self._condition():
+            if self._closed:
+                return
+            key = None
+            if self.overflow == EOverflowPolicy.coalesce and self.key:
+                key = self.key(event)
+            if key is not None and key in self._keyed:
+                self._keyed[key][1] = event
+                self.coalesced += 1
+                return
+
+            while len(self._slots) >= self.maxsize:
+                if self.overflow == EOverflowPolicy.block:
+                    await self._condition().wait()
+                    if self._closed:
+                        return
+                else:
+                    self._discard(self._slots.popleft())
+                    self.dropped += 1
+
+            slot = [key, event]
+            self._slots.append(slot)
+            if key is not None:
+                self._keyed[key] = slot
+            self._condition().notify_all()
+
+    def _discard(self, slot):
+        if slot[0] is not None and self._keyed.get(slot[0]) is slot:
+            del self._keyed[slot[0]]
+
+    async def get(self):
+        """
+        Wait for the next event
+
+        :raises StopAsyncIteration: The stream is closed and empty
+        :return: Typed event
+        """
+        await self.open()
+        async with self._condition():
+            while not self._slots:
+                if self._closed:
+                    raise StopAsyncIteration
+                await self._condition().wait()
+            slot = self._slots.popleft()
+            self._discard(slot)
+            self._condition().notify_all()
+            return slot[1]
+
+    def qsize(self):
+        return len(self._slots)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,293 @@
+# Socket.IO events of each topic: event name, method of the topic events object the event
+# is delivered to, and conversion of the payload to a typed event
+from galileo_sdk.business.objects.jobs import (
+    JobLauncherSubmittedEvent,
+    JobLauncherUpdatedEvent,
+    JobsEvents,
+    StationJobUpdatedEvent,
+)
+from galileo_sdk.business.objects.lz import (
+    ELzStatus,
+    LzHardwareUpdateEvent,
+    LzRegisteredEvent,
+    LzEvents,
+    LzStatusUpdateEvent,
+)
+from galileo_sdk.business.objects.stations import (
+    NewStationEvent,
+    StationAdminDestroyedEvent,
+    StationAdminInviteAcceptedEvent,
+    StationAdminInviteRejectedEvent,
+    StationAdminInviteSentEvent,
+    StationAdminLzAddedEvent,
+    StationAdminLzRemovedEvent,
+    StationAdminMemberRemovedEvent,
+    StationAdminRequestAcceptedEvent,
+    StationAdminRequestReceivedEvent,
+    StationAdminRequestRejectedEvent,
+    StationAdminStationUpdated,
+    StationAdminVolumeAddedEvent,
+    StationAdminVolumeHostPathAddedEvent,
+    StationAdminVolumeHostPathRemovedEvent,
+    StationAdminVolumeRemovedEvent,
+    StationMemberDestroyedEvent,
+    StationMemberLzAddedEvent,
+    StationMemberLzRemovedEvent,
+    StationMemberMemberEvent,
+    StationMemberMemberRemovedEvent,
+    StationMemberStationUpdated,
+    StationMemberVolumeAddedEvent,
+    StationMemberVolumeHostPathAddedEvent,
+    StationMemberVolumeHostPathRemovedEvent,
+    StationMemberVolumeRemovedEvent,
+    StationsEvents,
+    StationUserExpelledEvent,
+    StationUserInviteAcceptedEvent,
+    StationUserInviteDestroyedEvent,
+    StationUserInviteReceivedEvent,
+    StationUserInviteRejectedEvent,
+    StationUserRequestAcceptedEvent,
+    StationUserRequestDestroyedEvent,
+    StationUserRequestRejectedEvent,
+    StationUserRequestSentEvent,
+    StationUserWithdrawnEvent,
+)
+from galileo_sdk.data.repositories.jobs import job_dict_to_job
+from galileo_sdk.data.repositories.lz import lz_dict_to_lz
+from galileo_sdk.data.repositories.stations import (
+    station_dict_to_station,
+    volume_dict_to_volume,
+)
+
+
+def _volumes(data):
+    return [
+        volume_dict_to_volume(value) for key, value in data["volumes"].items()
+    ]
+
+
+LZ_EVENTS = [
+    (
+        "machine/status_updated",
+        "lz_status_update",
+        lambda data: LzStatusUpdateEvent(lz_id=data["mid"], status=ELzStatus[data["status"]]),
+    ),
+    (
+        "machine/registered",
+        "lz_registered",
+        lambda data: LzRegisteredEvent(lz_dict_to_lz(data["machine"])),
+    ),
+    (
+        "machine/hardware_updated",
+        "lz_hardware_update",
+        lambda data: LzHardwareUpdateEvent(lz_dict_to_lz(data["machine"])),
+    ),
+]
+
+JOBS_EVENTS = [
+    (
+        "job_launcher_updated",
+        "job_launcher_updated",
+        lambda data: JobLauncherUpdatedEvent(job_dict=data["job"], loader=job_dict_to_job),
+    ),
+    (
+        "station_job_updated",
+        "station_job_updated",
+        lambda data: StationJobUpdatedEvent(job_dict=data["job"], loader=job_dict_to_job),
+    ),
+    (
+        "job_launcher_submitted",
+        "job_launcher_submitted",
+        lambda data: JobLauncherSubmittedEvent(job_dict=data["job"], loader=job_dict_to_job),
+    ),
+]
+
+STATIONS_EVENTS = [
+    (
+        "new_station",
+        "new_station",
+        lambda data: NewStationEvent(station_dict_to_station(data["station"])),
+    ),
+    (
+        "station_admin_invite_sent",
+        "station_admin_invite_sent",
+        lambda data: StationAdminInviteSentEvent(data["stationid"], data["userids"]),
+    ),
+    (
+        "station_user_invite_received",
+        "station_user_invite_received",
+        lambda data: StationUserInviteReceivedEvent(station_dict_to_station(data["station"])),
+    ),
+    (
+        "station_admin_invite_accepted",
+        "station_admin_invite_accepted",
+        lambda data: StationAdminInviteAcceptedEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_member_member_added",
+        "station_member_member_added",
+        lambda data: StationMemberMemberEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_user_invite_accepted",
+        "station_user_invite_accepted",
+        lambda data: StationUserInviteAcceptedEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_admin_invite_rejected",
+        "station_admin_invite_rejected",
+        lambda data: StationAdminInviteRejectedEvent(data["stationid"], data["userids"]),
+    ),
+    (
+        "station_user_invite_rejected",
+        "station_user_invite_rejected",
+        lambda data: StationUserInviteRejectedEvent(data["stationid"], data["userids"]),
+    ),
+    (
+        "station_admin_request_received",
+        "station_admin_request_received",
+        lambda data: StationAdminRequestReceivedEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_user_request_sent",
+        "station_user_request_sent",
+        lambda data: StationUserRequestSentEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_admin_request_accepted",
+        "station_admin_request_accepted",
+        lambda data: StationAdminRequestAcceptedEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_user_request_accepted",
+        "station_user_request_accepted",
+        lambda data: StationUserRequestAcceptedEvent(data["stationid"]),
+    ),
+    (
+        "station_admin_request_rejected",
+        "station_admin_request_rejected",
+        lambda data: StationAdminRequestRejectedEvent(data["stationid"], data["userid"]),
+    ),
+    (
+        "station_user_request_rejected",
+        "station_user_request_rejected",
+        lambda data: StationUserRequestRejectedEvent(data["stationid"]),
+    ),
+    (
+        "station_admin_member_removed",
+        "station_admin_member_removed",
+        lambda data: StationAdminMemberRemovedEvent(data["stationid"], data["userids"]),
+    ),
+    (
+        "station_admin_machine_removed",
+        "station_admin_machine_removed",
+        lambda data: StationAdminLzRemovedEvent(data["stationid"], data["mids"]),
+    ),
+    (
+        "station_member_member_removed",
+        "station_member_member_removed",
+        lambda data: StationMemberMemberRemovedEvent(data["stationid"], data["userids"]),
+    ),
+    (
+        "station_member_machine_removed",
+        "station_member_machine_removed",
+        lambda data: StationMemberLzRemovedEvent(data["stationid"], data["mids"]),
+    ),
+    (
+        "station_user_withdrawn",
+        "station_user_withdrawn",
+        lambda data: StationUserWithdrawnEvent(data["stationid"], data["mids"]),
+    ),
+    (
+        "station_user_expelled",
+        "station_user_expelled",
+        lambda data: StationUserExpelledEvent(data["stationid"]),
+    ),
+    (
+        "station_admin_destroyed",
+        "station_admin_destroyed",
+        lambda data: StationAdminDestroyedEvent(data["stationid"]),
+    ),
+    (
+        "station_member_destroyed",
+        "station_member_destroyed",
+        lambda data: StationMemberDestroyedEvent(data["stationid"]),
+    ),
+    (
+        "station_user_invite_destroyed",
+        "station_user_invite_destroyed",
+        lambda data: StationUserInviteDestroyedEvent(data["stationid"]),
+    ),
+    (
+        "station_user_request_destroyed",
+        "station_user_request_destroyed",
+        lambda data: StationUserRequestDestroyedEvent(data["stationid"]),
+    ),
+    (
+        "station_admin_machine_added",
+        "station_admin_machine_added",
+        lambda data: StationAdminLzAddedEvent(data["stationid"], data["mids"]),
+    ),
+    (
+        "station_member_machine_added",
+        "station_member_machine_added",
+        lambda data: StationMemberLzAddedEvent(data["stationid"], data["mids"]),
+    ),
+    (
+        "station_admin_volume_added",
+        "station_admin_volume_added",
+        lambda data: StationAdminVolumeAddedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_member_volume_added",
+        "station_member_volume_added",
+        lambda data: StationMemberVolumeAddedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_admin_volume_host_path_added",
+        "station_admin_volume_host_path_added",
+        lambda data: StationAdminVolumeHostPathAddedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_member_volume_host_path_added",
+        "station_member_volume_host_path_added",
+        lambda data: StationMemberVolumeHostPathAddedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_admin_volume_host_path_removed",
+        "station_admin_volume_host_path_removed",
+        lambda data: StationAdminVolumeHostPathRemovedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_member_volume_host_path_removed",
+        "station_member_volume_host_path_removed",
+        lambda data: StationMemberVolumeHostPathRemovedEvent(data["stationid"], _volumes(data)),
+    ),
+    (
+        "station_admin_volume_removed",
+        "station_admin_volume_removed",
+        lambda data: StationAdminVolumeRemovedEvent(data["stationid"], data["volume_names"]),
+    ),
+    (
+        "station_member_volume_removed",
+        "station_member_volume_removed",
+        lambda data: StationMemberVolumeRemovedEvent(data["stationid"], data["volume_names"]),
+    ),
+    (
+        "station_admin_station_updated",
+        "station_admin_station_updated",
+        lambda data: StationAdminStationUpdated(station_dict_to_station(data["station"])),
+    ),
+    (
+        "station_member_station_updated",
+        "station_member_station_updated",
+        lambda data: StationMemberStationUpdated(station_dict_to_station(data["station"])),
+    ),
+]
+
+# Events object and events of each topic
+TOPICS = {
+    "lz": (LzEvents, LZ_EVENTS),
+    "jobs": (JobsEvents, JOBS_EVENTS),
+    "stations": (StationsEvents, STATIONS_EVENTS),
+}
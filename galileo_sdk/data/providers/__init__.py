@@ -1 +1,9 @@
+import sys
+
 from .auth import AuthProvider
+from .identity import IdentityCache
+from .response_cache import ResponseCache
+from .session import SessionProvider
+
+if sys.version_info[0] == 3:
+    from .async_session import AsyncSessionProvider
@@ -0,0 +1,58 @@
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncSessionProvider:
+    def __init__(
+        self,
+        limit=100,
+        limit_per_host=10,
+        keepalive_timeout=15,
+    ):
+        """
+        Provides the aiohttp session shared by all the repositories of an AsyncGalileoSdk instance.
+        The session has to be created inside a running event loop, so it is only opened on first use.
+
+        :param limit: Maximum number of simultaneous connections, defaults to 100
+        :type limit: int, optional
+        :param limit_per_host: Maximum number of simultaneous connections per host, defaults to 10
+        :type limit_per_host: int, optional
+        :param keepalive_timeout: Seconds an idle connection is kept open, defaults to 15
+        :type keepalive_timeout: float, optional
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncGalileoSdk requires aiohttp, install it with: pip install galileo_sdk[async]"
+            )
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+
+    def get_session(self):
+        """
+        Get the pooled session, creating it on first use. Must be called from a coroutine.
+
+        :return: HTTP session
+        :rtype: aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """
+        Close every pooled connection. A new session is created on the next request.
+
+        :return: None
+        """
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+
+
+class ConditionalCache:
+    def __init__(self, maxsize=64):
+        """
+        Remembers the validators (ETag, Last-Modified) of the last response of a URL along
+        with the objects parsed from it. The next GET of the URL is sent as a conditional
+        request, and on a 304 Not Modified the parsed objects are reused as they are.
+
+        :param maxsize: Maximum number of URLs remembered, defaults to 64
+        :type maxsize: int, optional
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def headers(self, key):
+        """
+        Get the conditional request headers for a URL
+
+        :param key: Cache key
+        :type key: Tuple[str, str]
+        :return: If-None-Match and/or If-Modified-Since headers, None if nothing is cached
+        :rtype: Dict[str, str]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def not_modified(self, key):
+        """
+        Get the objects parsed from the last full response of a URL, after a 304
+
+        :param key: Cache key
+        :type key: Tuple[str, str]
+        :return: Parsed objects, None if nothing is cached
+        :rtype: object
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            # Mark as most recently used
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            return entry[2]
+
+    def store(self, key, response, value):
+        """
+        Remember the validators of a response and the objects parsed from it
+
+        :param key: Cache key
+        :type key: Tuple[str, str]
+        :param response: Full (200) response
+        :type response: requests.Response
+        :param value: Objects parsed from the response
+        :type value: object
+        :return: None
+        """
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+            if not etag and not last_modified:
+                return
+            self._entries[key] = (etag, last_modified, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Forget every URL and reset the counters
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
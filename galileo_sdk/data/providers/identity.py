@@ -0,0 +1,53 @@
+import time
+
+try:
+    _clock = time.monotonic
+except AttributeError:  # Python 2
+    _clock = time.time
+
+
+class IdentityCache:
+    def __init__(self, ttl=300):
+        """
+        Remembers the profile of the logged in user, so the many calls that need the current
+        user id (e.g. listing your own jobs) do not each fetch /users/self again.
+
+        :param ttl: Seconds the profile is kept before it is fetched again, 0 disables the cache, defaults to 300
+        :type ttl: float, optional
+        """
+        self.ttl = ttl
+        self._profile = None
+        self._expires = 0
+
+    def get(self):
+        """
+        Get the cached profile
+
+        :return: Current user's profile, None if it is not cached or has expired
+        :rtype: Profile
+        """
+        if self._profile is not None and _clock() < self._expires:
+            return self._profile
+        return None
+
+    def set(self, profile):
+        """
+        Cache the current user's profile for ttl seconds
+
+        :param profile: Current user's profile
+        :type profile: Profile
+        :return: None
+        """
+        if not self.ttl:
+            return
+        self._profile = profile
+        self._expires = _clock() + self.ttl
+
+    def invalidate(self):
+        """
+        Forget the cached profile, the next lookup goes to the backend
+
+        :return: None
+        """
+        self._profile = None
+        self._expires = 0
@@ -0,0 +1,172 @@
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    _clock = time.monotonic
+except AttributeError:  # Python 2
+    _clock = time.time
+
+try:
+    import contextvars
+except ImportError:  # Python 2 and 3.6, bypass() is per thread
+    contextvars = None
+
+# Caches bypassed in the current context. A context variable rather than a thread local,
+# so a bypass() block in one asyncio task does not bypass the cache for the other tasks
+# running on the same thread.
+_bypassed = None
+if contextvars is not None:
+    _bypassed = contextvars.ContextVar("galileo_response_cache_bypassed",
+                                       default=())
+
+# Read-mostly endpoints, in seconds
+DEFAULT_TTLS = OrderedDict([
+    ("/projecttypes/summaries", 300),
+    ("/projecttypes", 300),
+    ("/storage", 60),
+    ("/universe", 300),
+    ("/stations/*/roles", 60),
+    ("/stations/*/resource_policy", 60),
+    ("/stations/*/resource_limits", 60),
+])
+
+
+class ResponseCache:
+    def __init__(self, ttls=None, maxsize=256):
+        """
+        Opt-in cache of GET responses shared by the repositories of a GalileoSdk instance.
+        Responses are keyed by URL and universe, only endpoints with a TTL are cached and the
+        least recently used response is evicted once maxsize responses are stored.
+        Any PUT, POST or DELETE drops the cached responses of the same resource.
+
+        :param ttls: Seconds each endpoint is cached for, keys may use * wildcards, defaults to DEFAULT_TTLS
+        :type ttls: Dict[str, float], optional
+        :param maxsize: Maximum number of cached responses, defaults to 256
+        :type maxsize: int, optional
+        """
+        self.ttls = OrderedDict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def ttl_for(self, endpoint):
+        """
+        Get how long responses of an endpoint are cached
+
+        :param endpoint: Endpoint path, e.g. /stations/{station_id}/roles
+        :type endpoint: str
+        :return: TTL in seconds, 0 if the endpoint is not cached
+        :rtype: float
+        """
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+        return 0
+
+    @property
+    def bypassed(self):
+        if _bypassed is not None:
+            return any(cache is self for cache in _bypassed.get())
+        return getattr(self._local, "bypass", False)
+
+    @contextmanager
+    def bypass(self):
+        """
+        Requests made inside the with block skip the cache and refresh it. Only the current
+        thread, or the current asyncio task and the tasks it starts, are affected.
+
+        Example:
+            >>> with cache.bypass():
+            >>>     mission_types = galileo.missions.list_mission_types()
+        """
+        if _bypassed is not None:
+            token = _bypassed.set(_bypassed.get() + (self, ))
+            try:
+                yield self
+            finally:
+                _bypassed.reset(token)
+            return
+        previous = self.bypassed
+        self._local.bypass = True
+        try:
+            yield self
+        finally:
+            self._local.bypass = previous
+
+    def get(self, key):
+        """
+        Get a cached response
+
+        :param key: Cache key
+        :type key: Tuple[str, str]
+        :return: The cached response, None on a miss
+        :rtype: requests.Response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self.bypassed:
+                self.misses += 1
+                return None
+            expires, response = entry
+            if _clock() >= expires:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            # Mark as most recently used
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            return response
+
+    def set(self, key, response, ttl):
+        """
+        Cache a response
+
+        :param key: Cache key
+        :type key: Tuple[str, str]
+        :param response: Response to cache
+        :type response: requests.Response
+        :param ttl: Seconds the response is cached for
+        :type ttl: float
+        :return: None
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (_clock() + ttl, response)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix):
+        """
+        Drop every cached response whose URL starts with prefix
+
+        :param prefix: URL prefix
+        :type prefix: str
+        :return: None
+        """
+        with self._lock:
+            for key in [
+                    key for key in self._entries if key[0].startswith(prefix)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Drop every cached response and reset the counters
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,101 @@
+import socket
+import sys
+
+from galileo_sdk.compat import requests
+
+_ver = sys.version_info
+
+is_py2 = _ver[0] == 2
+is_py3 = _ver[0] == 3
+
+if is_py3:
+    from requests.adapters import HTTPAdapter
+
+    class _SocketOptionsAdapter(HTTPAdapter):
+        def __init__(self, socket_options=None, **kwargs):
+            self._socket_options = socket_options
+            super(_SocketOptionsAdapter, self).__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            if self._socket_options is not None:
+                kwargs["socket_options"] = self._socket_options
+            return super(_SocketOptionsAdapter,
+                         self).init_poolmanager(*args, **kwargs)
+
+
+class SessionProvider:
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=True,
+        tcp_nodelay=True,
+    ):
+        """
+        Provides the HTTP session shared by all the repositories of a GalileoSdk instance.
+        Connections are pooled and kept alive, so consecutive calls to the backend reuse
+        the same TCP/TLS connection instead of performing a new handshake.
+
+        :param pool_connections: Number of per-host connection pools to cache, defaults to 10
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of connections kept open per host, defaults to 10
+        :type pool_maxsize: int, optional
+        :param pool_block: Block when the pool is exhausted instead of opening a throwaway connection, defaults to False
+        :type pool_block: bool, optional
+        :param keep_alive: Enable TCP keep-alive probes on pooled connections, defaults to True
+        :type keep_alive: bool, optional
+        :param tcp_nodelay: Disable Nagle's algorithm on pooled connections, defaults to True
+        :type tcp_nodelay: bool, optional
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.tcp_nodelay = tcp_nodelay
+        self._session = None
+
+    def _socket_options(self):
+        options = []
+        if self.tcp_nodelay:
+            options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if self.keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        return options
+
+    def _create_session(self):
+        if is_py2:
+            # The Python 2 compatibility layer has no connection pooling
+            return requests
+
+        session = requests.Session()
+        adapter = _SocketOptionsAdapter(
+            socket_options=self._socket_options(),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self):
+        """
+        Get the pooled session, creating it on first use.
+
+        :return: HTTP session
+        :rtype: requests.Session
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def close(self):
+        """
+        Close every pooled connection. A new session is created on the next request.
+
+        :return: None
+        """
+        if self._session is not None and is_py3:
+            self._session.close()
+        self._session = None
@@ -0,0 +1,8 @@
+from .requests import AsyncRequestsRepository
+from .universes import AsyncUniversesRepository
+from .cargobays import AsyncCargoBaysRepository
+from .jobs import AsyncJobsRepository
+from .lz import AsyncLzRepository
+from .profiles import AsyncProfilesRepository
+from .missions import AsyncMissionsRepository
+from .stations import AsyncStationsRepository
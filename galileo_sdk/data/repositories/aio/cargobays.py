@@ -0,0 +1,28 @@
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.cargobays import cargo_bay_dict_to_CargoBay
+
+
+class AsyncCargoBaysRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        super(AsyncCargoBaysRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def list_cargo_bays(self):
+        response = await self._get("/storage")
+        json = self._json(response)
+        cargobays = json["storage"]
+        return [cargo_bay_dict_to_CargoBay(cargobay) for cargobay in cargobays]
@@ -0,0 +1,263 @@
+import os
+
+from galileo_sdk.business.objects.tables import JobTable
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.jobs import (
+    top_dict_to_jobs_top,
+    file_dict_to_file_listing,
+    job_dict_to_job,
+)
+
+
+class AsyncJobsRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        super(AsyncJobsRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    """
+    #FIXME: POTENTIALLY OUT OF DATE
+    """
+
+    async def request_send_job(self):
+        return await self._get("/job/upload_request")
+
+    async def request_send_job_completed(self, destination_mid, filename,
+                                         station_id):
+        """
+        FIXME: Potentially out of date
+        """
+        return await self._post(
+            "/jobs",
+            {
+                "destination_mid": destination_mid,
+                "filename": filename,
+                "stationid": station_id,
+            },
+        )
+
+    async def request_receive_job(self, job_id):
+        """
+        FIXME Potentially incorrect endpoint
+        """
+        return await self._get(
+            "/jobs/{job_id}/results/location".format(job_id=job_id))
+
+    async def request_receive_job_completed(self, job_id):
+        """
+        FIXME Potentially incorrect endpoint
+        """
+        return await self._put(
+            "/jobs/{job_id}/results/download_complete".format(job_id=job_id))
+
+    async def submit_job(self, job_id):
+        """
+        FIXME: To submit a job, we need to use a mission/project endpoint:
+                /projects/{project_id}/jobs
+                To resume a job, we PUT to the job/{job_id}/start endpoint
+        """
+        return await self._put("/jobs/{job_id}/run".format(job_id=job_id))
+
+    async def request_stop_job(self, job_id):
+        """
+        Stops a job from running. 
+        This is a soft stop, the job has a chance to spin down, but it is not resumeable.
+        Results will be posted if any were generated.
+
+        :param job_id: Job Id of the job to stop
+        :type job_id: str
+        :return: The stopped job
+        :rtype: Job
+        """
+        response = await self._put("/jobs/{job_id}/stop".format(job_id=job_id))
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def request_pause_job(self, job_id):
+        """
+        Pauses a running job. It can be resumed with start
+
+        :param job_id: Job Id of the job to pause
+        :type job_id: str
+        :return: The paused job
+        :rtype: Job
+        """
+        response = await self._put("/jobs/{job_id}/pause".format(job_id=job_id)
+                                   )
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def request_start_job(self, job_id):
+        """
+        Resumes a paused job.
+
+        :param job_id: Job Id of the job to resume
+        :type job_id: str
+        :return: The resumed job
+        :rtype: Job
+        """
+        response = await self._put("/jobs/{job_id}/start".format(job_id=job_id)
+                                   )
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def request_top_from_job(self, job_id):
+        """
+        Gets the results of Top from docker- a report on resource usage of the job
+
+        :param job_id: Job Id of the job to get the top from
+        :type job_id: str
+        :return: The top of the job from docker
+        :rtype: TopProcess
+        """
+        response = await self._get("/jobs/{job_id}/top".format(job_id=job_id))
+        json = self._json(response)
+        top = json["top"]
+        return [
+            top_dict_to_jobs_top(process, top["Titles"])
+            for process in top["Processes"]
+        ]
+
+    async def request_logs_from_jobs(self, job_id):
+        """
+        Get the logs for the job
+
+        :param job_id: Job Id of the job to get the logs from
+        :type job_id: str
+        :return: Job Logs
+        :rtype: Dict
+        """
+        response = await self._get("/jobs/{job_id}/logs".format(job_id=job_id))
+        json = self._json(response)
+        logs = json["logs"]
+        return logs
+
+    async def list_jobs(self, query):
+        """
+        Gets a filtered list of jobs
+
+        :param query: Parameters to filter the list of jobs with
+        :type query: str
+        :return: List of jobs
+        :rtype: List[Job]
+        """
+        return await self._get_conditional(
+            "/jobs",
+            lambda json: [job_dict_to_job(job) for job in json["jobs"]],
+            query=query,
+        )
+
+    async def list_jobs_table(self, query):
+        """
+        Gets a filtered list of jobs as columns, without creating a Job per job
+
+        :param query: Parameters to filter the list of jobs with
+        :type query: str
+        :return: Jobs of the page
+        :rtype: JobTable
+        """
+        response = await self._get("/jobs", query=query)
+        return JobTable.from_dicts(self._json(response)["jobs"])
+
+    async def get_results_metadata(self, job_id):
+        """
+        Gets the jobs results metadata
+
+        :param job_id: Job Id of the job to get the results from
+        :type job_id: str
+        :return: Results file
+        :rtype: List[FileListing]
+        """
+        response = await self._get(
+            "/jobs/{job_id}/results".format(job_id=job_id))
+        json = self._json(response)
+        files = json["files"]
+        return [file_dict_to_file_listing(file) for file in files]
+
+    async def download_results(self,
+                               job_id,
+                               query,
+                               filename,
+                               chunk_size=8192,
+                               expected_size=None):
+        """
+        Downloads the results of the job
+
+        :param job_id: Job Id of the job to download the results from
+        :type job_id: str
+        :param query: Filter parameters for the results
+        :type query: str
+        :param filename: Filename to save the results to 
+        :type filename: str
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :param expected_size: Size of the results file, a file of this size is not downloaded again, defaults to None
+        :type expected_size: int, optional
+        :raises DownloadException: The downloaded file is incomplete or corrupted
+        :return: saved filename
+        :rtype: str
+        """
+        dir = os.path.dirname(filename)
+        if dir and not os.path.exists(dir):
+            try:
+                os.makedirs(dir)
+            except OSError:
+                # Created by a concurrent download of another file
+                if not os.path.isdir(dir):
+                    raise
+
+        return await self._download(
+            "/jobs/{job_id}/results".format(job_id=job_id),
+            filename,
+            query=query,
+            chunk_size=chunk_size,
+            expected_size=expected_size,
+        )
+
+    async def update_job(self, request):
+        """
+        Updates a job. You can archive or unarchive a job only.
+
+        :param request: The request to update the job with
+        :type request: UpdateJobRequest
+        :return: The updated job
+        :rtype: Job
+        """
+        response = await self._put(
+            "/jobs/{job_id}".format(job_id=request.job_id),
+            {"archived": request.archived},
+        )
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def request_kill_job(self, job_id):
+        """
+        Kills a job. This can be done at any phase of running a job, and terminates the job immediately. 
+        Results may exist if they were already posted but otherwise no results will be posted.
+
+        :param job_id: Job Id of the job to kill
+        :type job_id: str
+        :return: Killed job
+        :rtype: Job
+        """
+        response = await self._put("/jobs/{job_id}/kill".format(job_id=job_id))
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
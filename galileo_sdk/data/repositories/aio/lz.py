@@ -0,0 +1,99 @@
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.lz import lz_dict_to_lz
+
+
+class AsyncLzRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio LZ Repository
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Backend URL
+        :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: AsyncSessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        super(AsyncLzRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def get_lz_by_id(self, lz_id):
+        """
+        Get a Landing Zone by ID
+
+        :param lz_id: The Landing Zone's ID
+        :type machine_id: str
+        :return: LZ Object
+        :rtype: Lz
+        """
+        response = await self._get(
+            "/machines/{machine_id}".format(machine_id=lz_id))
+        json = self._json(response)
+        return lz_dict_to_lz(json)
+
+    async def list_lz(self, query):
+        """
+        List Lzs with a specific query
+
+        :param query: The attributes to filter Lzs by
+        :type query: str
+        :return: List of Lz objects
+        :rtype: List[Lz]
+        """
+        return await self._get_conditional(
+            "/machines",
+            lambda json: [lz_dict_to_lz(lz) for lz in json["machines"]],
+            query=query,
+        )
+
+    # FIXME: Could return success object rather than bool
+    async def delete_lz_by_id(self, lz_id):
+        """
+        Delete a Landing Zone by ID
+
+        :param lz_id: LZ ID of the machine to delete
+        :type lz_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete("/machines/{lz_id}".format(lz_id=lz_id))
+        return self._json(response)
+
+    async def update(self, request):
+        """
+        Update a Landing Zone
+
+        :param request: Update request
+        :type request: UpdateLzRequest
+        :return: Updated LZ
+        :rtype: Lz
+        """
+        response = await self._put(
+            "/machines/{lz_id}".format(lz_id=request.lz_id),
+            {
+                "name": request.name,
+                "active": request.active,
+            },
+        )
+        json = self._json(response)
+        lz = json["machine"]
+        return lz_dict_to_lz(lz)
@@ -0,0 +1,328 @@
+from galileo_sdk.business.objects.tables import MissionTable
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.missions import (
+    missiontype_dict_to_missiontype,
+    mission_dict_to_mission,
+    file_dict_to_file_listing,
+    job_dict_to_job,
+)
+
+
+class AsyncMissionsRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio Mission repository
+
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Backend URL
+        :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: AsyncSessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        super(AsyncMissionsRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def list_missions(self, query):
+        """
+        List missions
+
+        :param query: Query string to filter missions
+        :type query: str
+        :return: List of missions
+        :rtype: List[Mission]
+        """
+        response = await self._get("/projects", query=query)
+        json = self._json(response)
+        missions = json["projects"]
+        return [mission_dict_to_mission(mission) for mission in missions]
+
+    async def list_missions_table(self, query):
+        """
+        List missions as columns, without creating a Mission per mission
+
+        :param query: Query string to filter missions
+        :type query: str
+        :return: Missions of the page
+        :rtype: MissionTable
+        """
+        response = await self._get("/projects", query=query)
+        return MissionTable.from_dicts(self._json(response)["projects"])
+
+    async def create_mission(self, create_mission_request):
+        """
+        Create a new mission
+
+        :param request: Create mission request
+        :type request: CreateMissionRequest
+        :return: New mission
+        :rtype: Mission
+        """
+        body = {
+            "name": create_mission_request.name,
+            "description": create_mission_request.description,
+            "source_storage_id": create_mission_request.source_storage_id,
+            "destination_storage_id":
+            create_mission_request.destination_storage_id,
+            "source_path": create_mission_request.source_path,
+            "destination_path": create_mission_request.destination_path,
+            "mission_type_id": create_mission_request.mission_type_id,
+            "public": create_mission_request.public,
+        }
+        if create_mission_request.settings is not None:
+            body.update(create_mission_request.settings)
+        response = await self._post("/projects", data=body)
+        json = self._json(response)
+        mission = json["project"]
+        return mission_dict_to_mission(mission)
+
+    async def upload_single_file(self, mission_id, file, filename):
+        """
+        Upload a single file to a mission
+        :param mission_id: Mission ID
+        :type mission_id: str
+        :param file: File to upload
+        :type file: File
+        :param filename: Filename
+        :type filename: str
+        :return: Succesfully uploaded files
+        :rtype: bool
+        """
+        r = await self._post(
+            "/projects/{mission_id}/files".format(mission_id=mission_id),
+            files=file,
+            filename=filename,
+        )
+        return self._json(r)
+
+    async def upload_file_chunk(self, mission_id, chunk, filename, offset,
+                                total_size):
+        """
+        Upload one chunk of a file to a mission. The position of the chunk in the file is sent
+        in a Content-Range header, so a chunk can be sent again after a failure. This assumes
+        the backend assembles the file from the ranges, one that ignores the header replaces
+        the file with each chunk, so callers check the size of the file once it is complete.
+
+        :param mission_id: Mission ID
+        :type mission_id: str
+        :param chunk: Bytes of the chunk
+        :type chunk: bytes
+        :param filename: Filename
+        :type filename: str
+        :param offset: Position of the first byte of the chunk in the file
+        :type offset: int
+        :param total_size: Size of the whole file
+        :type total_size: int
+        :return: True once the chunk is stored
+        :rtype: bool
+        """
+        await self._post(
+            "/projects/{mission_id}/files".format(mission_id=mission_id),
+            files=chunk,
+            filename=filename,
+            headers={
+                "Content-Range":
+                "bytes {start}-{end}/{total}".format(
+                    start=offset,
+                    end=offset + len(chunk) - 1,
+                    total=total_size),
+            },
+        )
+        return True
+
+    async def run_job_on_station(self,
+                                 mission_id,
+                                 station_id,
+                                 cpu_count=None,
+                                 memory_amount=None,
+                                 gpu_count=None):
+        """
+        Run a job on a station
+        
+        :param mission_id: Mission id of the mission to run the job on
+        :type mission_id: str
+        :param station_id: Station id of the station to run the job on
+        :type station_id: str
+        :param cpu_count: Cpu count to run the job with, defaults to None
+        :type cpu_count: number, optional
+        :param memory_amount: Memory amount to run the job with, defaults to None
+        :type memory_amount: number, optional
+        :param gpu_count: GPU count to run the job with, defaults to None
+        :type gpu_count: number, optional
+        :return: Job that was run
+        :rtype: Job 
+        """
+        response = await self._post(
+            "/projects/{mission_id}/jobs".format(mission_id=mission_id),
+            data={
+                "station_id": station_id,
+                "cpu_count": cpu_count,
+                "memory_amount": memory_amount,
+                "gpu_count": gpu_count
+            },
+        )
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def run_job_on_lz(self,
+                            mission_id,
+                            station_id,
+                            lz_id,
+                            cpu_count=None,
+                            memory_amount=None,
+                            gpu_count=None):
+        """
+        Run a job on a specific LZ
+
+        :param mission_id: Mission id of the mission to run the job on
+        :type mission_id: str
+        :param station_id: Station id of the station to run the job on
+        :type station_id: str
+        :param lz_id: Specific LZ to run the job on
+        :type lz_id: str
+        :param cpu_count: Cpu count to run the job with, defaults to None
+        :type cpu_count: number, optional
+        :param memory_amount: Memory amount to run the job with, defaults to None
+        :type memory_amount: number, optional
+        :param gpu_count: GPU count to run the job with, defaults to None
+        :type gpu_count: number, optional
+        :return: Job that was run
+        :rtype: Job 
+        """
+        response = await self._post(
+            "/projects/{mission_id}/jobs".format(mission_id=mission_id),
+            data={
+                "station_id": station_id,
+                "machine_id": lz_id,
+                "cpu_count": cpu_count,
+                "memory_amount": memory_amount,
+                "gpu_count": gpu_count
+            },
+        )
+        json = self._json(response)
+        job = json["job"]
+        return job_dict_to_job(job)
+
+    async def get_mission_files(self, mission_id):
+        """
+        Get files for/from a mission
+
+        :param mission_id: Mission id of the mission to get files for/from
+        :type mission_id: str
+        :return: Files for/from the mission
+        :rtype: List[FileListing]
+
+        """
+        response = await self._get(
+            "/projects/{mission_id}/files".format(mission_id=mission_id))
+        json = self._json(response)
+        json = json["files"]
+        return [file_dict_to_file_listing(file) for file in json]
+
+    async def delete_mission(self, mission_id):
+        """
+        Delete a mission
+
+        :param mission_id: Mission id of the mission to delete
+        :type mission_id: str
+        :return: Success object
+        :rtype: Dict
+        """
+        response = await self._delete(
+            "/projects/{mission_id}".format(mission_id=mission_id))
+        return self._json(response)
+
+    async def update_mission(self, update_mission_request):
+        """
+        Update a mission
+
+        :param update_mission_request: Update mission request
+        :type update_mission_request: UpdateMissionRequest
+        :return: Updated Mission
+        :rtype: Mission
+        """
+        body = {
+            "id": update_mission_request.mission_id,
+            "name": update_mission_request.name,
+            "description": update_mission_request.description,
+            "source_storage_id": update_mission_request.source_storage_id,
+            "destination_storage_id":
+            update_mission_request.destination_storage_id,
+            "source_path": update_mission_request.source_path,
+            "destination_path": update_mission_request.destination_path,
+        }
+        if update_mission_request.settings is not None:
+            body.update({"settings": update_mission_request.settings})
+        response = await self._put(
+            "/projects/{mission_id}".format(
+                mission_id=update_mission_request.mission_id),
+            data=body,
+        )
+        json = self._json(response)
+        return json
+
+    async def delete_file(self, mission_id, query):
+        """
+        Delete a file
+
+        :param mission_id: Determines the mission to delete the file from
+        :type mission_id: str
+        :param query: Query to use to find the file
+        :type query: str
+        :return: Misssion ID of the mission the file was deleted from
+        :rtype: str
+        """
+        await self._delete(
+            "projects/{mission_id}/files".format(mission_id=mission_id),
+            query=query)
+        return mission_id
+
+    async def list_mission_types(self):
+        """
+        List all mission types
+
+        :return: All mission types
+        :rtype: List[MissionType]
+        """
+        response = await self._get("/projecttypes/summaries")
+        json = self._json(response)
+        missiontypes = json["project_types"]
+        return [
+            missiontype_dict_to_missiontype(missiontype)
+            for missiontype in missiontypes
+        ]
+
+    async def get_mission_type(self, query):
+        """
+        Get a mission type
+
+        :param query: Filter mission type by this query
+        :type query: str
+        :return: Selected mission type
+        :rtype: MissionType
+        """
+        response = await self._get("/projecttypes", query=query)
+        json = self._json(response)
+        missiontypes = json["projecttypes"]
+        return missiontype_dict_to_missiontype(missiontypes[0])
@@ -0,0 +1,94 @@
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.providers.identity import IdentityCache
+from galileo_sdk.data.repositories.profiles import user_dict_to_profile
+
+
+class AsyncProfilesRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        identity_cache=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio Profile repository
+
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Backend URL
+        :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: AsyncSessionProvider, optional
+        :param identity_cache: Cache of the current user's profile, defaults to None
+        :type identity_cache: IdentityCache, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        super(AsyncProfilesRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+        if identity_cache is None:
+            identity_cache = IdentityCache()
+        self._identity_cache = identity_cache
+
+    async def self(self):
+        """
+        Get the current logged in user's profile. The profile is cached, see IdentityCache
+
+        :return: Current user's profile
+        :rtype: Profile
+        """
+        profile = self._identity_cache.get()
+        if profile is None:
+            response = await self._get("/users/self")
+            json = self._json(response)
+            profile = user_dict_to_profile(json)
+            self._identity_cache.set(profile)
+        return profile
+
+    def invalidate_self(self):
+        """
+        Forget the cached profile of the current user
+
+        :return: None
+        """
+        self._identity_cache.invalidate()
+
+    async def list_users(self, query):
+        """
+        Searches for a list of filtered users
+
+        :param query: Query to filter users by
+        :type query: str
+        :return: Found filtered users
+        :rtype: List[Profile]
+        """
+        response = await self._get("/users", query=query)
+        json = self._json(response)
+        users = json["users"]
+        return [user_dict_to_profile(user) for user in users]
+
+    async def list_station_invites(self):
+        """
+        List all inbound station invites
+
+        :return: Stations inviting the current user
+        :rtype: List[Station]
+        """
+        response = await self._get("/users/invites")
+        json = self._json(response)
+        stations = json["stations"]
+        return [station_dict_to_station(station) for station in stations]
@@ -0,0 +1,180 @@
+import json as json_p
+
+from galileo_sdk.data.providers.async_session import AsyncSessionProvider
+from galileo_sdk.data.repositories.downloads import (
+    discard_partial,
+    finish_download,
+    is_complete,
+    load_validator,
+    parse_digest,
+    partial_path,
+    range_headers,
+    resume_offset,
+    save_validator,
+)
+from galileo_sdk.data.repositories.requests import RequestsRepository
+
+
+class BufferedResponse(object):
+    def __init__(self, status_code, headers, content):
+        """
+        HTTP response whose body has already been read, so it can be parsed without awaiting.
+
+        :param status_code: HTTP status code
+        :type status_code: int
+        :param headers: Response headers
+        :type headers: Mapping[str, str]
+        :param content: Response body
+        :type content: bytes
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json_p.loads(self.content.decode("utf-8"))
+
+
+class AsyncRequestsRepository(RequestsRepository):
+    def __init__(self,
+                 settings_repository,
+                 auth_provider,
+                 namespace,
+                 session_provider=None,
+                 response_cache=None,
+                 json_decoder=None):
+        """
+        Parent class for all the asyncio HTTP repositories.
+
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Backend URL
+        :type namespace: str
+        :param session_provider: Pooled aiohttp session shared between repositories, defaults to a private one
+        :type session_provider: AsyncSessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to no caching
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, such as orjson.loads, defaults to orjson or ujson when installed, else response.json()
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        if session_provider is None:
+            session_provider = AsyncSessionProvider()
+        super(AsyncRequestsRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def _request(
+        self,
+        method,
+        endpoint,
+        data=None,
+        params=None,
+        query=None,
+        fragment=None,
+        files=None,
+        filename=None,
+        headers=None,
+    ):
+        url = self._make_url(endpoint, params, query, fragment)
+        extra_headers = headers
+        headers = self._make_headers(filename)
+        if extra_headers:
+            headers.update(extra_headers)
+        session = self._session_provider.get_session()
+
+        async with session.request(method,
+                                   url,
+                                   json=data,
+                                   headers=headers,
+                                   data=files) as r:
+            r.raise_for_status()
+            content = await r.read()
+            return BufferedResponse(r.status, r.headers, content)
+
+    async def _download(self,
+                        endpoint,
+                        path,
+                        query=None,
+                        chunk_size=8192,
+                        expected_size=None):
+        if is_complete(path, expected_size):
+            return path
+
+        offset = resume_offset(path, expected_size)
+        digest = None
+        if expected_size is None or offset < int(expected_size):
+            url = self._make_url(endpoint, "", query, "")
+            headers = self._make_headers()
+            headers.update(range_headers(offset, load_validator(path)))
+            session = self._session_provider.get_session()
+
+            async with session.get(url, headers=headers) as r:
+                if r.status == 416 and offset:
+                    # The partial file does not match the file on the server anymore
+                    discard_partial(path)
+                    return await self._download(endpoint, path, query,
+                                                chunk_size, expected_size)
+                r.raise_for_status()
+                digest = parse_digest(r.headers)
+                # 200 instead of 206 if the server ignored the Range header, or if the file
+                # changed since the partial download was started
+                mode = "ab" if r.status == 206 else "wb"
+                if mode == "wb":
+                    save_validator(path, r.headers)
+                with open(partial_path(path), mode) as f:
+                    async for chunk in r.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+
+        return finish_download(path, expected_size, digest)
+
+    async def _get(self, endpoint, *args, **kwargs):
+        ttl = 0
+        if self._response_cache is not None:
+            ttl = self._response_cache.ttl_for(endpoint)
+        if ttl:
+            key = self._cache_key(endpoint, kwargs.get("params"),
+                                  kwargs.get("query"), kwargs.get("fragment"))
+            response = self._response_cache.get(key)
+            if response is not None:
+                return response
+
+        response = await self._request("GET", endpoint, *args, **kwargs)
+        if ttl:
+            self._response_cache.set(key, response, ttl)
+        return response
+
+    async def _get_conditional(self, endpoint, parse, query=None):
+        key = self._cache_key(endpoint, query=query)
+        headers = self._conditional_cache.headers(key)
+        response = await self._get(endpoint, query=query, headers=headers)
+        if response.status_code == 304:
+            value = self._conditional_cache.not_modified(key)
+            if value is not None:
+                # A new list, so callers cannot alter the cached one
+                return list(value) if isinstance(value, list) else value
+            response = await self._get(endpoint, query=query)
+        value = parse(self._json(response))
+        self._conditional_cache.store(key, response, value)
+        return value
+
+    async def _put(self, endpoint, *args, **kwargs):
+        response = await self._request("PUT", endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
+
+    async def _post(self, endpoint, *args, **kwargs):
+        response = await self._request("POST", endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
+
+    async def _delete(self, endpoint, *args, **kwargs):
+        response = await self._request("DELETE", endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
@@ -0,0 +1,763 @@
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.stations import (
+    station_role_request_to_dict,
+    role_dict_to_station_role,
+    volume_dict_to_volume,
+    station_dict_to_station,
+    public_station_dict_to_station,
+    user_dict_to_station_user,
+    resource_policy_dict_to_resource_policy,
+    resource_policy_request_to_dict,
+)
+
+
+class AsyncStationsRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio Stations Repository
+
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider 
+        :param namespace: URL namespace
+        :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: AsyncSessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        super(AsyncStationsRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def list_stations(self, query):
+        """
+        List stations filtered by query
+
+        :param query: Parameters to filter search by
+        :type query: str
+        :return: Filtered list of stations
+        :rtype: List[Station]
+        """
+        return await self._get_conditional(
+            "/stations",
+            lambda json: [
+                station_dict_to_station(station)
+                for station in json["stations"]
+            ],
+            query=query,
+        )
+
+    async def get_public_stations(self, query):
+        """
+        List public stations filtered by query
+ 
+        :param query: Parameters to filter search by
+        :type query: str
+        :return: Filtered list of public stations
+        :rtype: List[PublicStation]       
+        
+        """
+        response = await self._get("/stations/public", query=query)
+        json = self._json(response)
+        stations = json["stations"]
+        return [
+            public_station_dict_to_station(station) for station in stations
+        ]
+
+    async def create_station(self, name, description, user_ids=None):
+        """
+        Creates a new station
+
+        :param name: Name of the station
+        :type name: str
+        :param description: Short description of the station
+        :type description: str
+        :param user_ids: List of users invited to station, defaults to None
+        :type user_ids: List[str], optional
+        :return: Newly created station
+        :rtype: Station
+        """
+        response = await self._post("/station", {
+            "name": name,
+            "user_ids": user_ids,
+            "description": description
+        })
+        json = self._json(response)
+        station = json["station"]
+        return station_dict_to_station(station)
+
+    async def update_station(self, request):
+        """
+        Updates a station
+
+        :param request: Update Station Request object
+        :type request: UpdateStationRequest
+        :return: Updated station
+        :rtype: Station
+        """
+        response = await self._put(
+            "/station/{station_id}".format(station_id=request.station_id),
+            {
+                "name": request.name,
+                "description": request.description,
+                "public": request.public,
+                "allow_auto_join": request.allow_auto_join
+            },
+        )
+        json = self._json(response)
+        station = json["station"]
+        return station_dict_to_station(station)
+
+    async def delete_station(self, station_id):
+        """
+        Deletes a station
+
+        :param station_id: Station ID of station to delete
+        :type station_id: str
+        :return: Success 
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/station/{station_id}".format(station_id=station_id))
+        return self._json(response)  # Boolean
+
+    async def get_station_resource_policy(self, station_id):
+        """
+        Gets a station resource policy
+
+        :param station_id: Station ID of the station to get policy from
+        :type station_id: str
+        :return: A ResourcePolicy object containing the station's resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._get(
+            "/stations/{station_id}/resource_policy".format(
+                station_id=station_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def update_station_resource_policy(self, station_id, request):
+        """
+        Updates a station's resource policy
+
+        :param station_id: Station ID of the station to update
+        :type station_id: str
+        :param request: The new station resource policy
+        :type request: str
+        :return: A ResourcePolicy object containing the updated station resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._put(
+            "/stations/{station_id}/resource_policy".format(
+                station_id=station_id),
+            resource_policy_request_to_dict(request),
+        )
+        response = self._json(response)
+        policy = response["resource_policy"]
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def delete_station_resource_policy(self, station_id):
+        """
+        Deletes a station's resource policy
+
+        :param station_id: Station ID of the station to delete the resource policy from
+        :type station_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/stations/{station_id}/resource_policy".format(
+                station_id=station_id))
+        return self._json(response)  # Boolean
+
+    async def get_self_resource_limits(self, station_id):
+        """
+        Gets current user's resource limits in a station
+
+        :param station_id: Station ID of the station to get from
+        :type station_id: str
+        :return: A ResourcePolicy object containing the current user's resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._get(
+            "/stations/{station_id}/resource_limits".format(
+                station_id=station_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        machine_id = response["machine_id"]
+        return resource_policy_dict_to_resource_policy(policy), machine_id
+
+    async def invite_to_station(self, station_id, user_ids, role_id):
+        """
+        Invites users to a station
+
+        :param station_id: station ID of the station to invite users to
+        :type station_id: str
+        :param user_ids: User ids of users to invite
+        :type user_ids: List[str]
+        :param role_id: Role ID of the role to assign to the users
+        :type role_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._post(
+            "/station/{station_id}/users/invite".format(station_id=station_id),
+            {
+                "userids": user_ids,
+                "role_id": role_id
+            },
+        )
+        return self._json(response)  # Boolean
+
+    async def accept_station_invite(self, station_id):
+        """
+        Accepts an incoming station invite and updates the user in that station
+
+        :param station_id: Station ID of the station to accept invitation from
+        :type station_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._put(
+            "/station/{station_id}/users/accept".format(station_id=station_id))
+        return self._json(response)  # Boolean
+
+    async def reject_station_invite(self, station_id):
+        """
+        Rejects an incoming station invite and updates the user in that station
+
+        :param station_id: Station ID of the station to reject invitation from
+        :type station_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._put(
+            "/station/{station_id}/users/reject".format(station_id=station_id))
+        return self._json(response)  # Boolean
+
+    async def request_to_join(self, station_id):
+        """
+        Sends a join request to a station
+
+        :param station_id: Station ID of the station user is requesting to join
+        :type station_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._post(
+            "/station/{station_id}/requests".format(station_id=station_id))
+        return self._json(response)  # Boolean
+
+    async def approve_request_to_join(self, station_id, user_ids):
+        """
+        Approves a station request to join from a user
+
+        :param station_id: Station ID of the station to accept the request from
+        :type station_id: str
+        :param user_ids: List of user_ids to accept
+        :type userids: List[str]
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._put(
+            "/station/{station_id}/requests/approve".format(
+                station_id=station_id),
+            {"userids": user_ids},
+        )
+        return self._json(response)  # Boolean
+
+    async def reject_request_to_join(self, station_id, user_ids):
+        """
+        Rejects a station request to join from a user
+
+        :param station_id: Station ID of the station to reject the request from
+        :type station_id: str
+        :param user_ids: User ids to reject
+        :type user_ids: List[str]
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._put(
+            "/station/{station_id}/requests/reject".format(
+                station_id=station_id),
+            {"userids": user_ids},
+        )
+        return self._json(response)  # Boolean
+
+    async def leave_station(self, station_id):
+        """
+        Leave a station
+
+        :param station_id: Station ID of the station the user wants to leave 
+        :type station_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._put(
+            "/station/{station_id}/user/withdraw".format(station_id=station_id)
+        )
+        return self._json(response)  # Boolean
+
+    async def update_station_member(self, station_id, user_id, role_id):
+        """
+        Updates a station member 
+
+        :param station_id: Station ID of the station to update the member in 
+        :type station_id: str
+        :param user_id: User ID of the user to update
+        :type userid: str
+        :param role_id: Role ID of the role to update
+        :type role_id: str
+        :return: An updated StationUser object 
+        :rtype: StationUser
+        """
+        response = await self._put(
+            "/station/{station_id}/user/{userid}".format(station_id=station_id,
+                                                         userid=user_id),
+            {"role_id": role_id},
+        )
+        response = self._json(response)
+        user = response["station_user"]
+        return user_dict_to_station_user(user)
+
+    async def remove_member_from_station(self, station_id, user_id):
+        """
+        Removes a member from a station
+
+        :param station_id: Station Id of the station to remove the member from
+        :type station_id: str
+        :param user_id: User ID of the user to remove
+        :type user_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/station/{station_id}/user/{userid}/delete".format(
+                station_id=station_id, userid=user_id))
+        return self._json(response)  # Boolean
+
+    async def get_station_user_resource_policy(self, station_id, user_id):
+        """
+        Gets a users resource policy in a station
+        :param station_id: Station ID of the station to get the resource policy for
+        :type station_id: str
+        :param user_id: User ID of the user to get the resource policy for
+        :type user_id: str
+        :return: Station user resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._get(
+            "/stations/{station_id}/users/{user_id}/resource_policy".format(
+                station_id=station_id, user_id=user_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def update_station_user_resource_policy(self, station_id, user_id,
+                                                  request):
+        """
+        Update a station user resource policy
+
+        :param station_id: Station ID of the station to update the resource policy for
+        :type station_id: str
+        :param user_id: User ID of the user to update the resource policy for
+        :type user_id: 
+        :param request: Resource Policy Request  
+        :type request: ResourcePolicyRequest
+        :return: Updated Station user resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._put(
+            "/stations/{station_id}/users/{user_id}/resource_policy".format(
+                station_id=station_id, user_id=user_id),
+            resource_policy_request_to_dict(request),
+        )
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def delete_station_user_resource_policy(self, station_id, user_id):
+        """
+        Delete a station user resource policy
+
+        :param station_id: Station ID of the station to delete the resource policy for
+        :type station_id: str
+        :param user_id: User ID of the user to delete the resource policy for
+        :type user_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/stations/{station_id}/users/{user_id}/resource_policy".format(
+                station_id=station_id, user_id=user_id))
+
+        return self._json(response)  # Boolean
+
+    async def get_station_roles(self, station_id, query):
+        """
+        Get station roles
+
+        :param station_id: Station ID of the station to get the roles for
+        :type station_id: str
+        :param query: Query to filter the roles by
+        :type query: str
+        :return: Station roles
+        :rtype: List[StationRole]
+        """
+        response = await self._get(
+            "/stations/{station_id}/roles".format(station_id=station_id),
+            query=query)
+        response = self._json(response)
+        roles = response["roles"]
+        return [role_dict_to_station_role(role) for role in roles]
+
+    async def create_station_role(self, station_id, request):
+        """
+        Create a station role
+
+        :param station_id: Station ID of the station to create the role for
+        :type station_id: str
+        :param request: Create Station Role Request
+        :type request: CreateStationRoleRequest
+        :return: New Station Role
+        :rtype: StationRole
+        """
+        response = await self._post(
+            "/stations/{station_id}/roles".format(station_id=station_id),
+            station_role_request_to_dict(request),
+        )
+        response = self._json(response)
+        role = response["role"]
+        return role_dict_to_station_role(role)
+
+    async def update_station_role(self, station_id, station_role_id, request):
+        """
+        Update a station role
+
+        :param station_id: Station ID of the station to update the role for
+        :type station_id: str
+        :param station_role_id: Station Role ID of the station role to update
+        :type station_role_id: str
+        :param request: Update Station Role Request
+        :type request: UpdateStationRoleRequest
+        :return: The updated Station Role
+        :rtype: StationRole
+        """
+        response = await self._put(
+            "/stations/{station_id}/roles/{role_id}".format(
+                station_id=station_id, role_id=station_role_id),
+            station_role_request_to_dict(request),
+        )
+        response = self._json(response)
+        role = response["role"]
+        return role_dict_to_station_role(role)
+
+    async def delete_station_role(self, station_id, station_role_id):
+        """
+        Delete a station role
+
+        :param station_id: Station ID of the station to delete the role for
+        :type station_id: str
+        :param station_role_id: Station Role ID of the station role to delete
+        :type station_role_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/stations/{station_id}/roles/{role_id}".format(
+                station_id=station_id, role_id=station_role_id))
+
+        return self._json(response)  # Boolean
+
+    async def get_station_role_resource_policy(self, station_id, role_id):
+        """
+        Get a station role resource policy
+
+        :param station_id: Station ID of the station to get the resource policy for
+        :type station_id: str
+        :param role_id: ID of the station role to get the resource policy for
+        :type role_id: str
+        :return: Station role resource policy
+        :rtype: ResourcePolicy 
+        """
+        response = await self._get(
+            "/stations/{station_id}/roles/{role_id}/resource_policy".format(
+                station_id=station_id, role_id=role_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def update_station_role_resource_policy(self, station_id, role_id,
+                                                  request):
+        """
+        Update a station role resource policy
+
+        :param station_id: Station ID of the station to update the resource policy for
+        :type station_id: str
+        :param role_id: ID of the station role to update
+        :type role_id: str
+        :param request: Update Station Role Resource Policy Request
+        :type request: ResourcePolicyRequest
+        :return: Updated Station Role Resource Policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._put(
+            "/stations/{station_id}/roles/{role_id}/resource_policy".format(
+                station_id=station_id, role_id=role_id),
+            resource_policy_request_to_dict(request),
+        )
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def delete_station_role_resource_policy(self, station_id, role_id):
+        """
+        Delete a station role resource policy
+
+        :param station_id: Station ID of the station to delete the resource policy for
+        :type station_id: str
+        :param role_id: Role ID of the station role to delete
+        :type role_id: str 
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/stations/{station_id}/roles/{role_id}/resource_policy".format(
+                station_id=station_id, role_id=role_id))
+
+        return self._json(response)  # Boolean
+
+    async def add_lzs_to_station(self, station_id, lz_ids):
+        """
+        Add LZs to a station
+
+        :param station_id: Station ID of the station to add the LZs to
+        :type station_id: str
+        :param lz_ids: List of LZ IDs to add to the station
+        :type lz_ids: List[str]
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._post(
+            "/station/{station_id}/machines".format(station_id=station_id),
+            {"mids": lz_ids},
+        )
+        return self._json(response)
+
+    async def remove_lzs_from_station(self, station_id, lz_ids):
+        """
+        Remove LZs from a station
+
+        :param station_id: Station ID of the station to remove the LZs from
+        :type station_id: str
+        :param lz_ids: List of LZ IDs to remove from the station
+        :type lz_ids: List[str]
+        :return: Success    
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/station/{station_id}/machines".format(station_id=station_id),
+            {"mids": lz_ids},
+        )
+        return self._json(response)
+
+    async def get_station_lz_resource_policy(self, station_id, lz_id):
+        """
+        Get a station LZ resource policy
+        :param station_id: Station ID of the station to get the "Z's resource policy for
+        :type station_id: str
+        :param lz_id: LZ ID of the station LZ to get the resource policy for
+        :type lz_id: str
+        :return: Resource policy of the station LZ
+        :rtype: ResourcePolicy
+        """
+        response = await self._get(
+            "/stations/{station_id}/machines/{machine_id}/resource_policy".
+            format(station_id=station_id, machine_id=lz_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def update_station_lz_resource_policy(self, station_id, lz_id,
+                                                request):
+        """
+        Update a station LZ resource policy
+
+        :param station_id: Station ID of the station to update the resource policy for
+        :type station_id: str
+        :param lz_id: LZ ID of the station LZ to update resource policy for
+        :type lz_id: str
+        :param request: Update Station LZ Resource Policy Request
+        :type request: ResourcePolicyRequest 
+        :return: Updated LZ resource policy
+        :rtype: ResourcePolicy
+        """
+        response = await self._put(
+            "/stations/{station_id}/machines/{machine_id}/resource_policy".
+            format(station_id=station_id, machine_id=lz_id),
+            resource_policy_request_to_dict(request),
+        )
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def delete_station_lz_resource_policy(self, station_id, lz_id):
+        """
+        Delete a station LZ resource policy
+
+        :param station_id: Station ID of the station to delete the resource policy for
+        :type station_id: str
+        :param lz_id: LZ ID of the station LZ to delete resource policy for
+        :type lz_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/stations/{station_id}/machines/{machine_id}/resource_policy".
+            format(station_id=station_id, machine_id=lz_id))
+
+        return self._json(response)
+
+    async def get_station_lz_resource_limits(self, station_id, lz_id):
+        """
+        Get a station LZ resource limits
+
+        :param station_id: Station ID of the station to get the resource limits for
+        :type station_id: str
+        :param lz_id: station LZ ID of the station LZ to get the resource limits for
+        :type lz_id: str
+        :return: Resource limits of the station LZ
+        :rtype: ResourcePolicy
+        """
+        response = await self._get(
+            "/stations/{station_id}/machines/{machine_id}/resource_limits".
+            format(station_id=station_id, machine_id=lz_id))
+        response = self._json(response)
+        policy = response["resource_policy"]
+        if policy is None:
+            return None
+        return resource_policy_dict_to_resource_policy(policy)
+
+    async def add_volume_to_station(self, station_id, name, mount_point,
+                                    access):
+        """
+        Add a volume to a station
+
+        :param station_id: Station ID of the station to add the volume to
+        :type station_id: str
+        :param name: name of the volume to add
+        :type name: str
+        :param mount_point: Mount point of the volume to add
+        :type mount_point: str
+        :param access: Access mode of the volume to add
+        :type access: str
+        :return: Volume
+        :rtype: Volume
+        """
+        response = await self._post(
+            "/station/{station_id}/volumes".format(station_id=station_id),
+            {
+                "name": name,
+                "mount_point": mount_point,
+                "access": access.value
+            },
+        )
+        json = self._json(response)
+        volume = json["volumes"]
+        return volume_dict_to_volume(volume)
+
+    async def add_host_path_to_volume(self, station_id, volume_id, lz_id,
+                                      host_path):
+        """
+        Add a host path to a volume
+
+        :param station_id: Station ID of the station to add the host path to
+        :type station_id: str
+        :param volume_id: Volume ID of the volume to add the host path to
+        :type volume_id: str
+        :param lz_id: LZ ID of the LZ to add the host path to
+        :type lz_id: str
+        :param host_path: Host path of the host path to add
+        :type host_path: str
+        :return: Host Path to Volume
+        :rtype: Volume
+        """
+        response = await self._post(
+            "/station/{station_id}/volumes/{volume_id}/host_paths".format(
+                station_id=station_id, volume_id=volume_id),
+            {
+                "mid": lz_id,
+                "host_path": host_path
+            },
+        )
+        json = self._json(response)
+        volume = json["volume"]
+        return volume_dict_to_volume(volume)
+
+    async def delete_host_path_from_volume(self, station_id, volume_id,
+                                           host_path_id):
+        """
+        Delete a host path from a volume
+
+        :param station_id: Station ID of the station to delete the host path from
+        :type station_id: str 
+        :param volume_id: Volume ID of the volume to delete the host path from
+        :type volume_id: str
+        :param host_path_id: Host path id of the host path to delete
+        :type host_path_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/station/{station_id}/volumes/{volume_id}/host_paths/{host_path_id}"
+            .format(station_id=station_id,
+                    volume_id=volume_id,
+                    host_path_id=host_path_id))
+        return self._json(response)
+
+    # TODO - Swagger outdated/wrong response
+    async def remove_volume_from_station(self, station_id, volume_id):
+        """
+        Remove a volume from a station
+
+        :param station_id: Station ID of the station to remove the volume from
+        :type station_id: str
+        :param volume_id: Volume ID of the volume to remove
+        :type volume_id: str
+        :return: Success
+        :rtype: bool
+        """
+        response = await self._delete(
+            "/station/{station_id}/volumes/{volume_id}".format(
+                station_id=station_id, volume_id=volume_id))
+        return self._json(response)
@@ -0,0 +1,82 @@
+from galileo_sdk.data.repositories.aio.requests import AsyncRequestsRepository
+from galileo_sdk.data.repositories.universes import universe_dict_to_universe
+
+
+class AsyncUniversesRepository(AsyncRequestsRepository):
+    def __init__(
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
+    ):
+        """
+        Asyncio Universes Repository
+
+        :param settings_repository: Settings repository
+        :type settings_repository: SettingsRepository
+        :param auth_provider: Authentication provider
+        :type auth_provider: AuthProvider
+        :param namespace: Backend URL
+        :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: AsyncSessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
+        """
+        super(AsyncUniversesRepository, self).__init__(
+            settings_repository=settings_repository,
+            auth_provider=auth_provider,
+            namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
+        )
+
+    async def list_universes(self):
+        """
+        List available universes
+
+        :return: A list of available universes
+        :rtype: List[Universe]
+        """
+        response = await self._get("/universe")
+        json = self._json(response)
+        universes = json["universes"]
+        return [universe_dict_to_universe(universe) for universe in universes]
+
+    async def create_universe(self,
+                              name,
+                              admin_user_ids,
+                              require_positive_credit_balance=True,
+                              allow_scheduling_without_quota=True):
+        """
+        Create a new universe (Need very high permissions)
+
+        :param name: name of the universe
+        :type name: str
+        :param admin_user_ids: Admin of universe ids
+        :type admin_user_ids: List[str
+        :param require_positive_credit_balance: Require positive credit balance to be part of universe, defaults to True
+        :type require_positive_credit_balance: bool, optional
+        :param allow_scheduling_without_quota: Allow job scheduling without quota on universe, defaults to True
+        :type allow_scheduling_without_quota: bool, optional
+        :return: Created universe
+        :rtype: Universe
+        """
+        response = await self._post(
+            "/universe", {
+                "name": name,
+                "require_positive_credit_balance":
+                require_positive_credit_balance,
+                "allow_scheduling_without_quota":
+                allow_scheduling_without_quota,
+                "admin_user_ids": admin_user_ids,
+            })
+        json = self._json(response)
+        universe = json["universe"]
+        return universe_dict_to_universe(universe)
@@ -6,17 +6,26 @@ from galileo_sdk.data.repositories import RequestsRepository
 
 class CargoBaysRepository(RequestsRepository):
     def __init__(
-        self, settings_repository, auth_provider, namespace,
+        self,
+        settings_repository,
+        auth_provider,
+        namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         super(CargoBaysRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     def list_cargo_bays(self):
         response = self._get("/storage")
-        json = response.json()
+        json = self._json(response)
         cargobays = json["storage"]
         return [cargo_bay_dict_to_CargoBay(cargobay) for cargobay in cargobays]
 		
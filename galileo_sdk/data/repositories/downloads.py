@@ -0,0 +1,220 @@
+import base64
+import binascii
+import hashlib
+import os
+
+from galileo_sdk.business.objects.exceptions import DownloadException
+
+PARTIAL_SUFFIX = ".part"
+VALIDATOR_SUFFIX = ".validator"
+
+# Digest algorithm names (RFC 3230 / RFC 9530) and their hashlib names
+DIGEST_ALGORITHMS = {
+    "sha-512": "sha512",
+    "sha-256": "sha256",
+    "md5": "md5",
+}
+
+
+def partial_path(path):
+    """
+    Path the download is written to until it is complete and verified
+
+    :param path: Final path of the file
+    :type path: str
+    :return: Path of the partial file
+    :rtype: str
+    """
+    return path + PARTIAL_SUFFIX
+
+
+def _validator_path(path):
+    return partial_path(path) + VALIDATOR_SUFFIX
+
+
+def discard_partial(path):
+    """
+    Remove a partial download, so the file is downloaded from the start
+
+    :param path: Final path of the file
+    :type path: str
+    """
+    for partial in (partial_path(path), _validator_path(path)):
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def load_validator(path):
+    """
+    ETag or Last-Modified date of the file the partial download was started from
+
+    :param path: Final path of the file
+    :type path: str
+    :return: Validator to send in the If-Range header, None if it is unknown
+    :rtype: Optional[str]
+    """
+    try:
+        with open(_validator_path(path)) as f:
+            return f.read().strip() or None
+    except (IOError, OSError):
+        return None
+
+
+def save_validator(path, headers):
+    """
+    Keep the ETag, or else the Last-Modified date, of a response next to the partial file so
+    an interrupted download is only resumed while the file on the server is unchanged. Weak
+    ETags cannot be used in If-Range.
+
+    :param path: Final path of the file
+    :type path: str
+    :param headers: Response headers
+    :type headers: Mapping[str, str]
+    """
+    etag = headers.get("ETag")
+    validator = etag if etag and not etag.startswith("W/") else headers.get(
+        "Last-Modified")
+    if validator:
+        with open(_validator_path(path), "w") as f:
+            f.write(validator)
+    elif os.path.exists(_validator_path(path)):
+        os.remove(_validator_path(path))
+
+
+def _size(expected_size):
+    return None if expected_size is None else int(expected_size)
+
+
+def is_complete(path, expected_size):
+    """
+    Check whether a file was already downloaded. Without an expected size this cannot be
+    known, so the file is downloaded again.
+
+    :param path: Final path of the file
+    :type path: str
+    :param expected_size: Size of the file on the server
+    :type expected_size: int
+    :return: True if the file does not need to be downloaded
+    :rtype: bool
+    """
+    expected_size = _size(expected_size)
+    return (expected_size is not None and os.path.isfile(path)
+            and os.path.getsize(path) == expected_size)
+
+
+def resume_offset(path, expected_size):
+    """
+    Number of bytes already downloaded by a previous, interrupted download
+
+    :param path: Final path of the file
+    :type path: str
+    :param expected_size: Size of the file on the server
+    :type expected_size: int
+    :return: Offset to resume the download from
+    :rtype: int
+    """
+    partial = partial_path(path)
+    if not os.path.isfile(partial):
+        return 0
+    offset = os.path.getsize(partial)
+    expected_size = _size(expected_size)
+    if load_validator(path) is None or (expected_size is not None
+                                        and offset > expected_size):
+        # Cannot tell whether it is from the same version of the file
+        discard_partial(path)
+        return 0
+    return offset
+
+
+def range_headers(offset, validator=None):
+    """
+    Headers requesting the remainder of a file. With If-Range the server sends the whole
+    file, with a 200 status, if it changed since the partial download was started.
+
+    :param offset: Number of bytes already downloaded
+    :type offset: int
+    :param validator: ETag or Last-Modified date of the partial download, defaults to None
+    :type validator: str, optional
+    :return: Range and If-Range headers, empty when downloading from the start
+    :rtype: Dict[str, str]
+    """
+    if not offset or not validator:
+        return {}
+    return {
+        "Range": "bytes={offset}-".format(offset=offset),
+        "If-Range": validator,
+    }
+
+
+def parse_digest(headers):
+    """
+    Read the checksum of the whole file from the Repr-Digest or Digest response header
+
+    :param headers: Response headers
+    :type headers: Mapping[str, str]
+    :return: hashlib algorithm name and expected digest, None if the server sent none
+    :rtype: Optional[Tuple[str, bytes]]
+    """
+    for header in ("Repr-Digest", "Digest"):
+        value = headers.get(header)
+        if not value:
+            continue
+        for item in value.split(","):
+            algorithm, _, encoded = item.strip().partition("=")
+            algorithm = DIGEST_ALGORITHMS.get(algorithm.strip().lower())
+            if algorithm is None:
+                continue
+            try:
+                return algorithm, base64.b64decode(encoded.strip().strip(":"))
+            except (binascii.Error, TypeError, ValueError):
+                continue
+    return None
+
+
+def _file_digest(path, algorithm, block_size=1024 * 1024):
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def finish_download(path, expected_size=None, digest=None):
+    """
+    Verify the partial file and move it to its final path. A short file is kept so the
+    download can be resumed, a file that is too long or fails the checksum is removed.
+
+    :param path: Final path of the file
+    :type path: str
+    :param expected_size: Size of the file on the server, defaults to None
+    :type expected_size: int, optional
+    :param digest: hashlib algorithm name and expected digest, defaults to None
+    :type digest: Tuple[str, bytes], optional
+    :raises DownloadException: The file is incomplete or corrupted
+    :return: Final path of the file
+    :rtype: str
+    """
+    partial = partial_path(path)
+    size = os.path.getsize(partial)
+    expected_size = _size(expected_size)
+    if expected_size is not None and size != expected_size:
+        if size > expected_size:
+            discard_partial(path)
+        raise DownloadException(
+            path, "Downloaded {size} bytes, expected {expected}".format(
+                size=size, expected=expected_size))
+    if digest is not None and _file_digest(partial, digest[0]) != digest[1]:
+        discard_partial(path)
+        raise DownloadException(
+            path, "{algorithm} checksum mismatch".format(algorithm=digest[0]))
+
+    if hasattr(os, "replace"):
+        os.replace(partial, path)
+    else:
+        # Python 2, os.rename does not overwrite on Windows
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(partial, path)
+    if os.path.exists(_validator_path(path)):
+        os.remove(_validator_path(path))
+    return path
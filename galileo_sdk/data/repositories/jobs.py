@@ -4,6 +4,7 @@ import os
 from galileo_sdk.business.objects import EJobStatus, Job, JobStatus, UpdateJobRequest
 from galileo_sdk.business.objects.jobs import TopDetails, TopProcess
 from galileo_sdk.business.objects.missions import FileListing
+from galileo_sdk.business.objects.tables import JobTable
 from galileo_sdk.data.repositories import RequestsRepository
 
 import sys
@@ -21,11 +22,17 @@ class JobsRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         super(JobsRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     """
@@ -83,7 +90,7 @@ class JobsRepository(RequestsRepository):
         :rtype: Job
         """
         response = self._put("/jobs/{job_id}/stop".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -97,7 +104,7 @@ class JobsRepository(RequestsRepository):
         :rtype: Job
         """
         response = self._put("/jobs/{job_id}/pause".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -111,7 +118,7 @@ class JobsRepository(RequestsRepository):
         :rtype: Job
         """
         response = self._put("/jobs/{job_id}/start".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -125,7 +132,7 @@ class JobsRepository(RequestsRepository):
         :rtype: TopProcess
         """
         response = self._get("/jobs/{job_id}/top".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         top = json["top"]
         return [
             top_dict_to_jobs_top(process, top["Titles"])
@@ -142,7 +149,7 @@ class JobsRepository(RequestsRepository):
         :rtype: Dict
         """
         response = self._get("/jobs/{job_id}/logs".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         logs = json["logs"]
         return logs
 
@@ -155,10 +162,36 @@ class JobsRepository(RequestsRepository):
         :return: List of jobs
         :rtype: List[Job]
         """
+        return self._get_conditional(
+            "/jobs",
+            lambda json: [job_dict_to_job(job) for job in json["jobs"]],
+            query=query,
+        )
+
+    def list_jobs_table(self, query):
+        """
+        Gets a filtered list of jobs as columns, without creating a Job per job
+
+        :param query: Parameters to filter the list of jobs with
+        :type query: str
+        :return: Jobs of the page
+        :rtype: JobTable
+        """
         response = self._get("/jobs", query=query)
-        json = response.json()
-        jobs = json["jobs"]
-        return [job_dict_to_job(job) for job in jobs]
+        return JobTable.from_dicts(self._json(response)["jobs"])
+
+    def stream_jobs(self, query):
+        """
+        Gets a filtered list of jobs, converting each job as soon as it is received instead
+        of once the whole response has been read
+
+        :param query: Parameters to filter the list of jobs with
+        :type query: str
+        :return: Jobs of the page
+        :rtype: Iterator[Job]
+        """
+        return (job_dict_to_job(job)
+                for job in self._stream("/jobs", "jobs.item", query=query))
 
     def get_results_metadata(self, job_id):
         """
@@ -170,11 +203,16 @@ class JobsRepository(RequestsRepository):
         :rtype: List[FileListing]
         """
         response = self._get("/jobs/{job_id}/results".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         files = json["files"]
         return [file_dict_to_file_listing(file) for file in files]
 
-    def download_results(self, job_id, query, filename):
+    def download_results(self,
+                         job_id,
+                         query,
+                         filename,
+                         chunk_size=8192,
+                         expected_size=None):
         """
         Downloads the results of the job
 
@@ -184,23 +222,29 @@ class JobsRepository(RequestsRepository):
         :type query: str
         :param filename: Filename to save the results to 
         :type filename: str
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :param expected_size: Size of the results file, a file of this size is not downloaded again, defaults to None
+        :type expected_size: int, optional
+        :raises DownloadException: The downloaded file is incomplete or corrupted
         :return: saved filename
         :rtype: str
         """
         dir = os.path.dirname(filename)
-        if not os.path.exists(dir):
-            os.mkdir(dir)
+        if dir and not os.path.exists(dir):
+            try:
+                os.makedirs(dir)
+            except OSError:
+                # Created by a concurrent download of another file
+                if not os.path.isdir(dir):
+                    raise
 
         if is_py3:
-            with self._get(
-                    "/jobs/{job_id}/results".format(job_id=job_id),
-                    query=query,
-                    filename=filename,
-            ) as r:
-                with open(filename, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:  # filter out keep-alive new chunks
-                            f.write(chunk)
+            self._download("/jobs/{job_id}/results".format(job_id=job_id),
+                           filename,
+                           query=query,
+                           chunk_size=chunk_size,
+                           expected_size=expected_size)
         elif is_py2:
             r = self._get("/jobs/{job_id}/results".format(job_id=job_id),
                           query=query)
@@ -222,7 +266,7 @@ class JobsRepository(RequestsRepository):
             "/jobs/{job_id}".format(job_id=request.job_id),
             {"archived": request.archived},
         )
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -237,7 +281,7 @@ class JobsRepository(RequestsRepository):
         :rtype: Job
         """
         response = self._put("/jobs/{job_id}/kill".format(job_id=job_id))
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -285,8 +329,6 @@ def job_dict_to_job(job):
     :return: Job Object
     :rtype: Job
     """
-    print(job)
-
     return Job(
         job["jobid"],
         job["receiverid"],
@@ -308,10 +350,9 @@ def job_dict_to_job(job):
         job["pay_interval"],
         job["total_runtime"],
         job["archived"],
-        [
-            job_status_dict_to_job_status(job_status)
-            for job_status in job["status_history"]
-        ],
+        # Converted when status_history is first read
+        status_history_dicts=job["status_history"],
+        job_status_loader=job_status_dict_to_job_status,
     )
 
 
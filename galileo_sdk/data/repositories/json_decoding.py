@@ -0,0 +1,102 @@
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def default_json_decoder():
+    """
+    Fastest JSON decoder installed, orjson then ujson
+
+    :return: Function decoding a JSON document from bytes, None when neither is installed
+    :rtype: Callable[[bytes], object]
+    """
+    if orjson is not None:
+        return orjson.loads
+    if ujson is not None:
+        return ujson.loads
+    return None
+
+
+def decode_json(response, decoder=None):
+    """
+    Decode the JSON body of a response with decoder, or with response.json() when there is
+    no decoder or the body is not available as bytes. A body the decoder rejects, such as
+    one that is not UTF-8, is decoded by response.json(), which raises the usual error when
+    it is not JSON.
+
+    :param response: HTTP response
+    :type response: requests.Response
+    :param decoder: Function decoding a JSON document from bytes, defaults to None
+    :type decoder: Callable[[bytes], object], optional
+    :return: Decoded body
+    :rtype: object
+    """
+    if decoder is None:
+        return response.json()
+    content = getattr(response, "content", None)
+    if not content or not isinstance(content, bytes):
+        return response.json()
+    try:
+        return decoder(content)
+    except ValueError:
+        return response.json()
+
+
+def iter_json_items(chunks, prefix):
+    """
+    Incrementally decode the items of a JSON array as the chunks of the document arrive, so
+    each item is available before the rest of the document has been received and only the
+    current chunk and item are held in memory. Closing the returned generator closes chunks.
+
+    :param chunks: Chunks of the JSON document, such as response.iter_content()
+    :type chunks: Iterable[bytes]
+    :param prefix: ijson prefix of the items, e.g. "jobs.item" for the items of the jobs array
+    :type prefix: str
+    :raises ImportError: ijson is not installed
+    :return: Generator over the decoded items
+    :rtype: Iterator
+    """
+    if ijson is None:
+        raise ImportError(
+            "Streaming responses requires ijson, install it with: pip install galileo_sdk[stream]"
+        )
+    return _iter_items(chunks, prefix)
+
+
+class _ChunkReader(object):
+    # File-like view of the chunks, read by the ijson C parser faster than chunks pushed to it
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size=-1):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer = chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _iter_items(chunks, prefix):
+    try:
+        for item in ijson.items(_ChunkReader(chunks), prefix, use_float=True):
+            yield item
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
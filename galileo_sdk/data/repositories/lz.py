@@ -9,6 +9,9 @@ class LzRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         """
         LZ Repository
@@ -18,11 +21,20 @@ class LzRepository(RequestsRepository):
         :type auth_provider: AuthProvider
         :param namespace: Backend URL
         :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: SessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
         """
         super(LzRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     def get_lz_by_id(self, lz_id):
@@ -35,7 +47,7 @@ class LzRepository(RequestsRepository):
         :rtype: Lz
         """
         response = self._get("/machines/{machine_id}".format(machine_id=lz_id))
-        json = response.json()
+        json = self._json(response)
         return lz_dict_to_lz(json)
 
     def list_lz(self, query):
@@ -47,10 +59,11 @@ class LzRepository(RequestsRepository):
         :return: List of Lz objects
         :rtype: List[Lz]
         """
-        response = self._get("/machines", query=query)
-        json = response.json()
-        lzs = json["machines"]
-        return [lz_dict_to_lz(lz) for lz in lzs]
+        return self._get_conditional(
+            "/machines",
+            lambda json: [lz_dict_to_lz(lz) for lz in json["machines"]],
+            query=query,
+        )
 
     # FIXME: Could return success object rather than bool
     def delete_lz_by_id(self, lz_id):
@@ -63,7 +76,7 @@ class LzRepository(RequestsRepository):
         :rtype: bool
         """
         response = self._delete("/machines/{lz_id}".format(lz_id=lz_id))
-        return response.json()
+        return self._json(response)
 
     def update(self, request):
         """
@@ -81,7 +94,7 @@ class LzRepository(RequestsRepository):
                 "active": request.active,
             },
         )
-        json = response.json()
+        json = self._json(response)
         lz = json["machine"]
         return lz_dict_to_lz(lz)
 
@@ -3,6 +3,7 @@ from datetime import datetime
 from galileo_sdk.business.objects.missions import DirectoryListing, Mission, MissionType
 from galileo_sdk.business.objects import EJobStatus, Job, JobStatus
 from galileo_sdk.business.objects.missions import FileListing
+from galileo_sdk.business.objects.tables import MissionTable
 from galileo_sdk.data.repositories import RequestsRepository
 
 
@@ -13,6 +14,9 @@ class MissionsRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         """
         Mission repository
@@ -23,11 +27,20 @@ class MissionsRepository(RequestsRepository):
         :type auth_provider: AuthProvider
         :param namespace: Backend URL
         :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: SessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
         """
         super(MissionsRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     def list_missions(self, query):
@@ -40,10 +53,22 @@ class MissionsRepository(RequestsRepository):
         :rtype: List[Mission]
         """
         response = self._get("/projects", query=query)
-        json = response.json()
+        json = self._json(response)
         missions = json["projects"]
         return [mission_dict_to_mission(mission) for mission in missions]
 
+    def list_missions_table(self, query):
+        """
+        List missions as columns, without creating a Mission per mission
+
+        :param query: Query string to filter missions
+        :type query: str
+        :return: Missions of the page
+        :rtype: MissionTable
+        """
+        response = self._get("/projects", query=query)
+        return MissionTable.from_dicts(self._json(response)["projects"])
+
     def create_mission(self, create_mission_request):
         """
         Create a new mission
@@ -67,7 +92,7 @@ class MissionsRepository(RequestsRepository):
         if create_mission_request.settings is not None:
             body.update(create_mission_request.settings)
         response = self._post("/projects", data=body)
-        json = response.json()
+        json = self._json(response)
         mission = json["project"]
         return mission_dict_to_mission(mission)
 
@@ -76,8 +101,8 @@ class MissionsRepository(RequestsRepository):
         Upload a single file to a mission
         :param mission_id: Mission ID
         :type mission_id: str
-        :param file: File to upload
-        :type file: File
+        :param file: File to upload, an open file is streamed as the request body
+        :type file: Union[BinaryIO, bytes]
         :param filename: Filename
         :type filename: str
         :return: Succesfully uploaded files
@@ -88,7 +113,42 @@ class MissionsRepository(RequestsRepository):
             files=file,
             filename=filename,
         )
-        return r.json()
+        return self._json(r)
+
+    def upload_file_chunk(self, mission_id, chunk, filename, offset,
+                          total_size):
+        """
+        Upload one chunk of a file to a mission. The position of the chunk in the file is sent
+        in a Content-Range header, so a chunk can be sent again after a failure. This assumes
+        the backend assembles the file from the ranges, one that ignores the header replaces
+        the file with each chunk, so callers check the size of the file once it is complete.
+
+        :param mission_id: Mission ID
+        :type mission_id: str
+        :param chunk: Bytes of the chunk
+        :type chunk: bytes
+        :param filename: Filename
+        :type filename: str
+        :param offset: Position of the first byte of the chunk in the file
+        :type offset: int
+        :param total_size: Size of the whole file
+        :type total_size: int
+        :return: True once the chunk is stored
+        :rtype: bool
+        """
+        self._post(
+            "/projects/{mission_id}/files".format(mission_id=mission_id),
+            files=chunk,
+            filename=filename,
+            headers={
+                "Content-Range":
+                "bytes {start}-{end}/{total}".format(
+                    start=offset,
+                    end=offset + len(chunk) - 1,
+                    total=total_size),
+            },
+        )
+        return True
 
     def run_job_on_station(self,
                            mission_id,
@@ -121,7 +181,7 @@ class MissionsRepository(RequestsRepository):
                 "gpu_count": gpu_count
             },
         )
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -160,7 +220,7 @@ class MissionsRepository(RequestsRepository):
                 "gpu_count": gpu_count
             },
         )
-        json = response.json()
+        json = self._json(response)
         job = json["job"]
         return job_dict_to_job(job)
 
@@ -176,10 +236,24 @@ class MissionsRepository(RequestsRepository):
         """
         response = self._get(
             "/projects/{mission_id}/files".format(mission_id=mission_id))
-        json = response.json()
+        json = self._json(response)
         json = json["files"]
         return [file_dict_to_file_listing(file) for file in json]
 
+    def stream_mission_files(self, mission_id):
+        """
+        Get files for/from a mission, converting each file as soon as it is received instead
+        of once the whole response has been read
+
+        :param mission_id: Mission id of the mission to get files for/from
+        :type mission_id: str
+        :return: Files for/from the mission
+        :rtype: Iterator[FileListing]
+        """
+        return (file_dict_to_file_listing(file) for file in self._stream(
+            "/projects/{mission_id}/files".format(mission_id=mission_id),
+            "files.item"))
+
     def delete_mission(self, mission_id):
         """
         Delete a mission
@@ -191,7 +265,7 @@ class MissionsRepository(RequestsRepository):
         """
         response = self._delete(
             "/projects/{mission_id}".format(mission_id=mission_id))
-        return response.json()
+        return self._json(response)
 
     def update_mission(self, update_mission_request):
         """
@@ -219,7 +293,7 @@ class MissionsRepository(RequestsRepository):
                 mission_id=update_mission_request.mission_id),
             data=body,
         )
-        json = response.json()
+        json = self._json(response)
         return json
 
     def delete_file(self, mission_id, query):
@@ -246,7 +320,7 @@ class MissionsRepository(RequestsRepository):
         :rtype: List[MissionType]
         """
         response = self._get("/projecttypes/summaries")
-        json = response.json()
+        json = self._json(response)
         missiontypes = json["project_types"]
         return [
             missiontype_dict_to_missiontype(missiontype)
@@ -263,7 +337,7 @@ class MissionsRepository(RequestsRepository):
         :rtype: MissionType
         """
         response = self._get("/projecttypes", query=query)
-        json = response.json()
+        json = self._json(response)
         missiontypes = json["projecttypes"]
         return missiontype_dict_to_missiontype(missiontypes[0])
 
@@ -391,10 +465,9 @@ def job_dict_to_job(job):
         pay_interval=job["pay_interval"],
         total_runtime=job["total_runtime"],
         archived=job["archived"],
-        status_history=[
-            job_status_dict_to_job_status(job_status)
-            for job_status in job["status_history"]
-        ],
+        # Converted when status_history is first read
+        status_history_dicts=job["status_history"],
+        job_status_loader=job_status_dict_to_job_status,
     )
 
 
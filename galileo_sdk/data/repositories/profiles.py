@@ -1,4 +1,5 @@
 from galileo_sdk.business.objects import Profile, ProfileCard
+from galileo_sdk.data.providers.identity import IdentityCache
 from galileo_sdk.data.repositories.stations import station_dict_to_station
 from galileo_sdk.data.repositories import RequestsRepository
 
@@ -9,6 +10,10 @@ class ProfilesRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        identity_cache=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         """
         Profile repository
@@ -19,23 +24,49 @@ class ProfilesRepository(RequestsRepository):
         :type auth_provider: AuthProvider
         :param namespace: Backend URL
         :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: SessionProvider, optional
+        :param identity_cache: Cache of the current user's profile, defaults to None
+        :type identity_cache: IdentityCache, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
         """
         super(ProfilesRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
+        if identity_cache is None:
+            identity_cache = IdentityCache()
+        self._identity_cache = identity_cache
 
     def self(self):
         """
-        Get the current logged in user's profile
+        Get the current logged in user's profile. The profile is cached, see IdentityCache
 
         :return: Current user's profile
         :rtype: Profile
         """
-        response = self._get("/users/self")
-        json = response.json()
-        return user_dict_to_profile(json)
+        profile = self._identity_cache.get()
+        if profile is None:
+            response = self._get("/users/self")
+            json = self._json(response)
+            profile = user_dict_to_profile(json)
+            self._identity_cache.set(profile)
+        return profile
+
+    def invalidate_self(self):
+        """
+        Forget the cached profile of the current user
+
+        :return: None
+        """
+        self._identity_cache.invalidate()
 
     def list_users(self, query):
         """
@@ -47,7 +78,7 @@ class ProfilesRepository(RequestsRepository):
         :rtype: List[Profile]
         """
         response = self._get("/users", query=query)
-        json = response.json()
+        json = self._json(response)
         users = json["users"]
         return [user_dict_to_profile(user) for user in users]
 
@@ -59,7 +90,7 @@ class ProfilesRepository(RequestsRepository):
         :rtype: List[Station]
         """
         response = self._get("/users/invites")
-        json = response.json()
+        json = self._json(response)
         stations = json["stations"]
         return [station_dict_to_station(station) for station in stations]
 
@@ -1,8 +1,32 @@
-from galileo_sdk.compat import urlunparse, requests
+from galileo_sdk.compat import urlunparse
+from galileo_sdk.data.providers.conditional_cache import ConditionalCache
+from galileo_sdk.data.providers.session import SessionProvider
+from galileo_sdk.data.repositories.downloads import (
+    discard_partial,
+    finish_download,
+    is_complete,
+    load_validator,
+    parse_digest,
+    partial_path,
+    range_headers,
+    resume_offset,
+    save_validator,
+)
+from galileo_sdk.data.repositories.json_decoding import (
+    decode_json,
+    default_json_decoder,
+    iter_json_items,
+)
 
 
 class RequestsRepository(object):
-    def __init__(self, settings_repository, auth_provider, namespace):
+    def __init__(self,
+                 settings_repository,
+                 auth_provider,
+                 namespace,
+                 session_provider=None,
+                 response_cache=None,
+                 json_decoder=None):
         """
         Parent class for all the HTTP repositories.
 
@@ -12,10 +36,24 @@ class RequestsRepository(object):
         :type auth_provider: AuthProvider
         :param namespace: Backend URL
         :type namespace: str
+        :param session_provider: Pooled HTTP session shared between repositories, defaults to a private one
+        :type session_provider: SessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to no caching
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, such as orjson.loads, defaults to orjson or ujson when installed, else response.json()
+        :type json_decoder: Callable[[bytes], object], optional
         """
         self._settings_repository = settings_repository
         self._auth_provider = auth_provider
         self._namespace = namespace
+        if session_provider is None:
+            session_provider = SessionProvider()
+        self._session_provider = session_provider
+        self._response_cache = response_cache
+        self._conditional_cache = ConditionalCache()
+        if json_decoder is None:
+            json_decoder = default_json_decoder()
+        self._json_decoder = json_decoder
 
     def _make_url(self, endpoint, params="", query="", fragment=""):
         settings = self._settings_repository.get_settings()
@@ -30,18 +68,7 @@ class RequestsRepository(object):
             fragment,
         ))
 
-    def _request(
-        self,
-        request,
-        endpoint,
-        data=None,
-        params=None,
-        query=None,
-        fragment=None,
-        files=None,
-        filename=None,
-    ):
-        url = self._make_url(endpoint, params, query, fragment)
+    def _make_headers(self, filename=None):
         access_token = self._auth_provider.get_access_token()
         universe = self._settings_repository.get_settings().universe
         if universe:
@@ -59,6 +86,25 @@ class RequestsRepository(object):
         if filename:
             headers["filename"] = filename
             headers["Content-Type"] = "application/octet-stream"
+        return headers
+
+    def _request(
+        self,
+        request,
+        endpoint,
+        data=None,
+        params=None,
+        query=None,
+        fragment=None,
+        files=None,
+        filename=None,
+        headers=None,
+    ):
+        url = self._make_url(endpoint, params, query, fragment)
+        extra_headers = headers
+        headers = self._make_headers(filename)
+        if extra_headers:
+            headers.update(extra_headers)
 
         if files:
             r = request(url, json=data, headers=headers, data=files)
@@ -68,14 +114,168 @@ class RequestsRepository(object):
         r.raise_for_status()
         return r
 
-    def _get(self, *args, **kwargs):
-        return self._request(requests.get, *args, **kwargs)
+    def _json(self, response):
+        return decode_json(response, self._json_decoder)
+
+    def _cache_key(self, endpoint, params=None, query=None, fragment=None):
+        url = self._make_url(endpoint, params, query, fragment)
+        universe = self._settings_repository.get_settings().universe
+        return url, universe
+
+    def _invalidate_cache(self, endpoint):
+        if self._response_cache is None:
+            return
+        # Drop the cached responses of the resource, e.g. /stations/{station_id}
+        resource = "/" + "/".join(endpoint.lstrip("/").split("/")[:2])
+        self._response_cache.invalidate(self._make_url(resource))
+
+    def _get(self, endpoint, *args, **kwargs):
+        ttl = 0
+        if self._response_cache is not None:
+            ttl = self._response_cache.ttl_for(endpoint)
+        if ttl:
+            key = self._cache_key(endpoint, kwargs.get("params"),
+                                  kwargs.get("query"), kwargs.get("fragment"))
+            response = self._response_cache.get(key)
+            if response is not None:
+                return response
+
+        session = self._session_provider.get_session()
+        response = self._request(session.get, endpoint, *args, **kwargs)
+        if ttl:
+            self._response_cache.set(key, response, ttl)
+        return response
+
+    def _get_conditional(self, endpoint, parse, query=None):
+        """
+        GET an endpoint with If-None-Match/If-Modified-Since when the previous response had
+        validators. On a 304 the objects parsed from the previous response are returned
+        without parsing anything.
+
+        :param endpoint: Endpoint to get
+        :type endpoint: str
+        :param parse: Converts the response JSON to objects
+        :type parse: Callable[[Dict], object]
+        :param query: Query string, defaults to None
+        :type query: str, optional
+        :return: Parsed objects
+        :rtype: object
+        """
+        key = self._cache_key(endpoint, query=query)
+        headers = self._conditional_cache.headers(key)
+        response = self._get(endpoint, query=query, headers=headers)
+        if response.status_code == 304:
+            value = self._conditional_cache.not_modified(key)
+            if value is not None:
+                # A new list, so callers cannot alter the cached one
+                return list(value) if isinstance(value, list) else value
+            response = self._get(endpoint, query=query)
+        value = parse(self._json(response))
+        self._conditional_cache.store(key, response, value)
+        return value
+
+    def _stream(self, endpoint, prefix, query=None, chunk_size=65536):
+        """
+        GET an endpoint and decode the items of a JSON array of the response while the body
+        is received, instead of reading and decoding the whole body first. The response is
+        closed when the generator is exhausted or closed. Streamed responses are not cached.
+
+        :param endpoint: Endpoint to get
+        :type endpoint: str
+        :param prefix: ijson prefix of the items, e.g. "jobs.item"
+        :type prefix: str
+        :param query: Query string, defaults to None
+        :type query: str, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 65536
+        :type chunk_size: int, optional
+        :raises ImportError: ijson is not installed
+        :return: Generator over the decoded items
+        :rtype: Iterator[Dict]
+        """
+        # Nothing is requested until the first item is read
+        return iter_json_items(self._iter_content(endpoint, query, chunk_size),
+                               prefix)
+
+    def _iter_content(self, endpoint, query, chunk_size):
+        url = self._make_url(endpoint, "", query, "")
+        headers = self._make_headers()
+        session = self._session_provider.get_session()
+        with session.get(url, headers=headers, stream=True) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                yield chunk
+
+    def _download(self,
+                  endpoint,
+                  path,
+                  query=None,
+                  chunk_size=8192,
+                  expected_size=None):
+        """
+        Stream a response body to a file without holding it in memory. The body is written
+        next to the file and moved in place once complete. An interrupted download is resumed
+        with a Range request, sent with If-Range so a file changed on the server is downloaded
+        again from the start. A file that already has the expected size is not downloaded.
+
+        :param endpoint: Endpoint to get
+        :type endpoint: str
+        :param path: Path of the file to write
+        :type path: str
+        :param query: Query string, defaults to None
+        :type query: str, optional
+        :param chunk_size: Number of bytes read from the connection at a time, defaults to 8192
+        :type chunk_size: int, optional
+        :param expected_size: Size of the file on the server, checked before the file is moved in place, defaults to None
+        :type expected_size: int, optional
+        :raises DownloadException: The downloaded file is incomplete or fails the checksum sent by the server
+        :return: Path of the written file
+        :rtype: str
+        """
+        if is_complete(path, expected_size):
+            return path
+
+        offset = resume_offset(path, expected_size)
+        digest = None
+        if expected_size is None or offset < int(expected_size):
+            url = self._make_url(endpoint, "", query, "")
+            headers = self._make_headers()
+            headers.update(range_headers(offset, load_validator(path)))
+            session = self._session_provider.get_session()
+
+            with session.get(url, headers=headers, stream=True) as r:
+                if r.status_code == 416 and offset:
+                    # The partial file does not match the file on the server anymore
+                    discard_partial(path)
+                    return self._download(endpoint, path, query, chunk_size,
+                                          expected_size)
+                r.raise_for_status()
+                digest = parse_digest(r.headers)
+                # 200 instead of 206 if the server ignored the Range header, or if the file
+                # changed since the partial download was started
+                mode = "ab" if r.status_code == 206 else "wb"
+                if mode == "wb":
+                    save_validator(path, r.headers)
+                with open(partial_path(path), mode) as f:
+                    for chunk in r.iter_content(chunk_size=chunk_size):
+                        if chunk:  # filter out keep-alive new chunks
+                            f.write(chunk)
+
+        return finish_download(path, expected_size, digest)
 
-    def _put(self, *args, **kwargs):
-        return self._request(requests.put, *args, **kwargs)
+    def _put(self, endpoint, *args, **kwargs):
+        session = self._session_provider.get_session()
+        response = self._request(session.put, endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
 
-    def _post(self, *args, **kwargs):
-        return self._request(requests.post, *args, **kwargs)
+    def _post(self, endpoint, *args, **kwargs):
+        session = self._session_provider.get_session()
+        response = self._request(session.post, endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
 
-    def _delete(self, *args, **kwargs):
-        return self._request(requests.delete, *args, **kwargs)
+    def _delete(self, endpoint, *args, **kwargs):
+        session = self._session_provider.get_session()
+        response = self._request(session.delete, endpoint, *args, **kwargs)
+        self._invalidate_cache(endpoint)
+        return response
@@ -19,6 +19,9 @@ class StationsRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         """
         Stations Repository
@@ -29,11 +32,20 @@ class StationsRepository(RequestsRepository):
         :type auth_provider: AuthProvider 
         :param namespace: URL namespace
         :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: SessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
         """
         super(StationsRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     def list_stations(self, query):
@@ -45,10 +57,14 @@ class StationsRepository(RequestsRepository):
         :return: Filtered list of stations
         :rtype: List[Station]
         """
-        response = self._get("/stations", query=query)
-        json = response.json()
-        stations = json["stations"]
-        return [station_dict_to_station(station) for station in stations]
+        return self._get_conditional(
+            "/stations",
+            lambda json: [
+                station_dict_to_station(station)
+                for station in json["stations"]
+            ],
+            query=query,
+        )
 
     def get_public_stations(self, query):
         """
@@ -61,7 +77,7 @@ class StationsRepository(RequestsRepository):
         
         """
         response = self._get("/stations/public", query=query)
-        json = response.json()
+        json = self._json(response)
         stations = json["stations"]
         return [
             public_station_dict_to_station(station) for station in stations
@@ -85,7 +101,7 @@ class StationsRepository(RequestsRepository):
             "user_ids": user_ids,
             "description": description
         })
-        json = response.json()
+        json = self._json(response)
         station = json["station"]
         return station_dict_to_station(station)
 
@@ -107,7 +123,7 @@ class StationsRepository(RequestsRepository):
                 "allow_auto_join": request.allow_auto_join
             },
         )
-        json = response.json()
+        json = self._json(response)
         station = json["station"]
         return station_dict_to_station(station)
 
@@ -122,7 +138,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._delete(
             "/station/{station_id}".format(station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def get_station_resource_policy(self, station_id):
         """
@@ -135,7 +151,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._get("/stations/{station_id}/resource_policy".format(
             station_id=station_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         return resource_policy_dict_to_resource_policy(policy)
 
@@ -155,7 +171,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id),
             resource_policy_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         return resource_policy_dict_to_resource_policy(policy)
 
@@ -171,7 +187,7 @@ class StationsRepository(RequestsRepository):
         response = self._delete(
             "/stations/{station_id}/resource_policy".format(
                 station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def get_self_resource_limits(self, station_id):
         """
@@ -184,7 +200,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._get("/stations/{station_id}/resource_limits".format(
             station_id=station_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         machine_id = response["machine_id"]
         return resource_policy_dict_to_resource_policy(policy), machine_id
@@ -209,7 +225,7 @@ class StationsRepository(RequestsRepository):
                 "role_id": role_id
             },
         )
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def accept_station_invite(self, station_id):
         """
@@ -222,7 +238,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._put(
             "/station/{station_id}/users/accept".format(station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def reject_station_invite(self, station_id):
         """
@@ -235,7 +251,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._put(
             "/station/{station_id}/users/reject".format(station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def request_to_join(self, station_id):
         """
@@ -248,7 +264,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._post(
             "/station/{station_id}/requests".format(station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def approve_request_to_join(self, station_id, user_ids):
         """
@@ -266,7 +282,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id),
             {"userids": user_ids},
         )
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def reject_request_to_join(self, station_id, user_ids):
         """
@@ -284,7 +300,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id),
             {"userids": user_ids},
         )
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def leave_station(self, station_id):
         """
@@ -297,7 +313,7 @@ class StationsRepository(RequestsRepository):
         """
         response = self._put("/station/{station_id}/user/withdraw".format(
             station_id=station_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def update_station_member(self, station_id, user_id, role_id):
         """
@@ -317,7 +333,7 @@ class StationsRepository(RequestsRepository):
                                                          userid=user_id),
             {"role_id": role_id},
         )
-        response = response.json()
+        response = self._json(response)
         user = response["station_user"]
         return user_dict_to_station_user(user)
 
@@ -335,7 +351,7 @@ class StationsRepository(RequestsRepository):
         response = self._delete(
             "/station/{station_id}/user/{userid}/delete".format(
                 station_id=station_id, userid=user_id))
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def get_station_user_resource_policy(self, station_id, user_id):
         """
@@ -350,7 +366,7 @@ class StationsRepository(RequestsRepository):
         response = self._get(
             "/stations/{station_id}/users/{user_id}/resource_policy".format(
                 station_id=station_id, user_id=user_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -375,7 +391,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id, user_id=user_id),
             resource_policy_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -396,7 +412,7 @@ class StationsRepository(RequestsRepository):
             "/stations/{station_id}/users/{user_id}/resource_policy".format(
                 station_id=station_id, user_id=user_id))
 
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def get_station_roles(self, station_id, query):
         """
@@ -412,7 +428,7 @@ class StationsRepository(RequestsRepository):
         response = self._get(
             "/stations/{station_id}/roles".format(station_id=station_id),
             query=query)
-        response = response.json()
+        response = self._json(response)
         roles = response["roles"]
         return [role_dict_to_station_role(role) for role in roles]
 
@@ -432,7 +448,7 @@ class StationsRepository(RequestsRepository):
             "/stations/{station_id}/roles".format(station_id=station_id),
             station_role_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         role = response["role"]
         return role_dict_to_station_role(role)
 
@@ -454,7 +470,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id, role_id=station_role_id),
             station_role_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         role = response["role"]
         return role_dict_to_station_role(role)
 
@@ -473,7 +489,7 @@ class StationsRepository(RequestsRepository):
             "/stations/{station_id}/roles/{role_id}".format(
                 station_id=station_id, role_id=station_role_id))
 
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def get_station_role_resource_policy(self, station_id, role_id):
         """
@@ -489,7 +505,7 @@ class StationsRepository(RequestsRepository):
         response = self._get(
             "/stations/{station_id}/roles/{role_id}/resource_policy".format(
                 station_id=station_id, role_id=role_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -514,7 +530,7 @@ class StationsRepository(RequestsRepository):
                 station_id=station_id, role_id=role_id),
             resource_policy_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -535,7 +551,7 @@ class StationsRepository(RequestsRepository):
             "/stations/{station_id}/roles/{role_id}/resource_policy".format(
                 station_id=station_id, role_id=role_id))
 
-        return response.json()  # Boolean
+        return self._json(response)  # Boolean
 
     def add_lzs_to_station(self, station_id, lz_ids):
         """
@@ -552,7 +568,7 @@ class StationsRepository(RequestsRepository):
             "/station/{station_id}/machines".format(station_id=station_id),
             {"mids": lz_ids},
         )
-        return response.json()
+        return self._json(response)
 
     def remove_lzs_from_station(self, station_id, lz_ids):
         """
@@ -569,7 +585,7 @@ class StationsRepository(RequestsRepository):
             "/station/{station_id}/machines".format(station_id=station_id),
             {"mids": lz_ids},
         )
-        return response.json()
+        return self._json(response)
 
     def get_station_lz_resource_policy(self, station_id, lz_id):
         """
@@ -584,7 +600,7 @@ class StationsRepository(RequestsRepository):
         response = self._get(
             "/stations/{station_id}/machines/{machine_id}/resource_policy".
             format(station_id=station_id, machine_id=lz_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -608,7 +624,7 @@ class StationsRepository(RequestsRepository):
             format(station_id=station_id, machine_id=lz_id),
             resource_policy_request_to_dict(request),
         )
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -629,7 +645,7 @@ class StationsRepository(RequestsRepository):
             "/stations/{station_id}/machines/{machine_id}/resource_policy".
             format(station_id=station_id, machine_id=lz_id))
 
-        return response.json()
+        return self._json(response)
 
     def get_station_lz_resource_limits(self, station_id, lz_id):
         """
@@ -645,7 +661,7 @@ class StationsRepository(RequestsRepository):
         response = self._get(
             "/stations/{station_id}/machines/{machine_id}/resource_limits".
             format(station_id=station_id, machine_id=lz_id))
-        response = response.json()
+        response = self._json(response)
         policy = response["resource_policy"]
         if policy is None:
             return None
@@ -674,7 +690,7 @@ class StationsRepository(RequestsRepository):
                 "access": access.value
             },
         )
-        json = response.json()
+        json = self._json(response)
         volume = json["volumes"]
         return volume_dict_to_volume(volume)
 
@@ -701,7 +717,7 @@ class StationsRepository(RequestsRepository):
                 "host_path": host_path
             },
         )
-        json = response.json()
+        json = self._json(response)
         volume = json["volume"]
         return volume_dict_to_volume(volume)
 
@@ -724,7 +740,7 @@ class StationsRepository(RequestsRepository):
             .format(station_id=station_id,
                     volume_id=volume_id,
                     host_path_id=host_path_id))
-        return response.json()
+        return self._json(response)
 
     # TODO - Swagger outdated/wrong response
     def remove_volume_from_station(self, station_id, volume_id):
@@ -741,7 +757,7 @@ class StationsRepository(RequestsRepository):
         response = self._delete(
             "/station/{station_id}/volumes/{volume_id}".format(
                 station_id=station_id, volume_id=volume_id))
-        return response.json()
+        return self._json(response)
 
 
 def station_role_request_to_dict(request):
@@ -10,6 +10,9 @@ class UniversesRepository(RequestsRepository):
         settings_repository,
         auth_provider,
         namespace,
+        session_provider=None,
+        response_cache=None,
+        json_decoder=None,
     ):
         """
         UnivesesRepository
@@ -20,11 +23,20 @@ class UniversesRepository(RequestsRepository):
         :type auth_provider: AuthProvider
         :param namespace: Backend URL
         :type namespace: str
+        :param session_provider: Pooled HTTP session, defaults to None
+        :type session_provider: SessionProvider, optional
+        :param response_cache: Cache of the responses of read-mostly endpoints, defaults to None
+        :type response_cache: ResponseCache, optional
+        :param json_decoder: Function decoding the JSON responses from bytes, defaults to None
+        :type json_decoder: Callable[[bytes], object], optional
         """
         super(UniversesRepository, self).__init__(
             settings_repository=settings_repository,
             auth_provider=auth_provider,
             namespace=namespace,
+            session_provider=session_provider,
+            response_cache=response_cache,
+            json_decoder=json_decoder,
         )
 
     def list_universes(self):
@@ -35,7 +47,7 @@ class UniversesRepository(RequestsRepository):
         :rtype: List[Universe]
         """
         response = self._get("/universe")
-        json = response.json()
+        json = self._json(response)
         universes = json["universes"]
         return [universe_dict_to_universe(universe) for universe in universes]
 
@@ -67,7 +79,7 @@ class UniversesRepository(RequestsRepository):
                 allow_scheduling_without_quota,
                 "admin_user_ids": admin_user_ids,
             })
-        json = response.json()
+        json = self._json(response)
         universe = json["universe"]
         return universe_dict_to_universe(universe)
 
@@ -25,7 +25,7 @@ def cargobays_cli(main, galileo: GalileoSdk):
             print("Problem retrieving Cargo Bay list.", e)
             return
 
-        cargobays_ls = [cargobay.__dict__ for cargobay in cargobays_ls]
+        cargobays_ls = [cargobay.to_dict() for cargobay in cargobays_ls]
         
         cargobays_df = pandas.json_normalize(cargobays_ls)
         cargobays_df['creation_timestamp'] = pandas.to_datetime(cargobays_df.creation_timestamp)
@@ -1,9 +1,11 @@
 from requests.models import HTTPError
 from galileo_sdk import GalileoSdk
+from galileo_sdk.business.objects.exceptions import JobsException
 from halo import Halo
 import pandas
 import click
 import datetime
+import sys
 
 
 def jobs_cli(main, galileo: GalileoSdk):
@@ -23,7 +25,8 @@ def jobs_cli(main, galileo: GalileoSdk):
                                    statuses=list(status),
                                    page=page,
                                    items=items,
-                                   mission_ids=list(projectid))
+                                   mission_ids=list(projectid),
+                                   columnar=True)
 
         if len(r) == 0:
             spinner.stop()
@@ -31,16 +34,10 @@ def jobs_cli(main, galileo: GalileoSdk):
             return
 
         if isinstance(index, int):
-            jobs_list = r[index]
-        else:
-            jobs_list = r
+            r = r.take([index])
 
-        jobs_list = [job.__dict__ for job in jobs_list]
-        jobs_df = pandas.json_normalize(jobs_list)
-        jobs_df['time_created'] = pandas.to_datetime(jobs_df.time_created,
-                                                     unit='s')
-        jobs_df['last_updated'] = pandas.to_datetime(jobs_df.last_updated,
-                                                     unit='s')
+        # Times are already datetime64 columns
+        jobs_df = r.to_pandas()
         jobs_df = jobs_df.sort_values(by="last_updated", ascending=False)
         jobs_df.total_runtime = jobs_df.total_runtime.map(lambda x: x / 60)
         jobs_df = jobs_df[[
@@ -172,7 +169,7 @@ def jobs_cli(main, galileo: GalileoSdk):
         Request to stop a job.
         """
         jobs_list = [galileo.jobs.request_stop_job(jobid)]
-        jobs_list = [job.__dict__ for job in jobs_list]
+        jobs_list = [job.to_dict() for job in jobs_list]
         jobs_df = pandas.json_normalize(jobs_list)
         jobs_df.time_created = jobs_df.time_created.map(lambda x: x)
         jobs_df.last_updated = jobs_df.last_updated.map(lambda x: x)
@@ -202,7 +199,7 @@ def jobs_cli(main, galileo: GalileoSdk):
         Request to pause a job.
         """
         jobs_list = galileo.jobs.request_pause_job(jobid)
-        jobs_list = [job.__dict__ for job in jobs_list]
+        jobs_list = [job.to_dict() for job in jobs_list]
         jobs_df = pandas.json_normalize(jobs_list)
         jobs_df.time_created = jobs_df.time_created.map(
             lambda x: datetime.datetime.fromtimestamp(x))
@@ -246,7 +243,7 @@ def jobs_cli(main, galileo: GalileoSdk):
                     click.echo("Job does not exist")
                     return
             raise e
-        jobs_list = [job.__dict__ for job in jobs_list]
+        jobs_list = [job.to_dict() for job in jobs_list]
         jobs_df = pandas.json_normalize(jobs_list)
         jobs_df.time_created = jobs_df.time_created.map(
             lambda x: datetime.datetime.fromtimestamp(x))
@@ -285,6 +282,15 @@ def jobs_cli(main, galileo: GalileoSdk):
         """
         Download results of job when finished.
         """
-        r = galileo.jobs.download_job_results(jobid, path)
+        try:
+            r = galileo.jobs.download_job_results(jobid, path)
+        except JobsException as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
         if r:
             click.echo(f"Downloading results into directory '{path}' ...")
+        for result in r.failed:
+            click.echo(f"Failed to download {result.filename}: {result.error}",
+                       err=True)
+        if r.failed:
+            sys.exit(1)
@@ -54,7 +54,7 @@ def lzs_cli(main, galileo: GalileoSdk):
             click.echo("No Landing Zones found.")
             return
 
-        lzs = [lz.__dict__ for lz in lzs]
+        lzs = [lz.to_dict() for lz in lzs]
 
         lzs_df = pandas.json_normalize(lzs)
         lzs_df = lzs_df[[
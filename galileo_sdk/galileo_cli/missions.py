@@ -79,7 +79,7 @@ def missions_cli(main, galileo: GalileoSdk):
         else:
             missions_ls = missions
 
-        missions_ls = [mission.__dict__ for mission in missions_ls]
+        missions_ls = [mission.to_dict() for mission in missions_ls]
 
         missions_df = pandas.json_normalize(missions_ls)
         missions_df['creation_timestamp'] = pandas.to_datetime(
@@ -165,7 +165,7 @@ def missions_cli(main, galileo: GalileoSdk):
             print("Problem getting Mission details.", e)
             spinner.stop()
 
-        missions_ls = [mission.__dict__ for mission in missions_ls]
+        missions_ls = [mission.to_dict() for mission in missions_ls]
 
         missions_df = pandas.json_normalize(missions_ls)
         missions_df['creation_timestamp'] = pandas.to_datetime(
@@ -184,7 +184,7 @@ def missions_cli(main, galileo: GalileoSdk):
             missions_files = galileo.missions.get_mission_files(
                 missions_ls[0]["mission_id"])
 
-            missions_files = [thing.__dict__ for thing in missions_files]
+            missions_files = [thing.to_dict() for thing in missions_files]
 
             files_df = pandas.json_normalize(missions_files)
             files_df['creation_timestamp'] = pandas.to_datetime(
@@ -231,10 +231,17 @@ def missions_cli(main, galileo: GalileoSdk):
                 print("Please tell me what you'd like to save.")
                 return
 
-            success = galileo.missions.upload(missions_ls[0]["mission_id"],
-                                              os.fspath(payload),
-                                              rename=rename,
-                                              verbose=True)
+            if everything:
+                # Only the files changed since the last save are uploaded
+                success = galileo.missions.sync(missions_ls[0]["mission_id"],
+                                                 os.fspath(payload),
+                                                 verbose=True)
+            else:
+                success = galileo.missions.upload(
+                    missions_ls[0]["mission_id"],
+                    os.fspath(payload),
+                    rename=rename,
+                    verbose=True)
             spinner.stop()
         except Exception as e:
             spinner.stop()
@@ -18,7 +18,7 @@ def profiles_cli(main, galileo: GalileoSdk):
         Details of your Galileo profile.
         """
         r = galileo.profiles.self()
-        click.echo(pandas.json_normalize(r.__dict__))
+        click.echo(pandas.json_normalize(r.to_dict()))
 
     @profiles.command()
     @click.argument("index", type=int, required=False)
@@ -73,7 +73,7 @@ def profiles_cli(main, galileo: GalileoSdk):
         else:
             users_list = r
 
-        users_list = [user.__dict__ for user in users_list]
+        users_list = [user.to_dict() for user in users_list]
         users_df = pandas.json_normalize(users_list)
         users_df = users_df[["username", "user_id", "lz_ids"]]
 
@@ -97,6 +97,6 @@ def profiles_cli(main, galileo: GalileoSdk):
             click.echo("No user matches that query.")
             return
 
-        invites_list = [invites.__dict__ for invites in r]
+        invites_list = [invites.to_dict() for invites in r]
         spinner.stop()
         click.echo(pandas.json_normalize(invites_list))
@@ -90,7 +90,7 @@ def stations_cli(main, galileo: GalileoSdk):
         else:
             stations_list = r
 
-        stations_list = [station.__dict__ for station in stations_list]
+        stations_list = [station.to_dict() for station in stations_list]
         stations_df = pandas.json_normalize(stations_list)
         stations_df = stations_df[[
             "station_id", "name", "description", "users", "lz_ids", "volumes"
@@ -135,7 +135,7 @@ def stations_cli(main, galileo: GalileoSdk):
                                                       description=description,
                                                       user_ids=list(userid))
 
-        station_df = pandas.json_normalize(station.__dict__)
+        station_df = pandas.json_normalize(station.to_dict())
         station_df = station_df[["stationid", "name", "description"]]
         click.echo(station_df)
 
@@ -160,7 +160,7 @@ def stations_cli(main, galileo: GalileoSdk):
             click.echo("No station matches that query.")
             return
         users_list = r[0].users
-        users_list = [user.__dict__ for user in users_list]
+        users_list = [user.to_dict() for user in users_list]
         users_df = pandas.json_normalize(users_list)
         spinner.stop()
         click.echo(users_df)
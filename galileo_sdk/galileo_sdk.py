@@ -11,8 +11,11 @@ from .business import (
     MissionsService,
     StationsService,
 )
+from .business.utils.state_store import StateStore
 from .data import (
     AuthProvider,
+    IdentityCache,
+    SessionProvider,
     UniversesRepository,
     CargoBaysRepository,
     JobsRepository,
@@ -40,7 +43,7 @@ is_py2 = _ver[0] == 2
 is_py3 = _ver[0] == 3
 
 if is_py3:
-    from .data import GalileoConnector
+    from .data import EventRecovery, GalileoConnector
 
 NAMESPACE = "/galileo/user_interface/v1"
 
@@ -52,6 +55,69 @@ def notify():
         print("No message given for notification.")
 
 
+def create_settings_repository(config=None):
+    """
+    Create the settings repository, GALILEO_CONFIG takes precedence over config
+
+    :param config: production or development, defaults to production
+    :type config: str, optional
+    :return: Settings repository
+    :rtype: SettingsRepository
+    """
+    if "GALILEO_CONFIG" in os.environ:
+        return SettingsRepository(str(os.environ["GALILEO_CONFIG"]))
+    elif config:
+        return SettingsRepository(config)
+    else:
+        return SettingsRepository("production")
+
+
+def create_auth_provider(settings,
+                         auth_token=None,
+                         refresh_token=None,
+                         username=None,
+                         password=None):
+    """
+    Create the authentication provider from the environment or the given credentials
+
+    :param settings: Settings repository
+    :type settings: SettingsRepository
+    :param auth_token: authentication token
+    :param refresh_token: refresh token
+    :param username: Galileo username
+    :param password: Galileo password
+    :raises ValueError: No credentials were provided
+    :return: Authentication provider
+    :rtype: AuthProvider
+    """
+    if "GALILEO_TOKEN" in os.environ and "GALILEO_REFRESH_TOKEN" in os.environ:
+        return AuthProvider(
+            settings_repository=settings,
+            auth_token=str(os.environ["GALILEO_TOKEN"]),
+            refresh_token=str(os.environ["GALILEO_REFRESH_TOKEN"]),
+        )
+    elif username and password:
+        return AuthProvider(settings_repository=settings,
+                            username=username,
+                            password=password)
+    elif "GALILEO_USER" in os.environ and "GALILEO_PASSWORD" in os.environ:
+        return AuthProvider(
+            settings_repository=settings,
+            username=str(os.environ["GALILEO_USER"]),
+            password=str(os.environ["GALILEO_PASSWORD"]),
+        )
+    elif auth_token and refresh_token:
+        return AuthProvider(
+            settings_repository=settings,
+            auth_token=auth_token,
+            refresh_token=refresh_token,
+        )
+    else:
+        raise ValueError(
+            "Authentication token AND refresh token (OR) username AND password, must be provided"
+        )
+
+
 class GalileoSdk:
     def __init__(
         self,
@@ -60,6 +126,13 @@ class GalileoSdk:
         username=None,
         password=None,
         config=None,
+        session_provider=None,
+        identity_ttl=300,
+        response_cache=None,
+        event_executor=None,
+        on_event_error=None,
+        job_events_window=None,
+        json_decoder=None,
     ):
         """
         Galileo SDK object.
@@ -69,68 +142,84 @@ class GalileoSdk:
         :param username: Galileo username
         :param password: Galileo password
         :param config: production or development
+        :param session_provider: pooled HTTP session settings shared by every API, defaults to SessionProvider()
+        :param identity_ttl: seconds your profile is cached for, 0 fetches it on every call, defaults to 300
+        :param response_cache: opt-in cache of read-mostly endpoints such as mission types and station roles, e.g. ResponseCache(), defaults to None
+        :param event_executor: executor running your event handlers, e.g. ThreadPoolExecutor(4), so slow handlers do not hold up the connection; events of one job stay in order, defaults to None to run them on the connection's thread
+        :param on_event_error: called with the exception, the event name and the handler when an event handler fails, defaults to None to log it
+        :param job_events_window: seconds job_launcher_updated and station_job_updated events are held for, only the latest event of each job in the window is delivered, defaults to None to deliver every event
+        :param json_decoder: function decoding the JSON responses from bytes, such as json.loads, defaults to None to use orjson or ujson when installed
         """
         self.log = LogService()
 
-        if "GALILEO_CONFIG" in os.environ:
-            self._settings = SettingsRepository(
-                str(os.environ["GALILEO_CONFIG"]))
-        elif config:
-            self._settings = SettingsRepository(config)
-        else:
-            self._settings = SettingsRepository("production")
-
+        self._settings = create_settings_repository(config)
         settings = self._settings.get_settings()
         self.backend = settings.backend
 
-        if "GALILEO_TOKEN" in os.environ and "GALILEO_REFRESH_TOKEN" in os.environ:
-            self._auth_provider = AuthProvider(
-                settings_repository=self._settings,
-                auth_token=str(os.environ["GALILEO_TOKEN"]),
-                refresh_token=str(os.environ["GALILEO_REFRESH_TOKEN"]),
-            )
-        elif username and password:
-            self._auth_provider = AuthProvider(
-                settings_repository=self._settings,
-                username=username,
-                password=password)
-        elif "GALILEO_USER" in os.environ and "GALILEO_PASSWORD" in os.environ:
-            self._auth_provider = AuthProvider(
-                settings_repository=self._settings,
-                username=str(os.environ["GALILEO_USER"]),
-                password=str(os.environ["GALILEO_PASSWORD"]),
-            )
-        elif auth_token and refresh_token:
-            self._auth_provider = AuthProvider(
-                settings_repository=self._settings,
-                auth_token=auth_token,
-                refresh_token=refresh_token,
-            )
-        else:
-            raise ValueError(
-                "Authentication token AND refresh token (OR) username AND password, must be provided"
-            )
+        self._auth_provider = create_auth_provider(self._settings, auth_token,
+                                                   refresh_token, username,
+                                                   password)
+
+        # Set up the connection pool shared by every repository
+        if session_provider is None:
+            session_provider = SessionProvider()
+        self._session_provider = session_provider
+
+        # Your profile is looked up by every call listing your own jobs
+        self._identity_cache = IdentityCache(ttl=identity_ttl)
+
+        self._response_cache = response_cache
+        self._json_decoder = json_decoder
 
         # Set up feature repositories
-        self._universes_repo = UniversesRepository(self._settings,
-                                                   self._auth_provider,
-                                                   NAMESPACE)
-        self._cargo_bays_repo = CargoBaysRepository(self._settings,
-                                                    self._auth_provider,
-                                                    NAMESPACE)
-        self._jobs_repo = JobsRepository(self._settings, self._auth_provider,
-                                         NAMESPACE)
-        self._stations_repo = StationsRepository(self._settings,
-                                                 self._auth_provider,
-                                                 NAMESPACE)
-        self._profiles_repo = ProfilesRepository(self._settings,
-                                                 self._auth_provider,
-                                                 NAMESPACE)
-        self._lz_repo = LzRepository(self._settings, self._auth_provider,
-                                     NAMESPACE)
-        self._missions_repo = MissionsRepository(self._settings,
-                                                 self._auth_provider,
-                                                 NAMESPACE)
+        self._universes_repo = UniversesRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._cargo_bays_repo = CargoBaysRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._jobs_repo = JobsRepository(self._settings,
+                                         self._auth_provider,
+                                         NAMESPACE,
+                                         self._session_provider,
+                                         response_cache=self._response_cache,
+                                         json_decoder=self._json_decoder)
+        self._stations_repo = StationsRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._profiles_repo = ProfilesRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            self._identity_cache,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
+        self._lz_repo = LzRepository(self._settings,
+                                     self._auth_provider,
+                                     NAMESPACE,
+                                     self._session_provider,
+                                     response_cache=self._response_cache,
+                                     json_decoder=self._json_decoder)
+        self._missions_repo = MissionsRepository(
+            self._settings,
+            self._auth_provider,
+            NAMESPACE,
+            self._session_provider,
+            response_cache=self._response_cache,
+            json_decoder=self._json_decoder)
 
         # set up feature services
         self._universes_service = UniversesService(self._universes_repo)
@@ -149,9 +238,18 @@ class GalileoSdk:
 
         connector = None
         if is_py3:
-            connector = GalileoConnector(self._settings, self._auth_provider,
-                                         NAMESPACE)
+            connector = GalileoConnector(
+                self._settings,
+                self._auth_provider,
+                NAMESPACE,
+                executor=event_executor,
+                on_error=on_event_error,
+                job_events_window=job_events_window,
+                recovery=EventRecovery(self._jobs_service, self._lz_service,
+                                       self._profiles_service),
+            )
 
+        self._connector = connector
         self.jobs = JobsSdk(self._jobs_service, connector)
         self.stations = StationsSdk(self._stations_service, connector)
         self.lz = LzSdk(self._lz_service, connector)
@@ -165,6 +263,36 @@ class GalileoSdk:
             self.jobs.disconnect()
             self.stations.disconnect()
             self.lz.disconnect()
+        self._session_provider.close()
+
+    def state_store(self, items=25, concurrency=4):
+        """
+        Opt-in local view of your jobs, Landing Zones and stations. It is listed once and then
+        kept up to date by the events, so it can be queried as often as needed without a
+        request. Call close() on it when you are done.
+
+        :param items: int: Items per page when listing, default is 25
+        :param concurrency: int: Maximum number of pages requested at the same time, default is 4
+        :return: StateStore: lookups by id, and jobs(status, station_id, lz_id, mission_id), lzs(status) and stations(lz_id)
+
+        Example:
+
+            >>> store = galileo.state_store()
+            >>> running = store.jobs(status=EJobStatus.running)
+            >>> online = store.lzs(status=ELzStatus.online)
+            >>> store.close()
+        """
+        store = StateStore(self._jobs_service, self._lz_service,
+                           self._stations_service)
+        # Listening first, the events received while listing are applied over the lists
+        if self._connector is not None:
+            store.listen(self._connector.observe)
+        try:
+            store.load(items=items, concurrency=concurrency)
+        except Exception:
+            store.close()
+            raise
+        return store
 
     def update_auth_token(self, auth_token):
         """
@@ -173,6 +301,7 @@ class GalileoSdk:
         :return: None
         """
         self._auth_provider.set_access_token(auth_token)
+        self._identity_cache.invalidate()
 
     def set_universe(self, universe_id):
         """
@@ -214,4 +343,4 @@ class GalileoSdk:
             s.sendall("{message}".format(message=message).encode())
             print("Message send successfully.")
 
-        return True
\ No newline at end of file
+        return True
@@ -2,9 +2,10 @@ from .compat import mock
 
 
 class MockResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, headers=None):
         self.json_data = json_data
         self.status_code = status_code
+        self.headers = headers or {}
         self.raise_for_status = mock.Mock()
 
     def json(self):
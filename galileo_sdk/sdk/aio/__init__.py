@@ -0,0 +1,3 @@
+from galileo_sdk.sdk.aio.lz import AsyncLzSdk
+from galileo_sdk.sdk.aio.missions import AsyncMissionsSdk
+from galileo_sdk.sdk.aio.stations import AsyncStationsSdk
@@ -0,0 +1,16 @@
+from ..lz import LzSdk
+
+
+class AsyncLzSdk(LzSdk):
+    async def delete_lz_by_id(self, lz_id):
+        """
+        Remove a specific Landing Zone by its id
+
+        :param lz_id: str
+        :return: boolean
+
+        Example:
+            >>> await galileo.lz.delete_lz_by_id("lz_id")
+        """
+        response = await self._lz_service.delete_lz_by_id(lz_id)
+        return response.get("success", False)
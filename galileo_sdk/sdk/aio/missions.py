@@ -0,0 +1,51 @@
+from ..missions import MissionsSdk
+from ...business.objects.missions import CreateMissionRequest
+
+
+class AsyncMissionsSdk(MissionsSdk):
+    async def create_and_upload_mission(
+        self,
+        name,
+        directory,
+        description="",
+        source_storage_id=None,
+        destination_storage_id=None,
+        source_path=None,
+        destination_path=None,
+        mission_type_id=None,
+        settings=None,
+        public=False,
+    ):
+        """
+        Create a new Mission in your Galileo account and upload input files from the specified directory in the same call.
+
+        :param name: str: Human readable name of the Mission that will be displayed in the UI
+        :param directory: str: filepath to the folder you want to upload as input files to the Mission
+        :param description: Optional[str]: Textual description of the Mission
+        :param mission_type_id: Optional[str]: Mission Framework Type UUID
+        :param destination_path: Optional[str]: Storage directory in the destination Cargo Bay
+        :param source_path: Optional[str]: Source directory in the source Cargo Bay
+        :param destination_storage_id: Optional[str]: UUID of the Cargo Bay where results will be stored
+        :param source_storage_id: Optional[str]: UUID of the Cargo Bay where source files are to be stored
+        :param settings: Optional[Dict[str, str]]: Mission Framework Type settings
+        :param public: Optional[bool]: Boolean indicating if the resulting Mission should be listed as public (True) or private (False - default)
+        :return: Mission
+
+        Example:
+            >>> swmm_mission = await galileo.missions.create_and_upload_mission(name="SWMM Test2", directory=project_folder)
+        """
+        request = CreateMissionRequest(
+            name=name,
+            description=description,
+            source_storage_id=source_storage_id,
+            destination_storage_id=destination_storage_id,
+            source_path=source_path,
+            destination_path=destination_path,
+            mission_type_id=mission_type_id,
+            settings=settings,
+            public=public,
+        )
+        mission = await self._missions_service.create_mission(request)
+        await self._missions_service.upload(mission.mission_id, directory,
+                                            True)
+        return mission
@@ -0,0 +1,19 @@
+from ..stations import StationsSdk
+
+
+class AsyncStationsSdk(StationsSdk):
+    async def get_station_by_id(self, station_id):
+        """
+        Get station by id
+
+        :param station_id: int
+        :return: Station
+
+        Example:
+            >>> station_id = "my-station-id"
+            >>> station = await galileo.stations.get_station_by_id(station_id)
+
+        """
+        # Get first station with id = station_id, else return None
+        stations = await self.list_stations(station_ids=[station_id])
+        return next(iter(stations), None)
@@ -7,9 +7,14 @@ is_py3 = _ver[0] == 3
 
 
 class EventsSdk(object):
-    def __init__(self, connector=None, events=None):
+    # Event topic of the SDK: "lz", "jobs" or "stations"
+    _topic = None
+
+    def __init__(self, connector=None, events=None, stream_connector=None):
         self._connector = connector
         self._events = events
+        self._event_type = None
+        self._stream_connector = stream_connector
 
     def _set_event_handler(self, event_type):
         if is_py2:
@@ -24,7 +29,54 @@ class EventsSdk(object):
             self._events = self._connector.set_jobs_events()
         elif event_type == "stations":
             self._events = self._connector.set_stations_events()
+        self._event_type = event_type
+
+    @property
+    def event_metrics(self):
+        """
+        Queue depth, error count and handler latency of the event handlers of this SDK
+
+        :return: EventEmitterMetrics: None until a handler is registered
+
+        Example:
+            >>> metrics = galileo.jobs.event_metrics
+            >>> print(metrics.queue_depth, metrics.mean_handler_time)
+        """
+        if self._events is None:
+            return None
+        return self._events.metrics
+
+    def events(self, maxsize=1000, overflow=None, key=None):
+        """
+        Stream of the events of this SDK, to consume with async for on the event loop of an
+        AsyncGalileoSdk. Events are queued in a bounded queue, so a slow consumer never blocks
+        the other subscribers unless the overflow policy is EOverflowPolicy.block.
+
+        :param maxsize: int: Maximum number of queued events, default is 1000
+        :param overflow: EOverflowPolicy: What to do when the queue is full: drop_oldest (default), block, or coalesce to keep only the latest event of each job or landing zone
+        :param key: Callable: Coalescing key of an event, default is the job id or landing zone id
+        :return: EventStream: async iterator of typed events
+
+        Example:
+            >>> async with galileo.jobs.events(overflow=EOverflowPolicy.coalesce) as events:
+            >>>     async for event in events:
+            >>>         print(event.job.job_id, event.job.status)
+        """
+        if is_py2:
+            raise Exception("You cannot stream events in Python 2!")
+        if self._stream_connector is None:
+            raise Exception("Event streams are only available with AsyncGalileoSdk")
+
+        kwargs = {"maxsize": maxsize}
+        if overflow is not None:
+            kwargs["overflow"] = overflow
+        if key is not None:
+            kwargs["key"] = key
+        return self._stream_connector.stream(self._topic, **kwargs)
 
     def disconnect(self):
-        if is_py3 and self._connector:
-            self._connector.disconnect()
+        # The connection is shared with the other SDKs, it closes once they all released it
+        if is_py3 and self._connector and self._event_type:
+            self._connector.release(self._event_type)
+            self._events = None
+            self._event_type = None
@@ -1,14 +1,21 @@
 from galileo_sdk.business.services.jobs import JobsService
-from .event import EventsSdk
+from .event import EventsSdk, is_py3
 from ..business.objects.jobs import UpdateJobRequest
 
 
 class JobsSdk(EventsSdk):
-    def __init__(self, jobs_service, connector=None, events=None):
+    _topic = "jobs"
+
+    def __init__(self,
+                 jobs_service,
+                 connector=None,
+                 events=None,
+                 stream_connector=None):
         self._jobs_service = jobs_service
         super(JobsSdk, self).__init__(
             connector=connector,
             events=events,
+            stream_connector=stream_connector,
         )
 
     def on_job_launcher_updated(self, func):
@@ -102,6 +109,8 @@ class JobsSdk(EventsSdk):
         owner_ids=None,
         sort_by=None,
         sort_order=None,
+        columnar=False,
+        stream=False,
     ):
         """
         Get a filtered list of all jobs run under your Galileo account.
@@ -121,13 +130,21 @@ class JobsSdk(EventsSdk):
         :param owner_ids: List[str]: Filter by owner id
         :param sort_by: EJobSort
         :param sort_order: str: "asc" or "desc"
-        :return: List[Job]
+        :param columnar: boolean: Return a JobTable, the jobs as columns convertible to NumPy arrays, a pandas DataFrame or an Arrow table
+        :param stream: boolean: Return the jobs one by one as the response is received, so large pages are not held in memory at once, requires ijson: pip install galileo_sdk[stream]. Not supported by AsyncGalileoSdk, which raises ValueError
+        :return: List[Job], JobTable when columnar, or Iterator[Job] when stream
         
         Example:
         
             >>> jobs = galileo.jobs.list_jobs(items=25)
             >>> for job in jobs:
             >>>     print(job.name)
+            >>>
+            >>> df = galileo.jobs.list_jobs(items=100, columnar=True).to_pandas()
+            >>> df.groupby("status").total_runtime.sum()
+            >>>
+            >>> for job in galileo.jobs.list_jobs(items=1000, stream=True):
+            >>>     print(job.name)
         """
         return self._jobs_service.list_jobs(
             job_ids=job_ids,
@@ -145,25 +162,152 @@ class JobsSdk(EventsSdk):
             owner_ids=owner_ids,
             sort_by=sort_by,
             sort_order=sort_order,
+            columnar=columnar,
+            stream=stream,
+        )
+
+    def iter_jobs(self, items=25, prefetch=True, lzs=None, **filters):
+        """
+        Iterate over all the jobs run under your Galileo account. Pages are requested lazily,
+        the next one in the background while you process the current one.
+
+        :param items: int: Number of jobs requested per page
+        :param prefetch: boolean: Fetch the next page in the background
+        :param lzs: List[str]: Filter by lz id
+        :param filters: Any other filter accepted by list_jobs
+        :return: Iterator[Job]
+
+        Example:
+
+            >>> for job in galileo.jobs.iter_jobs(items=100, station_ids=[station_id]):
+            >>>     print(job.name)
+        """
+        return self._jobs_service.iter_jobs(items=items,
+                                            prefetch=prefetch,
+                                            lz_ids=lzs,
+                                            **filters)
+
+    def fetch_all_jobs(self,
+                       items=25,
+                       concurrency=4,
+                       lzs=None,
+                       columnar=False,
+                       **filters):
+        """
+        Get all the jobs run under your Galileo account at once. Up to concurrency pages are
+        requested at the same time, the jobs are returned in page order.
+
+        :param items: int: Number of jobs requested per page
+        :param concurrency: int: Maximum number of pages requested at the same time
+        :param lzs: List[str]: Filter by lz id
+        :param columnar: boolean: Return a single JobTable built from every page
+        :param filters: Any other filter accepted by list_jobs
+        :return: List[Job], or JobTable when columnar
+
+        Example:
+
+            >>> jobs = galileo.jobs.fetch_all_jobs(items=100, concurrency=8, station_ids=[station_id])
+            >>>
+            >>> columns = galileo.jobs.fetch_all_jobs(items=100, columnar=True).to_numpy()
+            >>> cpu_hours = (columns["cpu_count"] * columns["total_runtime"]).sum() / 3600
+        """
+        return self._jobs_service.fetch_all_jobs(items=items,
+                                                 concurrency=concurrency,
+                                                 lz_ids=lzs,
+                                                 columnar=columnar,
+                                                 **filters)
+
+    def wait_for_jobs(self,
+                      job_ids,
+                      until=None,
+                      timeout=None,
+                      poll_interval=2.0,
+                      max_poll_interval=60.0):
+        """
+        Wait for many jobs at once, getting each job as soon as it is done. Job events are
+        listened to on one connection, and the jobs still pending are listed by batches once
+        in a while in case an event was missed. Without events, the jobs are listed every
+        poll_interval seconds, backing off up to max_poll_interval while nothing changes.
+        The events are listened to from the start of the iteration to its end. A loop left
+        early must close() the waiter, or use it in a with statement.
+
+        :param job_ids: List[str]: Ids of the jobs to wait for
+        :param until: List[EJobStatus] or Callable[[Job], bool]: Statuses a job is done in, default is TERMINAL_JOB_STATUSES
+        :param timeout: float: Seconds to wait for, JobsException is raised once they are over, default is to wait forever
+        :param poll_interval: float: Shortest interval between two listings of the jobs
+        :param max_poll_interval: float: Longest interval between two listings of the jobs
+        :return: JobWaiter: Iterator over the jobs as they finish, also offering wait() and futures(). With AsyncGalileoSdk, an AsyncJobWaiter to iterate with async for, or to await wait() on
+
+        Example:
+
+            >>> for job in galileo.jobs.wait_for_jobs(job_ids, timeout=3600):
+            >>>     print(job.job_id, job.status)
+            >>>
+            >>> futures = galileo.jobs.wait_for_jobs(job_ids).futures()
+            >>> job = futures[job_id].result()
+            >>>
+            >>> with galileo.jobs.wait_for_jobs(job_ids) as waiter:
+            >>>     first_job = next(iter(waiter))
+            >>>
+            >>> async for job in async_galileo.jobs.wait_for_jobs(job_ids, timeout=3600):
+            >>>     print(job.job_id, job.status)
+        """
+        subscribe = None
+        if is_py3 and self._connector is not None:
+            subscribe = self._subscribe_job_events
+        return self._jobs_service.wait_for_jobs(
+            job_ids,
+            until=until,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            events=subscribe,
         )
 
-    def download_job_results(self, job_id, path, nonce=None):
+    def _subscribe_job_events(self, handler):
+        # A subscription of its own, released when the waiting is over
+        events = self._connector.set_jobs_events()
+        events.on_job_launcher_updated(handler)
+        events.on_station_job_updated(handler)
+
+        def unsubscribe():
+            events.off_job_launcher_updated(handler)
+            events.off_station_job_updated(handler)
+            self._connector.release("jobs")
+
+        return unsubscribe
+
+    def download_job_results(self,
+                             job_id,
+                             path,
+                             nonce=None,
+                             concurrency=4,
+                             chunk_size=8192):
         """
-        Download your job results when job is completed
+        Download your job results when job is completed. Several files are downloaded at the same time.
+        Each file is checked against its size (and checksum, when the server sends one) before it is moved
+        to path, so running the download again skips complete files and resumes interrupted ones. Files
+        keep the folder they have in the job results, relative to path.
 
         :param job_id: str
         :param path: str: path to directory, where results will be saved
         :param nonce: str: can still download the file if provide an auth token
-        :return: List[str]: list of filenames that were downloaded
+        :param concurrency: int: Number of files downloaded at the same time, default is 4
+        :param chunk_size: int: Number of bytes read from the connection at a time, default is 8192
+        :return: DownloadReport: list of filenames that were downloaded, the files that could not be downloaded are in its failed attribute. JobsException is raised when none of the files could be downloaded
 
         Example:
             >>> job_id = "my_job_id"
             >>> path = "results_folder"
             >>> results = galileo.jobs.download_job_results(job_id, path)
+            >>> for result in results.failed:
+            >>>     print("Failed to download", result.filename, result.error)
         """
         return self._jobs_service.download_job_results(job_id,
                                                        path,
-                                                       nonce=nonce)
+                                                       nonce=nonce,
+                                                       concurrency=concurrency,
+                                                       chunk_size=chunk_size)
 
     def update_job(self, job_id, archived=None):
         """ Updates an existing job
@@ -194,20 +338,38 @@ class JobsSdk(EventsSdk):
         """
         return self._jobs_service.request_kill_job(job_id)
 
-    def download_and_extract_job_results(self, job_id, path, nonce=None):
+    def download_and_extract_job_results(self,
+                                         job_id,
+                                         path,
+                                         nonce=None,
+                                         concurrency=4,
+                                         chunk_size=8192,
+                                         members=None,
+                                         delete_archives=False):
         """
-        Download and extract your job results when job is completed
+        Download and extract your job results when job is completed. Each zip archive is extracted as soon as
+        it is downloaded, while the remaining files keep downloading.
 
         :param job_id: str
         :param path: str: path to directory, where results will be saved
         :param nonce: str: can still download the file if provide an auth token
-        :return: List[str]: list of filenames that were downloaded
+        :param concurrency: int: Number of files downloaded, and of archives extracted, at the same time, default is 4
+        :param chunk_size: int: Number of bytes read from the connection at a time, default is 8192
+        :param members: List[str]: Only extract the archive members matching one of these glob patterns, default is None to extract everything
+        :param delete_archives: bool: Delete each archive once it is extracted, default is False
+        :return: DownloadReport: list of filenames that were downloaded, each result has the folder it was extracted to. JobsException is raised when none of the files could be downloaded and extracted
 
         Example:
             >>> job_id = "my_job_id"
             >>> path = "results_folder"
             >>> results = galileo.jobs.download_and_extract_job_results(job_id, path)
+            >>> csvs = galileo.jobs.download_and_extract_job_results(job_id, path, members=["*.csv"], delete_archives=True)
         """
-        return self._jobs_service.download_and_extract_job_results(job_id,
-                                                                   path,
-                                                                   nonce=nonce)
+        return self._jobs_service.download_and_extract_job_results(
+            job_id,
+            path,
+            nonce=nonce,
+            concurrency=concurrency,
+            chunk_size=chunk_size,
+            members=members,
+            delete_archives=delete_archives)
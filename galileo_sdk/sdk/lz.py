@@ -3,11 +3,18 @@ from ..business.objects.lz import UpdateLzRequest
 
 
 class LzSdk(EventsSdk):
-    def __init__(self, lz_service, connector=None, events=None):
+    _topic = "lz"
+
+    def __init__(self,
+                 lz_service,
+                 connector=None,
+                 events=None,
+                 stream_connector=None):
         self._lz_service = lz_service
         super(LzSdk, self).__init__(
             connector=connector,
             events=events,
+            stream_connector=stream_connector,
         )
 
     def on_lz_status_update(self, func):
@@ -91,6 +98,41 @@ class LzSdk(EventsSdk):
                                         page=page,
                                         items=items)
 
+    def iter_lz(self, items=25, prefetch=True, **filters):
+        """
+        Iterate over all the Landing Zones. Pages are requested lazily,
+        the next one in the background while you process the current one.
+
+        :param items: int: Number of Landing Zones requested per page
+        :param prefetch: boolean: Fetch the next page in the background
+        :param filters: Any other filter accepted by list_lz
+        :return: Iterator[Lz]
+
+        Example:
+            >>> for lz in galileo.lz.iter_lz(items=100):
+            >>>     print(lz.name)
+        """
+        return self._lz_service.iter_lz(items=items,
+                                        prefetch=prefetch,
+                                        **filters)
+
+    def fetch_all_lz(self, items=25, concurrency=4, **filters):
+        """
+        Get all the Landing Zones at once. Up to concurrency pages are
+        requested at the same time, the results are returned in page order.
+
+        :param items: int: Number of results requested per page
+        :param concurrency: int: Maximum number of pages requested at the same time
+        :param filters: Any other filter accepted by list_lz
+        :return: List[Lz]
+
+        Example:
+            >>> lz = galileo.lz.fetch_all_lz(items=100, concurrency=8)
+        """
+        return self._lz_service.fetch_all_lz(items=items,
+                                             concurrency=concurrency,
+                                             **filters)
+
     def update_lz(
         self,
         lz_id,
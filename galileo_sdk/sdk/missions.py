@@ -12,7 +12,8 @@ class MissionsSdk:
                       page=1,
                       items=25,
                       mission_type_ids=None,
-                      archived=None):
+                      archived=None,
+                      columnar=False):
         """
         Get list of Missions associated with your account
 
@@ -23,12 +24,15 @@ class MissionsSdk:
         :param items: Optional[int]: Number of Missions to return per page
         :param mission_type_ids: Optional[List[str]]: Filter by mission_type_ids
         :param archived: Optional[bool]: Filter for archived missions
-        :return: List[Mission]
+        :param columnar: Optional[bool]: Return a MissionTable, the missions as columns convertible to NumPy arrays, a pandas DataFrame or an Arrow table
+        :return: List[Mission], or MissionTable when columnar
         
         Example:
             >>> missions = galileo.missions.list_missions(items=10)
             >>> for mission in missions:
             >>>    print(mission.name)
+            >>>
+            >>> df = galileo.missions.list_missions(items=100, columnar=True).to_pandas()
         """
         return self._missions_service.list_missions(
             mission_ids=mission_ids,
@@ -37,7 +41,49 @@ class MissionsSdk:
             page=page,
             items=items,
             mission_type_ids=mission_type_ids,
-            archived=archived)
+            archived=archived,
+            columnar=columnar)
+
+    def iter_missions(self, items=25, prefetch=True, **filters):
+        """
+        Iterate over all the missions in your Galileo account. Pages are requested lazily,
+        the next one in the background while you process the current one.
+
+        :param items: int: Number of missions requested per page
+        :param prefetch: boolean: Fetch the next page in the background
+        :param filters: Any other filter accepted by list_missions
+        :return: Iterator[Mission]
+
+        Example:
+            >>> for mission in galileo.missions.iter_missions(items=100):
+            >>>     print(mission.name)
+        """
+        return self._missions_service.iter_missions(items=items,
+                                                    prefetch=prefetch,
+                                                    **filters)
+
+    def fetch_all_missions(self,
+                           items=25,
+                           concurrency=4,
+                           columnar=False,
+                           **filters):
+        """
+        Get all the missions in your Galileo account at once. Up to concurrency pages are
+        requested at the same time, the results are returned in page order.
+
+        :param items: int: Number of results requested per page
+        :param concurrency: int: Maximum number of pages requested at the same time
+        :param columnar: boolean: Return a single MissionTable built from every page
+        :param filters: Any other filter accepted by list_missions
+        :return: List[Mission], or MissionTable when columnar
+
+        Example:
+            >>> missions = galileo.missions.fetch_all_missions(items=100, concurrency=8)
+        """
+        return self._missions_service.fetch_all_missions(items=items,
+                                                         concurrency=concurrency,
+                                                         columnar=columnar,
+                                                         **filters)
 
     def get_mission_by_id(self, mission_id):
         """
@@ -107,7 +153,13 @@ class MissionsSdk:
 
         return self._missions_service.delete_mission(mission_id)
 
-    def upload(self, mission_id, payload, rename=None, verbose=False):
+    def upload(self,
+               mission_id,
+               payload,
+               rename=None,
+               verbose=False,
+               concurrency=4,
+               experimental_chunk_size=None):
         """
         Upload a file or directory to the specified Mission. If the payload is a file, this function 
         will place the file in the top level of the Mission file tree. If the payload is a directory, 
@@ -118,7 +170,9 @@ class MissionsSdk:
         :param payload: str: Path to folder or file to upload to targeted Mission
         :param rename: str: Used when uploading a single file to specify the desired path within the Mission context (i.e. rename='/data/mydata.csv').
         :param verbose: bool: Verbosity flag, default is False
-        :return: bool
+        :param concurrency: int: Number of files uploaded at the same time, default is 4
+        :param experimental_chunk_size: int: Experimental, upload files larger than experimental_chunk_size bytes in chunks that are retried on failure and resumed when the upload is run again. Only safe with a backend assembling Content-Range uploads: a backend ignoring the header replaces the Mission file with each chunk, destroying any existing file of the same name, and the file is only reported as failed afterwards. Default is None, each file is sent in one request
+        :return: UploadReport: outcome of each file, truthy if every file was uploaded
         
         Example:
             >>> my_missions = galileo.missions.list_missions() # get the UUID of the mission you want
@@ -128,10 +182,49 @@ class MissionsSdk:
             >>> if success:
             >>>     print("It worked")
             >>> else:
-            >>>     print("I don't think this Mission exists")
+            >>>     print("Failed uploads: ", success.failed)
+        """
+        return self._missions_service.upload(mission_id,
+                                             payload,
+                                             rename,
+                                             verbose,
+                                             concurrency=concurrency,
+                                             experimental_chunk_size=experimental_chunk_size)
+
+    def sync(self,
+             mission_id,
+             directory,
+             delete=False,
+             verbose=False,
+             concurrency=4,
+             manifest_dir=None,
+             experimental_chunk_size=None):
+        """
+        Sync a directory to the specified Mission, uploading only the files that are new or changed
+        since the last sync. Sizes, modification times and content hashes of the synced files are
+        kept in a manifest outside the directory (~/.galileo_sync by default), so re-running a sync
+        after a job that touched a few files only uploads those files.
+
+        :param mission_id: str: Target Mission UUID
+        :param directory: str: Path to the folder to sync with the targeted Mission
+        :param delete: bool: Delete the Mission files that no longer exist in the directory, default is False
+        :param verbose: bool: Verbosity flag, default is False
+        :param concurrency: int: Number of files uploaded at the same time, default is 4
+        :param manifest_dir: str: Folder where the sync manifests are kept, default is ~/.galileo_sync
+        :param experimental_chunk_size: int: Experimental, upload files larger than experimental_chunk_size bytes in resumable chunks, with the data loss risk described in upload. Default is None
+        :return: SyncReport: uploaded, unchanged and deleted files, truthy if every upload succeeded
+
+        Example:
+            >>> report = galileo.missions.sync(UUID, 'C:\\Users\\Galileo\\Julia Example')
+            >>> print(len(report.succeeded), "uploaded,", len(report.unchanged), "unchanged")
         """
-        return self._missions_service.upload(mission_id, payload, rename,
-                                             verbose)
+        return self._missions_service.sync(mission_id,
+                                           directory,
+                                           delete=delete,
+                                           verbose=verbose,
+                                           concurrency=concurrency,
+                                           manifest_dir=manifest_dir,
+                                           experimental_chunk_size=experimental_chunk_size)
 
     def run_job_on_station(self,
                            mission_id,
@@ -293,12 +386,13 @@ class MissionsSdk:
             lz_id=lz_id,
         )
 
-    def get_mission_files(self, mission_id):
+    def get_mission_files(self, mission_id, stream=False):
         """
         Provides the metadata of all files in a Mission context
 
         :param mission_id: UUID of the Mission to inspect
-        :return: List[FileListing]
+        :param stream: boolean: Return the files one by one as the response is received, so large listings are not held in memory at once, requires ijson: pip install galileo_sdk[stream]. Not supported by AsyncGalileoSdk, which raises ValueError
+        :return: List[FileListing], or Iterator[FileListing] when stream
         
         Example:
             >>> my_missions = galileo.missions.list_missions() # get the UUID of the mission you want
@@ -306,10 +400,13 @@ class MissionsSdk:
             >>> mission_files = galileo.missions.get_mission_files(UUID)
             >>> for file in mission_files:
             >>>     print(file.filename, file.path, file.file_size)
+            >>>
+            >>> total_size = sum(file.file_size for file in galileo.missions.get_mission_files(UUID, stream=True))
         
         """
 
-        return self._missions_service.get_mission_files(mission_id)
+        return self._missions_service.get_mission_files(mission_id,
+                                                        stream=stream)
 
     def delete_file(self, mission_id, file_path):
         """
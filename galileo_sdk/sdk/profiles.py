@@ -33,6 +33,41 @@ class ProfilesSdk:
             items=items,
         )
 
+    def iter_users(self, items=25, prefetch=True, **filters):
+        """
+        Iterate over all Galileo users and their profiles. Pages are requested lazily,
+        the next one in the background while you process the current one.
+
+        :param items: int: Number of users requested per page
+        :param prefetch: boolean: Fetch the next page in the background
+        :param filters: Any other filter accepted by list_users
+        :return: Iterator[Profile]
+
+        Example:
+            >>> for user in galileo.profiles.iter_users(items=100):
+            >>>     print(user.username)
+        """
+        return self._profile_service.iter_users(items=items,
+                                                prefetch=prefetch,
+                                                **filters)
+
+    def fetch_all_users(self, items=25, concurrency=4, **filters):
+        """
+        Get all the Galileo users and their profiles at once. Up to concurrency pages are
+        requested at the same time, the results are returned in page order.
+
+        :param items: int: Number of results requested per page
+        :param concurrency: int: Maximum number of pages requested at the same time
+        :param filters: Any other filter accepted by list_users
+        :return: List[Profile]
+
+        Example:
+            >>> users = galileo.profiles.fetch_all_users(items=100, concurrency=8)
+        """
+        return self._profile_service.fetch_all_users(items=items,
+                                                     concurrency=concurrency,
+                                                     **filters)
+
     def self(self):
         """
         Get your Galileo profile
@@ -45,6 +80,18 @@ class ProfilesSdk:
         """
         return self._profile_service.self()
 
+    def invalidate_self(self):
+        """
+        Your profile is cached for a few minutes, call this after changing it so the next
+        call to self fetches it again
+
+        :return: None
+
+        Example:
+            >>> galileo.profiles.invalidate_self()
+        """
+        self._profile_service.invalidate_self()
+
     def list_station_invites(self):
         """
         Get all your station invites
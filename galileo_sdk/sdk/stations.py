@@ -8,11 +8,18 @@ from ..business.objects import (
 
 
 class StationsSdk(EventsSdk):
-    def __init__(self, stations_service, connector=None, events=None):
+    _topic = "stations"
+
+    def __init__(self,
+                 stations_service,
+                 connector=None,
+                 events=None,
+                 stream_connector=None):
         self._stations_service = stations_service
         super(StationsSdk, self).__init__(
             connector=connector,
             events=events,
+            stream_connector=stream_connector,
         )
 
     def on_new_station(self, func):
@@ -555,6 +562,41 @@ class StationsSdk(EventsSdk):
             lz_status=lz_status,
         )
 
+    def iter_stations(self, items=25, prefetch=True, **filters):
+        """
+        Iterate over all the stations. Pages are requested lazily,
+        the next one in the background while you process the current one.
+
+        :param items: int: Number of stations requested per page
+        :param prefetch: boolean: Fetch the next page in the background
+        :param filters: Any other filter accepted by list_stations
+        :return: Iterator[Station]
+
+        Example:
+            >>> for station in galileo.stations.iter_stations(items=100):
+            >>>     print(station.name)
+        """
+        return self._stations_service.iter_stations(items=items,
+                                                    prefetch=prefetch,
+                                                    **filters)
+
+    def fetch_all_stations(self, items=25, concurrency=4, **filters):
+        """
+        Get all the stations at once. Up to concurrency pages are
+        requested at the same time, the results are returned in page order.
+
+        :param items: int: Number of results requested per page
+        :param concurrency: int: Maximum number of pages requested at the same time
+        :param filters: Any other filter accepted by list_stations
+        :return: List[Station]
+
+        Example:
+            >>> stations = galileo.stations.fetch_all_stations(items=100, concurrency=8)
+        """
+        return self._stations_service.fetch_all_stations(items=items,
+                                                         concurrency=concurrency,
+                                                         **filters)
+
     def list_public_stations(
         self,
         mission_types=[],
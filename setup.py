@@ -66,6 +66,7 @@ setup(
     package_data={
         "galileo_sdk": [
             "sdk/**",
+            "sdk/**/*",
             "business/**/*",
             "business/__init__.py",
             "config/**/*",
@@ -78,7 +79,13 @@ setup(
     },
     python_requires=">=2.7",
     install_requires=install_requires,
-    extras_require={"docs": ["sphinx>=2.2.0", "sphinx-material"]},
+    extras_require={
+        "docs": ["sphinx>=2.2.0", "sphinx-material"],
+        "async": ["aiohttp>=3.6"],
+        "arrow": ["pyarrow"],
+        "json": ["orjson"],
+        "stream": ["ijson>=3.1"],
+    },
     tests_require=["pytest-runner", "pytest"],
     cmdclass={
         "verify": VerifyVersionCommand,
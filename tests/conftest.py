@@ -0,0 +1,11 @@
+import sys
+
+# Test modules using asyncio or async syntax, which Python 2 cannot even import
+collect_ignore = []
+if sys.version_info[0] == 2:
+    collect_ignore += [
+        "unit/data/test_async_repos.py",
+        "unit/data/test_event_stream.py",
+        "unit/data/test_reconnect.py",
+        "unit/services/test_async_jobs_service.py",
+    ]
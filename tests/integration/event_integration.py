@@ -10,29 +10,29 @@ def on_machine_status_update(event):
 
 
 def on_hardware_update(event):
-    print("\non_hardware_update - ", vars(event.machine))
+    print("\non_hardware_update - ", event.machine.to_dict())
 
 
 def on_machine_registered(event):
-    print("\non_machine_registered_event - ", vars(event.machine))
+    print("\non_machine_registered_event - ", event.machine.to_dict())
 
 
 # Jobs
 def on_job_launcher_updated(event):
-    print("\non_job_launcher_updated - ", vars(event.job))
+    print("\non_job_launcher_updated - ", event.job.to_dict())
 
 
 def on_job_launcher_submitted(event):
-    print("\non_job_launcher_submitted - ", vars(event.job))
+    print("\non_job_launcher_submitted - ", event.job.to_dict())
 
 
 def on_station_job_updated(event):
-    print("\non_station_job_updated - ", vars(event.job))
+    print("\non_station_job_updated - ", event.job.to_dict())
 
 
 # Station
 def on_new_station(event):
-    print("\non_new_station - ", vars(event.station))
+    print("\non_new_station - ", event.station.to_dict())
 
 
 def on_station_admin_invite_sent(event):
@@ -40,7 +40,7 @@ def on_station_admin_invite_sent(event):
 
 
 def on_station_user_invite_received(event):
-    print("\non_station_user_invite_received - ", vars(event.station))
+    print("\non_station_user_invite_received - ", event.station.to_dict())
 
 
 def on_station_admin_invite_accepted(event):
@@ -139,7 +139,7 @@ def on_station_admin_volume_added(event):
     print(
         "\non_station_admin_volume_added",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -147,7 +147,7 @@ def on_station_member_volume_added(event):
     print(
         "\non_station_member_volume_added",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -155,7 +155,7 @@ def on_station_admin_volume_host_path_added(event):
     print(
         "\non_station_admin_volume_host_path_added",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -163,7 +163,7 @@ def on_station_member_volume_host_path_added(event):
     print(
         "\non_station_member_volume_host_path_added",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -171,7 +171,7 @@ def on_station_admin_volume_host_path_removed(event):
     print(
         "\non_station_admin_volume_host_path_removed",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -179,7 +179,7 @@ def on_station_member_volume_host_path_removed(event):
     print(
         "\non_station_member_volume_host_path_removed",
         event.stationid,
-        [vars(volume) for volume in event.volumes],
+        [volume.to_dict() for volume in event.volumes],
     )
 
 
@@ -192,11 +192,11 @@ def on_station_member_volume_removed(event):
 
 
 def on_station_admin_station_updated(event):
-    print("\non_station_admin_station_updated", vars(event.station))
+    print("\non_station_admin_station_updated", event.station.to_dict())
 
 
 def on_station_member_station_updated(event):
-    print("\non_station_member_station_updated", vars(event.station))
+    print("\non_station_member_station_updated", event.station.to_dict())
 
 
 galileo.lz.on_lz_status_update(on_machine_status_update)
@@ -0,0 +1,99 @@
+"""
+A tiny local stand-in for the Galileo backend used by the tests and benchmarks.
+
+Routes are registered as ``path -> callable(handler) -> (status, headers, body)``
+so each benchmark can describe only the endpoints it exercises. A route returning
+None drops the connection without answering, to simulate a network failure.
+"""
+import json
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+NAMESPACE = "/galileo/user_interface/v1"
+
+
+def json_route(payload, status=200):
+    body = json.dumps(payload).encode("utf-8")
+
+    def route(handler):
+        return status, {"Content-Type": "application/json"}, body
+
+    return route
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StandInServer:
+    def __init__(self, routes):
+        """
+        Local HTTP/1.1 server answering with canned responses.
+
+        :param routes: Map of request path (without query string) to route callables
+        :type routes: Dict[str, Callable]
+        """
+        self.routes = routes
+        self.request_count = 0
+        self.connection_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                BaseHTTPRequestHandler.setup(self)
+                server.connection_count += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                server.request_count += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                self.body = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                route = server.routes.get(path)
+                if route is None:
+                    response = 404, {}, b"{}"
+                else:
+                    response = route(self)
+                if response is None:
+                    self.close_connection = True
+                    return
+                status, headers, body = response
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PUT = _handle
+            do_DELETE = _handle
+
+        self._httpd = _ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def backend(self):
+        host, port = self._httpd.server_address[:2]
+        return "http://{host}:{port}".format(host=host, port=port)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._httpd.shutdown()
+        self._httpd.server_close()
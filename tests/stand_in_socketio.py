@@ -0,0 +1,130 @@
+"""
+A local stand-in for the Galileo Socket.IO endpoint, for the event connection tests.
+
+It runs python-socketio's aiohttp server on a background event loop, on a fixed port once
+started, so it can be killed, dropping every connection without a goodbye like a crashed
+backend, and started again at the same address.
+"""
+import asyncio
+import threading
+import time
+
+import socketio
+from aiohttp import web
+
+from tests.stand_in_server import NAMESPACE
+
+
+class SocketIOStandIn:
+    def __init__(self, namespace=NAMESPACE):
+        """
+        :param namespace: Socket.IO namespace clients connect to
+        :type namespace: str
+        """
+        self.namespace = namespace
+        self.port = 0
+        self._runner = None
+        self._server = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def backend(self):
+        return "http://127.0.0.1:{port}".format(port=self.port)
+
+    def _run(self, coroutine, timeout=10):
+        return asyncio.run_coroutine_threadsafe(coroutine,
+                                                self._loop).result(timeout)
+
+    def start(self):
+        """
+        Start serving, on the port of the previous start if there was one
+        """
+
+        async def start():
+            self._server = socketio.AsyncServer(async_mode="aiohttp")
+            self._server.register_namespace(
+                socketio.AsyncNamespace(self.namespace))
+            app = web.Application()
+            self._server.attach(app)
+            self._runner = web.AppRunner(app)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        self._run(start())
+        return self
+
+    def kill(self):
+        """
+        Stop serving, aborting the open connections
+        """
+
+        async def kill():
+            for connection in list(self._runner.server.connections):
+                if connection.transport is not None:
+                    connection.transport.abort()
+            await self._runner.cleanup()
+            self._runner = None
+
+        self._run(kill())
+
+    def clients(self):
+        """
+        :return: Session ids of the clients connected to the namespace
+        :rtype: List[str]
+        """
+
+        async def clients():
+            return self._participants()
+
+        return self._run(clients())
+
+    def _participants(self):
+        if self.namespace not in self._server.manager.rooms:
+            return []
+        return list(self._server.manager.get_participants(
+            self.namespace, None))
+
+    def wait_for_clients(self, count=1, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if len(self.clients()) >= count:
+                return True
+            time.sleep(0.02)
+        return False
+
+    def emit(self, event, data):
+        """
+        Send an event to every client of the namespace
+        """
+
+        async def emit():
+            # AsyncServer.emit passes coroutines to asyncio.wait, which Python 3.11 rejects
+            for sid in self._participants():
+                await self._server._emit_internal(sid, event, data,
+                                                  self.namespace)
+
+        self._run(emit())
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        if self._runner is not None:
+            self.kill()
+
+        async def cancel():
+            tasks = [
+                task for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._run(cancel())
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,191 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+
+from galileo_sdk.compat import mock
+from galileo_sdk.business.objects.lz import ELzStatus
+from galileo_sdk.data.providers.async_session import AsyncSessionProvider
+from galileo_sdk.data.repositories.aio import (
+    AsyncJobsRepository,
+    AsyncLzRepository,
+)
+
+NAMESPACE = "/galileo/user_interface/v1"
+JOB_ID = "job_id"
+UNIVERSE_ID = "universe_id"
+RESULTS = b"results" * 4096
+ETAG = '"v1"'
+
+
+def lz_dict(x):
+    return {
+        "mid": str(x),
+        "gpu": str(x),
+        "cpu": str(x),
+        "gpu_count": x,
+        "cpu_count": x,
+        "arch": str(x),
+        "memory": str(x),
+        "memory_amount": x,
+        "job_runner": str(x),
+        "container_technology": str(x),
+        "name": str(x),
+        "operating_system": str(x),
+        "running_jobs_limit": x,
+        "status": "online",
+        "userid": str(x),
+    }
+
+
+async def list_machines(request):
+    assert request.headers["Authorization"] == "Bearer ACCESS_TOKEN"
+    assert request.headers["universe-id"] == UNIVERSE_ID
+    return web.json_response({"machines": [lz_dict(x) for x in range(5)]})
+
+
+async def download_results(request):
+    assert request.query["filename"] == "results.zip"
+    requested = request.headers.get("Range")
+    if requested and request.headers.get("If-Range") == ETAG:
+        start = int(requested[len("bytes="):-1])
+        return web.Response(status=206,
+                            body=RESULTS[start:],
+                            headers={"ETag": ETAG})
+    return web.Response(body=RESULTS, headers={"ETag": ETAG})
+
+
+def run_with_server(test):
+
+    async def run():
+        app = web.Application()
+        app.router.add_get(NAMESPACE + "/machines", list_machines)
+        app.router.add_get(NAMESPACE + "/jobs/{job_id}/results",
+                           download_results)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        settings_repo = mock.Mock()
+        settings_repo.get_settings(
+        ).backend = "http://127.0.0.1:{port}".format(port=port)
+        settings_repo.get_settings().universe = UNIVERSE_ID
+        auth_provider = mock.Mock()
+        auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+        session_provider = AsyncSessionProvider()
+        try:
+            return await test(settings_repo, auth_provider, session_provider)
+        finally:
+            await session_provider.close()
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_list_lz():
+
+    async def test(settings_repo, auth_provider, session_provider):
+        lz_repo = AsyncLzRepository(settings_repo, auth_provider, NAMESPACE,
+                                    session_provider)
+
+        # Call
+        r = await lz_repo.list_lz("")
+
+        # Assert
+        assert len(r) == 5
+        for i in range(5):
+            assert r[i].lz_id == str(i)
+            assert r[i].status == ELzStatus.online
+
+    run_with_server(test)
+
+
+def test_concurrent_requests_share_session():
+
+    async def test(settings_repo, auth_provider, session_provider):
+        lz_repo = AsyncLzRepository(settings_repo, auth_provider, NAMESPACE,
+                                    session_provider)
+        session = session_provider.get_session()
+
+        # Call
+        r = await asyncio.gather(*[lz_repo.list_lz("") for _ in range(20)])
+
+        # Assert
+        assert all(len(lzs) == 5 for lzs in r)
+        assert session_provider.get_session() is session
+
+    run_with_server(test)
+
+
+def test_download_results():
+
+    async def test(settings_repo, auth_provider, session_provider):
+        jobs_repo = AsyncJobsRepository(settings_repo, auth_provider,
+                                        NAMESPACE, session_provider)
+        filename = os.path.join(tempfile.mkdtemp(), "results.zip")
+
+        # Call
+        r = await jobs_repo.download_results(JOB_ID, "filename=results.zip",
+                                             filename)
+
+        # Assert
+        assert r == filename
+        with open(filename, "rb") as f:
+            assert f.read() == RESULTS
+
+    run_with_server(test)
+
+
+def _write_partial(filename, content, validator):
+    with open(filename + ".part", "wb") as f:
+        f.write(content)
+    with open(filename + ".part.validator", "w") as f:
+        f.write(validator)
+
+
+def test_download_results_resumes_unchanged_file():
+
+    async def test(settings_repo, auth_provider, session_provider):
+        jobs_repo = AsyncJobsRepository(settings_repo, auth_provider,
+                                        NAMESPACE, session_provider)
+        filename = os.path.join(tempfile.mkdtemp(), "results.zip")
+        _write_partial(filename, RESULTS[:1000], ETAG)
+
+        # Call
+        await jobs_repo.download_results(JOB_ID,
+                                         "filename=results.zip",
+                                         filename,
+                                         expected_size=len(RESULTS))
+
+        # Assert
+        with open(filename, "rb") as f:
+            assert f.read() == RESULTS
+
+    run_with_server(test)
+
+
+def test_download_results_restarts_when_file_changed_on_server():
+
+    async def test(settings_repo, auth_provider, session_provider):
+        jobs_repo = AsyncJobsRepository(settings_repo, auth_provider,
+                                        NAMESPACE, session_provider)
+        filename = os.path.join(tempfile.mkdtemp(), "results.zip")
+        _write_partial(filename, b"x" * 1000, '"v0"')
+
+        # Call
+        await jobs_repo.download_results(JOB_ID,
+                                         "filename=results.zip",
+                                         filename,
+                                         expected_size=len(RESULTS))
+
+        # Assert
+        with open(filename, "rb") as f:
+            assert f.read() == RESULTS
+        assert not os.path.exists(filename + ".part.validator")
+
+    run_with_server(test)
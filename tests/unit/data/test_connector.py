@@ -0,0 +1,204 @@
+from galileo_sdk.compat import mock
+from galileo_sdk.data.events.connector import GalileoConnector
+from galileo_sdk.sdk.jobs import JobsSdk
+from galileo_sdk.sdk.lz import LzSdk
+from galileo_sdk.sdk.stations import StationsSdk
+
+BACKEND = "http://BACKEND"
+NAMESPACE = "/galileo/user_interface/v1"
+
+# Arrange
+settings_repo = mock.Mock()
+settings_repo.get_settings().backend = BACKEND
+auth_provider = mock.Mock()
+auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+
+
+class FakeClient:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.handlers = {}
+        self.connected = False
+        self.connect_count = 0
+        self.disconnect_count = 0
+        FakeClient.instances.append(self)
+
+    def on(self, event, handler=None, namespace=None):
+        self.handlers.setdefault(namespace, {})[event] = handler
+
+    def connect(self, url, **kwargs):
+        self.connected = True
+        self.connect_count += 1
+
+    def disconnect(self):
+        self.connected = False
+        self.disconnect_count += 1
+
+
+def _sdks():
+    FakeClient.instances = []
+    connector = GalileoConnector(settings_repo, auth_provider, NAMESPACE)
+    return (
+        connector,
+        JobsSdk(mock.Mock(), connector),
+        StationsSdk(mock.Mock(), connector),
+        LzSdk(mock.Mock(), connector),
+    )
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_topics_share_one_connection():
+    connector, jobs, stations, lz = _sdks()
+
+    # Call
+    jobs.on_job_launcher_updated(lambda event: None)
+    stations.on_new_station(lambda event: None)
+    lz.on_lz_status_update(lambda event: None)
+    jobs.on_station_job_updated(lambda event: None)
+
+    # Assert
+    assert len(FakeClient.instances) == 1
+    assert FakeClient.instances[0].connect_count == 1
+    handlers = FakeClient.instances[0].handlers[NAMESPACE]
+    assert "job_launcher_updated" in handlers
+    assert "new_station" in handlers
+    assert "machine/status_updated" in handlers
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_connection_is_closed_by_last_release():
+    # Arrange
+    connector, jobs, stations, lz = _sdks()
+    jobs.on_job_launcher_updated(lambda event: None)
+    stations.on_new_station(lambda event: None)
+    client = FakeClient.instances[0]
+
+    # Call
+    jobs.disconnect()
+    lz.disconnect()  # Never subscribed, releases nothing
+
+    # Assert
+    assert client.disconnect_count == 0
+    assert "job_launcher_updated" not in client.handlers[NAMESPACE]
+    assert "new_station" in client.handlers[NAMESPACE]
+
+    # Call
+    stations.disconnect()
+
+    # Assert
+    assert client.disconnect_count == 1
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_events_are_dispatched_to_subscribers():
+    # Arrange
+    connector, jobs, stations, lz = _sdks()
+    received = []
+    lz.on_lz_status_update(received.append)
+    handler = FakeClient.instances[0].handlers[NAMESPACE][
+        "machine/status_updated"]
+
+    # Call
+    handler({"mid": "lz_id", "status": "online"})
+
+    # Assert
+    assert [event.lz_id for event in received] == ["lz_id"]
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_handlers_run_on_the_executor():
+    # Arrange
+    FakeClient.instances = []
+    executor = mock.Mock()
+    connector = GalileoConnector(settings_repo,
+                                 auth_provider,
+                                 NAMESPACE,
+                                 executor=executor)
+    lz = LzSdk(mock.Mock(), connector)
+    received = []
+    lz.on_lz_status_update(received.append)
+    handler = FakeClient.instances[0].handlers[NAMESPACE][
+        "machine/status_updated"]
+
+    # Call
+    handler({"mid": "lz_id", "status": "online"})
+
+    # Assert
+    assert received == []
+    assert executor.submit.call_count == 1
+    assert lz.event_metrics.queue_depth == 1
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_job_updates_are_coalesced_per_job():
+    # Arrange
+    FakeClient.instances = []
+    connector = GalileoConnector(settings_repo,
+                                 auth_provider,
+                                 NAMESPACE,
+                                 job_events_window=60)
+    jobs = JobsSdk(mock.Mock(), connector)
+    received = []
+    jobs.on_job_launcher_updated(received.append)
+    handler = FakeClient.instances[0].handlers[NAMESPACE][
+        "job_launcher_updated"]
+    loader = mock.Mock(side_effect=lambda job: job["status"])
+
+    # Call
+    with mock.patch("galileo_sdk.data.events.topics.job_dict_to_job",
+                    loader):
+        for job_id, status in [("a", "queued"), ("b", "queued"),
+                               ("a", "running"), ("a", "exited")]:
+            handler({"job": {"jobid": job_id, "status": status}})
+        connector.jobs_events.flush()
+        delivered = [(event.job_id, event.job) for event in received]
+
+    # Assert
+    assert delivered == [("a", "exited"), ("b", "queued")]
+    assert loader.call_count == 2
+    assert connector.jobs_events.coalesced == 2
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_wait_for_jobs_holds_its_own_subscription():
+    # Arrange
+    connector, jobs, stations, lz = _sdks()
+    jobs.wait_for_jobs(["job_id"])
+    subscribe = jobs._jobs_service.wait_for_jobs.call_args[1]["events"]
+    received = []
+
+    # Call
+    unsubscribe = subscribe(received.append)
+    handler = FakeClient.instances[0].handlers[NAMESPACE][
+        "job_launcher_updated"]
+    with mock.patch("galileo_sdk.data.events.topics.job_dict_to_job"):
+        handler({"job": {"jobid": "job_id"}})
+    unsubscribe()
+
+    # Assert
+    assert [event.job_id for event in received] == ["job_id"]
+    assert connector.jobs_events._events._registered_listeners[
+        "job_launcher_updated"] == []
+    assert FakeClient.instances[0].disconnect_count == 1
+
+
+@mock.patch("galileo_sdk.data.events.connector.socketio.Client", FakeClient)
+def test_observers_receive_every_event_of_the_topic():
+    # Arrange
+    connector, jobs, stations, lz = _sdks()
+    received = []
+    unobserve = connector.observe("lz", received.append)
+    handlers = FakeClient.instances[0].handlers[NAMESPACE]
+
+    # Call
+    handlers["machine/status_updated"]({"mid": "lz_id", "status": "online"})
+    with mock.patch("galileo_sdk.data.events.topics.lz_dict_to_lz"):
+        handlers["machine/registered"]({"machine": {}})
+    unobserve()
+
+    # Assert
+    assert [type(event).__name__ for event in received] == [
+        "LzStatusUpdateEvent", "LzRegisteredEvent"
+    ]
+    assert FakeClient.instances[0].disconnect_count == 1
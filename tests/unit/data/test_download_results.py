@@ -0,0 +1,173 @@
+import base64
+import hashlib
+import os
+import re
+
+import pytest
+
+from tests.stand_in_server import NAMESPACE, StandInServer
+from galileo_sdk.compat import mock
+from galileo_sdk.business.objects.exceptions import DownloadException
+from galileo_sdk.data.repositories.jobs import JobsRepository
+
+JOB_ID = "job_id"
+RESULTS_PATH = NAMESPACE + "/jobs/job_id/results"
+CONTENT = os.urandom(50000)
+DIGEST = "sha-256=" + base64.b64encode(
+    hashlib.sha256(CONTENT).digest()).decode("ascii")
+ETAG = '"v1"'
+
+
+class ResultsRoute:
+    def __init__(self, content=CONTENT, ranges=True, digest=DIGEST, etag=ETAG):
+        """
+        Serves a results file, honouring Range requests unless ranges is False, or unless
+        If-Range does not match the ETag
+        """
+        self.content = content
+        self.ranges = ranges
+        self.digest = digest
+        self.etag = etag
+        self.range_headers = []
+        self.if_range_headers = []
+
+    def __call__(self, handler):
+        headers = {"Digest": self.digest} if self.digest else {}
+        headers["ETag"] = self.etag
+        requested = handler.headers.get("Range")
+        if_range = handler.headers.get("If-Range")
+        self.range_headers.append(requested)
+        self.if_range_headers.append(if_range)
+        if requested and self.ranges and if_range == self.etag:
+            start = int(re.match(r"bytes=(\d+)-", requested).group(1))
+            return 206, headers, self.content[start:]
+        return 200, headers, self.content
+
+
+def _repo(server):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = server.backend
+    settings_repo.get_settings().universe = None
+    auth_provider = mock.Mock()
+    auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+    return JobsRepository(settings_repo, auth_provider, NAMESPACE)
+
+
+def _download(route, path, expected_size=len(CONTENT)):
+    with StandInServer({RESULTS_PATH: route}) as server:
+        return _repo(server).download_results(JOB_ID,
+                                              "filename=results.zip",
+                                              path,
+                                              expected_size=expected_size)
+
+
+def _write_partial(path, content, validator=ETAG):
+    with open(path + ".part", "wb") as f:
+        f.write(content)
+    if validator is not None:
+        with open(path + ".part.validator", "w") as f:
+            f.write(validator)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_download_is_moved_in_place(tmp_path):
+    path = str(tmp_path / "results.zip")
+
+    r = _download(ResultsRoute(), path)
+
+    assert r == path
+    assert _read(path) == CONTENT
+    assert not os.path.exists(path + ".part")
+    assert not os.path.exists(path + ".part.validator")
+
+
+def test_download_resumes_partial_file(tmp_path):
+    # Arrange
+    path = str(tmp_path / "results.zip")
+    _write_partial(path, CONTENT[:20000])
+    route = ResultsRoute()
+
+    # Call
+    _download(route, path)
+
+    # Assert
+    assert route.range_headers == ["bytes=20000-"]
+    assert route.if_range_headers == [ETAG]
+    assert _read(path) == CONTENT
+
+
+def test_download_restarts_when_file_changed_on_server(tmp_path):
+    # Arrange, the partial file is from an older version of the results
+    path = str(tmp_path / "results.zip")
+    _write_partial(path, os.urandom(20000), validator='"v0"')
+    route = ResultsRoute()
+
+    # Call
+    _download(route, path)
+
+    # Assert
+    assert route.if_range_headers == ['"v0"']
+    assert _read(path) == CONTENT
+
+
+def test_partial_file_without_validator_is_not_resumed(tmp_path):
+    # Arrange
+    path = str(tmp_path / "results.zip")
+    _write_partial(path, os.urandom(20000), validator=None)
+    route = ResultsRoute()
+
+    # Call
+    _download(route, path)
+
+    # Assert
+    assert route.range_headers == [None]
+    assert _read(path) == CONTENT
+
+
+def test_download_restarts_when_range_is_ignored(tmp_path):
+    path = str(tmp_path / "results.zip")
+    _write_partial(path, CONTENT[:20000])
+
+    _download(ResultsRoute(ranges=False), path)
+
+    assert _read(path) == CONTENT
+
+
+def test_complete_file_is_not_downloaded_again(tmp_path):
+    # Arrange
+    path = str(tmp_path / "results.zip")
+    with open(path, "wb") as f:
+        f.write(CONTENT)
+    route = ResultsRoute()
+
+    # Call
+    _download(route, path)
+
+    # Assert
+    assert route.range_headers == []
+
+
+def test_truncated_download_is_kept_for_resuming(tmp_path):
+    path = str(tmp_path / "results.zip")
+
+    with pytest.raises(DownloadException):
+        _download(ResultsRoute(content=CONTENT[:30000], digest=None), path)
+
+    assert not os.path.exists(path)
+    assert os.path.getsize(path + ".part") == 30000
+    assert _read(path + ".part.validator").decode("ascii") == ETAG
+
+
+def test_checksum_mismatch_is_discarded(tmp_path):
+    path = str(tmp_path / "results.zip")
+    corrupted = CONTENT[:-1] + (b"\1" if CONTENT.endswith(b"\0") else b"\0")
+
+    with pytest.raises(DownloadException):
+        _download(ResultsRoute(content=corrupted), path)
+
+    assert not os.path.exists(path)
+    assert not os.path.exists(path + ".part")
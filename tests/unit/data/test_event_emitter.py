@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from galileo_sdk.business.objects.event import EventEmitter
+from galileo_sdk.business.objects.jobs import JobLauncherUpdatedEvent
+
+
+class Job:
+    def __init__(self, job_id, status):
+        self.job_id = job_id
+        self.status = status
+
+
+def _event(job_id, status):
+    return JobLauncherUpdatedEvent(Job(job_id, status))
+
+
+def _fail(event):
+    raise ValueError("handler failed")
+
+
+def test_failing_handler_does_not_stop_the_others():
+    # Arrange
+    errors = []
+    received = []
+    emitter = EventEmitter(
+        on_error=lambda error, name, handler: errors.append((error, name)))
+    emitter.on("job_launcher_updated", _fail)
+    emitter.on("job_launcher_updated", received.append)
+
+    # Call
+    emitter.emit("job_launcher_updated", _event("a", "running"))
+
+    # Assert
+    assert len(received) == 1
+    assert [name for error, name in errors] == ["job_launcher_updated"]
+    assert isinstance(errors[0][0], ValueError)
+    assert emitter.metrics.errors == 1
+    assert emitter.metrics.handler_calls == 2
+
+
+def test_events_of_a_job_stay_in_order():
+    # Arrange
+    received = []
+    lock = threading.Lock()
+
+    def handler(event):
+        with lock:
+            received.append((event.job.job_id, event.job.status))
+
+    with ThreadPoolExecutor(4) as executor:
+        emitter = EventEmitter(executor)
+        emitter.on("job_launcher_updated", handler)
+
+        # Call
+        for i in range(50):
+            for job_id in ("a", "b", "c"):
+                emitter.emit("job_launcher_updated", _event(job_id, i))
+        assert emitter.join(5)
+
+    # Assert
+    for job_id in ("a", "b", "c"):
+        assert [status for j, status in received
+                if j == job_id] == list(range(50))
+    assert emitter.metrics.events == 150
+    assert emitter.metrics.queue_depth == 0
+    assert emitter.metrics.max_queue_depth >= 1
+
+
+def test_slow_job_does_not_hold_up_the_others():
+    # Arrange
+    b_handled = threading.Event()
+
+    def handler(event):
+        if event.job.job_id == "a":
+            # Only returns if job b is handled while job a is still running
+            assert b_handled.wait(5)
+        else:
+            b_handled.set()
+
+    with ThreadPoolExecutor(2) as executor:
+        emitter = EventEmitter(executor)
+        emitter.on("job_launcher_updated", handler)
+
+        # Call
+        emitter.emit("job_launcher_updated", _event("a", "running"))
+        emitter.emit("job_launcher_updated", _event("b", "running"))
+        assert emitter.join(5)
+
+    # Assert
+    assert b_handled.is_set()
+    assert emitter.metrics.errors == 0
+    assert emitter.metrics.max_handler_time > 0
+
+
+def test_handlers_run_on_the_emitting_thread_after_executor_shutdown():
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+    received = []
+    emitter = EventEmitter(executor)
+    emitter.on("job_launcher_updated", received.append)
+
+    emitter.emit("job_launcher_updated", _event("a", "running"))
+
+    assert len(received) == 1
+    assert emitter.join(0)
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from galileo_sdk.business.objects.lz import ELzStatus, LzStatusUpdateEvent
+from galileo_sdk.compat import mock
+from galileo_sdk.data.events.recovery import RECOVERY_MARGIN, EventRecovery
+
+
+def _job(job_id, last_updated):
+    return mock.Mock(job_id=job_id,
+                     last_updated=datetime.fromtimestamp(last_updated))
+
+
+def test_recovery_synthesizes_updates_since_last_event():
+    # Arrange
+    since = 1000000
+    jobs_service = mock.Mock()
+    launched = {
+        1: [_job("new", since + 10),
+            _job("skewed", since - 1)],
+        2: [_job("old", since - RECOVERY_MARGIN - 1)] * 2,
+        3: [_job("older", since - 2 * RECOVERY_MARGIN)] * 2,
+    }
+    received = {1: [_job("received", since + 5)]}
+    jobs_service.list_jobs.side_effect = (
+        lambda page, lz_ids=None, **kwargs:
+        (received if lz_ids else launched)[page])
+    lzs = [
+        mock.Mock(lz_id="online", status=ELzStatus.online),
+        mock.Mock(lz_id="offline", status=ELzStatus.offline),
+    ]
+    lz_service = mock.Mock()
+    lz_service.list_lz.side_effect = lambda page, **kwargs: (lzs if page == 1
+                                                              else [])
+    profiles_service = mock.Mock()
+    profiles_service.self().user_id = "user_id"
+    recovery = EventRecovery(jobs_service,
+                             lz_service,
+                             profiles_service,
+                             items=2)
+    recovery.observe(LzStatusUpdateEvent("online", ELzStatus.online))
+
+    # Call
+    events = recovery.catch_up(since, ["jobs", "lz"])
+
+    # Assert
+    assert [(topic, method, getattr(event, "job_id", None) or event.lz_id)
+            for topic, method, event in events] == [
+                ("jobs", "job_launcher_updated", "new"),
+                ("jobs", "job_launcher_updated", "skewed"),
+                ("jobs", "station_job_updated", "received"),
+                ("lz", "lz_status_update", "offline"),
+            ]
+    # Page 3 is not requested, page 2 was already older than the cutoff
+    calls = [call[1] for call in jobs_service.list_jobs.call_args_list]
+    assert [call["page"] for call in calls] == [1, 2, 1]
+    # Received jobs are the jobs of your Landing Zones, whoever launched them
+    assert calls[2]["user_ids"] == []
+    assert calls[2]["lz_ids"] == ["offline", "online"]
+    assert "receiver_ids" not in calls[2]
+    # Listed once for both topics
+    assert lz_service.list_lz.call_count == 2
+
+
+def test_recovery_without_landing_zones_skips_received_jobs():
+    jobs_service = mock.Mock()
+    jobs_service.list_jobs.return_value = []
+    lz_service = mock.Mock()
+    lz_service.list_lz.return_value = []
+    recovery = EventRecovery(jobs_service, lz_service, mock.Mock())
+
+    assert recovery.catch_up(1000000, ["jobs"]) == []
+    assert jobs_service.list_jobs.call_count == 1
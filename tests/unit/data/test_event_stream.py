@@ -0,0 +1,136 @@
+import asyncio
+
+from galileo_sdk.business.objects.jobs import JobLauncherUpdatedEvent
+from galileo_sdk.compat import mock
+from galileo_sdk.data.events.async_connector import AsyncGalileoConnector
+from galileo_sdk.data.events.stream import EOverflowPolicy, EventStream
+
+BACKEND = "http://BACKEND"
+NAMESPACE = "/galileo/user_interface/v1"
+
+# Arrange
+settings_repo = mock.Mock()
+settings_repo.get_settings().backend = BACKEND
+auth_provider = mock.Mock()
+auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+
+
+class FakeAsyncClient:
+    instances = []
+
+    def __init__(self):
+        self.handlers = {}
+        self.connected = False
+        self.connect_count = 0
+        self.disconnect_count = 0
+        FakeAsyncClient.instances.append(self)
+
+    def on(self, event, handler=None, namespace=None):
+        self.handlers.setdefault(namespace, {})[event] = handler
+
+    async def connect(self, url, **kwargs):
+        self.connected = True
+        self.connect_count += 1
+
+    async def disconnect(self):
+        self.connected = False
+        self.disconnect_count += 1
+
+
+class Job:
+    def __init__(self, job_id, status):
+        self.job_id = job_id
+        self.status = status
+
+
+def _job_event(job_id, status):
+    return JobLauncherUpdatedEvent(Job(job_id, status))
+
+
+async def _drain(stream):
+    await stream.close()
+    return [event async for event in stream]
+
+
+def test_drop_oldest_keeps_latest_events():
+    async def run():
+        stream = EventStream(maxsize=2, overflow=EOverflowPolicy.drop_oldest)
+        for i in range(5):
+            await stream.put(i)
+        return stream, await _drain(stream)
+
+    stream, events = asyncio.run(run())
+
+    assert events == [3, 4]
+    assert stream.dropped == 3
+
+
+def test_coalesce_replaces_event_in_place():
+    async def run():
+        stream = EventStream(maxsize=10, overflow=EOverflowPolicy.coalesce)
+        await stream.put(_job_event("a", "queued"))
+        await stream.put(_job_event("b", "queued"))
+        await stream.put(_job_event("a", "running"))
+        return stream, await _drain(stream)
+
+    stream, events = asyncio.run(run())
+
+    assert [(e.job.job_id, e.job.status)
+            for e in events] == [("a", "running"), ("b", "queued")]
+    assert stream.coalesced == 1
+
+
+def test_block_waits_for_consumer():
+    async def run():
+        stream = EventStream(maxsize=1, overflow=EOverflowPolicy.block)
+        await stream.put(1)
+        producer = asyncio.ensure_future(stream.put(2))
+        await asyncio.sleep(0.01)
+        blocked = not producer.done()
+        first = await stream.get()
+        await producer
+        return blocked, first, await _drain(stream)
+
+    blocked, first, rest = asyncio.run(run())
+
+    assert blocked
+    assert first == 1
+    assert rest == [2]
+
+
+@mock.patch("galileo_sdk.data.events.async_connector.socketio.AsyncClient",
+            FakeAsyncClient)
+def test_streams_share_one_connection():
+    FakeAsyncClient.instances = []
+    connector = AsyncGalileoConnector(settings_repo, auth_provider, NAMESPACE)
+
+    async def run():
+        jobs = connector.stream("jobs")
+        lz = connector.stream("lz")
+        await jobs.open()
+        await lz.open()
+        client = FakeAsyncClient.instances[0]
+        handlers = client.handlers[NAMESPACE]
+        await handlers["job_launcher_updated"]({
+            "job": {
+                "jobid": "job_id"
+            }
+        })
+        await jobs.close()
+        registered = "job_launcher_updated" in handlers
+        disconnected = client.disconnect_count
+        await lz.close()
+        events = [event.job.job_id async for event in jobs]
+        return client, events, registered, disconnected
+
+    with mock.patch("galileo_sdk.data.events.topics.job_dict_to_job",
+                    lambda data: Job(data["jobid"], None)):
+        client, events, registered, disconnected = asyncio.run(run())
+
+    # Assert
+    assert len(FakeAsyncClient.instances) == 1
+    assert client.connect_count == 1
+    assert events == ["job_id"]
+    assert not registered
+    assert disconnected == 0
+    assert client.disconnect_count == 1
@@ -1,4 +1,8 @@
+import json
 import os
+import pickle
+
+import pytest
 
 from galileo_sdk.compat import mock
 from galileo_sdk.business.utils.generate_query_str import generate_query_str
@@ -133,7 +137,7 @@ def mocked_requests_put(*args, **kwargs):
     return MockResponse(None, 404)
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_request_send_job(mocked_requests):
     # Call
     r = job_repo.request_send_job()
@@ -155,7 +159,7 @@ def test_request_send_job(mocked_requests):
     assert r == {"location": LOCATION, "filename": FILENAME}
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_request_send_job_completed(mocked_requests):
     # Call
@@ -183,7 +187,7 @@ def test_request_send_job_completed(mocked_requests):
     assert r["job"] == {"jobinfo": "jobinfo"}
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_request_receive_job(mocked_requests):
     # Call
     r = job_repo.request_receive_job(JOB_ID)
@@ -205,7 +209,7 @@ def test_request_receive_job(mocked_requests):
     assert r["filename"] == FILENAME
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_request_receive_job_completed(mocked_requests):
     # Call
     r = job_repo.request_receive_job_completed(JOB_ID)
@@ -226,7 +230,7 @@ def test_request_receive_job_completed(mocked_requests):
     assert r.status_code == 200
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_submit_job(mocked_requests):
     # Call
     r = job_repo.submit_job(JOB_ID)
@@ -248,7 +252,7 @@ def test_submit_job(mocked_requests):
     assert r["job"]["status"] == "submit"
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_request_stop_job(mocked_requests):
     # Call
     r = job_repo.request_stop_job(JOB_ID)
@@ -269,7 +273,7 @@ def test_request_stop_job(mocked_requests):
     assert r.status == "stop"
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_request_pause_job(mocked_requests):
     # Call
     r = job_repo.request_pause_job(JOB_ID)
@@ -290,7 +294,7 @@ def test_request_pause_job(mocked_requests):
     assert r.status == "pause"
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_request_start_job(mocked_requests):
     # Call
     r = job_repo.request_start_job(JOB_ID)
@@ -311,7 +315,7 @@ def test_request_start_job(mocked_requests):
     assert r.status == "start"
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_request_top_from_job(mocked_requests):
     # Call
     r = job_repo.request_top_from_job(JOB_ID)
@@ -341,7 +345,7 @@ def test_request_top_from_job(mocked_requests):
     assert r[1].items[1].detail == "process22"
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_request_logs_from_job(mocked_requests):
     # Call
     r = job_repo.request_logs_from_jobs(JOB_ID)
@@ -362,7 +366,7 @@ def test_request_logs_from_job(mocked_requests):
     assert r == "logs"
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_jobs(mocked_requests):
     # Call
     r = job_repo.list_jobs("")
@@ -382,7 +386,7 @@ def test_list_jobs(mocked_requests):
     assert r[0].job_id == jobObject.job_id
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_kill_request(mocked_requests):
     r = job_repo.request_kill_job(JOB_ID)
 
@@ -400,7 +404,7 @@ def test_kill_request(mocked_requests):
     assert r.status == "kill"
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_get_results_url(mocked_requests):
     r = job_repo.get_results_metadata(JOB_ID)
 
@@ -417,3 +421,97 @@ def test_get_results_url(mocked_requests):
     assert len(r) == 1
     assert r[0].filename == FILENAME
     assert r[0].path == LOCATION
+
+
+def test_jobs_are_slotted():
+    restored = pickle.loads(pickle.dumps(jobObject))
+
+    assert not hasattr(type(jobObject), "__weakref__")
+    assert not hasattr(jobObject, "__dict__")
+    with pytest.raises(TypeError):
+        vars(jobObject)
+    assert restored.job_id == jobObject.job_id
+    assert len(restored.status_history) == len(jobObject.status_history)
+
+
+def test_job_to_dict():
+    r = jobObject.to_dict()
+    r["job_id"] = "other"
+
+    assert jobObject.job_id == "jobid"
+    assert jobObject.to_dict()["job_id"] == "jobid"
+    assert r["status_history"] is jobObject.status_history
+    assert not any(name.startswith("_") for name in r)
+    assert json.loads(json.dumps(jobObject.to_dict(), default=str))["job_id"] == "jobid"
+
+
+def test_status_history_is_converted_when_first_read():
+    with mock.patch(
+            "galileo_sdk.data.repositories.jobs.job_status_dict_to_job_status"
+    ) as loader:
+        decoded = job_dict_to_job(job)
+
+        assert loader.call_count == 0
+        assert decoded.status == job["status"]
+        assert len(decoded.status_history) == len(job["status_history"])
+        assert loader.call_count == len(job["status_history"])
+        decoded.status_history
+        assert loader.call_count == len(job["status_history"])
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
+def test_list_jobs_table(mocked_requests):
+    # Call
+    r = job_repo.list_jobs_table("")
+
+    # Assert
+    assert len(r) == 1
+    assert r.columns["job_id"] == ["jobid"]
+    assert r.columns["mission_id"] == ["mission_id"]
+    assert r.category_values("status") == ["uploaded"]
+
+
+class StreamedResponse(MockResponse):
+    def __init__(self, payload, chunk_size):
+        super(StreamedResponse, self).__init__(None, 200)
+        self.content = json.dumps(payload).encode("utf-8")
+        self.chunk_size = chunk_size
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), self.chunk_size):
+            yield self.content[start:start + self.chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+
+def test_stream_jobs():
+    pytest.importorskip("ijson")
+    response = StreamedResponse({"jobs": [job, job]}, chunk_size=64)
+
+    with mock.patch("galileo_sdk.compat.requests.Session.get",
+                    return_value=response) as mocked_requests:
+        r = job_repo.stream_jobs("page=1")
+
+        # Nothing is requested until the first job is read
+        assert mocked_requests.call_count == 0
+        first = next(r)
+        mocked_requests.assert_called_once_with(
+            "{backend}{namespace}/jobs?page=1".format(backend=BACKEND,
+                                                      namespace=NAMESPACE),
+            headers={
+                "Authorization": "Bearer ACCESS_TOKEN",
+                "universe-id": UNIVERSE_ID
+            },
+            stream=True,
+        )
+        rest = list(r)
+
+    assert first.job_id == jobObject.job_id
+    assert first.status_history[0].status.name == "uploaded"
+    assert len(rest) == 1
+    assert response.closed
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from galileo_sdk.compat import mock
+from galileo_sdk.data.repositories.json_decoding import decode_json, iter_json_items
+from galileo_sdk.data.repositories.lz import LzRepository
+from galileo_sdk.mock_response import MockResponse
+
+BACKEND = "http://BACKEND"
+NAMESPACE = "/galileo/user_interface/v1"
+
+settings_repo = mock.Mock()
+settings_repo.get_settings().backend = BACKEND
+settings_repo.get_settings().universe = None
+auth_provider = mock.Mock()
+auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+
+
+class ContentResponse(MockResponse):
+    def __init__(self, content):
+        super(ContentResponse, self).__init__(None, 200)
+        self.content = content
+        self.json = mock.Mock(return_value="response.json()")
+
+
+def test_decoder_reads_the_body_bytes():
+    decoder = mock.Mock(return_value={"machines": []})
+    response = ContentResponse(b'{"machines": []}')
+
+    r = decode_json(response, decoder)
+
+    decoder.assert_called_once_with(b'{"machines": []}')
+    assert r == {"machines": []}
+    assert response.json.call_count == 0
+
+
+def test_response_json_decodes_what_the_decoder_cannot():
+    rejecting = mock.Mock(side_effect=ValueError("not UTF-8"))
+
+    assert decode_json(ContentResponse(b"{}"), None) == "response.json()"
+    assert decode_json(ContentResponse(b""), json.loads) == "response.json()"
+    assert decode_json(ContentResponse(b"{}"), rejecting) == "response.json()"
+    assert decode_json(MockResponse({"a": 1}, 200), json.loads) == {"a": 1}
+
+
+def test_repository_uses_its_decoder():
+    decoder = mock.Mock(side_effect=json.loads)
+    repo = LzRepository(settings_repo,
+                        auth_provider,
+                        NAMESPACE,
+                        json_decoder=decoder)
+    repo._get = mock.Mock(return_value=ContentResponse(b'{"machines": []}'))
+
+    r = repo.list_lz("")
+
+    assert r == []
+    decoder.assert_called_once_with(b'{"machines": []}')
+
+
+def test_items_are_decoded_as_chunks_arrive():
+    pytest.importorskip("ijson")
+    document = json.dumps({
+        "jobs": [{
+            "jobid": str(i),
+            "cpu_count": 1.5
+        } for i in range(3)]
+    }).encode("utf-8")
+    read = []
+
+    def chunks():
+        for start in range(0, len(document), 10):
+            read.append(start)
+            yield document[start:start + 10]
+
+    items = iter_json_items(chunks(), "jobs.item")
+    first = next(items)
+
+    assert first == {"jobid": "0", "cpu_count": 1.5}
+    assert isinstance(first["cpu_count"], float)
+    assert len(read) < len(document) // 10
+    assert [item["jobid"] for item in items] == ["1", "2"]
+
+
+def test_closing_the_items_closes_the_chunks():
+    pytest.importorskip("ijson")
+    chunks = mock.MagicMock()
+    chunks.__iter__.return_value = iter([b'{"files": [{"path": "/a"}, ',
+                                         b'{"path": "/b"}]}'])
+
+    items = iter_json_items(chunks, "files.item")
+    next(items)
+    items.close()
+
+    chunks.close.assert_called_once_with()
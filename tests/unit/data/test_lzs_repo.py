@@ -119,7 +119,7 @@ def mocked_requests_delete(*args, **kwargs):
         }, 200)
     return MockResponse(None, 404)
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_get_lz_by_id(mocked_requests):
     # Call
     r = lz_repo.get_lz_by_id(LZ_ID)
@@ -137,7 +137,7 @@ def test_get_lz_by_id(mocked_requests):
     assert r.name == "1"
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_lzs(mocked_requests):
     # Call
     r = lz_repo.list_lz("")
@@ -155,7 +155,7 @@ def test_list_lzs(mocked_requests):
         assert r[i].userid == str(i)
         assert r[i].status == ELzStatus.online
 
-@mock.patch("galileo_sdk.compat.requests.delete", side_effect=mocked_requests_delete)
+@mock.patch("galileo_sdk.compat.requests.Session.delete", side_effect=mocked_requests_delete)
 def test_delete_lz(mocked_requests):
     # Call
     r = lz_repo.delete_lz_by_id(LZ_ID)
@@ -169,3 +169,32 @@ def test_delete_lz(mocked_requests):
 
     # Assert
     assert r["success"] is True
+
+
+@mock.patch("galileo_sdk.data.repositories.lz.lz_dict_to_lz")
+@mock.patch("galileo_sdk.compat.requests.Session.get")
+def test_list_lzs_not_modified(mocked_requests, mocked_lz_dict_to_lz):
+    # Arrange
+    repo = LzRepository(settings_repo, auth_provider, NAMESPACE)
+    full = mocked_requests_get("{backend}{namespace}/machines".format(
+        backend=BACKEND, namespace=NAMESPACE))
+    full.headers = {"ETag": '"v1"'}
+    mocked_requests.side_effect = [full, MockResponse(None, 304)]
+
+    # Call
+    first = repo.list_lz("")
+    second = repo.list_lz("")
+
+    # Act
+    conditional_headers = dict(HEADERS)
+    conditional_headers["If-None-Match"] = '"v1"'
+    mocked_requests.assert_called_with(
+        "{backend}{namespace}/machines".format(backend=BACKEND, namespace=NAMESPACE),
+        headers=conditional_headers,
+        json=None,
+    )
+
+    # Assert
+    assert second == first
+    assert second is not first
+    assert mocked_lz_dict_to_lz.call_count == 5
@@ -1,5 +1,6 @@
 from galileo_sdk.compat import mock
 from galileo_sdk.business.utils.generate_query_str import generate_query_str
+from galileo_sdk.data.providers.identity import IdentityCache
 from galileo_sdk.data.repositories.profiles import ProfilesRepository
 from galileo_sdk.mock_response import MockResponse
 
@@ -121,7 +122,7 @@ def mocked_requests_get(*args, **kwargs):
     return MockResponse(None, 404)
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_users(mocked_requests):
     # Call
     r = profile_repo.list_users("")
@@ -145,7 +146,7 @@ def test_list_users(mocked_requests):
         assert r[i].username == "username{i}".format(i=i)
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_get_profile(mocked_requests):
     # Call
     r = profile_repo.self()
@@ -167,7 +168,7 @@ def test_get_profile(mocked_requests):
     assert r.lz_ids == ["mids"]
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_station_invites(mocked_requests):
     # Call
     r = profile_repo.list_station_invites()
@@ -189,3 +190,46 @@ def test_list_station_invites(mocked_requests):
     assert r[0].lz_ids[0] == "1"
     assert r[0].name == "name"
     assert r[0].users[0].stationuser_id == "stationuserid"
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
+def test_get_profile_is_cached(mocked_requests):
+    # Arrange
+    repo = ProfilesRepository(settings_repo, auth_provider, NAMESPACE)
+
+    # Call
+    first = repo.self()
+    second = repo.self()
+
+    # Assert
+    assert first is second
+    assert mocked_requests.call_count == 1
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
+def test_get_profile_after_invalidate(mocked_requests):
+    # Arrange
+    repo = ProfilesRepository(settings_repo, auth_provider, NAMESPACE)
+    repo.self()
+
+    # Call
+    repo.invalidate_self()
+    r = repo.self()
+
+    # Assert
+    assert r.user_id == "userid"
+    assert mocked_requests.call_count == 2
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
+def test_get_profile_cache_disabled(mocked_requests):
+    # Arrange
+    repo = ProfilesRepository(settings_repo, auth_provider, NAMESPACE,
+                              identity_cache=IdentityCache(ttl=0))
+
+    # Call
+    repo.self()
+    repo.self()
+
+    # Assert
+    assert mocked_requests.call_count == 2
@@ -127,7 +127,7 @@ def mocked_requests_delete(*args, **kwargs):
 
     return MockResponse(None, 404)
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_projects(mocked_requests):
     r = projects_repo.list_missions(QUERY_STR)
 
@@ -149,7 +149,7 @@ def test_list_projects(mocked_requests):
     assert r[0].name == "name"
 
 
-@mock.patch("galileo_sdk.compat.requests.post", side_effect=mocked_requests_post)
+@mock.patch("galileo_sdk.compat.requests.Session.post", side_effect=mocked_requests_post)
 def tests_create_project(mocked_requests):
     r = projects_repo.create_mission(
         CreateMissionRequest(
@@ -186,7 +186,7 @@ def tests_create_project(mocked_requests):
     assert r.description == "description"
 
 
-@mock.patch("galileo_sdk.compat.requests.post", side_effect=mocked_requests_post)
+@mock.patch("galileo_sdk.compat.requests.Session.post", side_effect=mocked_requests_post)
 def tests_upload_file(mocked_requests):
     open("test_upload_file.txt", "wb")
     filename = "test_upload_file.txt"
@@ -196,7 +196,7 @@ def tests_upload_file(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.post", side_effect=mocked_requests_post)
+@mock.patch("galileo_sdk.compat.requests.Session.post", side_effect=mocked_requests_post)
 def test_run_job_on_station(mocked_requests):
     r = projects_repo.run_job_on_station(
         PROJECT_ID, STATION_ID, CPU_COUNT, MEMORY_AMOUNT, GPU_COUNT)
@@ -221,7 +221,7 @@ def test_run_job_on_station(mocked_requests):
     assert isinstance(r, Job)
 
 
-@mock.patch("galileo_sdk.compat.requests.post", side_effect=mocked_requests_post)
+@mock.patch("galileo_sdk.compat.requests.Session.post", side_effect=mocked_requests_post)
 def test_run_job_on_machine(mocked_requests):
     r = projects_repo.run_job_on_lz(
         PROJECT_ID, STATION_ID, LZ_ID, CPU_COUNT, MEMORY_AMOUNT, GPU_COUNT)
@@ -250,7 +250,7 @@ def test_run_job_on_machine(mocked_requests):
     assert len(r.status_history) == 1
     assert r.status_history[0].status == EJobStatus.uploaded
 
-@mock.patch("galileo_sdk.compat.requests.delete", side_effect=mocked_requests_delete)
+@mock.patch("galileo_sdk.compat.requests.Session.delete", side_effect=mocked_requests_delete)
 def test_delete_project(mocked_requests):
     # Call
     r = projects_repo.delete_mission(PROJECT_ID)
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from tests.stand_in_socketio import SocketIOStandIn
+from galileo_sdk.business.objects.jobs import JobLauncherUpdatedEvent
+from galileo_sdk.compat import mock
+from galileo_sdk.data.events.connector import GalileoConnector
+from galileo_sdk.sdk.jobs import JobsSdk
+
+NAMESPACE = "/galileo/user_interface/v1"
+
+
+class Received(list):
+    def __init__(self):
+        super(Received, self).__init__()
+        self._changed = threading.Condition()
+
+    def __call__(self, event):
+        with self._changed:
+            self.append(event)
+            self._changed.notify_all()
+
+    def wait_for(self, count, timeout=10):
+        with self._changed:
+            return self._changed.wait_for(lambda: len(self) >= count, timeout)
+
+
+def _connector(server, recovery=None):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = server.backend
+    auth_provider = mock.Mock()
+    auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+    return GalileoConnector(settings_repo,
+                            auth_provider,
+                            NAMESPACE,
+                            recovery=recovery,
+                            reconnect_delay=0.05,
+                            reconnect_delay_max=0.2)
+
+
+def _job_event(job_id):
+    return {"job": {"jobid": job_id}}
+
+
+def test_connection_is_restored_with_missed_events():
+    # Arrange
+    recovery = mock.Mock()
+    missed = JobLauncherUpdatedEvent(mock.Mock(job_id="missed"))
+    recovery.catch_up.return_value = [("jobs", "job_launcher_updated", missed)]
+    with SocketIOStandIn() as server:
+        connector = _connector(server, recovery)
+        jobs = JobsSdk(mock.Mock(), connector)
+        received = Received()
+        jobs.on_job_launcher_updated(received)
+        assert server.wait_for_clients()
+        server.emit("job_launcher_updated", _job_event("before"))
+        assert received.wait_for(1)
+        last_event_time = connector._last_event_time
+
+        # Call
+        server.kill()
+        time.sleep(0.3)  # Reconnection attempts fail while it is down
+        server.start()
+        assert server.wait_for_clients()
+        assert received.wait_for(2)
+        server.emit("job_launcher_updated", _job_event("after"))
+        assert received.wait_for(3)
+        connector.disconnect()
+
+    # Assert
+    assert [event.job_id
+            for event in received] == ["before", "missed", "after"]
+    recovery.catch_up.assert_called_once_with(last_event_time, ["jobs"])
+
+
+def test_disconnect_stops_reconnecting():
+    with SocketIOStandIn() as server:
+        connector = _connector(server)
+        jobs = JobsSdk(mock.Mock(), connector)
+        jobs.on_job_launcher_updated(lambda event: None)
+        assert server.wait_for_clients()
+
+        server.kill()
+        connector.disconnect()
+        server.start()
+        time.sleep(0.5)
+
+        assert server.clients() == []
@@ -0,0 +1,187 @@
+import pytest
+
+from galileo_sdk.compat import mock
+from galileo_sdk.data.providers.response_cache import ResponseCache
+from galileo_sdk.data.repositories.missions import MissionsRepository
+from galileo_sdk.data.repositories.stations import StationsRepository
+from galileo_sdk.mock_response import MockResponse
+
+BACKEND = "http://BACKEND"
+NAMESPACE = "/galileo/user_interface/v1"
+STATION_ID = "station_id"
+
+
+def make_settings(universe="universe_id"):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = BACKEND
+    settings_repo.get_settings().universe = universe
+    return settings_repo
+
+
+auth_provider = mock.Mock()
+auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+
+
+def mission_type_dict(x):
+    return {
+        "id": str(x),
+        "name": str(x),
+        "description": str(x),
+        "version": str(x),
+        "active": True,
+        "wizard_spec": [],
+        "container_technology": str(x),
+    }
+
+
+def mocked_requests_get(*args, **kwargs):
+    if args[0] == "{backend}{namespace}/projecttypes/summaries".format(
+            backend=BACKEND, namespace=NAMESPACE):
+        return MockResponse(
+            {"project_types": [mission_type_dict(x) for x in range(3)]}, 200)
+    return MockResponse(None, 404)
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get",
+            side_effect=mocked_requests_get)
+def test_cached_endpoint(mocked_requests):
+    # Arrange
+    cache = ResponseCache()
+    repo = MissionsRepository(make_settings(),
+                              auth_provider,
+                              NAMESPACE,
+                              response_cache=cache)
+
+    # Call
+    first = repo.list_mission_types()
+    second = repo.list_mission_types()
+
+    # Assert
+    assert mocked_requests.call_count == 1
+    assert [t.id for t in first] == [t.id for t in second]
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get",
+            side_effect=mocked_requests_get)
+def test_cache_keyed_by_universe(mocked_requests):
+    # Arrange
+    cache = ResponseCache()
+    settings_repo = make_settings("universe_a")
+    repo = MissionsRepository(settings_repo,
+                              auth_provider,
+                              NAMESPACE,
+                              response_cache=cache)
+
+    # Call
+    repo.list_mission_types()
+    settings_repo.get_settings().universe = "universe_b"
+    repo.list_mission_types()
+
+    # Assert
+    assert mocked_requests.call_count == 2
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get",
+            side_effect=mocked_requests_get)
+def test_cache_bypass(mocked_requests):
+    # Arrange
+    cache = ResponseCache()
+    repo = MissionsRepository(make_settings(),
+                              auth_provider,
+                              NAMESPACE,
+                              response_cache=cache)
+    repo.list_mission_types()
+
+    # Call
+    with cache.bypass():
+        repo.list_mission_types()
+    repo.list_mission_types()
+
+    # Assert
+    assert mocked_requests.call_count == 2
+    assert cache.hits == 1
+
+
+def test_cache_bypass_is_per_context():
+    contextvars = pytest.importorskip("contextvars")
+    cache = ResponseCache()
+    other_cache = ResponseCache()
+    # Each asyncio task runs in a copy of the context it was started from
+    other_task = contextvars.copy_context()
+
+    with cache.bypass():
+        assert cache.bypassed
+        assert not other_cache.bypassed
+        assert not other_task.run(lambda: cache.bypassed)
+        started_inside = contextvars.copy_context()
+
+    assert not cache.bypassed
+    assert started_inside.run(lambda: cache.bypassed)
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.get",
+            side_effect=mocked_requests_get)
+def test_uncached_endpoint_and_expired_ttl(mocked_requests):
+    # Arrange
+    cache = ResponseCache(ttls={"/projecttypes/summaries": 0})
+    repo = MissionsRepository(make_settings(),
+                              auth_provider,
+                              NAMESPACE,
+                              response_cache=cache)
+
+    # Call
+    repo.list_mission_types()
+    repo.list_mission_types()
+
+    # Assert
+    assert mocked_requests.call_count == 2
+    assert len(cache) == 0
+
+
+def test_ttl_patterns():
+    cache = ResponseCache()
+
+    assert cache.ttl_for("/projecttypes") == 300
+    assert cache.ttl_for("/stations/{id}/roles".format(id=STATION_ID)) == 60
+    assert cache.ttl_for(
+        "/stations/{id}/users/user_id/resource_policy".format(
+            id=STATION_ID)) == 60
+    assert cache.ttl_for("/jobs") == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    cache.set(("a", None), "a", 60)
+    cache.set(("b", None), "b", 60)
+    cache.get(("a", None))
+    cache.set(("c", None), "c", 60)
+
+    assert cache.get(("a", None)) == "a"
+    assert cache.get(("b", None)) is None
+    assert cache.get(("c", None)) == "c"
+
+
+@mock.patch("galileo_sdk.compat.requests.Session.put",
+            return_value=MockResponse({"role": None}, 200))
+def test_write_invalidates_resource(mocked_put):
+    # Arrange
+    cache = ResponseCache()
+    repo = StationsRepository(make_settings(),
+                              auth_provider,
+                              NAMESPACE,
+                              response_cache=cache)
+    roles_key = ("{backend}{namespace}/stations/{id}/roles".format(
+        backend=BACKEND, namespace=NAMESPACE, id=STATION_ID), "universe_id")
+    types_key = ("{backend}{namespace}/projecttypes".format(
+        backend=BACKEND, namespace=NAMESPACE), "universe_id")
+    cache.set(roles_key, "roles", 60)
+    cache.set(types_key, "types", 60)
+
+    # Call
+    repo._put("/stations/{id}/roles/role_id".format(id=STATION_ID))
+
+    # Assert
+    assert cache.get(roles_key) is None
+    assert cache.get(types_key) == "types"
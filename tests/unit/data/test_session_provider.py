@@ -0,0 +1,66 @@
+import socket
+
+from galileo_sdk.compat import mock
+from galileo_sdk.data.providers.session import SessionProvider
+from galileo_sdk.data.repositories.jobs import JobsRepository
+from galileo_sdk.data.repositories.lz import LzRepository
+from galileo_sdk.mock_response import MockResponse
+
+BACKEND = "http://BACKEND"
+NAMESPACE = "/galileo/user_interface/v1"
+
+# Arrange
+settings_repo = mock.Mock()
+settings_repo.get_settings().backend = BACKEND
+settings_repo.get_settings().universe = None
+auth_provider = mock.Mock()
+auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+
+
+def test_session_is_reused():
+    session_provider = SessionProvider()
+
+    assert session_provider.get_session() is session_provider.get_session()
+
+
+def test_session_pool_settings():
+    session_provider = SessionProvider(pool_connections=2, pool_maxsize=32)
+    adapter = session_provider.get_session().get_adapter("https://BACKEND")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+
+
+def test_close_recreates_session():
+    session_provider = SessionProvider()
+    session = session_provider.get_session()
+    session_provider.close()
+
+    assert session_provider.get_session() is not session
+
+
+def test_repositories_share_session():
+    session_provider = SessionProvider()
+    session = mock.Mock()
+    session.get.return_value = MockResponse({"jobs": [], "machines": []},
+                                            200)
+    session_provider._session = session
+    jobs_repo = JobsRepository(settings_repo, auth_provider, NAMESPACE,
+                               session_provider)
+    lz_repo = LzRepository(settings_repo, auth_provider, NAMESPACE,
+                           session_provider)
+
+    jobs_repo.list_jobs("")
+    lz_repo.list_lz("")
+
+    assert session.get.call_count == 2
+
+
+def test_keep_alive_only_sets_the_socket_option():
+    session_provider = SessionProvider(keep_alive=False)
+
+    session = session_provider.get_session()
+
+    assert session.headers.get("Connection") != "close"
+    assert all(option[1] != socket.SO_KEEPALIVE
+               for option in session_provider._socket_options())
@@ -306,7 +306,7 @@ def mocked_requests_delete(*args, **kwargs):
     return MockResponse(None, 404)
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_stations(mocked_requests):
     # Call
     r = stations_repo.list_stations("")
@@ -325,7 +325,7 @@ def test_list_stations(mocked_requests):
     assert r[0].volumes[0].name == NAME
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_get_public_stations(mocked_requests):
     # Call
     r = stations_repo.get_public_stations("")
@@ -342,7 +342,7 @@ def test_get_public_stations(mocked_requests):
     assert len(r) == 5
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_create_station(mocked_requests):
     # Call
@@ -367,7 +367,7 @@ def test_create_station(mocked_requests):
     assert r.users[1].user_id == USERNAMES[1]
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_invite_to_station(mocked_requests):
     # Call
@@ -388,7 +388,7 @@ def test_invite_to_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_accept_station_invite(mocked_requests):
     # Call
     r = stations_repo.accept_station_invite(STATION_ID)
@@ -405,7 +405,7 @@ def test_accept_station_invite(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_reject_station_invite(mocked_requests):
     # Call
     r = stations_repo.reject_station_invite(STATION_ID)
@@ -422,7 +422,7 @@ def test_reject_station_invite(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_request_to_join(mocked_requests):
     # Call
@@ -440,7 +440,7 @@ def test_request_to_join(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_approve_request_to_join(mocked_requests):
     # Call
     r = stations_repo.approve_request_to_join(STATION_ID, USERNAMES)
@@ -457,7 +457,7 @@ def test_approve_request_to_join(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_reject_request_to_join(mocked_requests):
     # Call
     r = stations_repo.reject_request_to_join(STATION_ID, USERNAMES)
@@ -474,7 +474,7 @@ def test_reject_request_to_join(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.put", side_effect=mocked_requests_put)
+@mock.patch("galileo_sdk.compat.requests.Session.put", side_effect=mocked_requests_put)
 def test_leave_station(mocked_requests):
     # Call
     r = stations_repo.leave_station(STATION_ID)
@@ -491,7 +491,7 @@ def test_leave_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.delete",
+@mock.patch("galileo_sdk.compat.requests.Session.delete",
             side_effect=mocked_requests_delete)
 def test_remove_member_from_station(mocked_requests):
     # Call
@@ -512,7 +512,7 @@ def test_remove_member_from_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.delete",
+@mock.patch("galileo_sdk.compat.requests.Session.delete",
             side_effect=mocked_requests_delete)
 def test_delete_station(mocked_requests):
     # Call
@@ -530,7 +530,7 @@ def test_delete_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_add_lzs_to_station(mocked_requests):
     # Call
@@ -548,7 +548,7 @@ def test_add_lzs_to_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.delete",
+@mock.patch("galileo_sdk.compat.requests.Session.delete",
             side_effect=mocked_requests_delete)
 def test_remove_lzs_from_station(mocked_requests):
     # Call
@@ -566,7 +566,7 @@ def test_remove_lzs_from_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_add_volumes_to_station(mocked_requests):
     # Call
@@ -589,7 +589,7 @@ def test_add_volumes_to_station(mocked_requests):
     assert r.name == NAME
 
 
-@mock.patch("galileo_sdk.compat.requests.post",
+@mock.patch("galileo_sdk.compat.requests.Session.post",
             side_effect=mocked_requests_post)
 def test_add_host_path_to_station(mocked_requests):
     # Call
@@ -616,7 +616,7 @@ def test_add_host_path_to_station(mocked_requests):
     assert r.name == NAME
 
 
-@mock.patch("galileo_sdk.compat.requests.delete",
+@mock.patch("galileo_sdk.compat.requests.Session.delete",
             side_effect=mocked_requests_delete)
 def test_delete_host_path_from_station(mocked_requests):
     # Call
@@ -641,7 +641,7 @@ def test_delete_host_path_from_station(mocked_requests):
     assert r is True
 
 
-@mock.patch("galileo_sdk.compat.requests.delete",
+@mock.patch("galileo_sdk.compat.requests.Session.delete",
             side_effect=mocked_requests_delete)
 def test_remove_volume_from_station(mocked_requests):
     # Call
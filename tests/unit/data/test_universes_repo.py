@@ -63,7 +63,7 @@ def mocked_requests_post(*args, **kwargs):
     return MockResponse(None, 404)
 
 
-@mock.patch("galileo_sdk.compat.requests.get", side_effect=mocked_requests_get)
+@mock.patch("galileo_sdk.compat.requests.Session.get", side_effect=mocked_requests_get)
 def test_list_universes(mocked_requests):
     # Call
     r = universe_repo.list_universes()
@@ -80,7 +80,7 @@ def test_list_universes(mocked_requests):
     # Assert
     assert r[0].universe_id == "universe-id"
 
-@mock.patch("galileo_sdk.compat.requests.post", side_effect=mocked_requests_post)
+@mock.patch("galileo_sdk.compat.requests.Session.post", side_effect=mocked_requests_post)
 def test_create_universe(mocked_requests):
     r = universe_repo.create_universe(name=NEW_UNIVERSE_ID, admin_user_ids=ADMIN_USERS)
 
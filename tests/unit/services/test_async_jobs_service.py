@@ -0,0 +1,299 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from galileo_sdk.async_galileo_sdk import AsyncGalileoSdk
+from galileo_sdk.compat import mock
+from galileo_sdk.business.objects.exceptions import JobsException
+from galileo_sdk.business.objects.tables import JobTable, MissionTable
+from galileo_sdk.business.services.aio import (
+    AsyncJobsService,
+    AsyncLzService,
+    AsyncMissionsService,
+)
+from galileo_sdk.mock_response import MockResponse
+from galileo_sdk.sdk.aio.missions import AsyncMissionsSdk
+from galileo_sdk.sdk.jobs import JobsSdk
+
+JOB_ID = "job_id"
+USER_ID = "user_id"
+
+# Arrange
+jobs_repo = mock.AsyncMock()
+profile_repo = mock.AsyncMock()
+jobs_service = AsyncJobsService(jobs_repo, profile_repo)
+
+
+def test_request_send_job():
+    jobs_repo.request_send_job.return_value = MockResponse(
+        {
+            "location": "location",
+            "filename": "filename"
+        }, 200)
+
+    # Call
+    r = asyncio.run(jobs_service.request_send_job())
+
+    # Assert
+    assert r == {"location": "location", "filename": "filename"}
+
+
+def test_list_jobs_defaults_to_self():
+    profile_repo.self.return_value = mock.Mock(user_id=USER_ID)
+    jobs_repo.list_jobs.return_value = []
+
+    # Call
+    r = asyncio.run(jobs_service.list_jobs())
+
+    # Assert
+    assert r == []
+    assert "userids={user_id}".format(
+        user_id=USER_ID) in jobs_repo.list_jobs.call_args[0][0]
+
+
+def test_download_job_results():
+    files = [
+        mock.Mock(filename="file{x}".format(x=x), path="/") for x in range(3)
+    ]
+    jobs_repo.get_results_metadata.return_value = files
+    jobs_repo.download_results.side_effect = (
+        lambda job_id, query, path, **kwargs: path)
+
+    # Call
+    r = asyncio.run(jobs_service.download_job_results(JOB_ID, "path"))
+
+    # Assert
+    assert r == [os.path.join("path", file.filename) for file in files]
+    assert jobs_repo.download_results.await_count == 3
+
+
+def test_download_job_results_keeps_remote_folders():
+    repo = mock.AsyncMock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="out.csv", path=path) for path in ("/", "/run2")
+    ]
+    repo.download_results.side_effect = (
+        lambda job_id, query, path, **kwargs: path)
+    service = AsyncJobsService(repo, profile_repo)
+
+    r = asyncio.run(service.download_job_results(JOB_ID, "path"))
+
+    assert r == [
+        os.path.join("path", "out.csv"),
+        os.path.join("path", "run2", "out.csv"),
+    ]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_iter_jobs_resolves_self_once():
+    repo = mock.AsyncMock()
+    repo.list_jobs.side_effect = lambda query: [] if "page=3&" in query else list(
+        range(5))
+    profiles = mock.AsyncMock()
+    profiles.self.return_value = mock.Mock(user_id=USER_ID)
+    service = AsyncJobsService(repo, profiles)
+
+    # Call
+    r = asyncio.run(_collect(service.iter_jobs(items=5)))
+
+    # Assert
+    assert r == list(range(5)) * 2
+    assert profiles.self.await_count == 1
+    assert repo.list_jobs.await_count == 3
+
+
+def test_iter_lz_stops_early_without_requesting_more():
+    repo = mock.AsyncMock()
+    repo.list_lz.side_effect = lambda query: list(range(5))
+    service = AsyncLzService(repo)
+
+    async def first_six():
+        lzs = []
+        async for lz in service.iter_lz(items=5, prefetch=False):
+            lzs.append(lz)
+            if len(lzs) == 6:
+                break
+        return lzs
+
+    # Call
+    r = asyncio.run(first_six())
+
+    # Assert
+    assert r == [0, 1, 2, 3, 4, 0]
+    assert repo.list_lz.await_count == 2
+
+
+def test_fetch_all_lz_requests_pages_concurrently():
+    in_flight = []
+    peak = []
+
+    async def list_lz(query):
+        in_flight.append(query)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(query)
+        return [] if "page=4&" in query else list(range(5))
+
+    repo = mock.Mock()
+    repo.list_lz.side_effect = list_lz
+    service = AsyncLzService(repo)
+
+    # Call
+    r = asyncio.run(service.fetch_all_lz(items=5, concurrency=3))
+
+    # Assert
+    assert r == list(range(5)) * 3
+    assert max(peak) == 3
+
+
+def test_fetch_all_jobs_resolves_self_once():
+    repo = mock.AsyncMock()
+    repo.list_jobs.side_effect = lambda query: [] if "page=3&" in query else list(
+        range(5))
+    profiles = mock.AsyncMock()
+    profiles.self.return_value = mock.Mock(user_id=USER_ID)
+    service = AsyncJobsService(repo, profiles)
+
+    # Call
+    r = asyncio.run(service.fetch_all_jobs(items=5, concurrency=1))
+
+    # Assert
+    assert r == list(range(5)) * 2
+    assert profiles.self.await_count == 1
+    assert repo.list_jobs.await_count == 3
+
+
+def test_sdk_list_jobs_with_async_service():
+    # Arrange, AsyncGalileoSdk builds its JobsSdk over an AsyncJobsService
+    repo = mock.AsyncMock()
+    repo.list_jobs.return_value = ["job"]
+    repo.list_jobs_table.side_effect = lambda query: JobTable.from_dicts(
+        [] if "page=2&" in query else [{"jobid": "a"}, {"jobid": "b"}])
+    profiles = mock.AsyncMock()
+    profiles.self.return_value = mock.Mock(user_id=USER_ID)
+    jobs = JobsSdk(AsyncJobsService(repo, profiles))
+
+    # Call
+    listed = asyncio.run(jobs.list_jobs())
+    table = asyncio.run(jobs.fetch_all_jobs(items=2, columnar=True))
+
+    # Assert
+    assert listed == ["job"]
+    assert isinstance(table, JobTable)
+    assert table.columns["job_id"] == ["a", "b"]
+
+
+def test_sdk_fetch_all_missions_columnar_with_async_service():
+    repo = mock.AsyncMock()
+    repo.list_missions_table.side_effect = lambda query: MissionTable.from_dicts(
+        [] if "page=2&" in query else [{"id": "a"}, {"id": "b"}])
+    missions = AsyncMissionsSdk(AsyncMissionsService(repo))
+
+    table = asyncio.run(missions.fetch_all_missions(items=2, columnar=True))
+
+    assert isinstance(table, MissionTable)
+    assert table.columns["mission_id"] == ["a", "b"]
+
+
+def test_sdk_stream_is_rejected_with_async_services():
+    jobs = JobsSdk(AsyncJobsService(mock.AsyncMock(), mock.AsyncMock()))
+    missions = AsyncMissionsSdk(AsyncMissionsService(mock.AsyncMock()))
+
+    with pytest.raises(ValueError):
+        asyncio.run(jobs.list_jobs(stream=True))
+    with pytest.raises(ValueError):
+        missions.get_mission_files("mission_id", stream=True)
+
+
+def _galileo_with_jobs(statuses):
+    """
+    AsyncGalileoSdk whose list_jobs answers with the next status of each job at every call
+    """
+    pytest.importorskip("aiohttp")
+    galileo = AsyncGalileoSdk(auth_token="ACCESS_TOKEN",
+                              refresh_token="REFRESH_TOKEN")
+    repo = mock.AsyncMock()
+    profiles = mock.AsyncMock()
+    profiles.self.return_value = mock.Mock(user_id=USER_ID)
+
+    def list_jobs(query):
+        return [
+            mock.Mock(job_id=job_id,
+                      status=job_statuses.pop(0)
+                      if len(job_statuses) > 1 else job_statuses[0])
+            for job_id, job_statuses in sorted(statuses.items())
+            if "jobids=" + job_id in query
+        ]
+
+    repo.list_jobs.side_effect = list_jobs
+    galileo._jobs_service._jobs_repo = repo
+    galileo._jobs_service._profile_repo = profiles
+    galileo.jobs._connector = mock.Mock()
+    return galileo, repo, profiles
+
+
+def test_sdk_wait_for_jobs_with_async_services():
+    # Arrange
+    galileo, repo, profiles = _galileo_with_jobs({
+        "a": ["running", "completed"],
+        "b": ["running", "running", "error"],
+    })
+
+    # Call
+    r = asyncio.run(
+        _collect(
+            galileo.jobs.wait_for_jobs(["a", "b"],
+                                       poll_interval=0.01,
+                                       max_poll_interval=0.02)))
+
+    # Assert
+    assert [job.job_id for job in r] == ["a", "b"]
+    assert profiles.self.await_count == 1
+    assert all("userids=user_id" in call[0][0]
+               for call in repo.list_jobs.call_args_list)
+
+
+def test_sdk_wait_for_jobs_finishes_jobs_on_events():
+    # Arrange
+    galileo, repo, profiles = _galileo_with_jobs({"a": ["running"]})
+    events = galileo.jobs._connector.set_jobs_events.return_value
+
+    def send_event():
+        time.sleep(0.05)
+        handler = events.on_station_job_updated.call_args[0][0]
+        event = mock.Mock(job_id="a")
+        event.job = mock.Mock(job_id="a", status="completed")
+        handler(event)
+
+    async def wait():
+        threading.Thread(target=send_event).start()
+        return await galileo.jobs.wait_for_jobs(["a"],
+                                                timeout=5,
+                                                poll_interval=60).wait()
+
+    # Call
+    r = asyncio.run(wait())
+
+    # Assert
+    assert r["a"].status == "completed"
+    assert repo.list_jobs.await_count == 1
+    events.off_station_job_updated.assert_called_once_with(
+        events.on_station_job_updated.call_args[0][0])
+
+
+def test_sdk_wait_for_jobs_times_out_with_async_services():
+    galileo, repo, profiles = _galileo_with_jobs({"a": ["running"]})
+    waiter = galileo.jobs.wait_for_jobs(["a"], timeout=0.1, poll_interval=0.02)
+
+    with pytest.raises(JobsException) as e:
+        asyncio.run(waiter.wait())
+    with pytest.raises(TypeError):
+        list(waiter)
+
+    assert e.value.job_id == ["a"]
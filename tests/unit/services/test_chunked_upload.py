@@ -0,0 +1,141 @@
+import json
+import os
+import re
+
+from tests.stand_in_server import NAMESPACE, StandInServer
+from galileo_sdk.compat import mock
+from galileo_sdk.business.services.missions import MissionsService
+from galileo_sdk.business.utils.sync_manifest import file_sha256
+from galileo_sdk.business.utils.upload_journal import UploadJournal
+from galileo_sdk.data.repositories.missions import MissionsRepository
+
+PROJECT_ID = "mission_id"
+FILES_PATH = NAMESPACE + "/projects/mission_id/files"
+CHUNK_SIZE = 1024
+CONTENT = os.urandom(CHUNK_SIZE * 4 + 100)
+
+
+class ChunkRoute:
+    def __init__(self, drop=None, ranges=True):
+        """
+        Stores the chunks of a file, dropping the connection when drop(call) is True. Without
+        ranges, each chunk replaces the file like on a backend ignoring Content-Range.
+        """
+        self.drop = drop or (lambda call: False)
+        self.ranges = ranges
+        self.calls = 0
+        self.offsets = []
+        self.content = bytearray(len(CONTENT))
+        self.size = 0
+
+    def __call__(self, handler):
+        if handler.command == "GET":
+            files = [{"filename": "large.bin", "path": "/", "file_size": self.size}]
+            return 200, {"Content-Type": "application/json"}, json.dumps({
+                "files": files
+            }).encode("utf-8")
+        self.calls += 1
+        if self.drop(self.calls):
+            return None
+        start, end, total = map(
+            int,
+            re.match(r"bytes (\d+)-(\d+)/(\d+)",
+                     handler.headers["Content-Range"]).groups())
+        self.content[start:end + 1] = handler.body
+        self.offsets.append(start)
+        self.size = end + 1 if self.ranges else len(handler.body)
+        return 200, {}, b""
+
+
+def _service(server):
+    settings_repo = mock.Mock()
+    settings_repo.get_settings().backend = server.backend
+    settings_repo.get_settings().universe = None
+    auth_provider = mock.Mock()
+    auth_provider.get_access_token.return_value = "ACCESS_TOKEN"
+    return MissionsService(
+        MissionsRepository(settings_repo, auth_provider, NAMESPACE))
+
+
+def _payload(tmp_path):
+    path = tmp_path / "large.bin"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@mock.patch("galileo_sdk.business.services.missions.CHUNK_RETRY_DELAY", 0)
+def test_chunk_is_retried_after_dropped_connection(tmp_path):
+    # Arrange, the first attempt of the second chunk is dropped
+    route = ChunkRoute(drop=lambda call: call == 2)
+
+    # Call
+    with StandInServer({FILES_PATH: route}) as server:
+        r = _service(server).upload(PROJECT_ID,
+                                    _payload(tmp_path),
+                                    experimental_chunk_size=CHUNK_SIZE,
+                                    journal_dir=str(tmp_path / "journal"))
+
+    # Assert
+    assert r
+    assert route.offsets == [0, 1024, 2048, 3072, 4096]
+    assert bytes(route.content) == CONTENT
+    assert not os.listdir(str(tmp_path / "journal"))
+
+
+@mock.patch("galileo_sdk.business.services.missions.CHUNK_RETRIES", 1)
+@mock.patch("galileo_sdk.business.services.missions.CHUNK_RETRY_DELAY", 0)
+def test_interrupted_upload_resumes_from_journal(tmp_path):
+    # Arrange, the connection is lost for good after two chunks
+    payload = _payload(tmp_path)
+    journal_dir = str(tmp_path / "journal")
+    lost = ChunkRoute(drop=lambda call: call > 2)
+    resumed = ChunkRoute()
+
+    # Call
+    with StandInServer({FILES_PATH: lost}) as server:
+        interrupted = _service(server).upload(PROJECT_ID,
+                                              payload,
+                                              experimental_chunk_size=CHUNK_SIZE,
+                                              journal_dir=journal_dir)
+    journal = UploadJournal(PROJECT_ID, "large.bin", file_sha256(payload),
+                            len(CONTENT), journal_dir)
+    with StandInServer({FILES_PATH: resumed}) as server:
+        r = _service(server).upload(PROJECT_ID,
+                                    payload,
+                                    experimental_chunk_size=CHUNK_SIZE,
+                                    journal_dir=journal_dir)
+
+    # Assert
+    assert not interrupted
+    assert journal.offset == 2 * CHUNK_SIZE
+    assert r
+    assert resumed.offsets == [2048, 3072, 4096]
+    assert bytes(lost.content[:2048] + resumed.content[2048:]) == CONTENT
+
+
+def test_journal_of_modified_file_starts_over(tmp_path):
+    journal_dir = str(tmp_path)
+    UploadJournal(PROJECT_ID, "large.bin", "old-hash", 10,
+                  journal_dir).update(5)
+
+    assert UploadJournal(PROJECT_ID, "large.bin", "old-hash", 10,
+                         journal_dir).offset == 5
+    assert UploadJournal(PROJECT_ID, "large.bin", "new-hash", 10,
+                         journal_dir).offset == 0
+
+
+def test_upload_fails_when_backend_ignores_content_range(tmp_path):
+    # Arrange
+    route = ChunkRoute(ranges=False)
+
+    # Call
+    with StandInServer({FILES_PATH: route}) as server:
+        r = _service(server).upload(PROJECT_ID,
+                                    _payload(tmp_path),
+                                    experimental_chunk_size=CHUNK_SIZE,
+                                    journal_dir=str(tmp_path / "journal"))
+
+    # Assert, the next attempt starts over
+    assert not r
+    assert "100 of 4196 bytes" in str(r.failed[0].error)
+    assert not os.listdir(str(tmp_path / "journal"))
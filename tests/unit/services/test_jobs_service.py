@@ -1,4 +1,13 @@
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
 from galileo_sdk.compat import mock
+from galileo_sdk.business.objects import DownloadReport, JobTable
+from galileo_sdk.business.objects.exceptions import JobsException
 from galileo_sdk.business.services.jobs import JobsService
 from galileo_sdk.mock_response import MockResponse
 
@@ -128,3 +137,399 @@ def list_jobs():
     # Assert
     assert r["jobs"] == [{"job": i} for i in range(10)]
     assert r["jobs"][9] == {"job": 9}
+
+
+def test_iter_jobs_resolves_self_once():
+    # Arrange
+    repo = mock.Mock()
+    repo.list_jobs.side_effect = [list(range(5)), list(range(5)), []]
+    profiles = mock.Mock()
+    profiles.self.return_value = mock.Mock(user_id="user_id")
+    service = JobsService(repo, profiles)
+
+    # Call
+    r = list(service.iter_jobs(items=5))
+
+    # Assert
+    assert len(r) == 10
+    assert profiles.self.call_count == 1
+    assert all("userids=user_id" in call[0][0]
+               for call in repo.list_jobs.call_args_list)
+
+
+def test_list_jobs_with_empty_user_ids_does_not_filter_by_launcher():
+    # Arrange
+    repo = mock.Mock()
+    repo.list_jobs.return_value = []
+    profiles = mock.Mock()
+    service = JobsService(repo, profiles)
+
+    # Call
+    service.list_jobs(user_ids=[], lz_ids=["lz_id"])
+
+    # Assert
+    assert repo.list_jobs.call_args[0][0] == "page=1&items=25&machines=lz_id"
+    assert not profiles.self.called
+
+
+def test_fetch_all_jobs_stops_after_short_page():
+    # Arrange
+    repo = mock.Mock()
+    repo.list_jobs.side_effect = lambda query: [] if "page=3&" in query else list(
+        range(5))
+    profiles = mock.Mock()
+    profiles.self.return_value = mock.Mock(user_id="user_id")
+    service = JobsService(repo, profiles)
+
+    # Call
+    r = service.fetch_all_jobs(items=5, concurrency=1)
+
+    # Assert
+    assert len(r) == 10
+    assert repo.list_jobs.call_count == 3
+    assert profiles.self.call_count == 1
+
+
+def _job_page(statuses, state="running"):
+    return JobTable.from_dicts([{
+        "jobid": status + "_job",
+        "status": status,
+        "state": state,
+        "time_created": 1584946381,
+        "cpu_count": 2,
+    } for status in statuses])
+
+
+def test_fetch_all_jobs_columnar_shares_categories():
+    # Arrange
+    repo = mock.Mock()
+    repo.list_jobs_table.side_effect = lambda query: (_job_page(
+        ["running", "completed"]) if "page=1&" in query else _job_page(
+            ["unknown_status"], state="done"))
+    profiles = mock.Mock()
+    profiles.self.return_value = mock.Mock(user_id="user_id")
+    service = JobsService(repo, profiles)
+
+    # Call
+    r = service.fetch_all_jobs(items=2, concurrency=2, columnar=True)
+
+    # Assert
+    assert isinstance(r, JobTable)
+    assert repo.list_jobs.call_count == 0
+    assert r.columns["job_id"] == [
+        "running_job", "completed_job", "unknown_status_job"
+    ]
+    assert r.category_values("status") == [
+        "running", "completed", "unknown_status"
+    ]
+    assert r.category_values("state") == ["running", "running", "done"]
+    assert r.columns["mission_id"] == [None, None, None]
+
+
+def test_job_table_conversions():
+    np = pytest.importorskip("numpy")
+    table = _job_page(["running", "completed"]).take([1])
+    table.extend([{"jobid": "empty"}])
+
+    arrays = table.to_numpy()
+    assert arrays["status"].dtype == np.int32
+    assert arrays["status"][1] == -1
+    assert arrays["time_created"][0] == np.datetime64(1584946381, "s")
+    assert np.isnat(arrays["time_created"][1])
+    assert np.isnan(arrays["cpu_count"][1])
+
+    pd = pytest.importorskip("pandas")
+    df = table.to_pandas()
+    assert list(df.job_id) == ["completed_job", "empty"]
+    assert df.status[0] == "completed"
+    assert pd.isna(df.status[1])
+
+    pytest.importorskip("pyarrow")
+    arrow = table.to_arrow()
+    assert arrow.num_rows == 2
+    assert arrow.column("status").to_pylist() == ["completed", None]
+
+
+def test_download_job_results_in_parallel():
+    # Arrange
+    repo = mock.Mock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="file{x}".format(x=x), path="/", file_size=x)
+        for x in range(4)
+    ]
+    # Every download waits for a second one, so this only passes if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+
+    def download_results(job_id, query, path, **kwargs):
+        barrier.wait()
+        if path.endswith("file2"):
+            raise IOError("connection reset")
+        return path
+
+    repo.download_results.side_effect = download_results
+    service = JobsService(repo, profile_repo)
+
+    # Call
+    r = service.download_job_results(JOB_ID,
+                                     "path",
+                                     concurrency=2,
+                                     chunk_size=65536)
+
+    # Assert
+    assert isinstance(r, DownloadReport)
+    assert r == [os.path.join("path", name) for name in ("file0", "file1", "file3")]
+    assert [result.filename for result in r.failed] == ["file2"]
+    assert repo.download_results.call_args[1]["chunk_size"] == 65536
+    assert repo.download_results.call_args[1]["expected_size"] == 3
+
+
+def test_download_job_results_raises_when_every_file_fails():
+    repo = mock.Mock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="file{x}".format(x=x), path="/", file_size=x)
+        for x in range(2)
+    ]
+    repo.download_results.side_effect = IOError("connection reset")
+    service = JobsService(repo, profile_repo)
+
+    with pytest.raises(JobsException) as e:
+        service.download_job_results(JOB_ID, "path")
+
+    assert e.value.job_id == JOB_ID
+    assert "connection reset" in str(e.value)
+
+
+def test_download_job_results_keeps_remote_folders():
+    # Arrange, two results with the same name in different folders
+    repo = mock.Mock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="out.csv", path="/", file_size=None),
+        mock.Mock(filename="out.csv", path="/run2", file_size=None),
+        mock.Mock(filename="out.csv", path="/../run3/", file_size=None),
+    ]
+    repo.download_results.side_effect = (
+        lambda job_id, query, path, **kwargs: path)
+    service = JobsService(repo, profile_repo)
+
+    # Call
+    r = service.download_job_results(JOB_ID, "path", concurrency=1)
+
+    # Assert
+    assert r == [
+        os.path.join("path", "out.csv"),
+        os.path.join("path", "run2", "out.csv"),
+        os.path.join("path", "run3", "out.csv"),
+    ]
+
+
+def _write_zip(path, names):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, name)
+
+
+def test_download_and_extract_selected_members(tmp_path):
+    # Arrange
+    repo = mock.Mock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="results.zip", path="/", file_size=None),
+        mock.Mock(filename="log.txt", path="/", file_size=None),
+    ]
+
+    def download_results(job_id, query, path, **kwargs):
+        if path.endswith(".zip"):
+            _write_zip(path, ["out/a.csv", "out/b.csv", "out/big.bin"])
+        else:
+            with open(path, "w") as f:
+                f.write("log")
+        return path
+
+    repo.download_results.side_effect = download_results
+    service = JobsService(repo, profile_repo)
+
+    # Call
+    r = service.download_and_extract_job_results(JOB_ID,
+                                                 str(tmp_path),
+                                                 members=["*.csv"],
+                                                 delete_archives=True)
+
+    # Assert
+    extracted = os.path.join(str(tmp_path), "results")
+    assert not r.failed
+    assert r.results[0].extracted_path == extracted
+    assert sorted(os.listdir(os.path.join(extracted, "out"))) == [
+        "a.csv", "b.csv"
+    ]
+    assert not os.path.exists(os.path.join(str(tmp_path), "results.zip"))
+    assert r.results[1].extracted_path is None
+    assert os.path.exists(os.path.join(str(tmp_path), "log.txt"))
+
+
+def test_extraction_overlaps_remaining_downloads(tmp_path):
+    # Arrange
+    repo = mock.Mock()
+    repo.get_results_metadata.return_value = [
+        mock.Mock(filename="first.zip", path="/", file_size=None),
+        mock.Mock(filename="second.zip", path="/", file_size=None),
+    ]
+    first_extracted = os.path.join(str(tmp_path), "first", "done.txt")
+
+    def download_results(job_id, query, path, **kwargs):
+        if path.endswith("second.zip"):
+            # Still downloading while the first archive is extracted
+            deadline = time.time() + 5
+            while not os.path.exists(first_extracted):
+                assert time.time() < deadline
+                time.sleep(0.01)
+        _write_zip(path, ["done.txt"])
+        return path
+
+    repo.download_results.side_effect = download_results
+    service = JobsService(repo, profile_repo)
+
+    # Call
+    r = service.download_and_extract_job_results(JOB_ID,
+                                                 str(tmp_path),
+                                                 concurrency=2)
+
+    # Assert
+    assert not r.failed
+    assert r == [
+        os.path.join(str(tmp_path), "first.zip"),
+        os.path.join(str(tmp_path), "second.zip"),
+    ]
+
+
+class WaitedJob:
+    def __init__(self, job_id, status):
+        self.job_id = job_id
+        self.status = status
+
+
+def _waiting_service(statuses):
+    """
+    Service whose list_jobs answers with the next status of each job at every call
+    """
+    repo = mock.Mock()
+    calls = []
+
+    def list_jobs(query):
+        calls.append(query)
+        return [
+            WaitedJob(job_id, job_statuses.pop(0) if len(job_statuses) > 1
+                      else job_statuses[0])
+            for job_id, job_statuses in sorted(statuses.items())
+            if "jobids=" + job_id in query
+        ]
+
+    repo.list_jobs.side_effect = list_jobs
+    return JobsService(repo, mock.Mock()), calls
+
+
+def test_wait_for_jobs_polls_pending_jobs_in_batches():
+    # Arrange
+    service, calls = _waiting_service({
+        "a": ["running", "completed"],
+        "b": ["running", "running", "error"],
+        "c": ["uploaded", "running", "running", "running", "completed"],
+    })
+
+    # Call
+    jobs = list(
+        service.wait_for_jobs(["a", "b", "c"],
+                              poll_interval=0.01,
+                              max_poll_interval=0.02))
+
+    # Assert
+    assert [job.job_id for job in jobs] == ["a", "b", "c"]
+    assert len(calls) == 5
+    # A single request per listing, finished jobs are not listed again
+    assert "jobids=a" not in calls[2]
+    assert "jobids=b" not in calls[3]
+
+
+def test_wait_for_jobs_finishes_jobs_on_events():
+    # Arrange
+    service, calls = _waiting_service({
+        "a": ["running"],
+        "b": ["running"],
+    })
+    handlers = []
+    unsubscribe = mock.Mock()
+
+    def subscribe(handler):
+        handlers.append(handler)
+        return unsubscribe
+
+    waiter = service.wait_for_jobs(["a", "b"],
+                                   timeout=5,
+                                   poll_interval=60,
+                                   events=subscribe)
+
+    def send_events():
+        time.sleep(0.05)
+        for job_id in ("b", "a"):
+            event = mock.Mock(job_id=job_id)
+            event.job = WaitedJob(job_id, "completed")
+            handlers[0](event)
+
+    # Call
+    threading.Thread(target=send_events).start()
+    jobs = list(waiter)
+
+    # Assert
+    assert [job.job_id for job in jobs] == ["b", "a"]
+    assert len(calls) == 1
+    unsubscribe.assert_called_once_with()
+
+
+def test_wait_for_jobs_subscribes_once_iterated():
+    # Arrange
+    service, calls = _waiting_service({"a": ["completed"], "b": ["running"]})
+    subscribe = mock.Mock()
+    unused = service.wait_for_jobs(["a", "b"], events=subscribe)
+
+    # Call
+    with service.wait_for_jobs(["a", "b"], events=subscribe) as waiter:
+        first = next(iter(waiter))
+        subscribed = subscribe.call_count
+
+    # Assert
+    assert first.job_id == "a"
+    assert subscribed == 1
+    subscribe.return_value.assert_called_once_with()
+    assert unused.events is False
+
+
+def test_wait_for_jobs_times_out_with_pending_jobs():
+    service, calls = _waiting_service({"a": ["completed"], "b": ["running"]})
+
+    with pytest.raises(JobsException) as e:
+        service.wait_for_jobs(["a", "b"], timeout=0.1,
+                              poll_interval=0.02).wait()
+
+    assert e.value.job_id == ["b"]
+
+
+def test_wait_for_jobs_futures():
+    service, calls = _waiting_service({
+        "a": ["running", "completed"],
+        "b": ["terminated"]
+    })
+
+    futures = service.wait_for_jobs(["a", "b"], poll_interval=0.01).futures()
+
+    assert futures["a"].result(5).status == "completed"
+    assert futures["b"].result(5).status == "terminated"
+
+
+def test_list_jobs_stream_returns_the_repository_iterator():
+    repo = mock.Mock()
+    service = JobsService(repo, mock.Mock())
+
+    r = service.list_jobs(user_ids=["user_id"], items=1000, stream=True)
+
+    assert r is repo.stream_jobs.return_value
+    assert "items=1000" in repo.stream_jobs.call_args[0][0]
+    with pytest.raises(ValueError):
+        service.list_jobs(user_ids=["user_id"], columnar=True, stream=True)
@@ -1,3 +1,5 @@
+import time
+
 from galileo_sdk.compat import mock
 from galileo_sdk.business.objects.lz import (
     ELzStatus,
@@ -101,3 +103,56 @@ def test_delete_lz():
     r = lzs_service.delete_lz_by_id(LZ_ID)
 
     assert r["success"] is True
+
+
+def test_iter_lz():
+    # Arrange
+    pages = {1: list(range(10)), 2: list(range(10, 20)), 3: [20, 21]}
+    repo = mock.Mock()
+    repo.list_lz.side_effect = lambda query: pages[int(
+        query.split("page=")[1].split("&")[0])]
+    service = LzService(repo)
+
+    # Call
+    r = list(service.iter_lz(items=10))
+
+    # Assert
+    assert r == list(range(22))
+    assert repo.list_lz.call_count == 3
+
+
+def test_iter_lz_stops_early():
+    # Arrange
+    repo = mock.Mock()
+    repo.list_lz.return_value = list(range(10))
+    service = LzService(repo)
+
+    # Call
+    lzs = service.iter_lz(items=10, prefetch=False)
+    r = [next(lzs) for _ in range(15)]
+
+    # Assert
+    assert r == list(range(10)) + list(range(5))
+    assert repo.list_lz.call_count == 2
+
+
+def test_fetch_all_lz_keeps_page_order():
+    # Arrange
+    def list_lz(query):
+        page = int(query.split("page=")[1].split("&")[0])
+        # Later pages answer first
+        time.sleep(0.01 * max(0, 5 - page))
+        if page > 4:
+            return []
+        return list(range((page - 1) * 10, page * 10))
+
+    repo = mock.Mock()
+    repo.list_lz.side_effect = list_lz
+    service = LzService(repo)
+
+    # Call
+    r = service.fetch_all_lz(items=10, concurrency=3)
+
+    # Assert
+    assert r == list(range(40))
+    assert repo.list_lz.call_count <= 6
@@ -1,9 +1,16 @@
+import os
 from datetime import datetime
 
 from galileo_sdk.compat import mock
 from galileo_sdk.business.objects.jobs import Job
-from galileo_sdk.business.objects.missions import Mission
+from galileo_sdk.business.objects.missions import (
+    FileListing,
+    Mission,
+    SyncReport,
+    UploadReport,
+)
 from galileo_sdk.business.services.missions import MissionsService
+from galileo_sdk.business.utils.sync_manifest import SyncManifest
 
 BACKEND = "http://BACKEND"
 NAME = "test_name"
@@ -47,7 +54,207 @@ def test_upload():
     projects_repo.upload_single_file.return_value = True
     r = projects_service.upload(PROJECT_ID, "python_example")
 
-    assert r is True
+    assert r
+    assert isinstance(r, UploadReport)
+    assert sorted(result.filename for result in r.results) == [
+        "Dockerfile", "Readme.md", "mtcars.csv", "python_example.py"
+    ]
+
+
+def test_upload_streams_files():
+    # Arrange
+    repo = mock.Mock()
+    bodies = []
+    repo.upload_single_file.side_effect = (
+        lambda mission_id, body, filename: bodies.append(
+            (filename, body.read())))
+    service = MissionsService(repo)
+
+    # Call
+    r = service.upload(PROJECT_ID,
+                       os.path.join("python_example", "mtcars.csv"),
+                       rename="data/cars.csv")
+
+    # Assert
+    with open(os.path.join("python_example", "mtcars.csv"), "rb") as f:
+        assert bodies == [("data/cars.csv", f.read())]
+    assert r.bytes_uploaded == len(bodies[0][1])
+
+
+def test_upload_reports_failed_files():
+    # Arrange
+    repo = mock.Mock()
+
+    def upload_single_file(mission_id, body, filename):
+        if filename == "mtcars.csv":
+            raise IOError("connection reset")
+
+    repo.upload_single_file.side_effect = upload_single_file
+    service = MissionsService(repo)
+
+    # Call
+    r = service.upload(PROJECT_ID, "python_example", concurrency=2)
+
+    # Assert
+    assert not r
+    assert [result.filename for result in r.failed] == ["mtcars.csv"]
+    assert len(r.succeeded) == 3
+
+
+def test_upload_missing_payload():
+    r = projects_service.upload(PROJECT_ID, "does_not_exist")
+
+    assert not r
+    assert r.results == []
+
+
+def _write(path, content):
+    with open(str(path), "w") as f:
+        f.write(content)
+
+
+def _listing(directory, *filenames):
+    return [
+        FileListing(filename, "/", None, None,
+                    os.path.getsize(os.path.join(str(directory), filename)))
+        for filename in filenames
+    ]
+
+
+def test_sync_uploads_only_changed_files(tmp_path):
+    # Arrange
+    directory = tmp_path / "mission"
+    directory.mkdir()
+    _write(directory / "a.txt", "unchanged")
+    _write(directory / "b.txt", "before")
+    repo = mock.Mock()
+    repo.get_mission_files.return_value = []
+    service = MissionsService(repo)
+    manifest_dir = str(tmp_path / "manifests")
+
+    # Call
+    first = service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+    repo.get_mission_files.return_value = _listing(directory, "a.txt",
+                                                   "b.txt")
+    _write(directory / "b.txt", "after, with more content")
+    # Touched but identical, its hash is compared instead of its mtime
+    os.utime(str(directory / "a.txt"), (1, 1))
+    repo.upload_single_file.reset_mock()
+    second = service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+
+    # Assert
+    assert isinstance(second, SyncReport)
+    assert sorted(result.filename for result in first.succeeded) == [
+        "a.txt", "b.txt"
+    ]
+    assert [result.filename for result in second.succeeded] == ["b.txt"]
+    assert second.unchanged == ["a.txt"]
+    assert repo.upload_single_file.call_count == 1
+
+
+def test_sync_compares_sizes_sent_as_strings(tmp_path):
+    # Arrange
+    directory = tmp_path / "mission"
+    directory.mkdir()
+    _write(directory / "a.txt", "content")
+    repo = mock.Mock()
+    repo.get_mission_files.return_value = []
+    service = MissionsService(repo)
+    manifest_dir = str(tmp_path / "manifests")
+    service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+    repo.get_mission_files.return_value = [
+        FileListing("a.txt", "/", None, None, str(len("content")))
+    ]
+
+    # Call
+    r = service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+
+    # Assert
+    assert r.unchanged == ["a.txt"]
+    assert r.succeeded == []
+
+
+def test_sync_uploads_files_missing_from_mission(tmp_path):
+    # Arrange
+    directory = tmp_path / "mission"
+    directory.mkdir()
+    _write(directory / "a.txt", "content")
+    repo = mock.Mock()
+    repo.get_mission_files.return_value = []
+    service = MissionsService(repo)
+    manifest_dir = str(tmp_path / "manifests")
+    service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+
+    # Call, the file was removed from the mission since the last sync
+    r = service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+
+    # Assert
+    assert [result.filename for result in r.succeeded] == ["a.txt"]
+    assert r.unchanged == []
+
+
+def test_sync_deletes_remote_files_missing_locally(tmp_path):
+    # Arrange
+    directory = tmp_path / "mission"
+    directory.mkdir()
+    _write(directory / "a.txt", "content")
+    repo = mock.Mock()
+    repo.get_mission_files.return_value = _listing(directory, "a.txt") + [
+        FileListing("old.txt", "/", None, None, 10)
+    ]
+    service = MissionsService(repo)
+    manifest_dir = str(tmp_path / "manifests")
+
+    # Call
+    kept = service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+    deleted = service.sync(PROJECT_ID,
+                           str(directory),
+                           delete=True,
+                           manifest_dir=manifest_dir)
+
+    # Assert
+    assert kept.deleted == []
+    assert deleted.deleted == ["old.txt"]
+    assert deleted.unchanged == ["a.txt"]
+    repo.delete_file.assert_called_once_with(PROJECT_ID, "filename=old.txt")
+
+
+def test_sync_deletes_nested_remote_files_by_their_path(tmp_path):
+    # Arrange
+    directory = tmp_path / "mission"
+    (directory / "sub").mkdir(parents=True)
+    _write(directory / "a.txt", "content")
+    _write(directory / "sub" / "old.txt", "old content")
+    repo = mock.Mock()
+    repo.get_mission_files.return_value = []
+    service = MissionsService(repo)
+    manifest_dir = str(tmp_path / "manifests")
+    service.sync(PROJECT_ID, str(directory), manifest_dir=manifest_dir)
+    os.remove(str(directory / "sub" / "old.txt"))
+    repo.get_mission_files.return_value = _listing(directory, "a.txt") + [
+        FileListing("old.txt", "/sub", None, None, 11)
+    ]
+
+    # Call
+    r = service.sync(PROJECT_ID,
+                     str(directory),
+                     delete=True,
+                     manifest_dir=manifest_dir)
+
+    # Assert
+    assert r.deleted == ["sub/old.txt"]
+    repo.delete_file.assert_called_once_with(PROJECT_ID,
+                                             "filename=sub%2Fold.txt")
+    assert "sub/old.txt" not in SyncManifest(PROJECT_ID, manifest_dir)._files
+
+
+def test_sync_missing_directory(tmp_path):
+    r = projects_service.sync(PROJECT_ID,
+                              str(tmp_path / "does_not_exist"),
+                              manifest_dir=str(tmp_path))
+
+    assert not r
+    assert r.results == []
 
 
 def test_run_job_on_station():
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from galileo_sdk.business.objects.jobs import (
+    EJobStatus,
+    JobLauncherUpdatedEvent,
+    StationJobUpdatedEvent,
+)
+from galileo_sdk.business.objects.lz import ELzStatus, LzStatusUpdateEvent
+from galileo_sdk.business.objects.stations import (
+    StationAdminDestroyedEvent,
+    StationAdminLzAddedEvent,
+    StationAdminVolumeAddedEvent,
+)
+from galileo_sdk.business.utils.state_store import StateStore
+from galileo_sdk.compat import mock
+
+
+def _job(job_id, status, station_id="station", lz_id="lz", updated=1):
+    return mock.Mock(job_id=job_id,
+                     status=status,
+                     station_id=station_id,
+                     receiver_id=lz_id,
+                     mission_id="mission",
+                     last_updated=datetime.fromtimestamp(updated))
+
+
+def _station(station_id, lz_ids):
+    return mock.Mock(station_id=station_id, lz_ids=lz_ids)
+
+
+def _store(jobs=(), lzs=(), stations=()):
+    jobs_service = mock.Mock()
+    jobs_service.fetch_all_jobs.return_value = list(jobs)
+    lz_service = mock.Mock()
+    lz_service.fetch_all_lz.return_value = list(lzs)
+    stations_service = mock.Mock()
+    stations_service.fetch_all_stations.return_value = list(stations)
+    stations_service.list_stations.return_value = []
+    return StateStore(jobs_service, lz_service, stations_service)
+
+
+def test_jobs_are_indexed_and_kept_up_to_date():
+    # Arrange
+    store = _store(jobs=[
+        _job("a", "running"),
+        _job("b", "running", lz_id="other"),
+        _job("c", "completed"),
+    ])
+    store.load()
+
+    # Call
+    store.apply(JobLauncherUpdatedEvent(_job("a", "completed", updated=2)))
+    store.apply(StationJobUpdatedEvent(_job("d", "running", updated=2)))
+
+    # Assert
+    assert sorted(job.job_id for job in store.jobs(
+        status=EJobStatus.running)) == ["b", "d"]
+    assert sorted(job.job_id
+                  for job in store.jobs(status="running", lz_id="lz")) == ["d"]
+    assert sorted(job.job_id
+                  for job in store.jobs(status="completed")) == ["a", "c"]
+    assert store.jobs(mission_id="missing") == []
+    assert len(store.jobs()) == 4
+
+
+def test_events_received_while_loading_are_applied_over_the_lists():
+    # Arrange
+    store = _store()
+    stale = _job("a", "running", updated=1)
+    fresh = _job("a", "completed", updated=3)
+
+    def fetch_all_jobs(**kwargs):
+        # Delivered while the jobs are being listed
+        store.apply(JobLauncherUpdatedEvent(fresh))
+        store.apply(JobLauncherUpdatedEvent(stale))
+        return [_job("a", "running", updated=2)]
+
+    store._jobs_service.fetch_all_jobs.side_effect = fetch_all_jobs
+
+    # Call
+    store.load()
+
+    # Assert
+    assert store.job("a") is fresh
+
+
+def test_lz_status_updates_move_the_lz():
+    store = _store(lzs=[mock.Mock(lz_id="lz", status=ELzStatus.offline)])
+    store.load()
+
+    store.apply(LzStatusUpdateEvent("lz", ELzStatus.online))
+
+    assert [lz.lz_id for lz in store.lzs(status=ELzStatus.online)] == ["lz"]
+    assert store.lzs(status="offline") == []
+
+
+def test_station_events_update_the_stations():
+    # Arrange
+    store = _store(stations=[_station("s1", ["lz"]), _station("s2", [])])
+    store.load()
+    refreshed = _station("s2", ["lz"])
+    store._stations_service.list_stations.return_value = [refreshed]
+
+    # Call
+    store.apply(StationAdminLzAddedEvent("s2", ["other"]))
+    store.apply(StationAdminDestroyedEvent("s1"))
+    store.apply(StationAdminVolumeAddedEvent("s2", []))
+
+    # Assert
+    assert store.station("s1") is None
+    assert store.stations(lz_id="lz") == [refreshed]
+    store._stations_service.list_stations.assert_called_once_with(
+        station_ids=["s2"], items=1)
+    assert store.stations(lz_id="other") == []
+
+
+def test_close_unsubscribes_every_topic():
+    store = _store()
+    closers = []
+
+    def subscribe(topic, handler):
+        closers.append(mock.Mock())
+        return closers[-1]
+
+    store.listen(subscribe)
+    store.close()
+
+    assert len(closers) == 3
+    assert all(closer.call_count == 1 for closer in closers)